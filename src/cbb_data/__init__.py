@@ -2,9 +2,26 @@
 
 A unified API for accessing college basketball (NCAA Men's & Women's)
 and international basketball data (EuroLeague, FIBA, NBL, etc.)
+
+The dataset API is imported on first use, so ``import cbb_data`` stays cheap
+for CLI calls and servers that only need part of the package.
 """
 
-from .api.datasets import get_dataset, list_datasets
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .api.datasets import get_dataset, list_datasets
 
 __version__ = "0.1.0"
 __all__ = ["get_dataset", "list_datasets"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the dataset API on first access (PEP 562)"""
+    if name in __all__:
+        from .api import datasets
+
+        return getattr(datasets, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -12,10 +12,13 @@ All datasets support the unified FilterSpec for consistent querying.
 from __future__ import annotations
 
 import copy
+import functools
+import json
 import logging
+import os
 from collections.abc import Callable
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pandas as pd
 
@@ -33,37 +36,60 @@ from ..compose.enrichers import (
     add_league_context,
     coerce_common_columns,
 )
-from ..fetchers import (
-    bcl,  # Basketball Champions League
-    cbbpy_mbb,  # CBBpy integration for NCAA Men's box scores
-    cbbpy_wbb,  # CBBpy integration for NCAA Women's box scores
-    cebl,  # Canadian Elite Basketball League
-    domestic_euro,  # European domestic leagues (BBL, BSL, LBA)
-    gleague,  # G League integration
-    nbl_official,  # NBL Australia (official via nblR R package)
-    ote,  # Overtime Elite
-    prestosports,  # PrestoSports platform (NJCAA, NAIA, U-SPORTS)
-)
-from ..filters.compiler import apply_post_mask, compile_params
+from ..filters.compiler import apply_post_mask, compile_params, compile_sql_filter
 from ..filters.spec import FilterSpec
 from ..filters.validator import validate_filters
-from ..storage.duckdb_storage import get_storage
+from ..storage.freshness import get_freshness_policy, refresh_in_background
+from ..utils.adaptive_concurrency import get_concurrency
 from ..utils.entity_resolver import (
     resolve_euroleague_team,
     resolve_ncaa_team,
 )
+from ..utils.executor import run_with_deadlines
+from ..utils.lazy_import import LazyModule
+from ..utils.single_flight import get_single_flight
 
 # Import post-fetch filter system
 from .filters import DatasetFilter, apply_filters
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from ..fetchers import (
+        bcl,  # Basketball Champions League
+        cbbpy_mbb,  # CBBpy integration for NCAA Men's box scores
+        cbbpy_wbb,  # CBBpy integration for NCAA Women's box scores
+        cebl,  # Canadian Elite Basketball League
+        domestic_euro,  # European domestic leagues (BBL, BSL, LBA)
+        gleague,  # G League integration
+        nbl_official,  # NBL Australia (official via nblR R package)
+        ote,  # Overtime Elite
+        prestosports,  # PrestoSports platform (NJCAA, NAIA, U-SPORTS)
+    )
+else:
+    # Fetchers (and their optional dependencies) are imported on first use
+    bcl = LazyModule("cbb_data.fetchers.bcl")
+    cbbpy_mbb = LazyModule("cbb_data.fetchers.cbbpy_mbb")
+    cbbpy_wbb = LazyModule("cbb_data.fetchers.cbbpy_wbb")
+    cebl = LazyModule("cbb_data.fetchers.cebl")
+    domestic_euro = LazyModule("cbb_data.fetchers.domestic_euro")
+    gleague = LazyModule("cbb_data.fetchers.gleague")
+    nbl_official = LazyModule("cbb_data.fetchers.nbl_official")
+    ote = LazyModule("cbb_data.fetchers.ote")
+    prestosports = LazyModule("cbb_data.fetchers.prestosports")
+
 logger = logging.getLogger(__name__)
 
 # Derive all supported leagues from LEAGUE_LEVELS (single source of truth)
 ALL_LEAGUES = list(LEAGUE_LEVELS.keys())
 
-# Register all league source configurations (must happen after fetcher imports)
+# Register all league source configurations (fetchers are referenced lazily)
 _register_league_sources()
 
+# prospect_player_season fan-out: leagues fetched at once, seconds allowed per league
+PROSPECT_MAX_WORKERS = int(os.getenv("CBB_PROSPECT_MAX_WORKERS", "8"))
+PROSPECT_LEAGUE_TIMEOUT = float(os.getenv("CBB_PROSPECT_LEAGUE_TIMEOUT", "120"))
+
 
 # ==============================================================================
 # Helper Functions
@@ -350,7 +376,11 @@ def fetch_with_duckdb_cache(
     fetcher_func: Callable[[], pd.DataFrame],
     force_refresh: bool = False,
     enable_cache: bool = True,
-) -> pd.DataFrame:
+    post_mask: dict[str, Any] | None = None,
+    columns: list[str] | None = None,
+    limit: int | None = None,
+    as_arrow: bool = False,
+) -> pd.DataFrame | pa.Table:
     """Fetch data with DuckDB persistent caching for 1000-4000x speedup on cache hits
 
     This wrapper function provides transparent persistent caching for slow API calls,
@@ -363,15 +393,37 @@ def fetch_with_duckdb_cache(
         fetcher_func: Function that fetches data from API (callable, no arguments)
         force_refresh: If True, bypass cache and fetch from API
         enable_cache: If False, skip caching entirely (for testing)
+        post_mask: Optional post_mask from compile_params, applied inside DuckDB on
+            cache hits (see Filter pushdown)
+        columns: Optional columns to read on cache hits
+        limit: Optional row limit on cache hits
+        as_arrow: Return cache hits whose filters are fully pushed down as a
+            pyarrow Table read straight from DuckDB (no pandas conversion)
 
     Returns:
-        DataFrame: Data from cache (if available) or freshly fetched from API
+        DataFrame: Data from cache (if available) or freshly fetched from API.
+        Cache misses return the full fetch; callers still apply their post_mask.
+        With as_arrow, exact pushdown hits are a pa.Table that is already
+        filtered, projected and limited.
 
     Performance:
         - First fetch: Full API time (e.g., 3-7 min for EuroLeague schedule)
         - Subsequent fetches: 0.1-1 second from DuckDB
         - Speedup: 1000-4000x faster on cache hits
 
+    Freshness:
+        Each save records its write time. Once a table is older than its
+        FreshnessPolicy (see storage/freshness.py) it is still returned
+        immediately, and a background refresh replaces it for later calls
+        (stale-while-revalidate). Completed seasons never go stale.
+
+    Filter pushdown:
+        On cache hits the post_mask is compiled to a parameterized WHERE clause
+        (compile_sql_filter), so only matching rows leave DuckDB. When every
+        active filter compiles exactly, the column projection and LIMIT are
+        pushed down too; otherwise all columns are read and the remaining
+        filters are left to the caller's apply_post_mask.
+
     Example:
         # Wrap slow fetcher with caching
         df = fetch_with_duckdb_cache(
@@ -389,6 +441,8 @@ def fetch_with_duckdb_cache(
         return fetcher_func()
 
     try:
+        from ..storage.duckdb_storage import get_storage
+
         storage = get_storage()
 
         # Check cache first (unless force refresh)
@@ -397,11 +451,45 @@ def fetch_with_duckdb_cache(
                 f"Loading {dataset}/{league}/{season} from DuckDB cache "
                 f"(instant vs 3-7 min API fetch)"
             )
-            df = storage.load(dataset, league, season)
+            pushdown = compile_sql_filter(
+                post_mask or {}, storage.get_schema(dataset, league, [season])
+            )
+            if pushdown.exact:
+                load = storage.load_arrow if as_arrow else storage.load
+                df = load(
+                    dataset,
+                    league,
+                    season,
+                    filter_sql=pushdown.where,
+                    params=pushdown.params,
+                    columns=columns,
+                    limit=limit,
+                )
+            else:
+                df = storage.load(
+                    dataset, league, season, filter_sql=pushdown.where, params=pushdown.params
+                )
 
-            if not df.empty:
-                logger.debug(f"Cache hit: {len(df):,} rows loaded in <1 second")
-                return df
+            # An empty filtered/limited read is a valid answer; only an empty full read is suspect
+            narrowed = pushdown.where is not None or (pushdown.exact and limit is not None)
+            if len(df) or narrowed:
+                policy = get_freshness_policy(dataset, league, season)
+                age = storage.get_age_seconds(dataset, league, season)
+                if not policy.is_stale(age):
+                    logger.debug(f"Cache hit: {len(df):,} rows loaded in <1 second")
+                    return df
+
+                age_str = f"{age:.0f}s" if age is not None else "unknown age"
+                if policy.serve_stale:
+                    logger.info(
+                        f"Serving stale {dataset}/{league}/{season} ({age_str}), "
+                        "refreshing in background"
+                    )
+                    refresh_in_background(dataset, league, season, fetcher_func)
+                    return df
+
+                logger.info(f"Stored {dataset}/{league}/{season} is stale ({age_str}), refetching")
+                force_refresh = True
             else:
                 logger.warning("Cache returned empty DataFrame - refetching from API")
 
@@ -426,6 +514,36 @@ def fetch_with_duckdb_cache(
         return fetcher_func()
 
 
+def _storage_pushdown(compiled: dict[str, Any]) -> dict[str, Any]:
+    """Filter/projection/limit kwargs for fetch_with_duckdb_cache from compiled params
+
+    Column projection, LIMIT and Arrow reads are only passed when get_dataset
+    applies no post-fetch filters, since those need every column and row of a
+    DataFrame.
+    """
+    meta = compiled.get("meta", {})
+    pushdown: dict[str, Any] = {"post_mask": compiled.get("post_mask")}
+    if not meta.get("post_filters"):
+        pushdown["columns"] = meta.get("columns")
+        pushdown["limit"] = meta.get("limit")
+        pushdown["as_arrow"] = bool(meta.get("arrow"))
+    return pushdown
+
+
+# compiled["meta"] keys that shape get_dataset's output (see _storage_pushdown)
+_OUTPUT_META_KEYS = ("columns", "limit", "arrow")
+
+
+def _schedule_meta(meta: dict[str, Any]) -> dict[str, Any]:
+    """Copy of a request's meta for an internal schedule fetch
+
+    Drops hints that shape the requested dataset's output (column projection,
+    row limit, Arrow reads): the schedule a dataset is derived from must be
+    read in full, or a limit of 10 rows would aggregate only 10 games.
+    """
+    return {k: copy.deepcopy(v) for k, v in meta.items() if k not in _OUTPUT_META_KEYS}
+
+
 def validate_fetch_request(dataset: str, filters: dict[str, Any], league: str | None) -> None:
     """Validate request before fetching - fail fast on configuration errors
 
@@ -780,6 +898,7 @@ def _fetch_schedule(compiled: dict[str, Any]) -> pd.DataFrame:
                 season=season, phase=phase, competition="E"
             ),
             force_refresh=params.get("ForceRefresh", False),
+            **_storage_pushdown(compiled),
         )
 
     elif league == "EuroCup":
@@ -798,6 +917,7 @@ def _fetch_schedule(compiled: dict[str, Any]) -> pd.DataFrame:
                 season=season, phase=phase, competition="U"
             ),
             force_refresh=params.get("ForceRefresh", False),
+            **_storage_pushdown(compiled),
         )
 
     elif league == "G-League":
@@ -821,6 +941,7 @@ def _fetch_schedule(compiled: dict[str, Any]) -> pd.DataFrame:
                 date_to=date_to,
             ),
             force_refresh=params.get("ForceRefresh", False),
+            **_storage_pushdown(compiled),
         )
 
     elif league == "BCL":
@@ -911,6 +1032,10 @@ def _fetch_schedule(compiled: dict[str, Any]) -> pd.DataFrame:
         df = coerce_common_columns(df, source="espn")
     # EuroLeague/EuroCup already use standard column names, no normalization needed
 
+    if not isinstance(df, pd.DataFrame):
+        # Arrow table from storage; the post_mask was applied inside DuckDB
+        return df
+
     # Apply post-mask filters
     df = apply_post_mask(df, post_mask)
 
@@ -978,7 +1103,7 @@ def _fetch_player_game(compiled: dict[str, Any]) -> pd.DataFrame:
             schedule_compiled = {
                 "params": copy.deepcopy(params),
                 "post_mask": copy.deepcopy(post_mask),  # Keep filters
-                "meta": copy.deepcopy(meta),
+                "meta": _schedule_meta(meta),
             }
             # Remove TEAM_ID/GAME_ID (want all games for season)
             schedule_compiled["post_mask"].pop("TEAM_ID", None)
@@ -1080,16 +1205,18 @@ def _fetch_player_game(compiled: dict[str, Any]) -> pd.DataFrame:
             """Fetch box score for a single game"""
             game_code = int(game_info["GAME_CODE"])
             try:
-                return fetchers.euroleague.fetch_euroleague_box_score(
-                    season, game_code, competition="E"
-                )
+                with concurrency.slot():
+                    return fetchers.euroleague.fetch_euroleague_box_score(
+                        season, game_code, competition="E"
+                    )
             except Exception as e:
                 logger.warning(f"Failed to fetch EuroLeague game {game_code}: {e}")
                 return None
 
         frames = []
-        # Use 5 workers to parallelize while respecting rate limits
-        with ThreadPoolExecutor(max_workers=5) as executor:
+        # Pool sized to the ceiling; the adaptive limit decides how many fetch at once
+        concurrency = get_concurrency("euroleague", initial_limit=5)
+        with ThreadPoolExecutor(max_workers=concurrency.max_limit) as executor:
             # Submit all tasks
             futures = {
                 executor.submit(fetch_single_game, game.to_dict()): game["GAME_CODE"]
@@ -1131,16 +1258,18 @@ def _fetch_player_game(compiled: dict[str, Any]) -> pd.DataFrame:
             """Fetch box score for a single EuroCup game"""
             game_code = int(game_info["GAME_CODE"])
             try:
-                return fetchers.euroleague.fetch_euroleague_box_score(
-                    season, game_code, competition="U"
-                )
+                with concurrency.slot():
+                    return fetchers.euroleague.fetch_euroleague_box_score(
+                        season, game_code, competition="U"
+                    )
             except Exception as e:
                 logger.warning(f"Failed to fetch EuroCup game {game_code}: {e}")
                 return None
 
         frames = []
-        # Use 5 workers to parallelize while respecting rate limits
-        with ThreadPoolExecutor(max_workers=5) as executor:
+        # Pool sized to the ceiling; the adaptive limit decides how many fetch at once
+        concurrency = get_concurrency("euroleague", initial_limit=5)
+        with ThreadPoolExecutor(max_workers=concurrency.max_limit) as executor:
             # Submit all tasks
             futures = {
                 executor.submit(fetch_single_game_eurocup, game.to_dict()): game["GAME_CODE"]
@@ -1854,7 +1983,7 @@ def _fetch_player_season(compiled: dict[str, Any]) -> pd.DataFrame:
     schedule_compiled = {
         "params": copy.deepcopy(params),
         "post_mask": {},  # No filters - want ALL games for the season
-        "meta": copy.deepcopy(meta),
+        "meta": _schedule_meta(meta),
     }
 
     # Get season schedule
@@ -2082,7 +2211,7 @@ def _fetch_player_team_season(compiled: dict[str, Any]) -> pd.DataFrame:
     schedule_compiled = {
         "params": copy.deepcopy(params),
         "post_mask": {},  # No filters - want ALL games for the season
-        "meta": copy.deepcopy(meta),
+        "meta": _schedule_meta(meta),
     }
 
     # Get season schedule
@@ -2141,6 +2270,76 @@ def _fetch_player_team_season(compiled: dict[str, Any]) -> pd.DataFrame:
     return season_stats
 
 
+def _fetch_prospect_leagues(
+    compiled: dict[str, Any],
+    leagues: list[str],
+    max_workers: int | None = None,
+    timeout: float | None = None,
+) -> tuple[list[pd.DataFrame], dict[str, Any]]:
+    """Fetch player_season for many leagues concurrently
+
+    Each league runs _fetch_player_season on its own copy of ``compiled``,
+    with a per-league timeout (see run_with_deadlines). Leagues that run out
+    of time are reported as timed out and their results dropped.
+
+    Args:
+        compiled: Compiled request parameters
+        leagues: League codes to fetch
+        max_workers: Concurrent leagues (default: PROSPECT_MAX_WORKERS)
+        timeout: Seconds allowed per league (default: PROSPECT_LEAGUE_TIMEOUT)
+
+    Returns:
+        (non-empty frames in league order, league report) where the report has
+        "successful", "empty", "timed_out" lists and "failed" {league: error}
+    """
+    timeout = PROSPECT_LEAGUE_TIMEOUT if timeout is None else timeout
+
+    def fetch_league(league: str) -> pd.DataFrame:
+        league_compiled = copy.deepcopy(compiled)
+        league_compiled["meta"]["league"] = league
+        logger.info(f"Fetching player_season for {league}...")
+        return _fetch_player_season(league_compiled)
+
+    outcomes = run_with_deadlines(
+        {league: functools.partial(fetch_league, league) for league in leagues},
+        timeout,
+        max_workers=max_workers or PROSPECT_MAX_WORKERS,
+        thread_name_prefix="cbb-prospect",
+    )
+
+    report: dict[str, Any] = {"successful": [], "empty": [], "failed": {}, "timed_out": []}
+    results: dict[str, pd.DataFrame] = {}
+    for league in leagues:
+        outcome = outcomes[league]
+        if outcome.timed_out:
+            report["timed_out"].append(league)
+            logger.warning(f"✗ {league} timed out after {timeout:.0f}s")
+        elif outcome.error is not None:
+            logger.warning(f"✗ {league} failed: {outcome.error}")
+            report["failed"][league] = str(outcome.error)
+        else:
+            results[league] = outcome.value
+
+    frames = []
+    for league in leagues:
+        df = results.get(league)
+        if df is None:
+            continue
+        if df.empty:
+            report["empty"].append(league)
+            logger.info(f"⊘ {league}: empty (scaffold or no data)")
+            continue
+        # Add LEAGUE column to identify source league
+        df["LEAGUE"] = league
+        frames.append(df)
+        report["successful"].append(league)
+        logger.info(f"✓ {league}: {len(df)} player-seasons")
+
+    report["timed_out"] = [lg for lg in leagues if lg in report["timed_out"]]
+    report["failed"] = {lg: report["failed"][lg] for lg in leagues if lg in report["failed"]}
+    return frames, report
+
+
 def _fetch_prospect_player_season(compiled: dict[str, Any]) -> pd.DataFrame:
     """Fetch unified prospect player season stats across all pre-NBA leagues
 
@@ -2150,10 +2349,16 @@ def _fetch_prospect_player_season(compiled: dict[str, Any]) -> pd.DataFrame:
 
     Strategy:
     1. Get all pre-NBA leagues (college + prepro, excluding WNBA)
-    2. For each league, fetch player_season data using existing _fetch_player_season
-    3. Add LEAGUE column to each result
-    4. Concatenate all results into unified DataFrame
-    5. Handle errors gracefully (skip leagues that fail)
+    2. Fetch player_season for every league concurrently (_fetch_prospect_leagues),
+       so latency is bounded by the slowest league instead of their sum
+    3. Add LEAGUE column to each result and concatenate in league order
+    4. Leagues that fail or exceed PROSPECT_LEAGUE_TIMEOUT are skipped and reported
+
+    The league report is attached as ``df.attrs["leagues"]`` ("successful",
+    "empty", "failed", "timed_out") and surfaced in REST response metadata.
+    Complete results are cached as one merged entry, so repeat calls skip the
+    fan-out; partial results are not cached, so the next call retries the
+    missing leagues (the leagues that succeeded hit their own caches).
 
     Args:
         compiled: Compiled request parameters (season, season_type, per_mode, etc.)
@@ -2166,7 +2371,10 @@ def _fetch_prospect_player_season(compiled: dict[str, Any]) -> pd.DataFrame:
         >>> df = get_dataset("prospect_player_season", season="2024", per_mode="PerGame")
         >>> top_scorers = df.nlargest(50, "PTS")
         >>> print(top_scorers[["PLAYER_NAME", "LEAGUE", "PTS", "REB", "AST"]])
+        >>> df.attrs["leagues"]["failed"]
     """
+    from ..fetchers.base import get_cache
+
     params = compiled["params"]
     season = params.get("Season", "2024")
     per_mode = params.get("PerMode", "Totals")
@@ -2178,53 +2386,58 @@ def _fetch_prospect_player_season(compiled: dict[str, Any]) -> pd.DataFrame:
     prepro_leagues = get_leagues_by_level("prepro")
     prospect_leagues = college_leagues + prepro_leagues
 
+    cache = get_cache()
+    request_key = {k: v for k, v in compiled.items() if k != "meta"}
+    request_key["params"] = {k: v for k, v in params.items() if k != "ForceRefresh"}
+    cache_key = (
+        "prospect_player_season",
+        json.dumps(
+            {"request": request_key, "leagues": prospect_leagues}, sort_keys=True, default=str
+        ),
+    )
+    if not params.get("ForceRefresh"):
+        try:
+            cached = cache.get(*cache_key)
+            report = cache.get(*cache_key, "leagues")
+        except Exception as e:
+            logger.warning(f"Cache deserialization error: {e}")
+            cached = report = None
+        if isinstance(cached, pd.DataFrame) and isinstance(report, dict):
+            logger.info(f"Loaded prospect_player_season {season} from merged cache entry")
+            cached.attrs["leagues"] = report
+            return cached
+
     logger.info(
         f"Fetching player_season from {len(prospect_leagues)} leagues: "
         f"{len(college_leagues)} college + {len(prepro_leagues)} prepro"
     )
 
-    frames = []
-    successful_leagues = []
-    failed_leagues = []
-
-    for league in prospect_leagues:
-        try:
-            # Create a compiled request for this specific league
-            league_compiled = copy.deepcopy(compiled)
-            league_compiled["meta"]["league"] = league
-
-            # Fetch player_season for this league
-            logger.info(f"Fetching player_season for {league}...")
-            df = _fetch_player_season(league_compiled)
-
-            # Only add if we got data
-            if not df.empty:
-                # Add LEAGUE column to identify source league
-                df["LEAGUE"] = league
-                frames.append(df)
-                successful_leagues.append(league)
-                logger.info(f"✓ {league}: {len(df)} player-seasons")
-            else:
-                logger.info(f"⊘ {league}: empty (scaffold or no data)")
-
-        except Exception as e:
-            logger.warning(f"✗ {league} failed: {e}")
-            failed_leagues.append(league)
+    frames, report = _fetch_prospect_leagues(compiled, prospect_leagues)
+    if report["failed"] or report["timed_out"]:
+        logger.warning(f"Failed leagues: {', '.join([*report['failed'], *report['timed_out']])}")
 
     # Concatenate all successful fetches
-    if frames:
-        result = pd.concat(frames, ignore_index=True)
-        logger.info(
-            f"Combined {len(result)} player-seasons from {len(successful_leagues)}/{len(prospect_leagues)} leagues"
-        )
+    if not frames:
+        logger.warning(f"No data fetched from any of {len(prospect_leagues)} leagues")
+        result = pd.DataFrame()
+        result.attrs["leagues"] = report
+        return result
 
-        if failed_leagues:
-            logger.warning(f"Failed leagues: {', '.join(failed_leagues)}")
+    result = pd.concat(frames, ignore_index=True)
+    logger.info(
+        f"Combined {len(result)} player-seasons from "
+        f"{len(report['successful'])}/{len(prospect_leagues)} leagues"
+    )
 
-        return result
-    else:
-        logger.warning(f"No data fetched from any of {len(prospect_leagues)} leagues")
-        return pd.DataFrame()
+    if not report["failed"] and not report["timed_out"]:
+        try:
+            cache.set(result, *cache_key)
+            cache.set(report, *cache_key, "leagues")
+        except Exception as e:
+            logger.warning(f"Cache serialization error: {e}")
+
+    result.attrs["leagues"] = report
+    return result
 
 
 # ==============================================================================
@@ -2484,7 +2697,9 @@ def get_dataset(
         filters: Filter dictionary (converted to FilterSpec)
         columns: Optional list of columns to return
         limit: Optional row limit
-        as_format: Output format ("pandas", "json", "parquet")
+        as_format: Output format ("pandas", "json", "arrow", "parquet"). Arrow and
+                   parquet requests answered from DuckDB storage with no post-fetch
+                   filters are read straight into Arrow, without a pandas frame.
         name_resolver: Optional function to resolve entity names to IDs.
                       If None, uses default resolver with name normalization.
                       Set to False to disable name resolution entirely.
@@ -2495,7 +2710,8 @@ def get_dataset(
                      Applied after data fetch for consistent filtering across all sources.
 
     Returns:
-        DataFrame (pandas), list of dicts (json), or dict with path (parquet)
+        DataFrame (pandas), list of dicts (json), pyarrow.Table (arrow),
+        or dict with path (parquet)
 
     Raises:
         KeyError: If dataset not found
@@ -2602,6 +2818,14 @@ def get_dataset(
     # Correct: "if limit is not None:" handles 0, None, and positive values properly
     if limit is not None:
         compiled["meta"]["limit"] = limit
+    # Let DuckDB-cached fetchers read only the requested columns (see _storage_pushdown)
+    if columns:
+        compiled["meta"]["columns"] = list(columns)
+    if post_filters is not None:
+        compiled["meta"]["post_filters"] = True
+    elif as_format in ("arrow", "parquet"):
+        # Stored partitions can be read straight into Arrow (see _storage_pushdown)
+        compiled["meta"]["arrow"] = True
     if force_fresh:
         compiled["params"]["ForceRefresh"] = True
         logger.debug("Force fresh data requested - bypassing cache")
@@ -2612,9 +2836,57 @@ def get_dataset(
     # Validate request BEFORE making API calls to fail fast on configuration errors
     validate_fetch_request(grouping, filters or {}, spec.league)
 
-    # Fetch data
+    # Fetch data. Identical concurrent requests (same dataset + compiled filters)
+    # share one fetch; the key is built before fetchers mutate `compiled`.
     fetch_fn = entry["fetch"]
-    df = fetch_fn(compiled)
+    flight_key = f"{grouping}|{json.dumps(compiled, sort_keys=True, default=str)}"
+    flight = get_single_flight()
+    # Cross-process modes can't hand the DataFrame to other workers, so the
+    # leader publishes it to the shared cache and workers that waited on its
+    # lock read it there. Each leader first drops the previous entry, so a
+    # waiter only ever sees the result of the flight it waited on.
+    handoff = flight.mode in ("file", "redis")
+
+    def fetch() -> pd.DataFrame | pa.Table:
+        if not handoff:
+            return fetch_fn(compiled)
+        from ..fetchers.base import get_cache
+
+        cache = get_cache()
+        cache.delete("get_dataset", flight_key)
+        result = fetch_fn(compiled)
+        if isinstance(result, pd.DataFrame):
+            # Arrow tables come straight from storage; waiters reread them cheaply
+            try:
+                cache.set(result, "get_dataset", flight_key)
+            except Exception as e:
+                logger.warning(f"Cache serialization error: {e}")
+        return result
+
+    def recheck() -> pd.DataFrame | None:
+        if force_fresh:
+            return None
+        from ..fetchers.base import get_cache
+
+        try:
+            cached = get_cache().get("get_dataset", flight_key)
+        except Exception as e:
+            logger.warning(f"Cache deserialization error: {e}")
+            return None
+        return cached if isinstance(cached, pd.DataFrame) else None
+
+    data = flight.do(
+        flight_key,
+        fetch,
+        recheck=recheck if handoff else None,
+        # Arrow tables are immutable and can be shared as-is
+        clone=lambda result: result.copy() if isinstance(result, pd.DataFrame) else result,
+    )
+
+    if not isinstance(data, pd.DataFrame):
+        # Arrow table read from storage with filters, columns and limit pushed down
+        return _arrow_output(data, grouping, as_format)
+    df = data
 
     # Apply post-fetch filters (names, dates, segments)
     if post_filters is not None and not df.empty:
@@ -2640,11 +2912,23 @@ def get_dataset(
         return df
     elif as_format == "json":
         return df.to_dict(orient="records")
-    elif as_format == "parquet":
-        import tempfile
+    elif as_format in ("arrow", "parquet"):
+        import pyarrow as pa
 
-        path = tempfile.mkstemp(prefix=f"{grouping}_", suffix=".parquet")[1]
-        df.to_parquet(path, index=False)
-        return {"path": path, "rows": len(df)}
+        return _arrow_output(pa.Table.from_pandas(df, preserve_index=False), grouping, as_format)
     else:
         raise ValueError(f"Unsupported format: {as_format}")
+
+
+def _arrow_output(table: pa.Table, grouping: str, as_format: str) -> Any:
+    """Return an Arrow table as get_dataset's "arrow" or "parquet" output"""
+    if as_format == "arrow":
+        return table
+
+    import tempfile
+
+    import pyarrow.parquet as pq
+
+    path = tempfile.mkstemp(prefix=f"{grouping}_", suffix=".parquet")[1]
+    pq.write_table(table, path)
+    return {"path": path, "rows": table.num_rows}
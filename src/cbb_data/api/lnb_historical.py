@@ -486,13 +486,13 @@ def get_lnb_normalized_player_game(
         - PLAYER_ID: Player identifier
         - PLAYER_NAME: Player name
         - TEAM_ID: Team identifier
-        - MIN: Minutes played
+        - MIN: Minutes played (null: not derivable from LNB play-by-play)
         - PTS, FGM, FGA, FG_PCT: Points and field goal stats
         - FG2M, FG2A, FG2_PCT: 2-point stats
         - FG3M, FG3A, FG3_PCT: 3-point stats
         - FTM, FTA, FT_PCT: Free throw stats
         - REB, AST, STL, BLK, TOV, PF: Traditional box score stats
-        - PLUS_MINUS: Plus/minus rating
+        - PLUS_MINUS: Plus/minus rating (null: not derivable from LNB play-by-play)
         - SEASON, LEAGUE: Metadata
 
     Examples:
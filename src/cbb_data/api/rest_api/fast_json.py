@@ -0,0 +1,173 @@
+"""
+Pre-serialized JSON responses for dataset queries.
+
+Returning a DatasetResponse model makes FastAPI validate the row payload
+(``list[Any]`` of ``df.values.tolist()``), walk every cell through
+jsonable_encoder and only then dump it to JSON. For warm-cache hits of 10k+
+rows that per-cell work is most of the request time. Here the rows are
+encoded straight from the DataFrame into JSON bytes and spliced into the
+response body; only the small DatasetMetadata model is still validated.
+
+Key Features:
+- Same wire schema as DatasetResponse: {"data": ..., "columns": ..., "metadata": ...}
+- json (array of arrays) and records (array of objects) output formats
+- orjson when installed (``pip install cbb-data[api]``); pandas' vectorized
+  JSON writer otherwise
+- NaN/NaT/pd.NA -> null, timestamps as ISO 8601, numpy scalars as numbers
+  (the model path fails on NaN: Starlette refuses non-finite floats)
+
+Usage:
+    from cbb_data.api.rest_api.fast_json import DatasetJSONResponse, encode_rows
+
+    rows, columns = encode_rows(df, "json")
+    return DatasetJSONResponse(rows, columns, metadata)
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import decimal
+import json
+import logging
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from fastapi.responses import Response
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    ORJSON_AVAILABLE = False
+
+from .models import DatasetMetadata
+
+logger = logging.getLogger(__name__)
+
+# Output formats encoded here; csv/parquet stay on the DatasetResponse model
+FAST_JSON_FORMATS = {"json": "values", "records": "records"}
+
+
+def _default(value: Any) -> Any:
+    """orjson fallback for cell types it does not serialize natively"""
+    if value is pd.NaT or value is pd.NA:
+        return None
+    if isinstance(value, pd.Timestamp | dt.datetime | dt.date | dt.time):
+        return value.isoformat()
+    if isinstance(value, pd.Timedelta | dt.timedelta):
+        return value.total_seconds()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    if isinstance(value, set | frozenset | tuple):
+        return list(value)
+    if isinstance(value, bytes):
+        return value.decode(errors="replace")
+    return str(value)
+
+
+def dumps(value: Any) -> bytes:
+    """Encode a Python value as compact JSON bytes (NaN -> null)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, default=_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(value, default=_default, separators=(",", ":")).encode()
+
+
+def _column_values(column: pd.Series) -> list[Any]:
+    """Convert one column to JSON-ready Python values, vectorized per dtype"""
+    values = column.to_numpy()
+    if isinstance(column.dtype, np.dtype) and column.dtype.kind in "biuf":
+        numbers: list[Any] = values.tolist()  # NaN floats are written as null
+        return numbers
+
+    if isinstance(column.dtype, np.dtype) and column.dtype.kind == "M":
+        # Naive timestamps: ISO 8601 like Timestamp.isoformat() (no per-cell boxing)
+        nat = np.isnat(values)
+        whole = values.astype("datetime64[ns]").view("i8") % 1_000_000_000 == 0
+        text = np.datetime_as_string(values, unit="s").astype(object)
+        if not whole.all():
+            fraction = ~whole & ~nat
+            text[fraction] = np.datetime_as_string(values[fraction], unit="us")
+        text[nat] = None
+        stamps: list[Any] = text.tolist()
+        return stamps
+
+    # Object, string, categorical and nullable extension columns
+    values = column.to_numpy(dtype=object)
+    missing = pd.isna(values)
+    if missing.any():
+        values = values.copy()
+        values[missing] = None
+    cells: list[Any] = values.tolist()
+    return cells
+
+
+def encode_rows(df: pd.DataFrame | None, output_format: str) -> tuple[bytes, list[str] | None]:
+    """
+    Encode DataFrame rows as a JSON array.
+
+    Args:
+        df: Rows to encode
+        output_format: "json" (array of arrays) or "records" (array of objects)
+
+    Returns:
+        (JSON bytes of the rows, column names or None for records), matching
+        the data/columns pair of DatasetResponse
+
+    Raises:
+        ValueError: If output_format is not a fast JSON format
+    """
+    orient = FAST_JSON_FORMATS.get(output_format)
+    if orient is None:
+        raise ValueError(f"Unsupported fast JSON format: {output_format}")
+    if df is None or df.empty:
+        return b"[]", []
+
+    names = [str(c) for c in df.columns]
+    columns = names if orient == "values" else None
+    if ORJSON_AVAILABLE:
+        try:
+            rows = zip(*(_column_values(df.iloc[:, i]) for i in range(df.shape[1])), strict=True)
+            if orient == "values":
+                return dumps(list(rows)), columns
+            return dumps([dict(zip(names, row, strict=True)) for row in rows]), columns
+        except (TypeError, orjson.JSONEncodeError) as e:
+            # e.g. integers beyond 64 bits in scraped columns
+            logger.debug(f"orjson could not encode rows ({e}); using pandas writer")
+
+    text = df.to_json(orient=orient, date_format="iso", double_precision=15, default_handler=str)
+    return text.encode(), columns
+
+
+class DatasetJSONResponse(Response):
+    """
+    application/json response with the DatasetResponse schema, built from
+    pre-encoded rows.
+
+    Args:
+        rows: JSON array from encode_rows
+        columns: Column names (None for records)
+        metadata: Query metadata (validated and dumped like the model path)
+        status_code: HTTP status
+        headers: Extra response headers
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        rows: bytes,
+        columns: list[str] | None,
+        metadata: DatasetMetadata | None = None,
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        meta = metadata.model_dump(mode="json") if metadata is not None else None
+        body = b"".join(
+            (b'{"data":', rows, b',"columns":', dumps(columns), b',"metadata":', dumps(meta), b"}")
+        )
+        super().__init__(content=body, status_code=status_code, headers=headers)
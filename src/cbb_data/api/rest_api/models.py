@@ -44,9 +44,25 @@ class DatasetRequest(BaseModel):
         default=0, description="Number of rows to skip (for pagination)", ge=0
     )
 
-    output_format: Literal["json", "csv", "parquet", "records", "ndjson"] = Field(
+    page_size: int | None = Field(
+        default=None,
+        description="Rows per page. The full result is kept server-side and "
+        "metadata.next_cursor fetches the next page without re-running the query",
+        ge=1,
+        le=10000,
+    )
+
+    cursor: str | None = Field(
+        default=None,
+        description="metadata.next_cursor from a previous paged response "
+        "(filters are ignored; 410 once the stored result has expired)",
+    )
+
+    output_format: Literal[
+        "json", "csv", "parquet", "records", "ndjson", "arrow", "parquet_raw"
+    ] = Field(
         default="json",
-        description="Output format: 'json' (array of arrays), 'csv' (comma-separated), 'parquet' (compressed binary), 'records' (array of objects), 'ndjson' (streaming newline-delimited JSON)",
+        description="Output format: 'json' (array of arrays), 'csv' (comma-separated), 'parquet' (compressed binary, base64 in JSON), 'records' (array of objects), 'ndjson' (streaming newline-delimited JSON), 'arrow' (streaming Arrow IPC record batches), 'parquet_raw' (streaming binary parquet file)",
     )
 
     include_metadata: bool = Field(
@@ -173,6 +189,17 @@ class DatasetMetadata(BaseModel):
     execution_time_ms: float = Field(description="Query execution time in milliseconds")
     cached: bool = Field(description="Whether result was served from cache")
     cache_key: str | None = Field(default=None, description="Cache key used")
+    leagues: dict[str, Any] | None = Field(
+        default=None,
+        description="Per-league outcome of multi-league datasets "
+        "(successful, empty, failed, timed_out)",
+    )
+    partial: bool = Field(
+        default=False, description="Whether some leagues failed or timed out (partial result)"
+    )
+    next_cursor: str | None = Field(
+        default=None, description="Cursor for the next page (page_size/cursor requests)"
+    )
     timestamp: datetime = Field(
         default_factory=datetime.utcnow, description="Timestamp of query execution (UTC)"
     )
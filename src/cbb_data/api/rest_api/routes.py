@@ -6,19 +6,22 @@ ensuring we reuse all existing logic without duplication.
 """
 
 import io
-import json
 import logging
+import os
 import time
-from collections.abc import Generator
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 
 import pandas as pd
-from fastapi import APIRouter, HTTPException, Path, Query, status
+import pyarrow as pa
+from fastapi import APIRouter, Header, HTTPException, Path, Query, status
 from fastapi.responses import Response, StreamingResponse
 
 # Import existing library functions - NO modifications needed!
 from cbb_data.api.datasets import get_dataset, get_recent_games, list_datasets
+from cbb_data.utils.executor import BoundedExecutor, ExecutorBusyError, get_executor
+from cbb_data.utils.result_store import Page, ResultExpiredError, get_result_store
 
 # Import metrics module for /metrics endpoint
 try:
@@ -27,6 +30,12 @@ try:
         PROMETHEUS_AVAILABLE,
         generate_latest,
         get_metrics_snapshot,
+        update_adaptive_concurrency_stats,
+        update_executor_stats,
+        update_memory_cache_stats,
+        update_rate_limiter_stats,
+        update_result_store_stats,
+        update_upstream_http_stats,
     )
 
     METRICS_AVAILABLE = PROMETHEUS_AVAILABLE
@@ -35,6 +44,7 @@ except ImportError:
     generate_latest = None  # type: ignore[assignment]
     CONTENT_TYPE_LATEST = "text/plain"
 
+from .fast_json import FAST_JSON_FORMATS, DatasetJSONResponse, encode_rows
 from .models import (
     DatasetInfo,
     DatasetMetadata,
@@ -47,6 +57,7 @@ from .models import (
     LNBSeasonReadiness,
     LNBValidationStatusResponse,
 )
+from .streaming import STREAM_CHUNK_ROWS, STREAM_MEDIA_TYPES, stream_dataframe
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -54,39 +65,18 @@ logger = logging.getLogger(__name__)
 # Create router
 router = APIRouter()
 
+# Dataset execution: blocking get_dataset calls run on these pools, never on the event loop
+REST_WORKERS = int(os.getenv("CBB_REST_WORKERS", "8"))
+REST_FAST_WORKERS = int(os.getenv("CBB_REST_FAST_WORKERS", "4"))
+REST_MAX_QUEUE = int(os.getenv("CBB_REST_MAX_QUEUE", "64"))
+REST_TIMEOUT_SECONDS = float(os.getenv("CBB_REST_TIMEOUT_SECONDS", "120"))
+
 
 # ============================================================================
 # Helper Functions
 # ============================================================================
 
 
-def _generate_ndjson_stream(df: pd.DataFrame) -> Generator[str, None, None]:
-    """
-    Generate NDJSON (newline-delimited JSON) stream for DataFrame.
-
-    Each row is serialized as a JSON object on its own line.
-    This allows LLMs to process results incrementally without loading
-    entire response into memory.
-
-    Args:
-        df: Pandas DataFrame to stream
-
-    Yields:
-        JSON lines (one per row)
-
-    Example output:
-        {"name": "John", "pts": 24}
-        {"name": "Mary", "pts": 22}
-        ...
-    """
-    if df is None or df.empty:
-        return
-
-    # Convert to records (list of dicts) for efficient streaming
-    for record in df.to_dict(orient="records"):
-        yield json.dumps(record) + "\n"
-
-
 def _dataframe_to_response_data(
     df: pd.DataFrame, output_format: str
 ) -> tuple[list[Any] | str | bytes | list[dict[str, Any]], list[str] | None]:
@@ -108,6 +98,9 @@ def _dataframe_to_response_data(
         - parquet: Compressed binary (5-10x smaller, base64-encoded)
         - records: Array of objects (most readable)
         - ndjson: Newline-delimited JSON (streaming, one object per line)
+
+    query_dataset streams ndjson, arrow and parquet_raw through
+    streaming.stream_dataframe instead.
     """
     if df is None or df.empty:
         return [], []
@@ -155,6 +148,140 @@ def _dataframe_to_response_data(
     return data, columns
 
 
+def _dataset_executor(fast: bool) -> BoundedExecutor:
+    """
+    Get the pool that runs dataset work.
+
+    Requests answered from DuckDB storage use a separate "fast" pool, so cache
+    hits never queue behind slow upstream scrapes.
+    """
+    if fast:
+        return get_executor("rest-fast", REST_FAST_WORKERS, REST_MAX_QUEUE, REST_TIMEOUT_SECONDS)
+    return get_executor("rest", REST_WORKERS, REST_MAX_QUEUE, REST_TIMEOUT_SECONDS)
+
+
+def _is_stored(dataset_id: str, filters: dict[str, Any]) -> bool:
+    """
+    Check whether a request can be answered from DuckDB storage.
+
+    Only a metadata lookup (no data is read), but blocking: the first call opens
+    DuckDB, so callers run it through _run_dataset_work. Requests without a
+    single league and season, or for datasets built from other datasets, report
+    False and take the regular pool.
+    """
+    league = filters.get("league")
+    season = filters.get("season")
+    if not isinstance(league, str) or not isinstance(season, str | int):
+        return False
+    try:
+        from cbb_data.storage.duckdb_storage import get_storage
+
+        return get_storage().has_data(dataset_id, league, str(season))
+    except Exception:
+        return False
+
+
+def _open_stored_stream(
+    dataset_id: str, request: DatasetRequest
+) -> tuple[pa.RecordBatchReader, int] | None:
+    """
+    Open a streamed read of a stored partition for a streaming output format.
+
+    Only plain league + season requests (no other filters, post-filters,
+    offset or pagination) whose partition is stored and fresh qualify: their
+    answer is the stored rows as-is, so they are sent straight from DuckDB in
+    record batches without building a DataFrame. Anything else returns None
+    and goes through get_dataset (which also refreshes stale partitions).
+
+    Blocking (metadata lookups), so callers run it through _run_dataset_work.
+
+    Returns:
+        (reader, row count) or None
+    """
+    filters = request.filters
+    if (
+        set(filters) - {"league", "season"}
+        or request.to_post_filters() is not None
+        or request.offset
+        or request.page_size
+        or request.cursor
+    ):
+        return None
+    league, season = filters.get("league"), filters.get("season")
+    if not isinstance(league, str) or not isinstance(season, str | int):
+        return None
+    season = str(season)
+    try:
+        from cbb_data.storage.duckdb_storage import get_storage
+        from cbb_data.storage.freshness import get_freshness_policy
+
+        storage = get_storage()
+        rows = storage.get_row_count(dataset_id, league, season)
+        if not rows:
+            return None
+        age = storage.get_age_seconds(dataset_id, league, season)
+        if get_freshness_policy(dataset_id, league, season).is_stale(age):
+            return None
+        reader = storage.stream_arrow(
+            dataset_id, league, season, limit=request.limit, batch_size=STREAM_CHUNK_ROWS
+        )
+    except Exception as e:
+        logger.debug(f"Stored stream unavailable for {dataset_id}: {e}")
+        return None
+    if request.limit is not None:
+        rows = min(rows, request.limit)
+    return reader, rows
+
+
+def _streaming_response(
+    dataset_id: str,
+    data: pd.DataFrame | pa.RecordBatchReader | None,
+    row_count: int,
+    output_format: str,
+    accept_encoding: str | None,
+    start_time: float,
+    next_cursor: str | None = None,
+) -> StreamingResponse:
+    """Build the StreamingResponse of a streaming output format"""
+    logger.info(f"Dataset query (streaming {output_format}): {dataset_id}, {row_count} rows")
+    body, media_type, encoding = stream_dataframe(data, output_format, accept_encoding)
+    headers = {
+        "X-Dataset-ID": dataset_id,
+        "X-Row-Count": str(row_count),
+        "X-Execution-Time-MS": f"{(time.time() - start_time) * 1000:.2f}",
+        "Vary": "Accept-Encoding",
+    }
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+    return StreamingResponse(body, media_type=media_type, headers=headers)
+
+
+async def _run_dataset_work(fn: Callable[[], Any], fast: bool = False) -> Any:
+    """
+    Run blocking dataset work off the event loop.
+
+    Raises:
+        HTTPException: 503 when the pool's queue is full, 504 on timeout
+    """
+    executor = _dataset_executor(fast)
+    try:
+        return await executor.run(fn)
+    except ExecutorBusyError as e:
+        logger.warning(str(e))
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server busy - too many queued dataset requests, retry shortly",
+            headers={"Retry-After": "5"},
+        ) from e
+    except TimeoutError as e:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail=f"Dataset request timed out after {executor.default_timeout:.0f}s",
+        ) from e
+
+
 # ============================================================================
 # Health Check Endpoint
 # ============================================================================
@@ -237,7 +364,7 @@ async def list_all_datasets() -> DatasetsListResponse:
     "/datasets/{dataset_id}",
     tags=["Datasets"],
     summary="Query a dataset",
-    description="Fetch data from a specific dataset with filters. Supports streaming with output_format=ndjson",
+    description="Fetch data from a specific dataset with filters. Supports streaming with output_format=ndjson, arrow or parquet_raw (zstd/gzip via Accept-Encoding)",
     response_model=None,  # Disable auto-model due to StreamingResponse union
 )
 async def query_dataset(
@@ -247,7 +374,10 @@ async def query_dataset(
         examples=["player_game", "schedule", "play_by_play"],
     ),
     request: DatasetRequest = DatasetRequest(),
-) -> StreamingResponse | DatasetResponse:
+    accept_encoding: str | None = Header(
+        default=None, description="Compression for streamed formats (zstd, gzip)"
+    ),
+) -> StreamingResponse | DatasetJSONResponse | DatasetResponse:
     """
     Query a dataset with filters.
 
@@ -262,9 +392,25 @@ async def query_dataset(
     Returns:
         Dataset rows with optional metadata
 
+    Streaming: ndjson, arrow (Arrow IPC stream) and parquet_raw (binary
+    parquet) are sent in row chunks as they are encoded; ndjson and arrow are
+    zstd/gzip-compressed when the client's Accept-Encoding allows it. A plain
+    league + season request for a stored, fresh partition is streamed straight
+    from DuckDB in record batches (_open_stored_stream); everything else is
+    built by get_dataset first and then streamed from the DataFrame.
+
+    json and records rows are encoded straight from the DataFrame
+    (fast_json.encode_rows) instead of being validated cell by cell through
+    the DatasetResponse model; the response schema is unchanged.
+
+    Pagination: with page_size set, the first call returns one page and keeps
+    the full result server-side; pass metadata.next_cursor as ``cursor`` to
+    read the next page without re-running the query.
+
     Raises:
         400: Invalid filters or dataset ID
         404: Dataset not found
+        410: Cursor expired (re-run the query)
         500: Internal server error
     """
     start_time = time.time()
@@ -276,56 +422,111 @@ async def query_dataset(
         # Convert post-filter fields to DatasetFilter object
         post_filters = request.to_post_filters()
 
-        # Call existing get_dataset() function with post-filters
-        df = get_dataset(
-            grouping=dataset_id,
-            filters=request.filters,
-            columns=None,  # Return all columns
-            limit=request.limit,
-            as_format="pandas",  # We'll convert to requested format
-            name_resolver=None,  # Use default name resolution
-            force_fresh=False,  # Use cache when available
-            post_filters=post_filters,  # Apply name/date/segment filters
+        def execute() -> tuple[pd.DataFrame, Any, Any, Page | None]:
+            page = None
+            if request.cursor:
+                # Next page of a stored result: O(page) read, no refetch
+                page = get_result_store().page(request.cursor, request.page_size)
+                df = page.frame
+            else:
+                # Call existing get_dataset() function with post-filters
+                df = get_dataset(
+                    grouping=dataset_id,
+                    filters=request.filters,
+                    columns=None,  # Return all columns
+                    limit=request.limit,
+                    as_format="pandas",  # We'll convert to requested format
+                    name_resolver=None,  # Use default name resolution
+                    force_fresh=False,  # Use cache when available
+                    post_filters=post_filters,  # Apply name/date/segment filters
+                )
+
+                # Handle pagination with offset
+                if request.offset and request.offset > 0:
+                    df = df.iloc[request.offset :]
+
+                # Keep the rest server-side for cursor reads
+                if request.page_size and df is not None:
+                    page = get_result_store().paginate(df, request.page_size)
+                    df = page.frame
+
+            if request.output_format in STREAM_MEDIA_TYPES:
+                # Encoded chunk by chunk while the response streams
+                return df, None, None, page
+            if request.output_format in FAST_JSON_FORMATS:
+                # Pre-encoded JSON bytes: no per-row model validation
+                body, columns = encode_rows(df, request.output_format)
+                return df, body, columns, page
+            # Convert DataFrame to response format (non-streaming)
+            data, columns = _dataframe_to_response_data(df, request.output_format)
+            return df, data, columns, page
+
+        # Fetch and serialize on the dataset pool (the event loop stays free)
+        # The storage lookup may open DuckDB (and migrate it) on first use: off the loop too
+        fast = bool(request.cursor) or await _run_dataset_work(
+            lambda: _is_stored(dataset_id, request.filters), fast=True
         )
 
-        # Handle pagination with offset
-        if request.offset and request.offset > 0:
-            df = df.iloc[request.offset :]
-
-        # Check if NDJSON streaming is requested
-        if request.output_format == "ndjson":
-            # Return streaming response for NDJSON
-            logger.info(
-                f"Dataset query (streaming): {dataset_id}, "
-                f"{len(df) if df is not None else 0} rows"
+        # Stored partitions stream straight from DuckDB in record batches
+        if fast and request.output_format in STREAM_MEDIA_TYPES:
+            stored = await _run_dataset_work(
+                lambda: _open_stored_stream(dataset_id, request), fast=True
             )
-            return StreamingResponse(
-                _generate_ndjson_stream(df),
-                media_type="application/x-ndjson",
-                headers={
-                    "X-Dataset-ID": dataset_id,
-                    "X-Row-Count": str(len(df) if df is not None else 0),
-                    "X-Execution-Time-MS": f"{(time.time() - start_time) * 1000:.2f}",
-                },
+            if stored is not None:
+                reader, row_count = stored
+                return _streaming_response(
+                    dataset_id,
+                    reader,
+                    row_count,
+                    request.output_format,
+                    accept_encoding,
+                    start_time,
+                )
+
+        df, data, columns, page = await _run_dataset_work(execute, fast=fast)
+
+        # Per-league outcome of multi-league datasets (prospect_player_season)
+        attrs = page.meta if page is not None else (df.attrs if df is not None else {})
+        league_report = attrs.get("leagues")
+        next_cursor = page.next_cursor if page is not None else None
+        total_rows = page.total_rows if page is not None else (len(df) if df is not None else 0)
+
+        # Streaming formats (ndjson, arrow, parquet_raw)
+        if request.output_format in STREAM_MEDIA_TYPES:
+            return _streaming_response(
+                dataset_id,
+                df,
+                len(df) if df is not None else 0,
+                request.output_format,
+                accept_encoding,
+                start_time,
+                next_cursor,
             )
 
-        # Convert DataFrame to response format (non-streaming)
-        data, columns = _dataframe_to_response_data(df, request.output_format)
-
         # Calculate execution time
         execution_time = (time.time() - start_time) * 1000
 
         # Build metadata if requested
+        fast_json = request.output_format in FAST_JSON_FORMATS
+        if fast_json:
+            row_count = len(df) if df is not None else 0
+        else:
+            row_count = len(data) if isinstance(data, list) else 0
         metadata = None
         if request.include_metadata:
             metadata = DatasetMetadata(
                 dataset_id=dataset_id,
                 filters_applied=request.filters,
-                row_count=len(data) if isinstance(data, list) else 0,
-                total_rows=len(df) if df is not None else 0,
+                row_count=row_count,
+                total_rows=total_rows,
                 execution_time_ms=round(execution_time, 2),
                 cached=execution_time < 100,  # Heuristic: <100ms likely cached
                 cache_key=None,  # Not exposed in current implementation
+                leagues=league_report,
+                partial=bool(
+                    league_report and (league_report["failed"] or league_report["timed_out"])
+                ),
+                next_cursor=next_cursor,
                 timestamp=datetime.utcnow(),
             )
 
@@ -335,8 +536,19 @@ async def query_dataset(
             f"{execution_time:.2f}ms"
         )
 
+        if fast_json:
+            return DatasetJSONResponse(data, columns, metadata)
         return DatasetResponse(data=data, columns=columns, metadata=metadata)
 
+    except HTTPException:
+        # Busy (503) / timeout (504) from the dataset pool
+        raise
+
+    except ResultExpiredError as e:
+        # Cursor of an expired/evicted result: the client has to re-run the query
+        logger.info(f"Expired cursor for {dataset_id}: {request.cursor}")
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail=str(e)) from e
+
     except KeyError as e:
         # Dataset not found
         logger.warning(f"Dataset not found: {dataset_id}")
@@ -382,7 +594,7 @@ async def get_recent_games_endpoint(
         description="Output format (json, csv, parquet, records, ndjson)",
         pattern="^(json|csv|parquet|records|ndjson)$",
     ),
-) -> DatasetResponse:
+) -> DatasetJSONResponse | DatasetResponse:
     """
     Get recent games for a league.
 
@@ -412,13 +624,24 @@ async def get_recent_games_endpoint(
         if teams:
             teams_list = [t.strip() for t in teams.split(",")]
 
-        # Call existing get_recent_games() function - NO CHANGES!
-        df = get_recent_games(
-            league=league, days=days, teams=teams_list, Division=division, force_fresh=False
-        )
+        def execute() -> tuple[pd.DataFrame, Any, Any]:
+            # Call existing get_recent_games() function - NO CHANGES!
+            df = get_recent_games(
+                league=league, days=days, teams=teams_list, Division=division, force_fresh=False
+            )
+
+            # Convert to response format
+            if output_format in FAST_JSON_FORMATS:
+                body, columns = encode_rows(df, output_format)
+                return df, body, columns
+            data, columns = _dataframe_to_response_data(df, output_format)
+            return df, data, columns
 
-        # Convert to response format
-        data, columns = _dataframe_to_response_data(df, output_format)
+        df, data, columns = await _run_dataset_work(execute)
+        if output_format in FAST_JSON_FORMATS:
+            row_count = len(df) if df is not None else 0
+        else:
+            row_count = len(data) if isinstance(data, list) else 0
 
         # Calculate execution time
         execution_time = (time.time() - start_time) * 1000
@@ -432,15 +655,20 @@ async def get_recent_games_endpoint(
                 "teams": teams_list,
                 "division": division,
             },
-            row_count=len(data) if isinstance(data, list) else 0,
+            row_count=row_count,
             total_rows=len(df) if df is not None else 0,
             execution_time_ms=round(execution_time, 2),
             cached=execution_time < 100,
             timestamp=datetime.utcnow(),
         )
 
+        if output_format in FAST_JSON_FORMATS:
+            return DatasetJSONResponse(data, columns, metadata)
         return DatasetResponse(data=data, columns=columns, metadata=metadata)
 
+    except HTTPException:
+        raise
+
     except Exception as e:
         logger.error(f"Error fetching recent games for {league}: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -1068,6 +1296,9 @@ async def get_metrics() -> Response:
         - cbb_tool_latency_ms: Tool execution latency histograms
         - cbb_rows_returned: Rows returned histograms
         - cbb_duckdb_size_mb: DuckDB cache size gauge
+        - cbb_memory_cache_*: In-memory cache entries, bytes, hits/misses/evictions
+        - cbb_executor_*: Dataset pool queue depth, running tasks, timeouts, rejections
+        - cbb_result_store: Stored paginated results, spills, evictions, page reads
         - cbb_request_total: HTTP request counters
         - cbb_request_duration_seconds: Request duration histograms
         - cbb_error_total: Error counters
@@ -1085,7 +1316,13 @@ async def get_metrics() -> Response:
         )
 
     try:
-        # Generate Prometheus metrics text format
+        # Refresh scrape-time gauges, then generate Prometheus metrics text format
+        update_memory_cache_stats()
+        update_upstream_http_stats()
+        update_executor_stats()
+        update_result_store_stats()
+        update_rate_limiter_stats()
+        update_adaptive_concurrency_stats()
         metrics_data = generate_latest()
         return Response(content=metrics_data, media_type=CONTENT_TYPE_LATEST)
 
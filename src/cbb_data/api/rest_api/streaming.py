@@ -0,0 +1,266 @@
+"""
+Streaming encoders for large REST results.
+
+The JSON response formats build the whole payload before sending anything
+(parquet even goes through base64). For PBP and shot exports of several
+hundred thousand rows the encoders here yield the result in row chunks
+instead, so the first bytes go out right away and the encoded output never
+exists in full in memory.
+
+Sources are either a DataFrame (sent in row chunks) or an Arrow
+RecordBatchReader (sent batch by batch as it is read). Stored partitions are
+streamed from DuckDBStorage.stream_arrow, so neither the result nor its
+encoding is ever held in full.
+
+Key Features:
+- arrow: Arrow IPC stream (application/vnd.apache.arrow.stream), one record
+  batch per chunk, one schema for the whole stream
+- ndjson: NDJSON encoded per chunk with pandas' vectorized JSON writer
+  (NaN -> null, timestamps as ISO 8601)
+- parquet_raw: a binary parquet file (application/vnd.apache.parquet), one
+  row group per chunk, the footer last
+- Content-Encoding negotiation (zstd, gzip) from Accept-Encoding, compressed
+  as a stream and flushed per chunk. Parquet is not re-compressed: its pages
+  are already zstd-compressed
+
+Configuration (environment):
+- CBB_STREAM_CHUNK_ROWS: Rows per chunk / batch / row group (default 10000)
+
+Usage:
+    from cbb_data.api.rest_api.streaming import stream_dataframe
+
+    body, media_type, encoding = stream_dataframe(df, "arrow", "gzip, zstd")
+    body, media_type, encoding = stream_dataframe(storage.stream_arrow(...), "ndjson")
+    return StreamingResponse(body, media_type=media_type, headers={"Content-Encoding": encoding})
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import os
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+STREAM_CHUNK_ROWS = int(os.getenv("CBB_STREAM_CHUNK_ROWS", "10000"))
+
+# output_format -> media type
+STREAM_MEDIA_TYPES = {
+    "arrow": "application/vnd.apache.arrow.stream",
+    "ndjson": "application/x-ndjson",
+    "parquet_raw": "application/vnd.apache.parquet",
+}
+
+# Content-Encodings we can produce, in server preference order
+SUPPORTED_ENCODINGS = tuple(c for c in ("zstd", "gzip") if pa.Codec.is_available(c))
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that buffers writes until drained"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._parts: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        chunk = bytes(data)
+        self._parts.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
+
+def _chunks(df: pd.DataFrame, chunk_rows: int) -> Iterator[pd.DataFrame]:
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start : start + chunk_rows]
+
+
+def _arrow_schema(df: pd.DataFrame) -> tuple[pd.DataFrame, pa.Schema]:
+    """Infer one schema for the whole frame (chunks alone may infer differently)"""
+    try:
+        return df, pa.Schema.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed-type object columns (scraped data): send them as strings
+        objects = df.select_dtypes(include="object").columns
+        df = df.astype(dict.fromkeys(objects, str))
+        return df, pa.Schema.from_pandas(df, preserve_index=False)
+
+
+def _record_batches(
+    data: pd.DataFrame | pa.RecordBatchReader | None, chunk_rows: int
+) -> tuple[pa.Schema, Iterator[pa.RecordBatch]]:
+    """Schema and record batches of a stream source (readers pass through)"""
+    if isinstance(data, pa.RecordBatchReader):
+        return data.schema, iter(data)
+    df, schema = _arrow_schema(pd.DataFrame() if data is None else data)
+    batches = (
+        pa.RecordBatch.from_pandas(chunk, schema=schema, preserve_index=False)
+        for chunk in _chunks(df, chunk_rows)
+    )
+    return schema, batches
+
+
+def iter_ndjson(
+    data: pd.DataFrame | pa.RecordBatchReader | None, chunk_rows: int | None = None
+) -> Iterator[bytes]:
+    """Encode a DataFrame or record batches as NDJSON, one vectorized chunk at a time"""
+    if isinstance(data, pa.RecordBatchReader):
+        chunks: Iterator[pd.DataFrame] = (batch.to_pandas() for batch in data)
+    elif data is None or data.empty:
+        return
+    else:
+        chunks = _chunks(data, chunk_rows or STREAM_CHUNK_ROWS)
+    for chunk in chunks:
+        if chunk.empty:
+            continue
+        text = chunk.to_json(orient="records", lines=True, date_format="iso")
+        yield (text if text.endswith("\n") else text + "\n").encode()
+
+
+def iter_arrow_stream(
+    data: pd.DataFrame | pa.RecordBatchReader | None, chunk_rows: int | None = None
+) -> Iterator[bytes]:
+    """Encode a DataFrame or record batches as an Arrow IPC stream"""
+    schema, batches = _record_batches(data, chunk_rows or STREAM_CHUNK_ROWS)
+    sink = _ChunkSink()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        yield sink.drain()  # schema message
+        for batch in batches:
+            writer.write_batch(batch)
+            yield sink.drain()
+    yield sink.drain()  # end-of-stream marker
+
+
+def iter_parquet(
+    data: pd.DataFrame | pa.RecordBatchReader | None, chunk_rows: int | None = None
+) -> Iterator[bytes]:
+    """Encode a DataFrame or record batches as a parquet file, one row group per chunk"""
+    import pyarrow.parquet as pq
+
+    schema, batches = _record_batches(data, chunk_rows or STREAM_CHUNK_ROWS)
+    sink = _ChunkSink()
+    with pq.ParquetWriter(sink, schema, compression="zstd") as writer:
+        for batch in batches:
+            writer.write_table(pa.Table.from_batches([batch], schema=schema))
+            yield sink.drain()
+    yield sink.drain()  # footer
+
+
+def negotiate_encoding(accept_encoding: Any) -> str | None:
+    """
+    Pick a Content-Encoding from an Accept-Encoding header.
+
+    Args:
+        accept_encoding: Header value, e.g. "gzip, zstd;q=1.0, br;q=0.5"
+
+    Returns:
+        "zstd" or "gzip" (highest client q-value, server order on ties), or
+        None for an identity response
+    """
+    if not isinstance(accept_encoding, str) or not accept_encoding.strip():
+        return None
+
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[name.strip().lower()] = q
+
+    best, best_q = None, 0.0
+    for encoding in SUPPORTED_ENCODINGS:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def compress_stream(chunks: Iterator[bytes], encoding: str | None) -> Iterator[bytes]:
+    """
+    Compress a byte stream, flushing after every chunk.
+
+    Args:
+        chunks: Uncompressed chunks
+        encoding: "zstd", "gzip" or None (pass through)
+
+    Yields:
+        Compressed chunks forming one zstd frame / gzip member
+    """
+    if encoding is None:
+        yield from chunks
+        return
+
+    sink = _ChunkSink()
+    stream = pa.CompressedOutputStream(pa.PythonFile(sink, mode="w"), encoding)
+    try:
+        for chunk in chunks:
+            if not chunk:
+                continue
+            stream.write(chunk)
+            stream.flush()
+            yield sink.drain()
+    finally:
+        stream.close()
+    yield sink.drain()
+
+
+_ENCODERS: dict[
+    str, Callable[[pd.DataFrame | pa.RecordBatchReader | None, int | None], Iterator[bytes]]
+] = {
+    "arrow": iter_arrow_stream,
+    "ndjson": iter_ndjson,
+    "parquet_raw": iter_parquet,
+}
+
+
+def stream_dataframe(
+    df: pd.DataFrame | pa.RecordBatchReader | None,
+    output_format: str,
+    accept_encoding: Any = None,
+    chunk_rows: int | None = None,
+) -> tuple[Iterator[bytes], str, str | None]:
+    """
+    Build a streaming body for a DataFrame or an Arrow RecordBatchReader.
+
+    Args:
+        df: Result to stream; a RecordBatchReader is read one batch per chunk
+            (chunk_rows does not apply)
+        output_format: "arrow", "ndjson" or "parquet_raw"
+        accept_encoding: Client Accept-Encoding header (None = no compression)
+        chunk_rows: Rows per chunk of a DataFrame (default: STREAM_CHUNK_ROWS)
+
+    Returns:
+        (body iterator, media type, Content-Encoding or None)
+
+    Raises:
+        ValueError: If output_format is not a streaming format
+    """
+    encoder = _ENCODERS.get(output_format)
+    if encoder is None:
+        raise ValueError(f"Unsupported streaming format: {output_format}")
+
+    encoding = None if output_format == "parquet_raw" else negotiate_encoding(accept_encoding)
+    body = compress_stream(encoder(df, chunk_rows), encoding)
+    return body, STREAM_MEDIA_TYPES[output_format], encoding
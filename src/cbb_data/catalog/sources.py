@@ -62,6 +62,8 @@ class LeagueSourceConfig:
         pbp_source: Source for play-by-play data
         shots_source: Source for shot chart data
         fetch_schedule: Function to fetch schedule/game results
+            (fetch_* attributes are usually LazyFetcher references that import
+            the fetcher module on first call)
         fetch_player_season: Function to fetch player season stats
         fetch_team_season: Function to fetch team season stats
         fetch_player_game: Function to fetch player per-game box scores
@@ -93,8 +95,7 @@ class LeagueSourceConfig:
 # ==============================================================================
 # League Source Registry
 # ==============================================================================
-# This will be populated after all fetchers are imported to avoid circular imports
-# See _register_league_sources() below
+# Populated by _register_league_sources() below (fetchers are referenced lazily)
 LEAGUE_SOURCES: dict[str, LeagueSourceConfig] = {}
 
 
@@ -162,8 +163,9 @@ def register_league_source(config: LeagueSourceConfig) -> None:
 def _register_league_sources() -> None:
     """Register all league source configurations
 
-    Called after all fetcher modules are imported to avoid circular dependencies.
-    This function should be called from api/datasets.py after imports.
+    Fetch functions are registered as LazyFetcher references, so building the
+    registry imports no fetcher module; each module is imported the first time
+    one of its functions is called. Called from api/datasets.py at import.
 
     **Phase 2 Status (Current)** - Updated 2025-11-19:
     - NCAA-MBB/WBB: ESPN API (fully functional)
@@ -183,29 +185,31 @@ def _register_league_sources() -> None:
     - Tier 1 (Secondary): CEBL, NZ-NBL, LNB_PROA, ACB, NBL - COMPLETE
     - Tier 2 (Development): NJCAA, NAIA, USPORTS, CCAA, ABA/BAL/BCL - COMPLETE
     """
-    from ..fetchers import (
-        aba,
-        acb,
-        bal,
-        bcl,
-        cbbpy_mbb,  # NCAA MBB box scores, PBP via cbbpy
-        cbbpy_wbb,  # NCAA WBB box scores, PBP via cbbpy
-        ccaa,  # CCAA (Canada) via PrestoSports
-        cebl,  # CEBL via ceblpy + FIBA LiveStats
-        espn_mbb,  # NCAA Men's Basketball via ESPN API
-        espn_wbb,  # NCAA Women's Basketball via ESPN API
-        euroleague,  # EuroLeague/EuroCup via euroleague-api package
-        gleague,  # G-League via NBA Stats API
-        lkl,
-        lnb,
-        naia,  # NAIA (USA) via PrestoSports
-        nbl_official,  # NBL Australia via nblR R package
-        njcaa,  # NJCAA (USA) via PrestoSports
-        nz_nbl_fiba,  # NZ NBL via FIBA LiveStats HTML scraping
-        ote,  # Overtime Elite via web scraping
-        usports,  # U SPORTS (Canada) via PrestoSports
-        wnba,  # WNBA via NBA Stats API
-    )
+    # Lazy references: fetcher modules (and their optional dependencies) are
+    # imported on first call, not when the registry is built
+    from ..utils.lazy_import import lazy_refs
+
+    aba = lazy_refs("cbb_data.fetchers.aba")
+    acb = lazy_refs("cbb_data.fetchers.acb")
+    bal = lazy_refs("cbb_data.fetchers.bal")
+    bcl = lazy_refs("cbb_data.fetchers.bcl")
+    cbbpy_mbb = lazy_refs("cbb_data.fetchers.cbbpy_mbb")  # NCAA MBB box scores, PBP via cbbpy
+    cbbpy_wbb = lazy_refs("cbb_data.fetchers.cbbpy_wbb")  # NCAA WBB box scores, PBP via cbbpy
+    ccaa = lazy_refs("cbb_data.fetchers.ccaa")  # CCAA (Canada) via PrestoSports
+    cebl = lazy_refs("cbb_data.fetchers.cebl")  # CEBL via ceblpy + FIBA LiveStats
+    espn_mbb = lazy_refs("cbb_data.fetchers.espn_mbb")  # NCAA Men's Basketball via ESPN API
+    espn_wbb = lazy_refs("cbb_data.fetchers.espn_wbb")  # NCAA Women's Basketball via ESPN API
+    euroleague = lazy_refs("cbb_data.fetchers.euroleague")  # EuroLeague/EuroCup (euroleague-api)
+    gleague = lazy_refs("cbb_data.fetchers.gleague")  # G-League via NBA Stats API
+    lkl = lazy_refs("cbb_data.fetchers.lkl")
+    lnb = lazy_refs("cbb_data.fetchers.lnb")
+    naia = lazy_refs("cbb_data.fetchers.naia")  # NAIA (USA) via PrestoSports
+    nbl_official = lazy_refs("cbb_data.fetchers.nbl_official")  # NBL Australia via nblR R package
+    njcaa = lazy_refs("cbb_data.fetchers.njcaa")  # NJCAA (USA) via PrestoSports
+    nz_nbl_fiba = lazy_refs("cbb_data.fetchers.nz_nbl_fiba")  # NZ NBL via FIBA LiveStats HTML
+    ote = lazy_refs("cbb_data.fetchers.ote")  # Overtime Elite via web scraping
+    usports = lazy_refs("cbb_data.fetchers.usports")  # U SPORTS (Canada) via PrestoSports
+    wnba = lazy_refs("cbb_data.fetchers.wnba")  # WNBA via NBA Stats API
 
     # ==========================================================================
     # Fully Functional Leagues (Phase 2 Complete)
@@ -767,5 +771,4 @@ def _register_league_sources() -> None:
 # Initialization
 # ==============================================================================
 
-# Note: _register_league_sources() will be called from api/datasets.py after all imports
-# to avoid circular dependency issues. Do not call it here.
+# Note: _register_league_sources() is called from api/datasets.py. Do not call it here.
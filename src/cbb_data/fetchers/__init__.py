@@ -1,29 +1,40 @@
-"""Data fetchers for various basketball data sources"""
-
-from . import (
-    aba,
-    acb,
-    bal,
-    base,
-    bcl,
-    cebl,
-    espn_mbb,
-    espn_wbb,
-    euroleague,
-    gleague,
-    html_tables,
-    lkl,
-    lnb,
-    nbl,
-    nbl_official,
-    nz_nbl_fiba,
-    ote,
-    prestosports,
-    wnba,
-)
-
-# Export shared error class for convenience
-from .base import DataUnavailableError
+"""Data fetchers for various basketball data sources
+
+Fetcher modules are imported on first access (``fetchers.espn_mbb`` or
+``from cbb_data.fetchers import lnb``), so importing this package does not
+load every league's dependencies.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import (
+        aba,
+        acb,
+        bal,
+        base,
+        bcl,
+        cebl,
+        espn_mbb,
+        espn_wbb,
+        euroleague,
+        gleague,
+        html_tables,
+        lkl,
+        lnb,
+        nbl,
+        nbl_official,
+        nz_nbl_fiba,
+        ote,
+        prestosports,
+        wnba,
+    )
+
+    # Export shared error class for convenience
+    from .base import DataUnavailableError
 
 __all__ = [
     "aba",
@@ -47,3 +58,19 @@ __all__ = [
     "prestosports",
     "wnba",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import fetcher submodules on first access (PEP 562)"""
+    if name == "DataUnavailableError":
+        from .base import DataUnavailableError
+
+        return DataUnavailableError
+    if name.startswith("_"):
+        raise AttributeError(name)
+    try:
+        return importlib.import_module(f"{__name__}.{name}")
+    except ModuleNotFoundError as e:
+        if e.name != f"{__name__}.{name}":
+            raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
@@ -73,6 +73,7 @@ from .base import cached_dataframe, retry_on_error
 from .fiba_html_common import (
     load_fiba_game_index,
     scrape_fiba_box_score,
+    scrape_fiba_games,
     scrape_fiba_play_by_play,
     scrape_fiba_shot_chart,
 )
@@ -210,36 +211,27 @@ def fetch_player_game(season: str = "2023-24", force_refresh: bool = False) -> p
     # Scrape player stats for each game
     all_player_stats = []
 
-    for _, game_row in schedule.iterrows():
-        game_id = game_row["GAME_ID"]
-
-        try:
-            # Scrape box score using shared FIBA HTML scraper
-            box_score = scrape_fiba_box_score(
-                league_code=FIBA_LEAGUE_CODE,
-                game_id=str(game_id),
-                league=LEAGUE,
-                season=season,
-                force_refresh=force_refresh,
-            )
-
-            if not box_score.empty:
-                # Add game identifier
-                box_score["GAME_ID"] = game_id
-
-                # Generate player IDs (TEAM_PLAYERNAME format)
-                box_score["PLAYER_ID"] = (
-                    box_score["TEAM"].str[:3] + "_" + box_score["PLAYER_NAME"].str.replace(" ", "_")
-                )
+    games = scrape_fiba_games(
+        scrape_fiba_box_score,
+        FIBA_LEAGUE_CODE,
+        schedule["GAME_ID"],
+        league=LEAGUE,
+        season=season,
+        force_refresh=force_refresh,
+    )
+    for game_id, box_score in games:
+        # Add game identifier
+        box_score["GAME_ID"] = game_id
 
-                # Ensure team ID
-                box_score["TEAM_ID"] = box_score["TEAM"]
+        # Generate player IDs (TEAM_PLAYERNAME format)
+        box_score["PLAYER_ID"] = (
+            box_score["TEAM"].str[:3] + "_" + box_score["PLAYER_NAME"].str.replace(" ", "_")
+        )
 
-                all_player_stats.append(box_score)
+        # Ensure team ID
+        box_score["TEAM_ID"] = box_score["TEAM"]
 
-        except Exception as e:
-            logger.warning(f"Failed to scrape {LEAGUE} game {game_id}: {e}")
-            continue
+        all_player_stats.append(box_score)
 
     # Combine all games
     if not all_player_stats:
@@ -395,26 +387,17 @@ def fetch_pbp(season: str = "2023-24", force_refresh: bool = False) -> pd.DataFr
     # Scrape PBP for each game
     all_pbp = []
 
-    for _, game_row in schedule.iterrows():
-        game_id = game_row["GAME_ID"]
-
-        try:
-            # Scrape PBP using shared FIBA HTML scraper
-            pbp = scrape_fiba_play_by_play(
-                league_code=FIBA_LEAGUE_CODE,
-                game_id=str(game_id),
-                league=LEAGUE,
-                season=season,
-                force_refresh=force_refresh,
-            )
-
-            if not pbp.empty:
-                pbp["GAME_ID"] = game_id
-                all_pbp.append(pbp)
-
-        except Exception as e:
-            logger.warning(f"Failed to scrape {LEAGUE} PBP for game {game_id}: {e}")
-            continue
+    games = scrape_fiba_games(
+        scrape_fiba_play_by_play,
+        FIBA_LEAGUE_CODE,
+        schedule["GAME_ID"],
+        league=LEAGUE,
+        season=season,
+        force_refresh=force_refresh,
+    )
+    for game_id, pbp in games:
+        pbp["GAME_ID"] = game_id
+        all_pbp.append(pbp)
 
     # Combine all games
     if not all_pbp:
@@ -458,23 +441,17 @@ def fetch_shot_chart(
         logger.warning(f"No schedule available for {LEAGUE} {season}")
         return pd.DataFrame()
 
-    all_shots = []
-    for _, game_row in schedule.iterrows():
-        game_id = game_row["GAME_ID"]
-        try:
-            shots = scrape_fiba_shot_chart(
-                league_code=FIBA_LEAGUE_CODE,
-                game_id=str(game_id),
-                league=LEAGUE,
-                season=season,
-                use_browser=use_browser,
-                debug_html=debug_html,
-            )
-            if not shots.empty:
-                all_shots.append(shots)
-        except Exception as e:
-            logger.warning(f"Failed to scrape {LEAGUE} shots for game {game_id}: {e}")
-            continue
+    games = scrape_fiba_games(
+        scrape_fiba_shot_chart,
+        FIBA_LEAGUE_CODE,
+        schedule["GAME_ID"],
+        max_workers=1 if use_browser else None,  # one browser at a time
+        league=LEAGUE,
+        season=season,
+        use_browser=use_browser,
+        debug_html=debug_html,
+    )
+    all_shots = [shots for _, shots in games]
 
     if not all_shots:
         logger.warning(f"No shot data for {LEAGUE} {season}. Try use_browser=True if HTTP blocked.")
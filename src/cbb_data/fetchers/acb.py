@@ -546,12 +546,13 @@ def fetch_acb_schedule(
         logger.info(f"ACB season {season} → temporada parameter = {temporada}")
 
         # Fetch calendar page - new React SPA at /es/calendario
-        import requests
         from bs4 import BeautifulSoup
 
+        from ..utils.http_transport import http_get
+
         url = f"{ACB_BASE_URL}/es/calendario?temporada={temporada}"
         headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
-        resp = requests.get(url, headers=headers, timeout=30)
+        resp = http_get(url, source="acb", headers=headers, timeout=30)
         resp.raise_for_status()
         soup = BeautifulSoup(resp.content, "html.parser")
 
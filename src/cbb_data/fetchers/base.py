@@ -2,6 +2,8 @@
 
 This module provides the core infrastructure for all data fetchers:
 - TTL-based caching (memory + optional Redis)
+- Pluggable binary codecs for cached DataFrames (Arrow IPC by default)
+- Bounded memory tier (LRU by entry count and bytes) with background TTL sweeping
 - Retry logic with exponential backoff
 - Rate limiting hooks
 - Error handling and logging
@@ -11,24 +13,36 @@ from __future__ import annotations
 
 import functools
 import hashlib
+import importlib.util
 import json
 import logging
 import os
+import struct
+import threading
 import time
+import weakref
+from collections import OrderedDict
 from collections.abc import Callable
-from io import StringIO
+from io import BytesIO, StringIO
 from typing import Any, TypeVar
 
 import pandas as pd
 
-# Try to import Redis; it's optional
+from ..utils.single_flight import get_single_flight
+
+# Redis is optional; it is only imported when the Redis tier is enabled
+REDIS_AVAILABLE = importlib.util.find_spec("redis") is not None
+
+# Try to import PyArrow; without it DataFrames fall back to the JSON codec
 try:
-    import redis
+    import pyarrow as pa
+    import pyarrow.parquet as pq
 
-    REDIS_AVAILABLE = True
+    PYARROW_AVAILABLE = True
 except ImportError:
-    redis = None  # type: ignore[assignment]
-    REDIS_AVAILABLE = False
+    pa = None  # type: ignore[assignment]
+    pq = None  # type: ignore[assignment]
+    PYARROW_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(
@@ -68,26 +82,235 @@ class DataUnavailableError(RuntimeError):
         self.league = league
 
 
+# ==============================================================================
+# Cache Codecs
+# ==============================================================================
+
+
+class CacheCodec:
+    """Base class for cache value codecs
+
+    A codec turns a cached value into bytes and back. Every encoded payload is
+    prefixed with the codec's one-byte ``tag`` so the cache can pick the right
+    decoder on read, even if the configured DataFrame codec changed since the
+    entry was written.
+    """
+
+    name: str = ""
+    tag: bytes = b""
+
+    def encode(self, value: Any) -> bytes:
+        raise NotImplementedError
+
+    def decode(self, payload: bytes) -> Any:
+        raise NotImplementedError
+
+
+class JSONValueCodec(CacheCodec):
+    """JSON codec for plain values (dicts, lists, scalars)"""
+
+    name = "json-value"
+    tag = b"J"
+
+    def encode(self, value: Any) -> bytes:
+        return json.dumps(value, default=str).encode("utf-8")
+
+    def decode(self, payload: bytes) -> Any:
+        return json.loads(payload.decode("utf-8"))
+
+
+class JSONFrameCodec(CacheCodec):
+    """Legacy DataFrame codec using ``to_json(orient="split")``
+
+    Kept as a fallback when PyArrow is unavailable or a frame holds objects
+    Arrow cannot represent. Loses dtypes (datetimes, categoricals, nullable ints).
+    """
+
+    name = "json"
+    tag = b"S"
+
+    def encode(self, value: pd.DataFrame) -> bytes:
+        text: str = value.to_json(orient="split")
+        return text.encode("utf-8")
+
+    def decode(self, payload: bytes) -> pd.DataFrame:
+        # Use StringIO to avoid pandas FutureWarning about passing literal JSON
+        return pd.read_json(StringIO(payload.decode("utf-8")), orient="split")
+
+
+class ArrowIPCCodec(CacheCodec):
+    """DataFrame codec using the Arrow IPC stream format
+
+    Preserves pandas dtypes (datetimes, categoricals, nullable ints) through the
+    pandas metadata Arrow stores alongside the schema. Decoding is close to a
+    memcpy, which makes this the fastest option for repeated cache hits.
+    """
+
+    name = "arrow"
+    tag = b"A"
+
+    def __init__(self, compression: str | None = "zstd"):
+        """
+        Args:
+            compression: IPC buffer compression ("zstd", "lz4" or None)
+        """
+        self.compression = compression
+
+    def encode(self, value: pd.DataFrame) -> bytes:
+        table = pa.Table.from_pandas(value)
+        sink = pa.BufferOutputStream()
+        options = pa.ipc.IpcWriteOptions(compression=self.compression)
+        with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+            writer.write_table(table)
+        return bytes(sink.getvalue().to_pybytes())
+
+    def decode(self, payload: bytes) -> pd.DataFrame:
+        table = pa.ipc.open_stream(pa.py_buffer(payload)).read_all()
+        df: pd.DataFrame = table.to_pandas()
+        return df
+
+
+class ParquetCodec(CacheCodec):
+    """DataFrame codec using Parquet
+
+    Smaller than Arrow IPC for wide, repetitive tables (PBP, shots) at the cost
+    of slower encode/decode. Useful when Redis memory is the constraint.
+    """
+
+    name = "parquet"
+    tag = b"P"
+
+    def __init__(self, compression: str | None = "zstd"):
+        """
+        Args:
+            compression: Parquet compression ("zstd", "snappy", "gzip" or None)
+        """
+        self.compression = compression
+
+    def encode(self, value: pd.DataFrame) -> bytes:
+        buffer = BytesIO()
+        pq.write_table(pa.Table.from_pandas(value), buffer, compression=self.compression or "none")
+        return buffer.getvalue()
+
+    def decode(self, payload: bytes) -> pd.DataFrame:
+        df: pd.DataFrame = pq.read_table(pa.py_buffer(payload)).to_pandas()
+        return df
+
+
+_VALUE_CODEC = JSONValueCodec()
+_FALLBACK_FRAME_CODEC = JSONFrameCodec()
+
+
+def make_frame_codec(name: str | None = None, compression: str | None = None) -> CacheCodec:
+    """Build a DataFrame codec by name
+
+    Args:
+        name: "arrow", "parquet" or "json" (default: CACHE_CODEC env var, then "arrow")
+        compression: Compression for binary codecs (default: CACHE_COMPRESSION env var,
+            then "zstd"). Use "none" to disable.
+
+    Returns:
+        CacheCodec instance. Falls back to the JSON codec if PyArrow is missing.
+    """
+    name = (name or os.getenv("CACHE_CODEC") or "arrow").lower()
+    if compression is None:
+        compression = os.getenv("CACHE_COMPRESSION", "zstd")
+    compression = None if compression.lower() in ("", "none") else compression.lower()
+
+    if name == "json":
+        return _FALLBACK_FRAME_CODEC
+    if name not in ("arrow", "parquet"):
+        raise ValueError(f"Unknown cache codec '{name}'. Use 'arrow', 'parquet' or 'json'.")
+    if not PYARROW_AVAILABLE:
+        logger.warning(f"pyarrow not installed; cache codec '{name}' falls back to JSON")
+        return _FALLBACK_FRAME_CODEC
+    if name == "parquet":
+        return ParquetCodec(compression=compression)
+    return ArrowIPCCodec(compression=compression)
+
+
+# ==============================================================================
+# Cache
+# ==============================================================================
+
+# Redis blob header: write timestamp (float64, big-endian)
+_REDIS_HEADER = struct.Struct(">d")
+
+
 class Cache:
     """Simple TTL cache with memory + optional Redis backend
 
     The cache uses a two-tier strategy:
-    1. In-memory cache (dict) for fast access
+    1. In-memory cache (LRU dict) for fast access
     2. Redis (optional) for persistence across processes
 
+    Values are stored encoded: DataFrames go through the configured frame codec
+    (Arrow IPC by default), everything else through JSON. Both tiers hold the
+    same bytes, so callers never share mutable objects through the cache.
+
+    The memory tier is bounded by entry count and by total payload bytes. When
+    either limit is exceeded the least recently used entries are evicted. A
+    daemon thread sweeps expired entries every ``sweep_interval_seconds`` so
+    long-running servers don't hold on to keys nobody reads again.
+
     Cache keys are SHA256 hashes of (function_name, json_params)
     """
 
-    def __init__(self, ttl_seconds: int = 3600, redis_enabled: bool | None = None):
+    def __init__(
+        self,
+        ttl_seconds: int = 3600,
+        redis_enabled: bool | None = None,
+        codec: CacheCodec | str | None = None,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        sweep_interval_seconds: float | None = None,
+    ):
         """Initialize cache
 
         Args:
             ttl_seconds: Time-to-live for cache entries (default 1 hour)
             redis_enabled: Override Redis detection (default: auto-detect via env)
+            codec: DataFrame codec instance or name ("arrow", "parquet", "json").
+                Default: CACHE_CODEC env var, then "arrow".
+            max_entries: Memory tier entry limit (default: CACHE_MAX_ENTRIES env var,
+                then 1024). 0 disables the limit.
+            max_bytes: Memory tier size limit in bytes (default: CACHE_MAX_MB env var,
+                then 512 MB). 0 disables the limit.
+            sweep_interval_seconds: How often to purge expired entries in the
+                background (default: CACHE_SWEEP_SECONDS env var, then 300). 0 disables.
         """
         self.ttl = ttl_seconds
-        self._mem: dict[str, tuple[float, Any]] = {}
+        self._mem: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._mem_bytes = 0
+        self._lock = threading.RLock()
         self._redis: Any | None = None
+        self.codec = codec if isinstance(codec, CacheCodec) else make_frame_codec(codec)
+
+        if max_entries is None:
+            max_entries = int(os.getenv("CACHE_MAX_ENTRIES", "1024"))
+        if max_bytes is None:
+            max_bytes = int(float(os.getenv("CACHE_MAX_MB", "512")) * 1024 * 1024)
+        if sweep_interval_seconds is None:
+            sweep_interval_seconds = float(os.getenv("CACHE_SWEEP_SECONDS", "300"))
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sweep_interval = sweep_interval_seconds
+        self._sweeper: threading.Thread | None = None
+        self._sweeper_stop = threading.Event()
+
+        # Counters reported by stats()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+        # Decoders for every codec we can read (entries in Redis may have been
+        # written by a process configured with a different codec)
+        decoders: list[CacheCodec] = [_VALUE_CODEC, _FALLBACK_FRAME_CODEC]
+        if PYARROW_AVAILABLE:
+            decoders += [ArrowIPCCodec(), ParquetCodec()]
+        self._decoders = {c.tag: c for c in decoders}
+        self._decoders[self.codec.tag] = self.codec
 
         # Determine if Redis should be enabled
         if redis_enabled is None:
@@ -95,6 +318,8 @@ class Cache:
 
         if redis_enabled and REDIS_AVAILABLE:
             try:
+                import redis
+
                 host = os.getenv("REDIS_HOST", "localhost")
                 port = int(os.getenv("REDIS_PORT", "6379"))
                 db = int(os.getenv("REDIS_DB", "0"))
@@ -119,6 +344,25 @@ class Cache:
         key_str = "|".join(str(p) for p in parts)
         return hashlib.sha256(key_str.encode()).hexdigest()
 
+    def _encode(self, value: Any) -> bytes:
+        """Encode a value with the frame codec (DataFrames) or JSON (everything else)"""
+        if isinstance(value, pd.DataFrame):
+            try:
+                return self.codec.tag + self.codec.encode(value)
+            except Exception as e:
+                if self.codec is _FALLBACK_FRAME_CODEC:
+                    raise
+                logger.debug(f"{self.codec.name} codec failed ({e}), falling back to JSON")
+                return _FALLBACK_FRAME_CODEC.tag + _FALLBACK_FRAME_CODEC.encode(value)
+        return _VALUE_CODEC.tag + _VALUE_CODEC.encode(value)
+
+    def _decode(self, blob: bytes) -> Any:
+        """Decode a tagged payload produced by _encode"""
+        codec = self._decoders.get(blob[:1])
+        if codec is None:
+            raise ValueError(f"Unknown cache codec tag: {blob[:1]!r}")
+        return codec.decode(blob[1:])
+
     def get(self, *parts: Any) -> Any | None:
         """Get cached value if exists and not expired"""
         key = self._key(*parts)
@@ -129,10 +373,12 @@ class Cache:
             try:
                 blob = self._redis.get(key)
                 if blob:
-                    ts, payload = json.loads(blob.decode("utf-8"))
+                    (ts,) = _REDIS_HEADER.unpack_from(blob)
                     if now - ts <= self.ttl:
                         logger.debug(f"Cache hit (Redis): {key[:12]}...")
-                        return payload
+                        with self._lock:
+                            self._hits += 1
+                        return self._decode(blob[_REDIS_HEADER.size :])
                     else:
                         # Expired; delete
                         self._redis.delete(key)
@@ -140,14 +386,26 @@ class Cache:
                 logger.warning(f"Redis get error: {e}")
 
         # Try memory cache
-        if key in self._mem:
-            ts, payload = self._mem[key]
-            if now - ts <= self.ttl:
-                logger.debug(f"Cache hit (memory): {key[:12]}...")
-                return payload
-            else:
-                # Expired; delete
-                del self._mem[key]
+        payload = None
+        with self._lock:
+            entry = self._mem.get(key)
+            if entry is not None:
+                ts, blob = entry
+                if now - ts <= self.ttl:
+                    # Mark as most recently used
+                    self._mem.move_to_end(key)
+                    self._hits += 1
+                    payload = blob
+                else:
+                    # Expired; delete
+                    self._remove(key)
+                    self._expirations += 1
+            if payload is None:
+                self._misses += 1
+
+        if payload is not None:
+            logger.debug(f"Cache hit (memory): {key[:12]}...")
+            return self._decode(payload)
 
         logger.debug(f"Cache miss: {key[:12]}...")
         return None
@@ -156,21 +414,97 @@ class Cache:
         """Set cache value"""
         key = self._key(*parts)
         now = time.time()
+        payload = self._encode(value)
 
         # Store in Redis (if available)
         if self._redis:
             try:
-                blob = json.dumps([now, value]).encode("utf-8")
-                self._redis.set(key, blob)
+                self._redis.set(key, _REDIS_HEADER.pack(now) + payload)
             except Exception as e:
                 logger.warning(f"Redis set error: {e}")
 
-        # Always store in memory as fallback
-        self._mem[key] = (now, value)
+        # Always store in memory as fallback (unless a single entry exceeds the budget)
+        with self._lock:
+            self._remove(key)
+            if self.max_bytes and len(payload) > self.max_bytes:
+                logger.debug(f"Entry {key[:12]}... exceeds memory budget, not cached in memory")
+                return
+            self._mem[key] = (now, payload)
+            self._mem_bytes += len(payload)
+            self._evict()
+
+        self._ensure_sweeper()
+
+    def delete(self, *parts: Any) -> None:
+        """Remove a cache entry (no-op if absent)"""
+        key = self._key(*parts)
+        if self._redis:
+            try:
+                self._redis.delete(key)
+            except Exception as e:
+                logger.warning(f"Redis delete error: {e}")
+        with self._lock:
+            self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        """Drop a memory entry and update byte accounting (caller holds lock)"""
+        entry = self._mem.pop(key, None)
+        if entry is not None:
+            self._mem_bytes -= len(entry[1])
+
+    def _evict(self) -> None:
+        """Evict least recently used entries until within limits (caller holds lock)"""
+        while self._mem and (
+            (self.max_entries and len(self._mem) > self.max_entries)
+            or (self.max_bytes and self._mem_bytes > self.max_bytes)
+        ):
+            key, (_, payload) = self._mem.popitem(last=False)
+            self._mem_bytes -= len(payload)
+            self._evictions += 1
+            logger.debug(f"Cache evicted (LRU): {key[:12]}...")
+
+    def sweep(self) -> int:
+        """Remove expired entries from the memory tier
+
+        Returns:
+            Number of entries removed
+        """
+        cutoff = time.time() - self.ttl
+        with self._lock:
+            expired = [key for key, (ts, _) in self._mem.items() if ts < cutoff]
+            for key in expired:
+                self._remove(key)
+            self._expirations += len(expired)
+
+        if expired:
+            logger.debug(f"Cache sweep removed {len(expired)} expired entries")
+        return len(expired)
+
+    def _ensure_sweeper(self) -> None:
+        """Start the background TTL sweeper on first write"""
+        if not self.sweep_interval or self._sweeper is not None:
+            return
+        with self._lock:
+            if self._sweeper is not None:
+                return
+            # Hold only a weak reference so a discarded cache can be collected
+            self._sweeper = threading.Thread(
+                target=_sweep_loop,
+                args=(weakref.ref(self), self._sweeper_stop, self.sweep_interval),
+                name="cbb-cache-sweeper",
+                daemon=True,
+            )
+            self._sweeper.start()
+
+    def close(self) -> None:
+        """Stop the background sweeper thread"""
+        self._sweeper_stop.set()
 
     def clear(self) -> None:
         """Clear all cache entries"""
-        self._mem.clear()
+        with self._lock:
+            self._mem.clear()
+            self._mem_bytes = 0
         if self._redis:
             try:
                 self._redis.flushdb()
@@ -182,7 +516,6 @@ class Cache:
 
     def stats(self) -> dict[str, Any]:
         """Get cache statistics"""
-        mem_size = len(self._mem)
         redis_size = None
         if self._redis:
             try:
@@ -190,12 +523,36 @@ class Cache:
             except Exception:
                 pass
 
-        return {
-            "memory_entries": mem_size,
-            "redis_entries": redis_size,
-            "ttl_seconds": self.ttl,
-            "redis_enabled": self._redis is not None,
-        }
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "memory_entries": len(self._mem),
+                "memory_bytes": self._mem_bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "redis_entries": redis_size,
+                "ttl_seconds": self.ttl,
+                "redis_enabled": self._redis is not None,
+                "codec": self.codec.name,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
+
+
+def _sweep_loop(cache_ref: weakref.ref[Cache], stop: threading.Event, interval: float) -> None:
+    """Background loop for Cache TTL sweeping (exits when the cache is collected)"""
+    while not stop.wait(interval):
+        cache = cache_ref()
+        if cache is None:
+            return
+        try:
+            cache.sweep()
+        except Exception as e:
+            logger.warning(f"Cache sweep error: {e}")
+        del cache
 
 
 # Global cache instance (can be reconfigured)
@@ -213,11 +570,18 @@ def set_cache(cache: Cache) -> None:
     _cache = cache
 
 
+def _copy_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Copy a DataFrame handed to single-flight followers"""
+    return df.copy() if isinstance(df, pd.DataFrame) else df
+
+
 def cached_dataframe(fn: Callable[..., pd.DataFrame]) -> Callable[..., pd.DataFrame]:
     """Decorator to cache DataFrame-returning functions
 
     The cache key includes the function name and all kwargs (serialized as JSON).
-    DataFrames are cached as JSON (orient='split') for fast serialization.
+    DataFrames are encoded with the cache's frame codec (Arrow IPC by default),
+    which round-trips dtypes and decodes far faster than JSON. Concurrent misses
+    for the same key are coalesced: one caller fetches, the others get a copy.
 
     Example:
         @cached_dataframe
@@ -234,27 +598,34 @@ def cached_dataframe(fn: Callable[..., pd.DataFrame]) -> Callable[..., pd.DataFr
             json.dumps(kwargs, sort_keys=True, default=str),
         )
 
-        # Try to get from cache
-        cached = _cache.get(*cache_key)
-        if cached is not None:
+        def lookup() -> pd.DataFrame | None:
             try:
-                # Use StringIO to avoid pandas FutureWarning about passing literal JSON
-                return pd.read_json(StringIO(cached), orient="split")
+                cached = _cache.get(*cache_key)
             except Exception as e:
                 logger.warning(f"Cache deserialization error: {e}")
+                return None
+            return cached if isinstance(cached, pd.DataFrame) else None
 
-        # Cache miss; call function
-        logger.debug(f"Fetching: {fn.__name__}({kwargs})")
-        df = fn(*args, **kwargs)
+        def load() -> pd.DataFrame:
+            # Cache miss; call function
+            logger.debug(f"Fetching: {fn.__name__}({kwargs})")
+            df = fn(*args, **kwargs)
 
-        # Store in cache
-        try:
-            serialized = df.to_json(orient="split")
-            _cache.set(serialized, *cache_key)
-        except Exception as e:
-            logger.warning(f"Cache serialization error: {e}")
+            # Store in cache
+            try:
+                _cache.set(df, *cache_key)
+            except Exception as e:
+                logger.warning(f"Cache serialization error: {e}")
 
-        return df
+            return df
+
+        # Try to get from cache
+        cached = lookup()
+        if cached is not None:
+            return cached
+
+        # Concurrent misses for the same key share one upstream call
+        return get_single_flight().do("|".join(cache_key), load, recheck=lookup, clone=_copy_frame)
 
     return wrapper
 
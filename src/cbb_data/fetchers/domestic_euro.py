@@ -44,6 +44,7 @@ from typing import Any
 import pandas as pd
 import requests
 
+from ..utils.http_transport import http_get
 from ..utils.rate_limiter import get_source_limiter
 from .base import cached_dataframe, retry_on_error
 
@@ -116,7 +117,7 @@ def _make_domestic_euro_request(league: str, url: str, params: dict[str, Any] |
     }
 
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=30)
+        response = http_get(url, source=league.lower(), headers=headers, params=params, timeout=30)
         response.raise_for_status()
         return response.text
     except requests.exceptions.RequestException as e:
@@ -0,0 +1,150 @@
+"""Shared ESPN Scoreboard Infrastructure
+
+Used by the ESPN MBB and WBB fetchers (same API, different sport path).
+
+Key Features:
+- Requests go through the shared HTTP transport (pooled keep-alive connections)
+- Concurrent per-day scoreboard fetching for date ranges
+- Per-day caching: days whose games are all final are kept in a long-lived
+  day cache, so refreshing a season only refetches recent/unfinished days
+
+Concurrency is bounded by ``ESPN_MAX_WORKERS`` (default 8). Every request still
+goes through ``rate_limiter.acquire("espn")``, so the source token bucket caps
+throughput regardless of the worker count; workers only overlap network latency.
+
+Usage:
+    from cbb_data.fetchers.espn_common import fetch_scoreboard_days
+
+    frames = fetch_scoreboard_days(
+        fetch_espn_scoreboard, "espn_mbb", date(2024, 11, 4), date(2025, 4, 7)
+    )
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+import pandas as pd
+
+from .base import Cache
+
+logger = logging.getLogger(__name__)
+
+# Concurrent scoreboard requests per date range
+ESPN_MAX_WORKERS = int(os.getenv("ESPN_MAX_WORKERS", "8"))
+
+# Finished days rarely change; keep them much longer than the default cache TTL
+ESPN_DAY_CACHE_TTL_SECONDS = int(os.getenv("ESPN_DAY_CACHE_TTL_SECONDS", str(30 * 24 * 3600)))
+
+# A day counts as finished once it is this far in the past (ESPN dates are US
+# Eastern; late West Coast games and stat corrections land the next day)
+FINISHED_DAY_LAG = timedelta(days=2)
+
+# Statuses that will not change again
+_FINAL_STATUSES = {"Postponed", "Canceled", "Cancelled", "Forfeit"}
+
+_day_cache: Cache | None = None
+_day_cache_lock = threading.Lock()
+
+
+def get_day_cache() -> Cache:
+    """Get the cache holding finished scoreboard days"""
+    global _day_cache
+    if _day_cache is None:
+        with _day_cache_lock:
+            if _day_cache is None:
+                _day_cache = Cache(ttl_seconds=ESPN_DAY_CACHE_TTL_SECONDS)
+    return _day_cache
+
+
+def is_finished_day(day: date, games: pd.DataFrame, today: date | None = None) -> bool:
+    """Check whether a scoreboard day can no longer change
+
+    Args:
+        day: Scoreboard date
+        games: Scoreboard rows for that date
+        today: Reference date (default: date.today())
+
+    Returns:
+        True if the day is old enough and every game is final (or called off)
+    """
+    if day > (today or date.today()) - FINISHED_DAY_LAG:
+        return False
+    if games.empty or "STATUS" not in games.columns:
+        return True
+    status = games["STATUS"].astype(str)
+    return bool((status.str.startswith("Final") | status.isin(_FINAL_STATUSES)).all())
+
+
+def fetch_scoreboard_days(
+    fetch_day: Callable[..., pd.DataFrame],
+    source: str,
+    date_from: date,
+    date_to: date,
+    season: int | None = None,
+    groups: str = "50",
+    max_workers: int | None = None,
+) -> list[pd.DataFrame]:
+    """Fetch one scoreboard per day, concurrently, in date order
+
+    Finished days are served from the day cache; the rest are fetched through
+    ``fetch_day`` (which keeps its own retry and TTL cache) on a bounded thread
+    pool. The first failing day raises, as a serial loop would.
+
+    Args:
+        fetch_day: Scoreboard fetcher called as fetch_day(date=, season=, groups=)
+        source: Day cache namespace (e.g., "espn_mbb")
+        date_from: Start date (inclusive)
+        date_to: End date (inclusive)
+        season: Optional season year
+        groups: Conference group filter
+        max_workers: Concurrent requests (default: ESPN_MAX_WORKERS)
+
+    Returns:
+        Non-empty scoreboard DataFrames, one per day with games, in date order
+    """
+    days = [date_from + timedelta(days=n) for n in range((date_to - date_from).days + 1)]
+    day_cache = get_day_cache()
+    frames: dict[date, pd.DataFrame] = {}
+    pending: list[date] = []
+
+    for day in days:
+        cached = day_cache.get(source, day.isoformat(), season, groups)
+        if isinstance(cached, pd.DataFrame):
+            frames[day] = cached
+        else:
+            pending.append(day)
+
+    def load(day: date) -> pd.DataFrame:
+        df = fetch_day(date=day.strftime("%Y%m%d"), season=season, groups=groups)
+        if is_finished_day(day, df):
+            try:
+                day_cache.set(df, source, day.isoformat(), season, groups)
+            except Exception as e:
+                logger.warning(f"Day cache serialization error: {e}")
+        return df
+
+    if pending:
+        workers = max(1, min(max_workers or ESPN_MAX_WORKERS, len(pending)))
+        logger.info(
+            f"{source}: fetching {len(pending)}/{len(days)} days "
+            f"({len(days) - len(pending)} finished days cached, {workers} workers)"
+        )
+        if workers == 1:
+            results = [load(day) for day in pending]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=source) as executor:
+                results = list(executor.map(load, pending))
+        frames.update(zip(pending, results, strict=True))
+
+    return [frames[day] for day in days if not frames[day].empty]
+
+
+def clear_day_cache() -> None:
+    """Drop all cached scoreboard days"""
+    get_day_cache().clear()
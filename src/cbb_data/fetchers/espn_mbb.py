@@ -18,14 +18,16 @@ Key Features:
 from __future__ import annotations
 
 import logging
-from datetime import date, timedelta
+from datetime import date
 from typing import Any
 
 import pandas as pd
 import requests
 
+from ..utils.http_transport import http_get
 from ..utils.rate_limiter import get_source_limiter
 from .base import cached_dataframe, retry_on_error
+from .espn_common import fetch_scoreboard_days
 
 logger = logging.getLogger(__name__)
 
@@ -55,7 +57,7 @@ def _espn_request(endpoint: str, params: dict | None = None) -> dict[str, Any]:
     url = f"{ESPN_BASE_URL}/{endpoint}"
 
     try:
-        response = requests.get(url, params=params, timeout=30)
+        response = http_get(url, source="espn_mbb", params=params, timeout=30)
         response.raise_for_status()
         return dict(response.json())
     except requests.RequestException as e:
@@ -413,7 +415,11 @@ def fetch_espn_game_summary(game_id: str) -> dict[str, pd.DataFrame]:
 
 
 def fetch_schedule_range(
-    date_from: date, date_to: date, season: int | None = None, groups: str = "50"
+    date_from: date,
+    date_to: date,
+    season: int | None = None,
+    groups: str = "50",
+    max_workers: int | None = None,
 ) -> pd.DataFrame:
     """Fetch ESPN MBB schedule for a date range
 
@@ -425,21 +431,24 @@ def fetch_schedule_range(
         season: Optional season year
         groups: Conference group filter (default: "50")
             "50" = All Division I games (default)
+        max_workers: Concurrent scoreboard requests (default: ESPN_MAX_WORKERS).
+            Requests still share the "espn" rate limit; finished days are
+            served from the per-day cache without a request.
 
     Returns:
         DataFrame with all games in range
     """
     logger.info(f"Fetching schedule from {date_from} to {date_to}")
 
-    frames = []
-    current = date_from
-
-    while current <= date_to:
-        date_str = current.strftime("%Y%m%d")
-        df = fetch_espn_scoreboard(date=date_str, season=season, groups=groups)
-        if not df.empty:
-            frames.append(df)
-        current += timedelta(days=1)
+    frames = fetch_scoreboard_days(
+        fetch_espn_scoreboard,
+        "espn_mbb",
+        date_from,
+        date_to,
+        season=season,
+        groups=groups,
+        max_workers=max_workers,
+    )
 
     if frames:
         result = pd.concat(frames, ignore_index=True)
@@ -496,7 +505,7 @@ def fetch_team_games(team_id: int, season: int, season_type: str = "2") -> pd.Da
         params["seasontype"] = season_type
 
     try:
-        response = requests.get(url, params=params, timeout=30)
+        response = http_get(url, source="espn_mbb", params=params, timeout=30)
         response.raise_for_status()
         data = response.json()
     except requests.exceptions.RequestException as e:
@@ -18,14 +18,16 @@ Key Features:
 from __future__ import annotations
 
 import logging
-from datetime import date, timedelta
+from datetime import date
 from typing import Any
 
 import pandas as pd
 import requests
 
+from ..utils.http_transport import http_get
 from ..utils.rate_limiter import get_source_limiter
 from .base import cached_dataframe, retry_on_error
+from .espn_common import fetch_scoreboard_days
 
 logger = logging.getLogger(__name__)
 
@@ -56,7 +58,7 @@ def _espn_wbb_request(endpoint: str, params: dict | None = None) -> dict[str, An
     url = f"{ESPN_WBB_BASE_URL}/{endpoint}"
 
     try:
-        response = requests.get(url, params=params, timeout=30)
+        response = http_get(url, source="espn_wbb", params=params, timeout=30)
         response.raise_for_status()
         return dict(response.json())
     except requests.RequestException as e:
@@ -349,7 +351,11 @@ def fetch_espn_wbb_game_summary(game_id: str) -> dict[str, pd.DataFrame]:
 
 
 def fetch_wbb_schedule_range(
-    date_from: date, date_to: date, season: int | None = None, groups: str = "50"
+    date_from: date,
+    date_to: date,
+    season: int | None = None,
+    groups: str = "50",
+    max_workers: int | None = None,
 ) -> pd.DataFrame:
     """Fetch ESPN WBB schedule for a date range
 
@@ -361,21 +367,24 @@ def fetch_wbb_schedule_range(
         season: Optional season year
         groups: Conference group filter (default: "50")
             "50" = All Division I games (default)
+        max_workers: Concurrent scoreboard requests (default: ESPN_MAX_WORKERS).
+            Requests still share the "espn" rate limit; finished days are
+            served from the per-day cache without a request.
 
     Returns:
         DataFrame with all games in range
     """
     logger.info(f"Fetching WBB schedule from {date_from} to {date_to}")
 
-    frames = []
-    current = date_from
-
-    while current <= date_to:
-        date_str = current.strftime("%Y%m%d")
-        df = fetch_espn_wbb_scoreboard(date=date_str, season=season, groups=groups)
-        if not df.empty:
-            frames.append(df)
-        current += timedelta(days=1)
+    frames = fetch_scoreboard_days(
+        fetch_espn_wbb_scoreboard,
+        "espn_wbb",
+        date_from,
+        date_to,
+        season=season,
+        groups=groups,
+        max_workers=max_workers,
+    )
 
     if frames:
         result = pd.concat(frames, ignore_index=True)
@@ -430,7 +439,7 @@ def fetch_wbb_team_games(
         params["seasontype"] = season_type
 
     try:
-        response = requests.get(url, params=params, timeout=30)
+        response = http_get(url, source="espn_wbb", params=params, timeout=30)
         response.raise_for_status()
         data = response.json()
     except requests.exceptions.RequestException as e:
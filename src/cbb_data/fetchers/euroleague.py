@@ -32,6 +32,7 @@ from typing import Any
 
 import pandas as pd
 
+from ..utils.adaptive_concurrency import get_concurrency
 from ..utils.rate_limiter import get_source_limiter
 from .base import cached_dataframe, retry_on_error
 
@@ -445,11 +446,14 @@ def fetch_euroleague_full_season(
 
     Uses ThreadPoolExecutor to fetch box scores, PBP, and shots concurrently.
     This reduces fetch time from ~25 minutes to ~3-5 minutes for a full season.
+    Calls run under the shared "euroleague" adaptive concurrency limit, which
+    grows while the API stays fast and halves on 429/5xx or timeouts.
 
     Args:
         season: Season code (e.g., "E2024")
         phase: Competition phase ("RS" or "PO")
-        max_workers: Maximum concurrent threads (default 4, respects 2 req/sec rate limit)
+        max_workers: Starting concurrency (default 4); adapted between 1 and
+            CBB_ADAPTIVE_MAX_CONCURRENCY as the API responds
         skip_pbp: Skip play-by-play data (faster if only need box scores)
         skip_shots: Skip shot data (faster if only need box scores)
 
@@ -461,12 +465,15 @@ def fetch_euroleague_full_season(
             - "shots": All shot data (empty if skip_shots=True)
 
     Note:
-        Rate limiting is handled by individual fetch functions.
-        max_workers=4 with 2 req/sec limit provides good throughput.
+        Rate limiting is handled by individual fetch functions; the adaptive
+        limit only decides how many calls are in flight.
     """
     from concurrent.futures import ThreadPoolExecutor, as_completed
 
-    logger.info(f"Fetching full EuroLeague season: {season}, {phase} (workers={max_workers})")
+    concurrency = get_concurrency("euroleague", initial_limit=max_workers)
+    logger.info(
+        f"Fetching full EuroLeague season: {season}, {phase} (concurrency={concurrency.limit})"
+    )
 
     result = {}
 
@@ -495,15 +502,18 @@ def fetch_euroleague_full_season(
 
         try:
             # Box score (always fetch)
-            game_result["box"] = fetch_euroleague_box_score(season, game_code)
+            with concurrency.slot():
+                game_result["box"] = fetch_euroleague_box_score(season, game_code)
 
             # Play-by-play (optional)
             if not skip_pbp:
-                game_result["pbp"] = fetch_euroleague_play_by_play(season, game_code)
+                with concurrency.slot():
+                    game_result["pbp"] = fetch_euroleague_play_by_play(season, game_code)
 
             # Shots (optional)
             if not skip_shots:
-                game_result["shots"] = fetch_euroleague_shot_data(season, game_code)
+                with concurrency.slot():
+                    game_result["shots"] = fetch_euroleague_shot_data(season, game_code)
 
         except Exception as e:
             logger.warning(f"Failed to fetch data for game {game_code}: {e}")
@@ -516,7 +526,7 @@ def fetch_euroleague_full_season(
     shot_data = []
     completed = 0
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+    with ThreadPoolExecutor(max_workers=concurrency.max_limit) as executor:
         # Submit all fetch tasks
         futures = {executor.submit(fetch_game_data, gc): gc for gc in game_codes}
 
@@ -48,6 +48,7 @@ from typing import Any
 import pandas as pd
 import requests
 
+from ..utils.http_transport import http_get
 from ..utils.rate_limiter import get_source_limiter
 from .base import cached_dataframe, retry_on_error
 
@@ -107,7 +108,9 @@ def _make_exposure_request(
     }
 
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=30)
+        response = http_get(
+            url, source=config["rate_limit_key"], headers=headers, params=params, timeout=30
+        )
         response.raise_for_status()
         data: dict[str, Any] | list[dict[str, Any]] = response.json()
         return data
@@ -8,6 +8,7 @@ Key Features:
 - Game index management (CSV-based game ID catalog)
 - Retry logic with exponential backoff
 - Local caching to reduce server load
+- Concurrent season scraping (bounded worker pool, pooled keep-alive connections)
 - Data validation against contracts
 - Incremental updates (fetch only new games)
 
@@ -17,6 +18,9 @@ Architecture:
   - Play-by-play: https://fibalivestats.dcd.shared.geniussports.com/u/{LEAGUE_CODE}/{GAME_ID}/pbp.html
 - Each league has a 3-letter code (e.g., "NZN" for NZ-NBL, "LKL" for Lithuania)
 - Game IDs must be pre-collected in CSV files (FIBA doesn't provide searchable index API)
+- All leagues share one host, so requests go through the shared HTTP transport, at most
+  FIBA_MAX_CONNECTIONS_PER_HOST requests in flight per host, and the
+  "fiba_livestats" token bucket of the source rate limiter
 
 Usage:
     from cbb_data.fetchers.fiba_html_common import scrape_fiba_box_score, load_fiba_game_index
@@ -27,6 +31,9 @@ Usage:
     # Scrape box score for a specific game
     player_stats = scrape_fiba_box_score("LKL", "123456")
 
+    # Scrape every game of a season concurrently
+    games = scrape_fiba_games(scrape_fiba_box_score, "LKL", game_index["GAME_ID"])
+
 Data Granularities:
 - schedule: ✅ Via game index CSV
 - player_game: ✅ Via HTML box score scraping
@@ -39,10 +46,14 @@ from __future__ import annotations
 
 import functools
 import logging
+import os
+import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, TypeVar
+from urllib.parse import urlsplit
 
 import pandas as pd
 
@@ -64,11 +75,22 @@ GAME_INDEX_DIR = Path("data/game_indexes")
 CACHE_DIR = Path("data/.cache/fiba_html")
 CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
+# Rate limiter source shared by every FIBA LiveStats request
+RATE_LIMIT_SOURCE = "fiba_livestats"
+
+# Concurrent game scrapes per season fetch
+FIBA_MAX_WORKERS = int(os.getenv("FIBA_MAX_WORKERS", "8"))
+
+# Requests in flight per host (all leagues share the LiveStats host)
+FIBA_MAX_CONNECTIONS_PER_HOST = int(os.getenv("FIBA_MAX_CONNECTIONS_PER_HOST", "4"))
+
 # Try to import optional dependencies
 try:
     import requests
     from bs4 import BeautifulSoup
 
+    from ..utils.http_transport import get_transport
+
     HTML_PARSING_AVAILABLE = True
 except ImportError:
     HTML_PARSING_AVAILABLE = False
@@ -161,7 +183,10 @@ def with_cache(
             result = fn(*args, **kwargs)
             if isinstance(result, pd.DataFrame) and not result.empty:
                 try:
-                    result.to_parquet(cache_file, index=False)
+                    # Write then rename so concurrent readers never see a partial file
+                    tmp_file = cache_file.with_suffix(f".{threading.get_ident()}.tmp")
+                    result.to_parquet(tmp_file, index=False)
+                    tmp_file.replace(cache_file)
                     logger.debug(f"Saved to cache: {cache_file.name}")
                 except Exception as e:
                     logger.warning(f"Cache write failed for {cache_file.name}: {e}")
@@ -295,6 +320,9 @@ def get_new_games(
 ) -> pd.DataFrame:
     """Get games from index that aren't in existing dataset (for incremental updates)
 
+    For seasons kept in DuckDB storage, storage.incremental.sync_season tracks
+    the ingested games itself (per-partition watermark).
+
     Args:
         league_code: FIBA league code
         season: Season string
@@ -327,6 +355,27 @@ def get_new_games(
 # ==============================================================================
 
 
+_host_slots: dict[str, threading.BoundedSemaphore] = {}
+_host_slots_lock = threading.Lock()
+
+
+def _host_slot(url: str) -> threading.BoundedSemaphore:
+    """Get the semaphore bounding in-flight requests to the URL's host"""
+    host = urlsplit(url).netloc
+    with _host_slots_lock:
+        slot = _host_slots.get(host)
+        if slot is None:
+            slot = _host_slots[host] = threading.BoundedSemaphore(FIBA_MAX_CONNECTIONS_PER_HOST)
+    return slot
+
+
+def _http_get(url: str, timeout: float) -> requests.Response:
+    """GET through the shared transport, per-host limit and source rate limiter"""
+    with _host_slot(url):
+        rate_limiter.acquire(RATE_LIMIT_SOURCE)
+        return get_transport().get(url, source=RATE_LIMIT_SOURCE, timeout=timeout)
+
+
 @with_retry(max_attempts=3, base_delay=2.0)
 def _fetch_fiba_html(league_code: str, game_id: str, page_type: str = "bs") -> str:
     """Fetch FIBA LiveStats HTML page with retry logic
@@ -347,16 +396,82 @@ def _fetch_fiba_html(league_code: str, game_id: str, page_type: str = "bs") -> s
 
     url = f"{FIBA_BASE_URL}/u/{league_code}/{game_id}/{page_type}.html"
 
-    rate_limiter.acquire("fiba_livestats")
-
     logger.debug(f"Fetching FIBA {page_type}: {league_code} game {game_id}")
 
-    response = requests.get(url, timeout=30)
+    response = _http_get(url, timeout=30)
     response.raise_for_status()
 
     return response.text
 
 
+# ==============================================================================
+# Concurrent Season Scraping
+# ==============================================================================
+
+
+def scrape_fiba_games(
+    scrape_fn: Callable[..., pd.DataFrame],
+    league_code: str,
+    game_ids: Iterable[Any],
+    max_workers: int | None = None,
+    **kwargs: Any,
+) -> list[tuple[Any, pd.DataFrame]]:
+    """Scrape many games concurrently with a per-game scraper
+
+    Games run on a bounded thread pool; each scraper call keeps its own parquet
+    cache (with_cache) and retries, and every HTTP request still passes the
+    per-host limit and the source rate limiter, so workers only overlap network
+    latency and cache reads. A game that fails is logged and skipped, like the
+    serial loops did.
+
+    Args:
+        scrape_fn: Per-game scraper called as scrape_fn(league_code=, game_id=, **kwargs)
+            (e.g., scrape_fiba_box_score, scrape_fiba_play_by_play)
+        league_code: FIBA league code (e.g., "LKL")
+        game_ids: Game IDs in schedule order
+        max_workers: Concurrent games (default: FIBA_MAX_WORKERS)
+        **kwargs: Passed to scrape_fn (league, season, force_refresh, ...)
+
+    Returns:
+        (game_id, DataFrame) for every game with data, in input order
+
+    Example:
+        >>> schedule = load_fiba_game_index("LKL", "2023-24")
+        >>> games = scrape_fiba_games(
+        ...     scrape_fiba_box_score, "LKL", schedule["GAME_ID"], league="LKL", season="2023-24"
+        ... )
+        >>> df = pd.concat([box for _, box in games], ignore_index=True)
+    """
+    game_ids = list(game_ids)
+    if not game_ids:
+        return []
+
+    def scrape(game_id: Any) -> pd.DataFrame:
+        try:
+            return scrape_fn(league_code=league_code, game_id=str(game_id), **kwargs)
+        except Exception as e:
+            logger.warning(f"Failed to scrape {league_code} game {game_id}: {e}")
+            return pd.DataFrame()
+
+    workers = max(1, min(max_workers or FIBA_MAX_WORKERS, len(game_ids)))
+    name = getattr(scrape_fn, "__name__", "scrape")
+    logger.info(f"{league_code}: {name} for {len(game_ids)} games ({workers} workers)")
+
+    start = time.perf_counter()
+    if workers == 1:
+        frames = [scrape(game_id) for game_id in game_ids]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fiba") as executor:
+            frames = list(executor.map(scrape, game_ids))
+
+    results = [(game_id, df) for game_id, df in zip(game_ids, frames, strict=True) if not df.empty]
+    logger.info(
+        f"{league_code}: {name} returned data for {len(results)}/{len(game_ids)} games "
+        f"in {time.perf_counter() - start:.1f}s"
+    )
+    return results
+
+
 # ==============================================================================
 # HTML Parsing Helpers (from NZ-NBL pattern)
 # ==============================================================================
@@ -1246,8 +1361,7 @@ def _fetch_fiba_json_api(league_code: str, game_id: str, endpoint: str) -> dict[
         # But we don't have season info here, so try simplified endpoint
         url = f"{FIBA_BASE_URL}/data/{league_code}/data/{game_id}/{endpoint}.json"
 
-        rate_limiter.acquire("fiba_livestats")
-        response = requests.get(url, timeout=10)
+        response = _http_get(url, timeout=10)
 
         if response.status_code == 200:
             return response.json()
@@ -79,6 +79,7 @@ from typing import Any
 import pandas as pd
 import requests
 
+from ..utils.http_transport import http_get
 from ..utils.rate_limiter import get_source_limiter
 from .base import cached_dataframe, retry_on_error
 
@@ -136,7 +137,9 @@ def _make_fiba_request(endpoint: str, params: dict[str, Any] | None = None) -> d
     url = f"{FIBA_BASE_URL}{endpoint}"
 
     try:
-        response = requests.get(url, headers=FIBA_HEADERS, params=params, timeout=30)
+        response = http_get(
+            url, source="fiba_livestats", headers=FIBA_HEADERS, params=params, timeout=30
+        )
         response.raise_for_status()
         data: dict[str, Any] = response.json()
         return data
@@ -29,6 +29,7 @@ import logging
 import pandas as pd
 import requests
 
+from ..utils.http_transport import http_get
 from ..utils.rate_limiter import get_source_limiter
 from .base import cached_dataframe, retry_on_error
 
@@ -70,7 +71,9 @@ def _make_gleague_request(endpoint: str, params: dict) -> dict:
     url = f"{GLEAGUE_BASE_URL}/{endpoint}"
 
     try:
-        response = requests.get(url, headers=GLEAGUE_HEADERS, params=params, timeout=30)
+        response = http_get(
+            url, source="gleague", headers=GLEAGUE_HEADERS, params=params, timeout=30
+        )
         response.raise_for_status()
         data: dict = response.json()
         return data
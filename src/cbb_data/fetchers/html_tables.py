@@ -15,6 +15,8 @@ This module consolidates common HTML scraping patterns used across multiple fetc
 
 Key Features:
 - Retry logic with exponential backoff
+- Shared HTTP transport: keep-alive connections, and pages answered with 304
+  Not Modified reuse the previously parsed tables
 - Intelligent table selection (finds first suitable table)
 - Rate limiting integration
 - UTF-8 encoding support for international names
@@ -37,11 +39,30 @@ from io import StringIO
 from typing import Any
 
 import pandas as pd
-import requests
+
+from ..utils.http_transport import get_transport
 
 logger = logging.getLogger(__name__)
 
 
+def _parse_tables(response: Any) -> list[pd.DataFrame]:
+    """Parse every HTML table of a response (StringIO avoids a FutureWarning)"""
+    tables: list[pd.DataFrame] = pd.read_html(StringIO(response.text), encoding="utf-8")
+    return tables
+
+
+def _fetch_tables(url: str, headers: dict[str, str], timeout: int) -> list[pd.DataFrame]:
+    """Fetch and parse a page's tables (parsed tables are reused on 304)"""
+    return get_transport().fetch_parsed(
+        url,
+        _parse_tables,
+        source="html_tables",
+        clone=lambda tables: [table.copy() for table in tables],
+        headers=headers,
+        timeout=timeout,
+    )
+
+
 def read_first_table(
     url: str,
     min_columns: int = 3,
@@ -80,19 +101,14 @@ def read_first_table(
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
         }
 
     last_error = None
 
     for attempt in range(max_retries):
         try:
-            # Fetch HTML content
-            response = requests.get(url, headers=headers, timeout=timeout)
-            response.raise_for_status()
-
-            # Parse HTML tables with pandas (use StringIO to avoid FutureWarning)
-            tables = pd.read_html(StringIO(response.text), encoding="utf-8")
+            # Fetch and parse HTML tables
+            tables = _fetch_tables(url, headers, timeout)
 
             # Find first suitable table
             for i, table in enumerate(tables):
@@ -170,10 +186,7 @@ def read_all_tables(
 
     for attempt in range(max_retries):
         try:
-            response = requests.get(url, headers=headers, timeout=timeout)
-            response.raise_for_status()
-
-            tables: list[Any] = pd.read_html(StringIO(response.text), encoding="utf-8")
+            tables = _fetch_tables(url, headers, timeout)
             logger.debug(f"Found {len(tables)} tables at {url}")
             return tables
 
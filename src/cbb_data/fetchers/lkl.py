@@ -46,6 +46,7 @@ from .base import cached_dataframe, retry_on_error
 from .fiba_html_common import (
     load_fiba_game_index,
     scrape_fiba_box_score,
+    scrape_fiba_games,
     scrape_fiba_play_by_play,
     scrape_fiba_shot_chart,
 )
@@ -161,42 +162,31 @@ def fetch_player_game(
         logger.warning(f"No schedule available for {LEAGUE} {season}")
         return pd.DataFrame()
 
-    # Scrape box scores for each game
+    # Scrape box scores for all games concurrently (with automatic caching)
     all_player_stats = []
 
-    for _, game_row in schedule.iterrows():
-        game_id = game_row["GAME_ID"]
-
-        try:
-            # Scrape box score (with automatic caching)
-            box_score = scrape_fiba_box_score(
-                league_code=FIBA_LEAGUE_CODE,
-                game_id=str(game_id),
-                league=LEAGUE,
-                season=season,
-                force_refresh=force_refresh,
+    games = scrape_fiba_games(
+        scrape_fiba_box_score,
+        FIBA_LEAGUE_CODE,
+        schedule["GAME_ID"],
+        league=LEAGUE,
+        season=season,
+        force_refresh=force_refresh,
+    )
+    for game_id, box_score in games:
+        # Add game context
+        box_score["GAME_ID"] = game_id
+        box_score["SEASON"] = season
+        box_score["LEAGUE"] = LEAGUE
+
+        # Create player IDs (team_playerName for uniqueness)
+        if "TEAM" in box_score.columns and "PLAYER_NAME" in box_score.columns:
+            box_score["PLAYER_ID"] = (
+                box_score["TEAM"].str[:3] + "_" + box_score["PLAYER_NAME"].str.replace(" ", "_")
             )
+            box_score["TEAM_ID"] = box_score["TEAM"]  # Use team name as ID
 
-            if not box_score.empty:
-                # Add game context
-                box_score["GAME_ID"] = game_id
-                box_score["SEASON"] = season
-                box_score["LEAGUE"] = LEAGUE
-
-                # Create player IDs (team_playerName for uniqueness)
-                if "TEAM" in box_score.columns and "PLAYER_NAME" in box_score.columns:
-                    box_score["PLAYER_ID"] = (
-                        box_score["TEAM"].str[:3]
-                        + "_"
-                        + box_score["PLAYER_NAME"].str.replace(" ", "_")
-                    )
-                    box_score["TEAM_ID"] = box_score["TEAM"]  # Use team name as ID
-
-                all_player_stats.append(box_score)
-
-        except Exception as e:
-            logger.warning(f"Failed to scrape {LEAGUE} game {game_id}: {e}")
-            continue
+        all_player_stats.append(box_score)
 
     if not all_player_stats:
         logger.warning(f"No player stats scraped for {LEAGUE} {season}")
@@ -332,28 +322,16 @@ def fetch_pbp(
         logger.warning(f"No schedule available for {LEAGUE} {season}")
         return pd.DataFrame()
 
-    # Scrape PBP for each game
-    all_pbp = []
-
-    for _, game_row in schedule.iterrows():
-        game_id = game_row["GAME_ID"]
-
-        try:
-            # Scrape play-by-play (with automatic caching)
-            pbp = scrape_fiba_play_by_play(
-                league_code=FIBA_LEAGUE_CODE,
-                game_id=str(game_id),
-                league=LEAGUE,
-                season=season,
-                force_refresh=force_refresh,
-            )
-
-            if not pbp.empty:
-                all_pbp.append(pbp)
-
-        except Exception as e:
-            logger.warning(f"Failed to scrape {LEAGUE} PBP for game {game_id}: {e}")
-            continue
+    # Scrape PBP for all games concurrently (with automatic caching)
+    games = scrape_fiba_games(
+        scrape_fiba_play_by_play,
+        FIBA_LEAGUE_CODE,
+        schedule["GAME_ID"],
+        league=LEAGUE,
+        season=season,
+        force_refresh=force_refresh,
+    )
+    all_pbp = [pbp for _, pbp in games]
 
     if not all_pbp:
         logger.warning(f"No PBP events scraped for {LEAGUE} {season}")
@@ -421,35 +399,20 @@ def fetch_shot_chart(
         logger.warning(f"No schedule available for {LEAGUE} {season}")
         return pd.DataFrame()
 
-    # Scrape shots for each game
-    all_shots = []
-    games_with_shots = 0
-    games_without_shots = 0
-
-    for _, game_row in schedule.iterrows():
-        game_id = game_row["GAME_ID"]
-
-        try:
-            # Scrape shot chart (with automatic caching)
-            shots = scrape_fiba_shot_chart(
-                league_code=FIBA_LEAGUE_CODE,
-                game_id=str(game_id),
-                league=LEAGUE,
-                season=season,
-                use_browser=use_browser,
-                debug_html=debug_html,
-            )
-
-            if not shots.empty:
-                all_shots.append(shots)
-                games_with_shots += 1
-            else:
-                games_without_shots += 1
-
-        except Exception as e:
-            logger.warning(f"Failed to scrape {LEAGUE} shots for game {game_id}: {e}")
-            games_without_shots += 1
-            continue
+    # Scrape shots for all games concurrently
+    games = scrape_fiba_games(
+        scrape_fiba_shot_chart,
+        FIBA_LEAGUE_CODE,
+        schedule["GAME_ID"],
+        max_workers=1 if use_browser else None,  # one browser at a time
+        league=LEAGUE,
+        season=season,
+        use_browser=use_browser,
+        debug_html=debug_html,
+    )
+    all_shots = [shots for _, shots in games]
+    games_with_shots = len(all_shots)
+    games_without_shots = len(schedule) - games_with_shots
 
     if not all_shots:
         logger.warning(
@@ -83,6 +83,7 @@ import pandas as pd
 import requests
 
 from ..api.datasets import get_current_season
+from ..utils.http_transport import http_get
 from ..utils.rate_limiter import get_source_limiter
 from .base import cached_dataframe, retry_on_error
 from .browser_scraper import BrowserScraper, is_playwright_available
@@ -883,7 +884,9 @@ def _create_atrium_state(fixture_id: str, view: str) -> str:
 # NOTE: Removed @cached_dataframe - game-level data should not be globally cached
 #       since cache key doesn't include positional args (game_id). Caching should
 #       happen at season/bulk level instead.
-def fetch_lnb_play_by_play(game_id: str, league_id: str = "LNB_PROA") -> pd.DataFrame:
+def fetch_lnb_play_by_play(
+    game_id: str, league_id: str = "LNB_PROA", raise_on_error: bool = False
+) -> pd.DataFrame:
     """Fetch LNB play-by-play data from Atrium Sports API
 
     Retrieves detailed play-by-play events from Atrium Sports (third-party stats
@@ -899,6 +902,9 @@ def fetch_lnb_play_by_play(game_id: str, league_id: str = "LNB_PROA") -> pd.Data
                  Format: "3522345e-3362-11f0-b97d-7be2bdc7a840"
         league_id: Canonical league ID (default: "LNB_PROA")
                    Options: "LNB_PROA", "LNB_ELITE2", "LNB_ESPOIRS_ELITE", "LNB_ESPOIRS_PROB"
+        raise_on_error: Re-raise request and parsing errors instead of returning an
+                        empty DataFrame, so callers (e.g., bulk ingestion under an
+                        adaptive concurrency limit) can tell 429/5xx/timeouts apart
 
     Returns:
         DataFrame with play-by-play events
@@ -958,8 +964,8 @@ def fetch_lnb_play_by_play(game_id: str, league_id: str = "LNB_PROA") -> pd.Data
 
         params = {"fixtureId": game_id, "state": state}
 
-        response = requests.get(
-            ATRIUM_FIXTURE_DETAIL_URL, params=params, headers=headers, timeout=10
+        response = http_get(
+            ATRIUM_FIXTURE_DETAIL_URL, source="lnb", params=params, headers=headers, timeout=10
         )
         response.raise_for_status()
 
@@ -1035,6 +1041,8 @@ def fetch_lnb_play_by_play(game_id: str, league_id: str = "LNB_PROA") -> pd.Data
         return df
 
     except requests.RequestException as e:
+        if raise_on_error:
+            raise
         logger.error(f"Failed to fetch LNB play-by-play for game {game_id}: {e}")
         return pd.DataFrame(
             columns=[
@@ -1058,6 +1066,8 @@ def fetch_lnb_play_by_play(game_id: str, league_id: str = "LNB_PROA") -> pd.Data
             ]
         )
     except Exception as e:
+        if raise_on_error:
+            raise
         logger.error(f"Unexpected error fetching LNB play-by-play for game {game_id}: {e}")
         import traceback
 
@@ -1089,7 +1099,9 @@ def fetch_lnb_play_by_play(game_id: str, league_id: str = "LNB_PROA") -> pd.Data
 # NOTE: Removed @cached_dataframe - game-level data should not be globally cached
 #       since cache key doesn't include positional args (game_id). Caching should
 #       happen at season/bulk level instead.
-def fetch_lnb_game_shots(game_id: str, league_id: str = "LNB_PROA") -> pd.DataFrame:
+def fetch_lnb_game_shots(
+    game_id: str, league_id: str = "LNB_PROA", raise_on_error: bool = False
+) -> pd.DataFrame:
     """Fetch LNB shot chart data from Atrium Sports API (single game)
 
     Retrieves detailed shot chart data from Atrium Sports (third-party stats
@@ -1108,6 +1120,9 @@ def fetch_lnb_game_shots(game_id: str, league_id: str = "LNB_PROA") -> pd.DataFr
                  Format: "3522345e-3362-11f0-b97d-7be2bdc7a840"
         league_id: Canonical league ID (default: "LNB_PROA")
                    Options: "LNB_PROA", "LNB_ELITE2", "LNB_ESPOIRS_ELITE", "LNB_ESPOIRS_PROB"
+        raise_on_error: Re-raise request and parsing errors instead of returning an
+                        empty DataFrame, so callers (e.g., bulk ingestion under an
+                        adaptive concurrency limit) can tell 429/5xx/timeouts apart
 
     Returns:
         DataFrame with shot chart data
@@ -1167,8 +1182,8 @@ def fetch_lnb_game_shots(game_id: str, league_id: str = "LNB_PROA") -> pd.DataFr
 
         params = {"fixtureId": game_id, "state": state}
 
-        response = requests.get(
-            ATRIUM_FIXTURE_DETAIL_URL, params=params, headers=headers, timeout=10
+        response = http_get(
+            ATRIUM_FIXTURE_DETAIL_URL, source="lnb", params=params, headers=headers, timeout=10
         )
         response.raise_for_status()
 
@@ -1232,6 +1247,8 @@ def fetch_lnb_game_shots(game_id: str, league_id: str = "LNB_PROA") -> pd.DataFr
         return df
 
     except requests.RequestException as e:
+        if raise_on_error:
+            raise
         logger.error(f"Failed to fetch LNB shot chart for game {game_id}: {e}")
         return pd.DataFrame(
             columns=[
@@ -1254,6 +1271,8 @@ def fetch_lnb_game_shots(game_id: str, league_id: str = "LNB_PROA") -> pd.DataFr
             ]
         )
     except Exception as e:
+        if raise_on_error:
+            raise
         logger.error(f"Unexpected error fetching LNB shot chart for game {game_id}: {e}")
         import traceback
 
@@ -19,7 +19,7 @@ API for France's top professional basketball leagues (Betclic ÉLITE / LNB Pro A
 ⚠️  Shot Chart: Placeholder (needs DevTools path discovery)
 
 **Key Features**:
-- Shared requests.Session for connection pooling
+- Shared HTTP transport for connection pooling and conditional GETs
 - Automatic retry with exponential backoff
 - Response envelope unwrapping ({"status": true, "data": ...} → data)
 - Calendar chunking for full-season pulls
@@ -124,6 +124,7 @@ from typing import Any
 
 import requests
 
+from ..utils.http_transport import get_transport
 from .lnb_api_config import load_lnb_headers
 
 logger = logging.getLogger(__name__)
@@ -227,9 +228,9 @@ class LNBClient:
         self.max_retries = max_retries
         self.retry_sleep = retry_sleep
 
-        # Shared session for connection pooling
-        self.session = requests.Session()
-        self.session.headers.update(DEFAULT_HEADERS)
+        # Requests go through the shared transport (pooled connections); headers
+        # are sent per request so they don't leak to other fetchers
+        self.headers = dict(DEFAULT_HEADERS)
 
         logger.debug(
             f"Initialized LNBClient: base_url={base_url}, "
@@ -272,10 +273,12 @@ class LNBClient:
                     f"{method} {path} (params={params}, json={json})"
                 )
 
-                resp = self.session.request(
-                    method=method,
-                    url=url,
+                resp = get_transport().request(
+                    method,
+                    url,
+                    source="lnb_api",
                     params=params,
+                    headers=self.headers,
                     json=json,
                     timeout=self.timeout,
                 )
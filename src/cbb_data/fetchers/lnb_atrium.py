@@ -38,8 +38,8 @@ from dataclasses import dataclass
 from typing import Any
 
 import pandas as pd
-import requests
 
+from ..utils.http_transport import http_get
 from ..utils.rate_limiter import get_source_limiter
 from .base import cached_dataframe, retry_on_error
 
@@ -279,8 +279,9 @@ def fetch_fixture_detail_and_pbp(fixture_uuid: str) -> dict[str, Any]:
         "Referer": "https://lnb.fr/",
     }
 
-    response = requests.get(
+    response = http_get(
         ATRIUM_FIXTURE_DETAIL_URL,
+        source="lnb_atrium",
         params=params,
         headers=headers,
         timeout=30,
@@ -60,6 +60,7 @@ import pandas as pd
 import requests
 
 from ..clients.api_basketball import APIBasketballClient
+from ..utils.http_transport import http_get
 from ..utils.rate_limiter import get_source_limiter
 from .base import cached_dataframe, retry_on_error
 
@@ -128,7 +129,7 @@ def _download_nblr_file(data_type: str, force_refresh: bool = False) -> Path | N
     logger.info(f"Downloading nblR {data_type} data from: {url}")
 
     try:
-        response = requests.get(url, timeout=120)
+        response = http_get(url, source="nbl", timeout=120)
         response.raise_for_status()
 
         # Save to cache
@@ -56,9 +56,10 @@ DEFAULT_GAME_INDEX_CSV = Path("data/nz_nbl_game_index.csv")
 
 # Try to import optional dependencies
 try:
-    import requests
     from bs4 import BeautifulSoup
 
+    from ..utils.http_transport import http_get
+
     HTML_PARSING_AVAILABLE = True
 except ImportError:
     HTML_PARSING_AVAILABLE = False
@@ -216,7 +217,7 @@ def _scrape_nz_nbl_schedule(season: str) -> pd.DataFrame:
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         }
-        response = requests.get(url, headers=headers, timeout=30)
+        response = http_get(url, source="nz_nbl_web", headers=headers, timeout=30)
         response.raise_for_status()
 
         soup = BeautifulSoup(response.content, "html.parser")
@@ -659,7 +660,7 @@ def _scrape_fiba_box_score(game_id: str) -> pd.DataFrame:
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         }
-        response = requests.get(url, headers=headers, timeout=30)
+        response = http_get(url, source="fiba_livestats", headers=headers, timeout=30)
         response.raise_for_status()
 
         soup = BeautifulSoup(response.content, "html.parser")
@@ -837,7 +838,7 @@ def _scrape_fiba_play_by_play(game_id: str) -> pd.DataFrame:
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         }
-        response = requests.get(url, headers=headers, timeout=30)
+        response = http_get(url, source="fiba_livestats", headers=headers, timeout=30)
         response.raise_for_status()
 
         soup = BeautifulSoup(response.content, "html.parser")
@@ -1228,7 +1229,7 @@ def _scrape_fiba_shot_chart(game_id: str) -> pd.DataFrame:
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         }
-        response = requests.get(url, headers=headers, timeout=30)
+        response = http_get(url, source="fiba_livestats", headers=headers, timeout=30)
         response.raise_for_status()
 
         soup = BeautifulSoup(response.content, "html.parser")
@@ -43,6 +43,7 @@ import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
+from ..utils.http_transport import http_get
 from ..utils.rate_limiter import get_source_limiter
 from .base import cached_dataframe, retry_on_error
 
@@ -81,7 +82,7 @@ def _make_ote_request(url: str, params: dict[str, Any] | None = None) -> str:
     rate_limiter.acquire("ote")
 
     try:
-        response = requests.get(url, headers=OTE_HEADERS, params=params, timeout=30)
+        response = http_get(url, source="ote", headers=OTE_HEADERS, params=params, timeout=30)
         response.raise_for_status()
         return response.text
     except requests.exceptions.RequestException as e:
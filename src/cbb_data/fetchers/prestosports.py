@@ -48,6 +48,7 @@ from typing import Any
 import pandas as pd
 import requests
 
+from ..utils.http_transport import http_get
 from ..utils.rate_limiter import get_source_limiter
 from .base import cached_dataframe, retry_on_error
 
@@ -137,7 +138,7 @@ def _make_prestosports_request(
     }
 
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=30)
+        response = http_get(url, source=league.lower(), headers=headers, params=params, timeout=30)
         response.raise_for_status()
         return response.text
     except requests.exceptions.RequestException as e:
@@ -35,6 +35,7 @@ import logging
 import pandas as pd
 import requests
 
+from ..utils.http_transport import http_get
 from ..utils.rate_limiter import get_source_limiter
 from .base import cached_dataframe, retry_on_error
 
@@ -76,7 +77,7 @@ def _make_wnba_request(endpoint: str, params: dict) -> dict:
     url = f"{WNBA_BASE_URL}/{endpoint}"
 
     try:
-        response = requests.get(url, headers=WNBA_HEADERS, params=params, timeout=30)
+        response = http_get(url, source="wnba", headers=WNBA_HEADERS, params=params, timeout=30)
         response.raise_for_status()
         data: dict = response.json()
         return data
@@ -3,6 +3,8 @@
 The compiler takes a normalized FilterSpec and produces:
 1. Endpoint-specific parameters (for API calls)
 2. Post-processing masks (for filtering results after fetch)
+3. DuckDB predicates for post-masks (compile_sql_filter), so stored data is
+   filtered inside the database instead of in pandas
 
 This separation allows us to:
 - Use native endpoint filters when available (more efficient)
@@ -12,7 +14,10 @@ This separation allows us to:
 
 from __future__ import annotations
 
+import re
 from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import date, datetime
 from typing import Any
 
 from .spec import FilterSpec
@@ -408,3 +413,219 @@ def apply_post_mask(df: Any, post_mask: dict[str, Any]) -> Any:
             out = out.dropna(subset=key_cols)
 
     return out
+
+
+# --- SQL pushdown (DuckDB storage) ---
+
+_SQL_NUMERIC_PREFIXES = (
+    "TINYINT",
+    "SMALLINT",
+    "INTEGER",
+    "BIGINT",
+    "HUGEINT",
+    "UTINYINT",
+    "USMALLINT",
+    "UINTEGER",
+    "UBIGINT",
+    "FLOAT",
+    "DOUBLE",
+    "DECIMAL",
+)
+_REGEX_METACHARS = re.compile(r"[.^$*+?{}\[\]\\|()]")
+
+
+@dataclass
+class SQLFilter:
+    """post_mask compiled to a parameterized DuckDB predicate
+
+    Attributes:
+        where: SQL predicate with ? placeholders (None if nothing was pushed down)
+        params: Values bound to the placeholders, in order
+        residual: post_mask keys that could not be expressed exactly in SQL
+            and must still be applied in pandas
+    """
+
+    where: str | None = None
+    params: list[Any] = field(default_factory=list)
+    residual: list[str] = field(default_factory=list)
+
+    @property
+    def exact(self) -> bool:
+        """True if the predicate reproduces apply_post_mask exactly
+
+        Only then is it safe to push LIMIT and column projection into the query.
+        """
+        return not self.residual
+
+
+def compile_sql_filter(post_mask: dict[str, Any], schema: dict[str, str]) -> SQLFilter:
+    """Compile a post_mask into a DuckDB WHERE clause for stored data
+
+    Mirrors apply_post_mask: the same column lookup (exact name first, then
+    case-insensitive, same fallback names) and the same semantics per filter.
+    A filter is only pushed down when SQL gives exactly the pandas result for
+    the column's type (e.g., integer IDs against a numeric column, plain-text
+    names against a VARCHAR column); anything else is reported in
+    ``residual`` and left to apply_post_mask.
+
+    Args:
+        post_mask: Dictionary of filters from compile_params
+        schema: Stored column name -> DuckDB type (DuckDBStorage.get_schema)
+
+    Returns:
+        SQLFilter with the predicate, bound parameters and residual keys
+
+    Example:
+        >>> compile_sql_filter({"PLAYER_ID": [101, 102]}, {"PLAYER_ID": "BIGINT"})
+        SQLFilter(where='"PLAYER_ID" IN (?, ?)', params=[101, 102], residual=[])
+    """
+    clauses: list[str] = []
+    params: list[Any] = []
+    residual: list[str] = []
+
+    def find_column(*names: str) -> str | None:
+        """Same lookup as apply_post_mask's find_column, over fallback names"""
+        for col_name in names:
+            if col_name in schema:
+                return col_name
+            col_upper = col_name.upper()
+            for col in schema:
+                if col.upper() == col_upper:
+                    return col
+        return None
+
+    def kind(col: str) -> str:
+        col_type = schema[col].upper()
+        if col_type.startswith(_SQL_NUMERIC_PREFIXES):
+            return "numeric"
+        if col_type == "VARCHAR":
+            return "text"
+        if col_type in ("DATE", "TIMESTAMP", "TIMESTAMP_NS", "TIMESTAMP_MS", "TIMESTAMP_S"):
+            return "temporal"
+        return "other"
+
+    def quote(col: str) -> str:
+        return '"' + col.replace('"', '""') + '"'
+
+    def values_match(col: str, values: list[Any]) -> bool:
+        """Values compare in SQL exactly as pandas isin/== would"""
+        col_kind = kind(col)
+        if col_kind == "numeric":
+            return all(isinstance(v, int | float) and not isinstance(v, bool) for v in values)
+        if col_kind == "text":
+            return all(isinstance(v, str) for v in values)
+        return False
+
+    def push_in(key: str, col: str | None) -> None:
+        values = post_mask.get(key)
+        if not values or not col:
+            return
+        values = list(values)
+        if not values_match(col, values):
+            residual.append(key)
+            return
+        clauses.append(f"{quote(col)} IN ({', '.join('?' for _ in values)})")
+        params.extend(values)
+
+    def push_eq(key: str, col: str | None) -> None:
+        value = post_mask.get(key)
+        if not value or not col:
+            return
+        if not values_match(col, [value]):
+            residual.append(key)
+            return
+        clauses.append(f"{quote(col)} = ?")
+        params.append(value)
+
+    def push_min_max(key: str, col: str | None, op: str) -> None:
+        value = post_mask.get(key)
+        if value is None or not col:
+            return
+        if kind(col) != "numeric":
+            residual.append(key)
+            return
+        clauses.append(f"{quote(col)} {op} ?")
+        params.append(float(value))
+
+    def push_contains(key: str, col: str | None) -> None:
+        value = post_mask.get(key)
+        if not value or not col:
+            return
+        if kind(col) != "text":
+            residual.append(key)
+            return
+        clauses.append(f"contains(lower({quote(col)}), lower(?))")
+        params.append(value)
+
+    def push_names(key: str, col: str | None) -> None:
+        names = post_mask.get(key)
+        if not names or not col:
+            return
+        # Plain names only: regex syntax differs between Python re and DuckDB (RE2)
+        if kind(col) != "text" or any(_REGEX_METACHARS.search(name) for name in names):
+            residual.append(key)
+            return
+        clauses.append(f"regexp_matches({quote(col)}, ?, 'i')")
+        params.append("|".join(names))
+
+    # IDs
+    push_in("GAME_ID", find_column("GAME_ID"))
+    push_in("PLAYER_ID", find_column("PLAYER_ID"))
+    push_in("TEAM_ID", find_column("TEAM_ID"))
+    push_in("OPPONENT_TEAM_ID", find_column("OPPONENT_TEAM_ID"))
+
+    # Categorical
+    push_eq("LEAGUE", find_column("LEAGUE"))
+    push_eq("HOME_AWAY", find_column("HOME_AWAY"))
+    push_in("QUARTER", find_column("PERIOD") or find_column("PERIOD_ID") or find_column("QUARTER"))
+
+    # Date range (native DATE/TIMESTAMP columns; strings are parsed by pandas)
+    date_range = post_mask.get("DATE_RANGE")
+    date_col = find_column("GAME_DATE") or find_column("DATE") or find_column("date")
+    if date_range and date_col:
+        if kind(date_col) != "temporal":
+            residual.append("DATE_RANGE")
+        else:
+            for bound, op in ((date_range.start, ">="), (date_range.end, "<=")):
+                if bound:
+                    if isinstance(bound, date) and not isinstance(bound, datetime):
+                        bound = datetime(bound.year, bound.month, bound.day)
+                    clauses.append(f"{quote(date_col)} {op} ?")
+                    params.append(bound)
+
+    # Game minute / minutes played
+    game_minute_col = (
+        find_column("GAME_MINUTE")
+        or find_column("ELAPSED_TIME")
+        or find_column("GAME_TIME")
+        or find_column("game_minute")
+    )
+    push_min_max("MIN_GAME_MINUTE", game_minute_col, ">=")
+    push_min_max("MAX_GAME_MINUTE", game_minute_col, "<=")
+    push_min_max("MIN_MINUTES", find_column("MIN") or find_column("MINUTES"), ">=")
+
+    # Strings
+    push_contains("CONFERENCE", find_column("CONFERENCE"))
+    push_contains("VENUE", find_column("VENUE") or find_column("ARENA"))
+    push_names("PLAYER_NAME", find_column("PLAYER_NAME") or find_column("player_name"))
+    push_names(
+        "TEAM_NAME",
+        find_column("TEAM_NAME") or find_column("team_name") or find_column("TEAM"),
+    )
+    push_names(
+        "OPPONENT_NAME",
+        find_column("OPPONENT_NAME") or find_column("opponent_name") or find_column("OPPONENT"),
+    )
+
+    # Completeness (pandas dropna also drops float NaN)
+    if post_mask.get("ONLY_COMPLETE"):
+        for key_name in ["GAME_ID", "PLAYER_ID", "TEAM_ID"]:
+            col = find_column(key_name)
+            if col:
+                if schema[col].upper() in ("FLOAT", "DOUBLE"):
+                    clauses.append(f"NOT ({quote(col)} IS NULL OR isnan({quote(col)}))")
+                else:
+                    clauses.append(f"{quote(col)} IS NOT NULL")
+
+    where = " AND ".join(clauses) if clauses else None
+    return SQLFilter(where=where, params=params, residual=residual)
@@ -0,0 +1,568 @@
+"""Season-level builder for normalized LNB tables
+
+Transforms raw LNB play-by-play and shots partitions into the normalized
+tables read by api/lnb_historical.py:
+1. player_game - Player box score per game
+2. team_game - Team box score per game (with opponent and result)
+3. shot_events - Unified shot table (zone, distance, points)
+
+A season is processed in one pass: every raw partition for the season is read
+into a single frame, stats are computed with vectorized numpy/groupby
+operations, and each table is written as one parquet file per season.
+
+player_game keeps the MIN and PLUS_MINUS columns of the historical schema but
+leaves them null: the raw PBP has no starting lineups and its score columns
+are not tied to team IDs, so on-court time and plus/minus cannot be derived.
+
+Layout:
+    data/raw/lnb/{pbp,shots}/season=YYYY-YYYY/game_id=<uuid>.parquet   (input)
+    data/normalized/lnb/{table}/season=YYYY-YYYY/data.parquet          (output)
+
+Usage:
+    from cbb_data.lnb.normalize import build_season_tables, transform_season
+
+    tables = build_season_tables("2024-2025")  # DataFrames, nothing written
+    stats = transform_season("2024-2025", force=True)  # build + write
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# ==============================================================================
+# CONFIG
+# ==============================================================================
+
+# Division to League mapping
+DIVISION_TO_LEAGUE = {
+    "1": "LNB_PROA",
+    "2": "LNB_ELITE2",
+    "3": "LNB_ESPOIRS_ELITE",
+    "4": "LNB_ESPOIRS_PROB",
+}
+DEFAULT_LEAGUE = "LNB_PROA"
+
+RAW_DIR = Path("data/raw/lnb")
+NORMALIZED_DIR = Path("data/normalized/lnb")
+HISTORICAL_DIR = Path("data/lnb/historical")
+
+TABLES = ("player_game", "team_game", "shot_events")
+SEASON_FILE = "data.parquet"
+
+# PBP event type -> player_game stat counted once per event
+EVENT_STATS = {
+    "assist": "AST",
+    "steal": "STL",
+    "block": "BLK",
+    "turnover": "TOV",
+    "foul": "PF",
+    "rebound": "REB",
+}
+
+# Basket location (0-100 court coordinates) and court length in feet
+BASKET_X = 4.2
+BASKET_Y = 50.0
+FEET_PER_UNIT = 0.94
+
+# player_game columns the raw data cannot support (always null, see module docstring)
+UNSUPPORTED_PLAYER_COLUMNS = ("MIN", "PLUS_MINUS")
+
+PLAYER_GAME_COLUMNS = [
+    "GAME_ID",
+    "PLAYER_ID",
+    "PLAYER_NAME",
+    "TEAM_ID",
+    "MIN",
+    "PTS",
+    "FGM",
+    "FGA",
+    "FG_PCT",
+    "FG2M",
+    "FG2A",
+    "FG2_PCT",
+    "FG3M",
+    "FG3A",
+    "FG3_PCT",
+    "FTM",
+    "FTA",
+    "FT_PCT",
+    "REB",
+    "AST",
+    "STL",
+    "BLK",
+    "TOV",
+    "PF",
+    "PLUS_MINUS",
+    "SEASON",
+    "LEAGUE",
+]
+
+TEAM_SUM_COLUMNS = [
+    "PTS",
+    "FGM",
+    "FGA",
+    "FG2M",
+    "FG2A",
+    "FG3M",
+    "FG3A",
+    "FTM",
+    "FTA",
+    "REB",
+    "AST",
+    "STL",
+    "BLK",
+    "TOV",
+    "PF",
+]
+
+SHOT_EVENT_COLUMNS = [
+    "GAME_ID",
+    "EVENT_ID",
+    "PLAYER_ID",
+    "PLAYER_NAME",
+    "TEAM_ID",
+    "PERIOD",
+    "CLOCK",
+    "CLOCK_SECONDS",
+    "SHOT_TYPE",
+    "SHOT_SUBTYPE",
+    "SHOT_ZONE",
+    "SHOT_DISTANCE",
+    "X",
+    "Y",
+    "MADE",
+    "POINTS",
+    "DESCRIPTION",
+    "LEAGUE",
+    "SEASON",
+]
+
+# ==============================================================================
+# VECTORIZED HELPERS
+# ==============================================================================
+
+
+def parse_clock_seconds(clock: pd.Series) -> pd.Series:
+    """Convert ISO 8601 clock strings (e.g., "PT9M59.5S") to seconds
+
+    Unparseable or missing values become 0.0.
+    """
+    parts = clock.astype("string").str.extract(r"^PT(?:(\d+)M)?(?:(\d+(?:\.\d*)?)S)?$")
+    minutes = pd.to_numeric(parts[0], errors="coerce").fillna(0)
+    seconds = pd.to_numeric(parts[1], errors="coerce").fillna(0)
+    return (minutes * 60 + seconds).astype(float)
+
+
+def shot_distance(x: pd.Series, y: pd.Series) -> pd.Series:
+    """Distance from the basket in feet (NaN when a coordinate is missing)"""
+    x = pd.to_numeric(x, errors="coerce").astype(float)
+    y = pd.to_numeric(y, errors="coerce").astype(float)
+    return np.hypot(x - BASKET_X, y - BASKET_Y).mul(FEET_PER_UNIT).round(1)
+
+
+def classify_shot_zones(x: pd.Series, y: pd.Series, shot_type: pd.Series) -> pd.Series:
+    """Classify shots into Paint, Mid-Range and Three-Point (Corner/Wing/Top)
+
+    Missing coordinates are classified as "Unknown".
+    """
+    x = pd.to_numeric(x, errors="coerce").to_numpy(dtype=float)
+    y = pd.to_numeric(y, errors="coerce").to_numpy(dtype=float)
+    three = (shot_type == "3pt").to_numpy()
+    zones = np.select(
+        [
+            np.isnan(x) | np.isnan(y),
+            three & ((y < 22) | (y > 78)),
+            three & ((y < 35) | (y > 65)),
+            three,
+            x < 19,  # In the paint (under basket to free throw line)
+        ],
+        ["Unknown", "Three-Point (Corner)", "Three-Point (Wing)", "Three-Point (Top)", "Paint"],
+        default="Mid-Range",
+    )
+    return pd.Series(zones, index=shot_type.index, dtype=object)
+
+
+def _pct(made: pd.Series, attempts: pd.Series) -> pd.Series:
+    """Shooting percentage rounded to 3 places (0.0 when there are no attempts)"""
+    return (made / attempts.where(attempts > 0)).round(3).fillna(0.0)
+
+
+# ==============================================================================
+# LOADING
+# ==============================================================================
+
+
+def read_season_partitions(kind: str, season: str, raw_dir: Path | None = None) -> pd.DataFrame:
+    """Read every per-game raw partition of a season into one DataFrame
+
+    Files are scanned together as one pyarrow dataset (schemas are unified, so
+    all-null columns in some games don't break the read). Rows whose GAME_ID
+    doesn't match the file's game_id=<uuid> name are dropped, so corrupted
+    partitions can't leak into other games.
+
+    Args:
+        kind: Raw table ("pbp" or "shots")
+        season: Season string (e.g., "2024-2025")
+        raw_dir: Raw LNB directory (default: RAW_DIR)
+
+    Returns:
+        Concatenated rows for all games (empty if the season has no data)
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    season_dir = (raw_dir or RAW_DIR) / kind / f"season={season}"
+    files = sorted(str(f) for f in season_dir.glob("game_id=*.parquet"))
+    if not files:
+        return pd.DataFrame()
+
+    schemas = [pq.read_schema(f) for f in files]
+    try:
+        schema = pa.unify_schemas(schemas, promote_options="permissive")
+    except TypeError:  # pyarrow < 14
+        schema = pa.unify_schemas(schemas)
+    schema = schema.remove_metadata()
+
+    batches = []
+    file_ids = []
+    for tagged in ds.dataset(files, schema=schema, format="parquet").scanner().scan_batches():
+        batches.append(tagged.record_batch)
+        file_ids.append(
+            np.full(
+                tagged.record_batch.num_rows, Path(tagged.fragment.path).stem[len("game_id=") :]
+            )
+        )
+
+    df = pa.Table.from_batches(batches, schema=schema).to_pandas()
+    if df.empty or "GAME_ID" not in df.columns:
+        return df
+
+    file_game_ids = np.concatenate(file_ids) if file_ids else np.array([], dtype=object)
+    mismatch = df["GAME_ID"].astype(str).to_numpy() != file_game_ids
+    if mismatch.any():
+        bad_files = sorted(set(file_game_ids[mismatch]))
+        logger.error(
+            f"UUID mismatch between file name and GAME_ID in {len(bad_files)} {kind} "
+            f"partitions for {season}; skipping those rows: {bad_files[:5]}"
+        )
+        df = df[~mismatch].reset_index(drop=True)
+
+    df["GAME_ID"] = df["GAME_ID"].astype(str)
+    return df
+
+
+def load_game_league_mapping(season: str, historical_dir: Path | None = None) -> dict[str, str]:
+    """Build a game_id -> league mapping from the season's fixtures files
+
+    Args:
+        season: Season string (e.g., "2025-2026")
+        historical_dir: Historical LNB directory (default: HISTORICAL_DIR)
+
+    Returns:
+        Dict mapping game_id (fixture_uuid) to league name (empty if no fixtures)
+    """
+    game_to_league: dict[str, str] = {}
+
+    season_dir = (historical_dir or HISTORICAL_DIR) / season
+    if not season_dir.exists():
+        logger.warning(f"No historical directory for {season}, using default {DEFAULT_LEAGUE}")
+        return game_to_league
+
+    for fixtures_file in sorted(season_dir.glob("*fixtures*.parquet")):
+        try:
+            fixtures = pd.read_parquet(fixtures_file)
+        except Exception as e:
+            logger.warning(f"Failed to load {fixtures_file}: {e}")
+            continue
+
+        if "division" not in fixtures.columns:
+            continue
+
+        id_col = "fixture_uuid" if "fixture_uuid" in fixtures.columns else "GAME_ID"
+        leagues = fixtures["division"].astype(str).map(DIVISION_TO_LEAGUE).fillna(DEFAULT_LEAGUE)
+        game_to_league.update(zip(fixtures[id_col].astype(str), leagues, strict=True))
+        logger.info(f"Loaded {len(fixtures)} game->league mappings from {fixtures_file.name}")
+
+    return game_to_league
+
+
+# ==============================================================================
+# TRANSFORMS
+# ==============================================================================
+
+
+def build_player_game(
+    pbp: pd.DataFrame,
+    shots: pd.DataFrame,
+    season: str,
+    game_to_league: dict[str, str] | None = None,
+) -> pd.DataFrame:
+    """Aggregate PBP events and shots into player box scores for many games
+
+    Counting stats (AST, STL, BLK, TOV, PF, REB, FTM/FTA) come from PBP events,
+    field goals from the shots table. Only games with both PBP and shots are
+    included. Players are listed per game in order of first appearance (PBP
+    first, then shooters who have no PBP events). MIN and PLUS_MINUS are
+    unsupported and left null.
+
+    Args:
+        pbp: PBP rows for all games (GAME_ID, PLAYER_ID, PLAYER_NAME, TEAM_ID,
+            EVENT_TYPE, SUCCESS)
+        shots: Shot rows for all games (GAME_ID, PLAYER_ID, PLAYER_NAME,
+            TEAM_ID, SHOT_TYPE, SUCCESS)
+        season: Season string
+        game_to_league: Optional game_id -> league mapping (default: LNB_PROA)
+
+    Returns:
+        DataFrame with PLAYER_GAME_COLUMNS
+    """
+    if pbp.empty or shots.empty:
+        return pd.DataFrame(columns=PLAYER_GAME_COLUMNS)
+
+    games = np.intersect1d(pbp["GAME_ID"].unique(), shots["GAME_ID"].unique())
+    pbp = pbp[pbp["GAME_ID"].isin(games) & pbp["PLAYER_ID"].notna()]
+    shots = shots[shots["GAME_ID"].isin(games) & shots["PLAYER_ID"].notna()]
+
+    keys = ["GAME_ID", "PLAYER_ID"]
+    identity = ["PLAYER_NAME", "TEAM_ID"]
+
+    # First appearance gives each player's name and team
+    players = pd.concat([pbp[keys + identity], shots[keys + identity]], ignore_index=True)
+    players = players.drop_duplicates(keys)
+    game_order = pd.factorize(players["GAME_ID"])[0]
+    players = players.iloc[np.argsort(game_order, kind="stable")].reset_index(drop=True)
+
+    # Counting stats from PBP: one indicator column per stat, one groupby
+    event_type = pbp["EVENT_TYPE"]
+    is_ft = event_type == "freeThrow"
+    counts = pd.DataFrame({stat: event_type == event for event, stat in EVENT_STATS.items()})
+    counts["FTA"] = is_ft
+    counts["FTM"] = is_ft & pbp["SUCCESS"].eq(True)
+    counts[keys] = pbp[keys]
+    event_totals = counts.groupby(keys, sort=False).sum()
+
+    # Field goals from shots
+    shot_type = shots["SHOT_TYPE"]
+    made = shots["SUCCESS"].eq(True)
+    fg = pd.DataFrame(
+        {
+            "FG2A": shot_type == "2pt",
+            "FG2M": (shot_type == "2pt") & made,
+            "FG3A": shot_type == "3pt",
+            "FG3M": (shot_type == "3pt") & made,
+        }
+    )
+    fg[keys] = shots[keys]
+    shot_totals = fg.groupby(keys, sort=False).sum()
+
+    df = players.join(event_totals, on=keys).join(shot_totals, on=keys)
+    stat_columns = list(EVENT_STATS.values()) + ["FTA", "FTM", "FG2A", "FG2M", "FG3A", "FG3M"]
+    df[stat_columns] = df[stat_columns].fillna(0).astype("int64")
+
+    df["FGM"] = df["FG2M"] + df["FG3M"]
+    df["FGA"] = df["FG2A"] + df["FG3A"]
+    df["PTS"] = df["FG2M"] * 2 + df["FG3M"] * 3 + df["FTM"]
+    df["FG_PCT"] = _pct(df["FGM"], df["FGA"])
+    df["FG2_PCT"] = _pct(df["FG2M"], df["FG2A"])
+    df["FG3_PCT"] = _pct(df["FG3M"], df["FG3A"])
+    df["FT_PCT"] = _pct(df["FTM"], df["FTA"])
+    df[list(UNSUPPORTED_PLAYER_COLUMNS)] = np.nan
+    df["SEASON"] = season
+    df["LEAGUE"] = df["GAME_ID"].map(game_to_league or {}).fillna(DEFAULT_LEAGUE)
+
+    return df[PLAYER_GAME_COLUMNS]
+
+
+def build_team_game(player_game: pd.DataFrame) -> pd.DataFrame:
+    """Aggregate player box scores into team box scores
+
+    Games with exactly two teams also get OPP_ID, OPP_PTS and WIN.
+
+    Args:
+        player_game: Output of build_player_game()
+
+    Returns:
+        DataFrame with one row per (game, team)
+    """
+    if player_game.empty:
+        return pd.DataFrame()
+
+    df = (
+        player_game.groupby(["GAME_ID", "TEAM_ID"], sort=False, dropna=False)
+        .agg({**dict.fromkeys(TEAM_SUM_COLUMNS, "sum"), "SEASON": "first", "LEAGUE": "first"})
+        .reset_index()
+    )
+    df[TEAM_SUM_COLUMNS] = df[TEAM_SUM_COLUMNS].astype("int64")
+    df["FG_PCT"] = _pct(df["FGM"], df["FGA"])
+    df["FG2_PCT"] = _pct(df["FG2M"], df["FG2A"])
+    df["FG3_PCT"] = _pct(df["FG3M"], df["FG3A"])
+    df["FT_PCT"] = _pct(df["FTM"], df["FTA"])
+    pct_columns = ["FG_PCT", "FG2_PCT", "FG3_PCT", "FT_PCT"]
+    df = df[["GAME_ID", "TEAM_ID", *TEAM_SUM_COLUMNS, *pct_columns, "SEASON", "LEAGUE"]]
+
+    # Opponent columns: the other row of the same game (two-team games only)
+    game_order = pd.factorize(df["GAME_ID"])[0]
+    df = df.iloc[np.argsort(game_order, kind="stable")].reset_index(drop=True)
+    two_teams = (df.groupby("GAME_ID", sort=False)["TEAM_ID"].transform("size") == 2).to_numpy()
+    position = df.groupby("GAME_ID", sort=False).cumcount().to_numpy()
+    opponent = np.where(position == 0, df.index + 1, df.index - 1)
+    opponent = np.where(two_teams, opponent, 0)
+
+    df["OPP_ID"] = df["TEAM_ID"].to_numpy()[opponent]
+    df["OPP_PTS"] = df["PTS"].to_numpy()[opponent]
+    df["WIN"] = (df["PTS"] > df["OPP_PTS"]).astype("int64")
+    df.loc[~two_teams, ["OPP_ID", "OPP_PTS", "WIN"]] = np.nan
+    return df
+
+
+def build_shot_events(shots: pd.DataFrame, season: str) -> pd.DataFrame:
+    """Standardize raw shots into the unified shot events table
+
+    Args:
+        shots: Raw shot rows for all games
+        season: Season string
+
+    Returns:
+        DataFrame with SHOT_EVENT_COLUMNS
+    """
+    if shots.empty:
+        return pd.DataFrame(columns=SHOT_EVENT_COLUMNS)
+
+    df = shots.copy()
+    made = df["SUCCESS"].eq(True)
+    df["CLOCK_SECONDS"] = parse_clock_seconds(df["CLOCK"])
+    df["SHOT_DISTANCE"] = shot_distance(df["X_COORD"], df["Y_COORD"])
+    df["SHOT_ZONE"] = classify_shot_zones(df["X_COORD"], df["Y_COORD"], df["SHOT_TYPE"])
+    df["POINTS"] = np.where(made, np.where(df["SHOT_TYPE"] == "2pt", 2, 3), 0)
+
+    df = df.rename(
+        columns={"PERIOD_ID": "PERIOD", "SUCCESS": "MADE", "X_COORD": "X", "Y_COORD": "Y"}
+    )
+    df["SEASON"] = season
+    for col in SHOT_EVENT_COLUMNS:
+        if col not in df.columns:
+            df[col] = None
+    return df[SHOT_EVENT_COLUMNS]
+
+
+# ==============================================================================
+# PIPELINE
+# ==============================================================================
+
+
+def build_season_tables(
+    season: str,
+    raw_dir: Path | None = None,
+    historical_dir: Path | None = None,
+) -> dict[str, pd.DataFrame]:
+    """Build all normalized tables for a season (nothing is written)
+
+    Args:
+        season: Season string (e.g., "2024-2025")
+        raw_dir: Raw LNB directory (default: RAW_DIR)
+        historical_dir: Historical LNB directory for fixtures (default: HISTORICAL_DIR)
+
+    Returns:
+        {"player_game": ..., "team_game": ..., "shot_events": ...}
+    """
+    pbp = read_season_partitions("pbp", season, raw_dir)
+    shots = read_season_partitions("shots", season, raw_dir)
+    game_to_league = load_game_league_mapping(season, historical_dir)
+
+    player_game = build_player_game(pbp, shots, season, game_to_league)
+    return {
+        "player_game": player_game,
+        "team_game": build_team_game(player_game),
+        "shot_events": build_shot_events(shots, season),
+    }
+
+
+def _season_output(table: str, season: str, out_dir: Path | None) -> Path:
+    return (out_dir or NORMALIZED_DIR) / table / f"season={season}" / SEASON_FILE
+
+
+def _is_up_to_date(season: str, raw_dir: Path | None, out_dir: Path | None) -> bool:
+    """True if every output exists and is newer than every raw input file"""
+    outputs = [_season_output(table, season, out_dir) for table in TABLES]
+    if not all(path.exists() for path in outputs):
+        return False
+    inputs: Iterable[Path] = (
+        f
+        for kind in ("pbp", "shots")
+        for f in ((raw_dir or RAW_DIR) / kind / f"season={season}").glob("*.parquet")
+    )
+    newest_input = max((f.stat().st_mtime for f in inputs), default=0.0)
+    return min(path.stat().st_mtime for path in outputs) >= newest_input
+
+
+def write_season_tables(
+    tables: dict[str, pd.DataFrame], season: str, out_dir: Path | None = None
+) -> dict[str, int]:
+    """Write each table as a single parquet file per season
+
+    Older per-game files (game_id=<uuid>.parquet) in the season directory are
+    removed so readers don't see duplicate rows.
+
+    Args:
+        tables: Output of build_season_tables()
+        season: Season string
+        out_dir: Normalized LNB directory (default: NORMALIZED_DIR)
+
+    Returns:
+        Rows written per table
+    """
+    written = {}
+    for table, df in tables.items():
+        path = _season_output(table, season, out_dir)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        for stale in path.parent.glob("game_id=*.parquet"):
+            stale.unlink()
+        if df.empty:
+            path.unlink(missing_ok=True)
+            written[table] = 0
+            continue
+        tmp = path.with_suffix(".tmp")
+        df.to_parquet(tmp, index=False)
+        tmp.replace(path)
+        written[table] = len(df)
+    return written
+
+
+def transform_season(
+    season: str,
+    force: bool = False,
+    raw_dir: Path | None = None,
+    out_dir: Path | None = None,
+    historical_dir: Path | None = None,
+) -> dict[str, Any]:
+    """Build and write all normalized tables for a season
+
+    Args:
+        season: Season string (e.g., "2024-2025")
+        force: Rebuild even if outputs are newer than the raw inputs
+        raw_dir: Raw LNB directory (default: RAW_DIR)
+        out_dir: Normalized LNB directory (default: NORMALIZED_DIR)
+        historical_dir: Historical LNB directory (default: HISTORICAL_DIR)
+
+    Returns:
+        Dict with games processed, rows written per table and whether the
+        season was skipped as up to date
+    """
+    if not force and _is_up_to_date(season, raw_dir, out_dir):
+        logger.info(f"LNB {season}: normalized tables are up to date")
+        return {"season": season, "skipped": True, "games": 0}
+
+    tables = build_season_tables(season, raw_dir, historical_dir)
+    written = write_season_tables(tables, season, out_dir)
+    games = int(tables["player_game"]["GAME_ID"].nunique()) if written["player_game"] else 0
+    logger.info(f"LNB {season}: normalized {games} games {written}")
+    return {"season": season, "skipped": False, "games": games, **written}
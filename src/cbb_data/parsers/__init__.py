@@ -7,11 +7,15 @@ enabling box score generation for NCAA games where ESPN's API returns empty stat
 from cbb_data.parsers.pbp_parser import (
     extract_player_mapping,
     parse_game_to_box_score,
+    parse_games_to_box_scores,
     parse_pbp_to_player_stats,
+    parse_pbp_to_player_stats_batch,
 )
 
 __all__ = [
     "parse_game_to_box_score",
     "extract_player_mapping",
     "parse_pbp_to_player_stats",
+    "parse_games_to_box_scores",
+    "parse_pbp_to_player_stats_batch",
 ]
@@ -10,14 +10,20 @@ Key Functions:
     - extract_player_mapping(): Get player ID→name mapping from boxscore.players
     - parse_pbp_to_player_stats(): Calculate statistics from play-by-play events
     - parse_game_to_box_score(): Main entry point, orchestrates full transformation
+    - parse_pbp_to_player_stats_batch() / parse_games_to_box_scores(): many games in one pass
 
+Statistics are computed column-wise: PARTICIPANTS is exploded once, each
+PLAY_TYPE is mapped to stat deltas via PLAY_TYPE_DELTAS, and totals come from a
+single groupby over (GAME_ID, PLAYER_ID).
 """
 
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
@@ -110,124 +116,182 @@ def extract_player_mapping(boxscore: dict) -> dict:
     return player_map
 
 
-def _initialize_player_stats(player_id: str) -> dict:
-    """Initialize empty stats dict for a player
-
-    Creates a dictionary with all stat categories initialized to 0. This is used
-    when a player is first encountered in the play-by-play data.
+# Box score stat columns, in output order
+STAT_COLUMNS = [
+    "PTS",  # Points
+    "FGM",  # Field goals made
+    "FGA",  # Field goals attempted
+    "FG2M",  # 2-point FG made
+    "FG2A",  # 2-point FG attempted
+    "FG3M",  # 3-point FG made
+    "FG3A",  # 3-point FG attempted
+    "FTM",  # Free throws made
+    "FTA",  # Free throws attempted
+    "OREB",  # Offensive rebounds
+    "DREB",  # Defensive rebounds
+    "AST",  # Assists
+    "STL",  # Steals
+    "TOV",  # Turnovers
+    "BLK",  # Blocks
+    "PF",  # Personal fouls
+]
+
+# Field goal play types (JumpShot can be 2PT or 3PT; the rest are 2PT)
+SHOT_PLAY_TYPES = ["JumpShot", "LayUpShot", "DunkShot", "TipShot"]
+
+# Fixed per-play stat deltas for the primary participant. Shots depend on
+# SCORE_VALUE and TEXT and are handled separately; any other play type whose
+# name contains "Turnover" counts as a turnover.
+PLAY_TYPE_DELTAS: dict[str, dict[str, int]] = {
+    "MadeFreeThrow": {"FTA": 1, "FTM": 1, "PTS": 1},
+    "MissedFreeThrow": {"FTA": 1},
+    "Defensive Rebound": {"DREB": 1},
+    "Offensive Rebound": {"OREB": 1},
+    "Steal": {"STL": 1},
+    "Block Shot": {"BLK": 1},
+    "PersonalFoul": {"PF": 1},
+}
+
+
+def _play_type_delta_matrix(play_types: pd.Series) -> np.ndarray:
+    """Look up fixed stat deltas for each play
 
     Args:
-        player_id: ESPN player ID (string)
+        play_types: PLAY_TYPE column
 
     Returns:
-        Dict with all stat fields set to 0
+        int64 array of shape (len(play_types), len(STAT_COLUMNS))
     """
-    return {
-        "PLAYER_ID": player_id,
-        "PTS": 0,  # Points
-        "FGM": 0,  # Field goals made
-        "FGA": 0,  # Field goals attempted
-        "FG2M": 0,  # 2-point FG made
-        "FG2A": 0,  # 2-point FG attempted
-        "FG3M": 0,  # 3-point FG made
-        "FG3A": 0,  # 3-point FG attempted
-        "FTM": 0,  # Free throws made
-        "FTA": 0,  # Free throws attempted
-        "OREB": 0,  # Offensive rebounds
-        "DREB": 0,  # Defensive rebounds
-        "AST": 0,  # Assists
-        "STL": 0,  # Steals
-        "TOV": 0,  # Turnovers
-        "BLK": 0,  # Blocks
-        "PF": 0,  # Personal fouls
-    }
-
-
-def _handle_shot(
-    stats: dict, shooter_id: str, participants: list, score_value: int, text: str
-) -> None:
-    """Process shot attempts (field goals)
-
-    Updates shooter's stats for field goal attempts. Determines if 2PT or 3PT based
-    on score_value, and if made or missed based on text keywords.
-
-    For made shots, also checks for assists (second participant in list).
+    codes, uniques = pd.factorize(play_types)
+    table = np.zeros((len(uniques) + 1, len(STAT_COLUMNS)), dtype=np.int64)
+    for i, play_type in enumerate(uniques):
+        deltas = PLAY_TYPE_DELTAS.get(play_type)
+        if deltas is None and isinstance(play_type, str) and "Turnover" in play_type:
+            deltas = {"TOV": 1}
+        for stat, value in (deltas or {}).items():
+            table[i, STAT_COLUMNS.index(stat)] = value
+    # Code -1 (missing play type) selects the trailing all-zero row
+    deltas_by_play: np.ndarray = table[codes]
+    return deltas_by_play
 
-    Args:
-        stats: Master stats dict {player_id: stats_dict}
-        shooter_id: Player ID of shooter
-        participants: List of player IDs involved [shooter, assister(optional)]
-        score_value: Points scored (0=miss, 2=2PT made, 3=3PT made)
-        text: Play description text (used to detect "made" vs "missed")
-
-    Side Effects:
-        Modifies stats dict in-place, updating shooter and assister stats
-
-    Play Types Handled:
-        - JumpShot (2PT or 3PT)
-        - LayUpShot (2PT)
-        - DunkShot (2PT)
-        - TipShot (2PT)
-    """
-    # Determine if 2PT or 3PT from score value
-    is_three = score_value == 3
-    is_two = score_value == 2
 
-    # Update attempts
-    stats[shooter_id]["FGA"] += 1
-    if is_three:
-        stats[shooter_id]["FG3A"] += 1
-    elif is_two:
-        stats[shooter_id]["FG2A"] += 1
+def _column(plays: pd.DataFrame, name: str, default: Any) -> pd.Series:
+    """Get a plays column, or a constant Series when it is missing"""
+    if name in plays.columns:
+        return plays[name]
+    return pd.Series([default] * len(plays), index=plays.index, dtype=object)
 
-    # Check if shot was made (from text description)
-    text_lower = text.lower() if text else ""
-    made = "made" in text_lower or "makes" in text_lower
 
-    if made:
-        # Update makes
-        stats[shooter_id]["FGM"] += 1
-        if is_three:
-            stats[shooter_id]["FG3M"] += 1
-        elif is_two:
-            stats[shooter_id]["FG2M"] += 1
+def _accumulate_player_stats(plays: pd.DataFrame, game_ids: pd.Series) -> pd.DataFrame:
+    """Aggregate play-by-play events into per-(game, player) stat totals
 
-        # Add points
-        stats[shooter_id]["PTS"] += score_value
+    Each play credits its first participant; made field goals also credit the
+    second participant with an assist. Players are returned in order of first
+    appearance within each game, games in order of first appearance.
 
-        # Check for assist (2nd participant)
-        if len(participants) > 1:
-            assister_id = participants[1]
-            if assister_id not in stats:
-                stats[assister_id] = _initialize_player_stats(assister_id)
-            stats[assister_id]["AST"] += 1
+    Args:
+        plays: PBP rows (PLAY_TYPE, PARTICIPANTS, SCORE_VALUE, TEXT)
+        game_ids: Game key for each play (aligned with plays)
 
+    Returns:
+        DataFrame with GAME_ID, PLAYER_ID and STAT_COLUMNS (empty if no player events)
+    """
+    # Explode PARTICIPANTS once; each play occupies max(len, 1) exploded slots
+    participants = _column(plays, "PARTICIPANTS", []).reset_index(drop=True)
+    exploded_series = participants.explode()
+    exploded = exploded_series.to_numpy()
+    n_participants = np.bincount(exploded_series.index, minlength=len(participants))
+    first_slot = np.concatenate([[0], np.cumsum(n_participants)[:-1]])
+
+    # A single null slot is either an empty/missing list or [None]
+    maybe_empty = np.flatnonzero((n_participants == 1) & pd.isna(exploded[first_slot]))
+    n_participants[maybe_empty] = [
+        len(p) if isinstance(p, (list, tuple, np.ndarray)) else 0
+        for p in participants.to_numpy()[maybe_empty]
+    ]
 
-def _handle_free_throw(stats: dict, player_id: str, play_type: str) -> None:
-    """Process free throw attempts
+    # Team events (no participants) don't affect player stats
+    valid = n_participants > 0
+    play_types = _column(plays, "PLAY_TYPE", None)[valid]
+    score = pd.to_numeric(_column(plays, "SCORE_VALUE", 0)[valid], errors="coerce")
+    text = _column(plays, "TEXT", "")[valid].to_numpy()
+    first_slot = first_slot[valid]
+    n_participants = n_participants[valid]
+    games = game_ids[valid].to_numpy()
+
+    # Fixed deltas (free throws, rebounds, steals, blocks, fouls, turnovers)
+    deltas = _play_type_delta_matrix(play_types)
+
+    # Field goals: attempts from the play type, makes from the description
+    is_shot = play_types.isin(SHOT_PLAY_TYPES).to_numpy()
+    made = np.zeros(len(is_shot), dtype=bool)
+    made[is_shot] = [
+        isinstance(t, str) and ("made" in t.lower() or "makes" in t.lower()) for t in text[is_shot]
+    ]
+    is_two = (score == 2).to_numpy()
+    is_three = (score == 3).to_numpy()
+    scored = made & score.notna().to_numpy()
+
+    col = STAT_COLUMNS.index
+    deltas[:, col("FGA")] += is_shot
+    deltas[:, col("FG2A")] += is_shot & is_two
+    deltas[:, col("FG3A")] += is_shot & is_three
+    deltas[:, col("FGM")] += made
+    deltas[:, col("FG2M")] += made & is_two
+    deltas[:, col("FG3M")] += made & is_three
+
+    primary = pd.DataFrame(deltas, columns=STAT_COLUMNS)
+    points = score.where(scored, 0).to_numpy()
+    primary["PTS"] = primary["PTS"].to_numpy() + points
+    primary.insert(0, "PLAYER_ID", exploded[first_slot].astype(str))
+    primary.insert(0, "GAME_ID", games)
+
+    # Assists: second participant on made field goals
+    assisted = scored & (n_participants > 1)
+    assists = pd.DataFrame(0, index=range(int(assisted.sum())), columns=STAT_COLUMNS)
+    assists["AST"] = 1
+    assists.insert(0, "PLAYER_ID", exploded[first_slot[assisted] + 1])
+    assists.insert(0, "GAME_ID", games[assisted])
+
+    # Interleave so each assist follows its shot (preserves first-appearance order)
+    order = np.concatenate([np.arange(len(primary)) * 2, np.flatnonzero(assisted) * 2 + 1])
+    events = pd.concat([primary, assists], ignore_index=True)
+    events = events.iloc[np.argsort(order, kind="stable")]
+
+    return (
+        events.groupby(["GAME_ID", "PLAYER_ID"], sort=False, dropna=False)[STAT_COLUMNS]
+        .sum()
+        .reset_index()
+    )
 
-    Updates player's FT stats. Made free throws also add 1 point.
 
-    Args:
-        stats: Master stats dict {player_id: stats_dict}
-        player_id: Player ID taking free throw
-        play_type: Play type string ("MadeFreeThrow" or "MissedFreeThrow")
+def _finalize_player_stats(
+    stats: pd.DataFrame, player_mappings: Mapping[Any, dict], game_ids: pd.Series
+) -> pd.DataFrame:
+    """Add player names, teams, REB and FG_PCT to accumulated stats"""
+    info = [
+        player_mappings.get(game_id, {}).get(player_id, {})
+        for game_id, player_id in zip(game_ids, stats["PLAYER_ID"], strict=True)
+    ]
+    stats["PLAYER_NAME"] = [player.get("name", "Unknown") for player in info]
+    stats["TEAM"] = [player.get("team_name", "Unknown") for player in info]
 
-    Side Effects:
-        Modifies stats dict in-place
-    """
-    stats[player_id]["FTA"] += 1
+    # Calculate total rebounds
+    stats["REB"] = stats["OREB"] + stats["DREB"]
 
-    if play_type == "MadeFreeThrow":
-        stats[player_id]["FTM"] += 1
-        stats[player_id]["PTS"] += 1
+    # Calculate field goal percentage (avoid division by zero)
+    stats["FG_PCT"] = (stats["FGM"] / stats["FGA"]).fillna(0.0)
+    return stats
 
 
 def parse_pbp_to_player_stats(plays: pd.DataFrame, player_mapping: dict) -> pd.DataFrame:
     """Parse play-by-play events to calculate per-player statistics
 
-    Iterates through all plays and accumulates statistics for each player based on
-    play type. Uses player_mapping to enrich results with player names and team info.
+    Maps each play type to stat deltas through PLAY_TYPE_DELTAS, credits the
+    first participant (and the second, for assists on made field goals), and
+    aggregates with a single groupby. Uses player_mapping to enrich results with
+    player names and team info. For many games at once, use
+    parse_pbp_to_player_stats_batch().
 
     Args:
         plays: DataFrame with PBP data, required columns:
@@ -256,88 +320,146 @@ def parse_pbp_to_player_stats(plays: pd.DataFrame, player_mapping: dict) -> pd.D
     Notes:
         - Players with no stats (DNP) will not appear in output
         - Team events (team rebounds, timeouts) are skipped
-        - Malformed plays are logged and skipped
+        - Players are listed in order of first appearance in the plays
         - FG_PCT = FGM / FGA, NaN becomes 0.0 for players with no attempts
     """
     if plays.empty:
         logger.warning("Empty plays DataFrame provided")
         return pd.DataFrame()
 
-    stats = {}
-
-    # Iterate through plays and accumulate stats
-    for _, play in plays.iterrows():
-        try:
-            play_type = play.get("PLAY_TYPE")
-            participants = play.get("PARTICIPANTS", [])
-            score_value = play.get("SCORE_VALUE", 0)
-            text = play.get("TEXT", "")
-
-            # Skip team events (no participants)
-            if not participants or len(participants) == 0:
-                continue
-
-            # Primary player (first in participants list)
-            primary_player_id = str(participants[0])
-
-            # Initialize player stats if first time seeing them
-            if primary_player_id not in stats:
-                stats[primary_player_id] = _initialize_player_stats(primary_player_id)
+    game_ids = pd.Series(0, index=plays.index)
+    stats = _accumulate_player_stats(plays, game_ids)
+    if stats.empty:
+        logger.warning("No player stats accumulated from plays")
+        return pd.DataFrame()
 
-            # Process play based on type
-            if play_type in ["JumpShot", "LayUpShot", "DunkShot", "TipShot"]:
-                _handle_shot(stats, primary_player_id, participants, score_value, text)
+    df = _finalize_player_stats(
+        stats.drop(columns="GAME_ID"), {0: player_mapping}, stats["GAME_ID"]
+    )
+    logger.info(f"Parsed PBP to {len(df)} player box scores")
+    return df
 
-            elif play_type in ["MadeFreeThrow", "MissedFreeThrow"]:
-                _handle_free_throw(stats, primary_player_id, play_type)
 
-            elif play_type == "Defensive Rebound":
-                stats[primary_player_id]["DREB"] += 1
+def parse_pbp_to_player_stats_batch(
+    plays: pd.DataFrame, player_mappings: Mapping[str, dict], game_col: str = "GAME_ID"
+) -> pd.DataFrame:
+    """Parse play-by-play events for many games at once
 
-            elif play_type == "Offensive Rebound":
-                stats[primary_player_id]["OREB"] += 1
+    Same statistics as parse_pbp_to_player_stats(), computed for every game in
+    one pass instead of once per game.
 
-            elif play_type == "Steal":
-                stats[primary_player_id]["STL"] += 1
+    Args:
+        plays: Concatenated PBP rows for all games, with a game ID column
+        player_mappings: {game_id: extract_player_mapping() result} for each game
+        game_col: Name of the game ID column in plays (default: "GAME_ID")
 
-            elif play_type == "Block Shot":
-                stats[primary_player_id]["BLK"] += 1
+    Returns:
+        DataFrame with GAME_ID followed by the parse_pbp_to_player_stats()
+        columns; one row per (game, player), in order of first appearance
 
-            elif play_type and "Turnover" in play_type:  # type: ignore[operator]
-                stats[primary_player_id]["TOV"] += 1
+    Example:
+        >>> plays = pd.concat([g["plays"] for g in games.values()], ignore_index=True)
+        >>> mappings = {gid: extract_player_mapping(g["boxscore_raw"]) for gid, g in games.items()}
+        >>> box_scores = parse_pbp_to_player_stats_batch(plays, mappings)
+    """
+    if plays.empty:
+        logger.warning("Empty plays DataFrame provided")
+        return pd.DataFrame()
+    if game_col not in plays.columns:
+        raise ValueError(f"plays is missing game ID column {game_col!r}")
 
-            elif play_type == "PersonalFoul":
-                stats[primary_player_id]["PF"] += 1
+    stats = _accumulate_player_stats(plays, plays[game_col])
+    if stats.empty:
+        logger.warning("No player stats accumulated from plays")
+        return pd.DataFrame()
 
-            # Other play types (Substitution, Timeout, etc.) don't affect box scores
+    df = _finalize_player_stats(stats, player_mappings, stats["GAME_ID"])
+    logger.info(f"Parsed PBP to {len(df)} player box scores across {df['GAME_ID'].nunique()} games")
+    return df
 
-        except Exception as e:
-            logger.warning(f"Error processing play: {e}")
-            continue
 
-    # Convert stats dict to DataFrame
-    if not stats:
-        logger.warning("No player stats accumulated from plays")
-        return pd.DataFrame()
+# Output columns of parse_game_to_box_score (EuroLeague player_game schema)
+BOX_SCORE_COLUMNS = [
+    "SEASON",
+    "GAME_ID",
+    "Home",
+    "PLAYER_ID",
+    "STARTER",
+    "IsPlaying",
+    "TEAM",
+    "Dorsal",
+    "PLAYER_NAME",
+    "MIN",
+    "PTS",
+    "FG2M",
+    "FG2A",
+    "FG3M",
+    "FG3A",
+    "FTM",
+    "FTA",
+    "OREB",
+    "DREB",
+    "REB",
+    "AST",
+    "STL",
+    "TOV",
+    "BLK",
+    "BLK_AGAINST",
+    "PF",
+    "PF_DRAWN",
+    "VALUATION",
+    "PLUS_MINUS",
+    "LEAGUE",
+    "FGM",
+    "FGA",
+    "FG_PCT",
+]
+
+
+def _to_euroleague_schema(
+    df: pd.DataFrame,
+    player_mappings: Mapping[Any, dict],
+    season: int | None,
+    league: str,
+) -> pd.DataFrame:
+    """Add metadata and placeholder columns, then order columns as BOX_SCORE_COLUMNS
 
-    df = pd.DataFrame.from_dict(stats, orient="index").reset_index(drop=True)
+    Args:
+        df: Player stats with a GAME_ID column
+        player_mappings: {game_id: player mapping} used for jersey numbers
+        season: Season year (default 2026)
+        league: League identifier
 
-    # Enrich with player names and team info from mapping
-    df["PLAYER_NAME"] = df["PLAYER_ID"].map(
-        lambda pid: player_mapping.get(pid, {}).get("name", "Unknown")
-    )
-    df["TEAM"] = df["PLAYER_ID"].map(
-        lambda pid: player_mapping.get(pid, {}).get("team_name", "Unknown")
-    )
+    Returns:
+        DataFrame with exactly BOX_SCORE_COLUMNS
+    """
+    df["SEASON"] = season if season else 2026  # Default to current season
+    df["LEAGUE"] = league
 
-    # Calculate total rebounds
-    df["REB"] = df["OREB"] + df["DREB"]
+    df["MIN"] = "0:00"  # Minutes not calculable from PBP in v1
+    df["Home"] = 0  # Could be derived from team_id comparison (future enhancement)
+    df["STARTER"] = 0  # Could be derived from first substitutions (future enhancement)
+    df["IsPlaying"] = 1  # All players in box score are playing
+    df["Dorsal"] = [
+        player_mappings.get(game_id, {}).get(player_id, {}).get("jersey", "")
+        for game_id, player_id in zip(df["GAME_ID"], df["PLAYER_ID"], strict=True)
+    ]
+    df["PLUS_MINUS"] = 0.0  # Not calculable from PBP alone
+    df["VALUATION"] = 0  # EuroLeague-specific stat
+    df["BLK_AGAINST"] = 0  # Not tracked in NCAA PBP
+    df["PF_DRAWN"] = 0  # Not tracked in NCAA PBP
 
-    # Calculate field goal percentage (avoid division by zero)
-    df["FG_PCT"] = (df["FGM"] / df["FGA"]).fillna(0.0)
+    # Ensure all columns exist (add missing ones with default values)
+    for col in BOX_SCORE_COLUMNS:
+        if col not in df.columns:
+            df[col] = (
+                0
+                if col in ["Home", "STARTER", "IsPlaying", "VALUATION", "BLK_AGAINST", "PF_DRAWN"]
+                else ""
+            )
 
-    logger.info(f"Parsed PBP to {len(df)} player box scores")
-    return df
+    # Select and reorder columns
+    return df[BOX_SCORE_COLUMNS]
 
 
 def parse_game_to_box_score(
@@ -417,70 +539,59 @@ def parse_game_to_box_score(
         logger.warning(f"No player stats generated from PBP for game {game_id}")
         return pd.DataFrame()
 
-    # Step 3: Add metadata columns
-    df["SEASON"] = season if season else 2026  # Default to current season
+    # Step 3-4: Add metadata columns and match EuroLeague schema
     df["GAME_ID"] = game_id
-    df["LEAGUE"] = league
+    df = _to_euroleague_schema(df, {game_id: player_mapping}, season, league)
 
-    # Step 4: Add columns to match EuroLeague schema
-    df["MIN"] = "0:00"  # Minutes not calculable from PBP in v1
-    df["Home"] = 0  # Could be derived from team_id comparison (future enhancement)
-    df["STARTER"] = 0  # Could be derived from first substitutions (future enhancement)
-    df["IsPlaying"] = 1  # All players in box score are playing
-    df["Dorsal"] = df["PLAYER_ID"].map(lambda pid: player_mapping.get(pid, {}).get("jersey", ""))
-    df["PLUS_MINUS"] = 0.0  # Not calculable from PBP alone
-    df["VALUATION"] = 0  # EuroLeague-specific stat
-    df["BLK_AGAINST"] = 0  # Not tracked in NCAA PBP
-    df["PF_DRAWN"] = 0  # Not tracked in NCAA PBP
+    logger.info(f"Generated box score for game {game_id}: {len(df)} players")
+    return df
 
-    # Reorder columns to match EuroLeague schema
-    column_order = [
-        "SEASON",
-        "GAME_ID",
-        "Home",
-        "PLAYER_ID",
-        "STARTER",
-        "IsPlaying",
-        "TEAM",
-        "Dorsal",
-        "PLAYER_NAME",
-        "MIN",
-        "PTS",
-        "FG2M",
-        "FG2A",
-        "FG3M",
-        "FG3A",
-        "FTM",
-        "FTA",
-        "OREB",
-        "DREB",
-        "REB",
-        "AST",
-        "STL",
-        "TOV",
-        "BLK",
-        "BLK_AGAINST",
-        "PF",
-        "PF_DRAWN",
-        "VALUATION",
-        "PLUS_MINUS",
-        "LEAGUE",
-        "FGM",
-        "FGA",
-        "FG_PCT",
-    ]
 
-    # Ensure all columns exist (add missing ones with default values)
-    for col in column_order:
-        if col not in df.columns:
-            df[col] = (
-                0
-                if col in ["Home", "STARTER", "IsPlaying", "VALUATION", "BLK_AGAINST", "PF_DRAWN"]
-                else ""
-            )
+def parse_games_to_box_scores(
+    games: Mapping[str, dict], season: int | None = None, league: str = "NCAA-MBB"
+) -> pd.DataFrame:
+    """Transform many ESPN games into player box scores in one pass
 
-    # Select and reorder columns
-    df = df[column_order]
+    Batch version of parse_game_to_box_score(): plays from every game are
+    concatenated and aggregated together, which is much faster than looping
+    over games when rebuilding box scores for a whole season.
 
-    logger.info(f"Generated box score for game {game_id}: {len(df)} players")
+    Args:
+        games: {game_id: fetch_espn_game_summary() result}
+        season: Season year (int), optional
+        league: League identifier ("NCAA-MBB" or "NCAA-WBB")
+
+    Returns:
+        DataFrame with the parse_game_to_box_score() columns for all games.
+        Games without plays or roster data are skipped (with a warning).
+    """
+    plays_frames = []
+    player_mappings: dict[str, dict] = {}
+
+    for game_id, game_data in games.items():
+        plays = game_data.get("plays", pd.DataFrame())
+        boxscore_raw = game_data.get("boxscore_raw", {})
+        if plays.empty or not boxscore_raw:
+            logger.warning(f"No play-by-play or boxscore_raw data for game {game_id}")
+            continue
+
+        player_mapping = extract_player_mapping(boxscore_raw)
+        if not player_mapping:
+            logger.warning(f"Failed to extract player mapping for game {game_id}")
+            continue
+
+        player_mappings[game_id] = player_mapping
+        plays_frames.append(plays.assign(GAME_ID=game_id))
+
+    if not plays_frames:
+        return pd.DataFrame()
+
+    df = parse_pbp_to_player_stats_batch(
+        pd.concat(plays_frames, ignore_index=True), player_mappings
+    )
+    if df.empty:
+        return pd.DataFrame()
+
+    df = _to_euroleague_schema(df, player_mappings, season, league)
+    logger.info(f"Generated box scores for {len(player_mappings)} games: {len(df)} players")
     return df
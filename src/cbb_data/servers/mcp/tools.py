@@ -1347,6 +1347,13 @@ def tool_list_fiba_leagues() -> dict[str, Any]:
 # ============================================================================
 # Tool Registry for MCP Server
 # ============================================================================
+#
+# Optional execution keys (read by BasketballDataMCPServer.execute_tool):
+#   max_concurrency: Calls of this tool allowed to run at once
+#                    (default CBB_MCP_TOOL_CONCURRENCY)
+#   timeout:         Seconds per call, waiting for a slot included
+#                    (default CBB_MCP_TOOL_TIMEOUT)
+# Event-level tools (play-by-play, shots) scrape per game, so they get fewer slots.
 
 TOOLS = [
     {
@@ -1551,6 +1558,7 @@ Tips: Use compact=True for large event sequences.""",
             "required": ["league", "game_ids"],
         },
         "handler": tool_get_play_by_play,
+        "max_concurrency": 2,
     },
     {
         "name": "get_shot_chart",
@@ -1613,6 +1621,7 @@ Tips: Use compact=True for large shot datasets.""",
             "required": ["league", "game_ids"],
         },
         "handler": tool_get_shot_chart,
+        "max_concurrency": 2,
     },
     {
         "name": "get_player_season_stats",
@@ -1899,6 +1908,7 @@ Tips: PBP data is large - use compact=True (default) and filter by fixture_uuid
             "required": ["season"],
         },
         "handler": tool_get_lnb_historical_pbp,
+        "max_concurrency": 2,
     },
     {
         "name": "get_lnb_historical_player_stats",
@@ -2078,6 +2088,8 @@ Tips: Uses browser scraping for reliable access. compact=True recommended for la
             "required": ["league", "season"],
         },
         "handler": tool_get_fiba_shots,
+        "max_concurrency": 2,
+        "timeout": 300,
     },
     {
         "name": "get_fiba_schedule",
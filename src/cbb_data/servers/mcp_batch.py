@@ -5,7 +5,12 @@ Allows LLMs to execute multiple tool calls in a single request, reducing round-t
 and improving efficiency for complex multi-step queries.
 
 Key Features:
-    - Execute multiple tools in parallel
+    - Execute multiple tools in parallel (bounded by max_concurrent)
+    - Results returned in request order
+    - Per-request timeouts (CBB_BATCH_REQUEST_TIMEOUT, default 120s)
+    - Identical sub-requests (same tool + args) run once and share the result
+    - Sub-requests backed by the same dataset fetch share it: concurrent
+      cache misses are coalesced by the fetch layer's single-flight
     - Per-tool error handling (one failure doesn't break all)
     - Aggregated results with individual success/error envelopes
     - Token-efficient response format
@@ -26,13 +31,22 @@ Usage:
     ]
 """
 
+import copy
+import functools
+import json
 import logging
+import os
 import time
 from collections.abc import Callable
 from typing import Any
 
+from cbb_data.utils.executor import run_with_deadlines
+
 logger = logging.getLogger(__name__)
 
+# Seconds allowed per sub-request, counted from when a worker starts it
+BATCH_REQUEST_TIMEOUT = float(os.getenv("CBB_BATCH_REQUEST_TIMEOUT", "120"))
+
 # Tool registry (populated at module import)
 TOOL_DISPATCH: dict[str, Callable] = {}
 
@@ -76,25 +90,63 @@ def list_registered_tools() -> list[str]:
 # ============================================================================
 
 
-def batch_query(requests: list[dict[str, Any]], max_concurrent: int = 10) -> list[dict[str, Any]]:
+def _resolve_request(i: int, req: Any) -> tuple[str, Callable, dict[str, Any]]:
+    """Validate one batch request and look up its tool"""
+    # Validate request structure
+    if not isinstance(req, dict):
+        raise ValueError(f"Request {i} must be a dict, got {type(req)}")
+
+    if "tool" not in req:
+        raise ValueError(f"Request {i} missing 'tool' field")
+
+    if "args" not in req:
+        raise ValueError(f"Request {i} missing 'args' field")
+
+    tool_name = req["tool"]
+
+    # Check if tool exists
+    if tool_name not in TOOL_DISPATCH:
+        available = ", ".join(list_registered_tools())
+        raise KeyError(f"Unknown tool: '{tool_name}'. Available tools: {available}")
+
+    return tool_name, TOOL_DISPATCH[tool_name], req["args"]
+
+
+def _error_envelope(tool_name: str, error: BaseException, duration_ms: float) -> dict[str, Any]:
+    return {
+        "ok": False,
+        "error": str(error),
+        "error_type": type(error).__name__,
+        "tool": tool_name,
+        "duration_ms": round(duration_ms, 2),
+    }
+
+
+def batch_query(
+    requests: list[dict[str, Any]], max_concurrent: int = 10, timeout: float | None = None
+) -> list[dict[str, Any]]:
     """
     Execute multiple tool calls in a batch.
 
-    Each request is executed independently with isolated error handling.
-    One tool failure doesn't affect others.
+    Requests run concurrently on up to max_concurrent threads, each with
+    isolated error handling. One tool failure doesn't affect others. Identical
+    requests (same tool and args) run once; their copies get the same result
+    with "deduplicated": True. A request's timeout starts when a worker picks
+    it up; a timed-out tool's result is dropped (see run_with_deadlines).
 
     Args:
         requests: List of tool requests, each with:
             - tool: str - Tool name
             - args: dict - Tool arguments
-        max_concurrent: Maximum concurrent executions (currently sequential, reserved for future)
+        max_concurrent: Maximum concurrent executions
+        timeout: Seconds allowed per request (default: BATCH_REQUEST_TIMEOUT)
 
     Returns:
-        List of results, each with:
+        List of results in request order, each with:
             - ok: bool - Success flag
             - result: Any - Tool result (if successful)
             - error: str - Error message (if failed)
-            - error_type: str - Error class name (if failed)
+            - error_type: str - Error class name (if failed, "TimeoutError" on timeout)
             - duration_ms: float - Execution time
 
     Examples:
@@ -107,71 +159,70 @@ def batch_query(requests: list[dict[str, Any]], max_concurrent: int = 10) -> lis
             {"ok": False, "error": "Unknown tool: invalid_tool", "duration_ms": 0.1}
         ]
     """
-    results = []
+    timeout = BATCH_REQUEST_TIMEOUT if timeout is None else timeout
+    results: list[dict[str, Any] | None] = [None] * len(requests)
 
+    # Group identical requests: one call per distinct (tool, args)
+    calls: dict[str, list[int]] = {}
+    specs: dict[str, tuple[str, Callable, dict[str, Any]]] = {}
     for i, req in enumerate(requests):
-        start_time = time.perf_counter()
-
         try:
-            # Validate request structure
-            if not isinstance(req, dict):
-                raise ValueError(f"Request {i} must be a dict, got {type(req)}")
-
-            if "tool" not in req:
-                raise ValueError(f"Request {i} missing 'tool' field")
-
-            if "args" not in req:
-                raise ValueError(f"Request {i} missing 'args' field")
-
-            tool_name = req["tool"]
-            tool_args = req["args"]
-
-            # Check if tool exists
-            if tool_name not in TOOL_DISPATCH:
-                available = ", ".join(list_registered_tools())
-                raise KeyError(f"Unknown tool: '{tool_name}'. Available tools: {available}")
-
-            # Execute tool
-            tool_func = TOOL_DISPATCH[tool_name]
-            result = tool_func(**tool_args)
-
-            # Calculate duration
-            duration_ms = (time.perf_counter() - start_time) * 1000
-
-            # Success envelope
-            results.append(
-                {
-                    "ok": True,
-                    "result": result,
-                    "tool": tool_name,
-                    "duration_ms": round(duration_ms, 2),
-                }
-            )
-
-            logger.info(f"Batch tool '{tool_name}' succeeded ({duration_ms:.0f}ms)")
-
+            tool_name, tool_func, tool_args = _resolve_request(i, req)
         except Exception as e:
-            # Error envelope
-            duration_ms = (time.perf_counter() - start_time) * 1000
-
-            error_info = {
-                "ok": False,
-                "error": str(e),
-                "error_type": type(e).__name__,
-                "tool": req.get("tool", "unknown"),
+            tool_name = req.get("tool", "unknown") if isinstance(req, dict) else "unknown"
+            results[i] = _error_envelope(tool_name, e, 0.0)
+            logger.error(f"Batch tool '{tool_name}' failed: {str(e)}")
+            continue
+        key = f"{tool_name}|{json.dumps(tool_args, sort_keys=True, default=str)}"
+        calls.setdefault(key, []).append(i)
+        specs[key] = (tool_name, tool_func, tool_args)
+
+    def run(key: str) -> Any:
+        _, tool_func, tool_args = specs[key]
+        return tool_func(**tool_args)
+
+    outcomes = run_with_deadlines(
+        {key: functools.partial(run, key) for key in calls},
+        timeout,
+        max_workers=max_concurrent,
+        thread_name_prefix="cbb-batch",
+    )
+
+    envelopes: dict[str, dict[str, Any]] = {}
+    for key, outcome in outcomes.items():
+        tool_name = specs[key][0]
+        duration_ms = outcome.duration * 1000
+        if outcome.timed_out:
+            error = TimeoutError(f"Tool '{tool_name}' timed out after {timeout:.0f}s")
+            envelopes[key] = _error_envelope(tool_name, error, duration_ms)
+            logger.warning(f"Batch tool '{tool_name}' timed out after {timeout:.0f}s")
+        elif outcome.error is not None:
+            envelopes[key] = _error_envelope(tool_name, outcome.error, duration_ms)
+            logger.error(
+                f"Batch tool '{tool_name}' failed: {outcome.error}", exc_info=outcome.error
+            )
+        else:
+            # Success envelope
+            envelopes[key] = {
+                "ok": True,
+                "result": outcome.value,
+                "tool": tool_name,
                 "duration_ms": round(duration_ms, 2),
             }
+            logger.info(f"Batch tool '{tool_name}' succeeded ({duration_ms:.0f}ms)")
 
-            results.append(error_info)
-
-            logger.error(
-                f"Batch tool '{req.get('tool', 'unknown')}' failed: {str(e)}", exc_info=True
-            )
+    for key, indexes in calls.items():
+        first, *duplicates = indexes
+        results[first] = envelopes[key]
+        for i in duplicates:
+            results[i] = {**copy.deepcopy(envelopes[key]), "deduplicated": True}
 
-    return results
+    return results  # type: ignore[return-value]
 
 
-def batch_query_safe(requests: list[dict[str, Any]]) -> dict[str, Any]:
+def batch_query_safe(
+    requests: list[dict[str, Any]], max_concurrent: int = 10, timeout: float | None = None
+) -> dict[str, Any]:
     """
     Execute batch query with aggregated metadata.
 
@@ -179,6 +230,8 @@ def batch_query_safe(requests: list[dict[str, Any]]) -> dict[str, Any]:
 
     Args:
         requests: List of tool requests
+        max_concurrent: Maximum concurrent executions
+        timeout: Seconds allowed per request (default: BATCH_REQUEST_TIMEOUT)
 
     Returns:
         Dict with:
@@ -187,7 +240,8 @@ def batch_query_safe(requests: list[dict[str, Any]]) -> dict[str, Any]:
                 - total: Total requests
                 - successful: Successful requests
                 - failed: Failed requests
-                - total_duration_ms: Total execution time
+                - total_duration_ms: Sum of request execution times
+                - wall_duration_ms: Elapsed time of the whole batch
 
     Examples:
         >>> batch_query_safe([
@@ -200,12 +254,15 @@ def batch_query_safe(requests: list[dict[str, Any]]) -> dict[str, Any]:
                 "total": 2,
                 "successful": 2,
                 "failed": 0,
-                "total_duration_ms": 250.5
+                "total_duration_ms": 250.5,
+                "wall_duration_ms": 130.2
             }
         }
     """
     # Execute batch
-    results = batch_query(requests)
+    start_time = time.perf_counter()
+    results = batch_query(requests, max_concurrent=max_concurrent, timeout=timeout)
+    wall_duration = (time.perf_counter() - start_time) * 1000
 
     # Calculate summary
     successful = sum(1 for r in results if r["ok"])
@@ -218,6 +275,7 @@ def batch_query_safe(requests: list[dict[str, Any]]) -> dict[str, Any]:
         "failed": failed,
         "total_duration_ms": round(total_duration, 2),
         "average_duration_ms": round(total_duration / len(results), 2) if results else 0,
+        "wall_duration_ms": round(wall_duration, 2),
     }
 
     return {"results": results, "summary": summary}
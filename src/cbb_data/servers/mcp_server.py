@@ -3,6 +3,19 @@ MCP (Model Context Protocol) Server for college basketball data.
 
 Provides LLM-friendly tools for accessing basketball data via the MCP protocol.
 
+Tool handlers are blocking (they fetch and format data), so call_tool runs
+each handler and its JSON encoding on a bounded executor instead of the event
+loop; concurrent sessions no longer serialize behind one slow tool. Each tool
+has its own concurrency limit and timeout (TOOLS "max_concurrency"/"timeout"
+keys, defaults below), and a call cancelled by the client before it starts is
+dropped from the queue.
+
+Configuration (environment):
+- CBB_MCP_WORKERS: Tool worker threads (default 8)
+- CBB_MCP_MAX_QUEUE: Calls allowed to wait for a worker (default 64)
+- CBB_MCP_TOOL_CONCURRENCY: Default concurrent calls per tool (default 4)
+- CBB_MCP_TOOL_TIMEOUT: Default seconds per tool call (default 120)
+
 Usage:
     # Start server in stdio mode (for Claude Desktop)
     python -m cbb_data.servers.mcp_server
@@ -12,9 +25,12 @@ Usage:
 """
 
 import argparse
+import asyncio
 import json
 import logging
+import os
 import sys
+from collections.abc import Callable
 from typing import Any
 
 try:
@@ -29,6 +45,8 @@ except ImportError:
     Server = None  # type: ignore[assignment,misc]
     stdio_server = None  # type: ignore[assignment]
 
+from cbb_data.utils.executor import ExecutorBusyError, get_executor
+
 from .mcp.prompts import PROMPTS
 from .mcp.resources import (
     STATIC_RESOURCES,
@@ -43,6 +61,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Tool execution: handlers run on the "mcp" executor, never on the event loop
+MCP_WORKERS = int(os.getenv("CBB_MCP_WORKERS", "8"))
+MCP_MAX_QUEUE = int(os.getenv("CBB_MCP_MAX_QUEUE", "64"))
+MCP_TOOL_CONCURRENCY = int(os.getenv("CBB_MCP_TOOL_CONCURRENCY", "4"))
+MCP_TOOL_TIMEOUT = float(os.getenv("CBB_MCP_TOOL_TIMEOUT", "120"))
+
+
+def _run_tool(handler: Callable[..., Any], arguments: dict[str, Any]) -> str:
+    """Call a tool handler and JSON-encode its result (runs on the executor)"""
+    return json.dumps(handler(**arguments), indent=2)
+
+
+def _error_text(error: str, error_type: str) -> str:
+    return json.dumps({"success": False, "error": error, "error_type": error_type})
+
 
 # ============================================================================
 # MCP Server Implementation
@@ -67,12 +100,77 @@ class BasketballDataMCPServer:
         self.name = name
         self.server: Any = None
         self.tools_registry = {tool["name"]: tool for tool in TOOLS}
+        self.executor = get_executor("mcp", MCP_WORKERS, MCP_MAX_QUEUE)
+        self._tool_slots: dict[str, asyncio.Semaphore] = {}
 
         logger.info(f"Initialized {name} MCP server")
         logger.info(f"Registered {len(TOOLS)} tools")
         logger.info(f"Registered {len(STATIC_RESOURCES)} resources")
         logger.info(f"Registered {len(PROMPTS)} prompts")
 
+    def _slots(self, name: str) -> asyncio.Semaphore:
+        """Get the concurrency limit of a tool"""
+        slots = self._tool_slots.get(name)
+        if slots is None:
+            limit = self.tools_registry[name].get("max_concurrency", MCP_TOOL_CONCURRENCY)
+            slots = self._tool_slots[name] = asyncio.Semaphore(max(1, int(limit)))  # type: ignore[call-overload]
+        return slots
+
+    async def execute_tool(self, name: str, arguments: dict[str, Any]) -> str:
+        """
+        Run a tool and return its JSON-encoded result.
+
+        The handler and json.dumps run on the "mcp" executor. At most the tool's
+        max_concurrency calls run at once; the others wait for a slot, and that
+        wait counts against the tool's timeout. Errors, timeouts and a full
+        executor queue come back as {"success": false, ...} payloads.
+
+        Cancelling the awaiting task (client disconnect or MCP cancellation)
+        releases the slot and drops the call if it has not started (see
+        BoundedExecutor for calls already running).
+
+        Args:
+            name: Tool name
+            arguments: Tool arguments
+
+        Returns:
+            JSON text of the tool result
+        """
+        tool = self.tools_registry.get(name)
+        if not tool:
+            return json.dumps({"success": False, "error": f"Tool '{name}' not found"})
+
+        timeout = float(tool.get("timeout", MCP_TOOL_TIMEOUT))  # type: ignore[arg-type]
+        slots = self._slots(name)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        try:
+            async with asyncio.timeout(timeout):
+                await slots.acquire()
+            try:
+                return await self.executor.run(
+                    _run_tool,
+                    tool["handler"],
+                    arguments,
+                    timeout=max(0.0, deadline - loop.time()),
+                )
+            finally:
+                slots.release()
+        except TimeoutError:
+            logger.warning(f"Tool {name} timed out after {timeout:.0f}s")
+            return _error_text(f"Tool '{name}' timed out after {timeout:.0f}s", "TimeoutError")
+        except ExecutorBusyError as e:
+            logger.warning(str(e))
+            return _error_text(
+                "Server busy - too many queued tool calls, retry shortly", type(e).__name__
+            )
+        except asyncio.CancelledError:
+            logger.info(f"Tool {name} cancelled by client")
+            raise
+        except Exception as e:
+            logger.error(f"Error executing tool {name}: {e}", exc_info=True)
+            return _error_text(str(e), type(e).__name__)
+
     def setup_server(self) -> Server | None:
         """
         Set up the MCP server with tools, resources, and prompts.
@@ -109,30 +207,8 @@ class BasketballDataMCPServer:
             """Call a tool with arguments."""
             logger.info(f"Tool called: {name} with args: {arguments}")
 
-            # Find tool
-            tool = self.tools_registry.get(name)
-            if not tool:
-                return [
-                    TextContent(
-                        type="text",
-                        text=json.dumps({"success": False, "error": f"Tool '{name}' not found"}),
-                    )
-                ]
-
-            # Execute tool handler
-            try:
-                result = tool["handler"](**arguments)  # type: ignore[index,operator]
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
-            except Exception as e:
-                logger.error(f"Error executing tool {name}: {e}", exc_info=True)
-                return [
-                    TextContent(
-                        type="text",
-                        text=json.dumps(
-                            {"success": False, "error": str(e), "error_type": type(e).__name__}
-                        ),
-                    )
-                ]
+            # Handler and JSON encoding run on the tool executor (see execute_tool)
+            return [TextContent(type="text", text=await self.execute_tool(name, arguments))]
 
         # Register list_resources handler
         @self.server.list_resources()
@@ -9,7 +9,10 @@ Key Features:
     - Auto-pagination: Fetches data in chunks to stay under token budget
     - Token estimation: Cheap upper-bound calculation (rows × cols × 4)
     - Shape modes: 'array', 'records', 'summary' for different use cases
-    - Cursor support: Continue fetching with next_cursor
+    - Cursor support: Continue fetching with next_cursor. For getters without
+      offset support the result is fetched once and kept in the result store
+      (utils.result_store); next_cursor is then an opaque string and later
+      pages are read from the stored result instead of refetching
     - Column pruning: Optional reduction to key columns only
 
 Environment Variables:
@@ -35,6 +38,13 @@ from typing import Any
 
 import pandas as pd
 
+from cbb_data.utils.result_store import (
+    Page,
+    ResultExpiredError,
+    get_result_store,
+    parse_cursor,
+)
+
 logger = logging.getLogger(__name__)
 
 # Configuration from environment
@@ -195,7 +205,7 @@ def mcp_autopaginate(get_df_fn: Callable) -> Callable:
         - limit: int (optional) - rows to fetch per chunk
         - offset: int (optional) - starting row offset
         - shape: str (optional) - 'array', 'records', or 'summary'
-        - cursor: int (optional) - continuation cursor
+        - cursor: int | str (optional) - continuation cursor (str = stored result)
         - compact_columns: bool (optional) - enable column pruning
 
     Returns:
@@ -226,7 +236,7 @@ def mcp_autopaginate(get_df_fn: Callable) -> Callable:
         *args: Any,
         shape: str = "array",
         limit: int | None = None,
-        cursor: int | None = None,
+        cursor: int | str | None = None,
         offset: int | None = None,
         compact_columns: bool = False,
         dataset_id: str | None = None,
@@ -248,12 +258,26 @@ def mcp_autopaginate(get_df_fn: Callable) -> Callable:
         Returns:
             Dict with data + metadata (shape != None) or DataFrame (legacy)
         """
-        # Determine starting offset
-        start_offset = cursor or offset or 0
-
         # Determine chunk size
         chunk_size = min(limit or MAX_ROWS, MAX_ROWS)
 
+        # Opaque cursor: next page of a stored result, no refetch
+        if isinstance(cursor, str):
+            try:
+                resume_offset = parse_cursor(cursor)[1]
+            except ResultExpiredError as e:
+                raise ValueError(str(e)) from None
+            try:
+                page = get_result_store().page(cursor, chunk_size)
+            except ResultExpiredError:
+                # Result expired or evicted: fetch again and resume at the same row
+                logger.info(f"Cursor {cursor} expired - re-running query")
+                page = _store_result(get_df_fn(*args, **kwargs), chunk_size, resume_offset)
+            return _page_result(page, shape, compact_columns, dataset_id)
+
+        # Determine starting offset
+        start_offset = cursor or offset or 0
+
         # Pagination loop
         df_chunks = []
         total_tokens = 0
@@ -264,12 +288,10 @@ def mcp_autopaginate(get_df_fn: Callable) -> Callable:
             try:
                 chunk = get_df_fn(*args, limit=chunk_size, offset=current_offset, **kwargs)
             except TypeError:
-                # Function doesn't support offset - fetch once and slice
-                chunk = get_df_fn(*args, limit=chunk_size, **kwargs)
-                if start_offset > 0 and not chunk.empty:
-                    chunk = chunk.iloc[start_offset:]
-                # Disable pagination for functions without offset support
-                chunk_size = len(chunk)
+                # Function doesn't support offset - fetch the full result once and
+                # serve this and later pages from the result store
+                page = _store_result(get_df_fn(*args, **kwargs), chunk_size, start_offset)
+                return _page_result(page, shape, compact_columns, dataset_id)
 
             if chunk.empty:
                 break
@@ -338,7 +360,46 @@ def mcp_autopaginate(get_df_fn: Callable) -> Callable:
     return wrapper
 
 
-def _create_summary(df: pd.DataFrame, truncated: bool, next_cursor: int | None) -> dict[str, Any]:
+def _store_result(df: pd.DataFrame, page_size: int, offset: int = 0) -> Page:
+    """Store a full result and return the page starting at offset"""
+    store = get_result_store()
+    if offset <= 0:
+        return store.paginate(df, page_size)
+    # Resume mid-result: store everything, then read the requested page
+    first = store.paginate(df, offset)
+    if first.next_cursor is None:
+        return Page(df.iloc[:0], offset, len(df), None, first.meta)
+    return store.page(first.next_cursor, page_size)
+
+
+def _page_result(
+    page: Page, shape: str, compact_columns: bool, dataset_id: str | None
+) -> pd.DataFrame | dict[str, Any]:
+    """Shape a result-store page like an auto-paginated chunk"""
+    df = page.frame
+    if compact_columns:
+        df = prune_to_key_columns(df, dataset_id)
+    truncated = page.next_cursor is not None
+    tokens = estimate_tokens(len(df), len(df.columns))
+
+    if shape == "summary":
+        return _create_summary(df, truncated, page.next_cursor)
+    if shape in ("records", "array"):
+        return {
+            "columns": df.columns.tolist(),
+            "data": df.to_dict(orient="records") if shape == "records" else df.values.tolist(),
+            "truncated": truncated,
+            "next_cursor": page.next_cursor,
+            "row_count": len(df),
+            "total_rows": page.total_rows,
+            "estimated_tokens": tokens,
+        }
+    return df
+
+
+def _create_summary(
+    df: pd.DataFrame, truncated: bool, next_cursor: int | str | None
+) -> dict[str, Any]:
     """
     Create ultra-compact summary of DataFrame.
 
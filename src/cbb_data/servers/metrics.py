@@ -11,6 +11,18 @@ Metrics Exposed:
     - cbb_tool_latency_ms: Histogram of tool execution times
     - cbb_rows_returned: Histogram of rows returned per request
     - cbb_duckdb_size_mb: Gauge of DuckDB cache size
+    - cbb_memory_cache_entries / cbb_memory_cache_bytes: In-memory cache size gauges
+    - cbb_memory_cache_events: In-memory cache hits/misses/evictions/expirations
+    - cbb_upstream_requests / cbb_upstream_bytes / cbb_upstream_latency_ms: Upstream
+      HTTP counters per source (utils.http_transport)
+    - cbb_executor_tasks / cbb_executor_events / cbb_executor_queue_wait_ms: Server
+      executor queue depth and call outcomes (utils.executor)
+    - cbb_result_store: Paginated result store size and events (utils.result_store)
+    - cbb_rate_limiter: Source rate limiter acquires/rejections per source
+    - cbb_rate_limit_wait_seconds: Histogram of time spent waiting for a source
+      rate-limit token (utils.rate_limiter)
+    - cbb_adaptive_concurrency: Adaptive fetch concurrency limit and outcomes per
+      source (utils.adaptive_concurrency)
     - cbb_request_total: Counter of HTTP requests by endpoint and status
     - cbb_request_duration_seconds: Histogram of request duration
 
@@ -116,6 +128,104 @@ if PROMETHEUS_AVAILABLE and METRICS_ENABLED:
     # DuckDB cache size gauge
     DUCKDB_SIZE_MB = Gauge("cbb_duckdb_size_mb", "DuckDB cache file size in megabytes")
 
+    # In-memory fetcher cache (fetchers.base.Cache) gauges, refreshed on scrape
+    MEMORY_CACHE_ENTRIES = Gauge("cbb_memory_cache_entries", "Entries in the memory cache")
+    MEMORY_CACHE_BYTES = Gauge("cbb_memory_cache_bytes", "Payload bytes in the memory cache")
+    MEMORY_CACHE_EVENTS = Gauge(
+        "cbb_memory_cache_events",
+        "Memory cache lookups and removals since process start",
+        ["event"],  # hit, miss, eviction, expiration
+    )
+
+    # Upstream HTTP transport (utils.http_transport) gauges, refreshed on scrape
+    UPSTREAM_REQUESTS = Gauge(
+        "cbb_upstream_requests",
+        "Upstream HTTP requests since process start",
+        ["source", "event"],  # request, error, not_modified
+    )
+    UPSTREAM_BYTES = Gauge(
+        "cbb_upstream_bytes",
+        "Upstream HTTP bytes since process start",
+        ["source", "kind"],  # downloaded, saved (304 answered from the store)
+    )
+    UPSTREAM_LATENCY_MS = Gauge(
+        "cbb_upstream_latency_ms",
+        "Upstream HTTP request latency in milliseconds",
+        ["source", "stat"],  # avg, max
+    )
+
+    # Blocking-work executors (utils.executor) gauges, refreshed on scrape
+    EXECUTOR_TASKS = Gauge(
+        "cbb_executor_tasks",
+        "Calls currently in a server executor",
+        ["executor", "state"],  # running, queued
+    )
+    EXECUTOR_EVENTS = Gauge(
+        "cbb_executor_events",
+        "Server executor call outcomes since process start",
+        ["executor", "event"],  # completed, failed, timeout, cancelled, rejected
+    )
+    EXECUTOR_QUEUE_WAIT_MS = Gauge(
+        "cbb_executor_queue_wait_ms",
+        "Time calls waited for an executor worker in milliseconds",
+        ["executor", "stat"],  # avg, max
+    )
+
+    # Paginated result store (utils.result_store) gauge, refreshed on scrape
+    RESULT_STORE = Gauge(
+        "cbb_result_store",
+        "Paginated result store size and events since process start",
+        ["stat"],  # results, spilled_results, memory_bytes, disk_bytes, pages, misses, ...
+    )
+
+    # Source rate limiter (utils.rate_limiter) gauge, refreshed on scrape
+    RATE_LIMITER = Gauge(
+        "cbb_rate_limiter",
+        "Source rate limiter counters since process start",
+        ["source", "stat"],  # acquired, waited, rejected, wait_max_seconds
+    )
+
+    class _RateLimitWaitCollector:
+        """Export SourceRateLimiter wait-time histograms at scrape time
+
+        The limiter keeps its own bucket counts (it must not import this
+        module), so the histogram is rebuilt from stats() on every scrape.
+        """
+
+        def describe(self) -> list[Any]:
+            from prometheus_client.core import HistogramMetricFamily
+
+            return [
+                HistogramMetricFamily(
+                    "cbb_rate_limit_wait_seconds",
+                    "Time spent waiting for a source rate-limit token",
+                    labels=["source"],
+                )
+            ]
+
+        def collect(self) -> Any:
+            from prometheus_client.core import HistogramMetricFamily
+
+            from cbb_data.utils.rate_limiter import get_source_limiter
+
+            family = HistogramMetricFamily(
+                "cbb_rate_limit_wait_seconds",
+                "Time spent waiting for a source rate-limit token",
+                labels=["source"],
+            )
+            for source, s in get_source_limiter().stats().items():
+                family.add_metric([source], list(s["wait_buckets"].items()), s["wait_sum_seconds"])
+            yield family
+
+    REGISTRY.register(_RateLimitWaitCollector())
+
+    # Adaptive fetch concurrency (utils.adaptive_concurrency) gauge, refreshed on scrape
+    ADAPTIVE_CONCURRENCY = Gauge(
+        "cbb_adaptive_concurrency",
+        "Adaptive upstream concurrency limit and call outcomes since process start",
+        ["source", "stat"],  # limit, in_flight, increases, decreases, congestion, ...
+    )
+
     # HTTP request counters
     REQUEST_TOTAL = Counter(
         "cbb_request_total", "Total HTTP requests", ["method", "endpoint", "status"]
@@ -151,6 +261,18 @@ else:
     REQUEST_DURATION = NoOpMetric()  # type: ignore[assignment]
     ROWS_RETURNED = NoOpMetric()  # type: ignore[assignment]
     DUCKDB_SIZE_MB = NoOpMetric()  # type: ignore[assignment]
+    MEMORY_CACHE_ENTRIES = NoOpMetric()  # type: ignore[assignment]
+    MEMORY_CACHE_BYTES = NoOpMetric()  # type: ignore[assignment]
+    MEMORY_CACHE_EVENTS = NoOpMetric()  # type: ignore[assignment]
+    UPSTREAM_REQUESTS = NoOpMetric()  # type: ignore[assignment]
+    UPSTREAM_BYTES = NoOpMetric()  # type: ignore[assignment]
+    UPSTREAM_LATENCY_MS = NoOpMetric()  # type: ignore[assignment]
+    EXECUTOR_TASKS = NoOpMetric()  # type: ignore[assignment]
+    EXECUTOR_EVENTS = NoOpMetric()  # type: ignore[assignment]
+    EXECUTOR_QUEUE_WAIT_MS = NoOpMetric()  # type: ignore[assignment]
+    RESULT_STORE = NoOpMetric()  # type: ignore[assignment]
+    RATE_LIMITER = NoOpMetric()  # type: ignore[assignment]
+    ADAPTIVE_CONCURRENCY = NoOpMetric()  # type: ignore[assignment]
     REQUEST_TOTAL = NoOpMetric()  # type: ignore[assignment]
     ERROR_TOTAL = NoOpMetric()  # type: ignore[assignment]
 
@@ -292,6 +414,232 @@ def update_cache_size(size_mb: float) -> None:
     DUCKDB_SIZE_MB.set(size_mb)
 
 
+def update_memory_cache_stats(stats: dict[str, Any] | None = None) -> dict[str, Any]:
+    """
+    Refresh memory cache gauges from Cache.stats().
+
+    Called by the /metrics endpoint right before rendering, so the gauges
+    always reflect the live cache.
+
+    Args:
+        stats: Stats dict from Cache.stats() (default: global fetcher cache)
+
+    Returns:
+        The stats dict that was published
+
+    Example:
+        >>> update_memory_cache_stats()
+        {"memory_entries": 12, "memory_bytes": 1048576, "hits": 40, ...}
+    """
+    if stats is None:
+        from cbb_data.fetchers.base import get_cache
+
+        stats = get_cache().stats()
+
+    MEMORY_CACHE_ENTRIES.set(stats.get("memory_entries", 0))
+    MEMORY_CACHE_BYTES.set(stats.get("memory_bytes", 0))
+    for event, key in (
+        ("hit", "hits"),
+        ("miss", "misses"),
+        ("eviction", "evictions"),
+        ("expiration", "expirations"),
+    ):
+        MEMORY_CACHE_EVENTS.labels(event=event).set(stats.get(key, 0))
+
+    return stats
+
+
+def update_upstream_http_stats(
+    stats: dict[str, dict[str, Any]] | None = None,
+) -> dict[str, dict[str, Any]]:
+    """
+    Refresh upstream HTTP gauges from HttpTransport.stats().
+
+    Called by the /metrics endpoint right before rendering.
+
+    Args:
+        stats: Stats dict from HttpTransport.stats() (default: global transport)
+
+    Returns:
+        The stats dict that was published
+
+    Example:
+        >>> update_upstream_http_stats()
+        {"espn_mbb": {"requests": 120, "not_modified": 95, "bytes": 48213, ...}}
+    """
+    if stats is None:
+        from cbb_data.utils.http_transport import get_transport
+
+        stats = get_transport().stats()
+
+    for source, s in stats.items():
+        for event, key in (
+            ("request", "requests"),
+            ("error", "errors"),
+            ("not_modified", "not_modified"),
+        ):
+            UPSTREAM_REQUESTS.labels(source=source, event=event).set(s.get(key, 0))
+        UPSTREAM_BYTES.labels(source=source, kind="downloaded").set(s.get("bytes", 0))
+        UPSTREAM_BYTES.labels(source=source, kind="saved").set(s.get("bytes_saved", 0))
+        UPSTREAM_LATENCY_MS.labels(source=source, stat="avg").set(s.get("latency_avg_ms", 0.0))
+        UPSTREAM_LATENCY_MS.labels(source=source, stat="max").set(s.get("latency_max_ms", 0.0))
+
+    return stats
+
+
+def update_executor_stats(
+    stats: dict[str, dict[str, Any]] | None = None,
+) -> dict[str, dict[str, Any]]:
+    """
+    Refresh executor gauges from utils.executor.executor_stats().
+
+    Called by the /metrics endpoint right before rendering.
+
+    Args:
+        stats: {executor: BoundedExecutor.stats()} (default: all named executors)
+
+    Returns:
+        The stats dict that was published
+
+    Example:
+        >>> update_executor_stats()
+        {"rest": {"running": 3, "queued": 0, "timeouts": 1, ...}}
+    """
+    if stats is None:
+        from cbb_data.utils.executor import executor_stats
+
+        stats = executor_stats()
+
+    for name, s in stats.items():
+        for state in ("running", "queued"):
+            EXECUTOR_TASKS.labels(executor=name, state=state).set(s.get(state, 0))
+        for event, key in (
+            ("completed", "completed"),
+            ("failed", "failed"),
+            ("timeout", "timeouts"),
+            ("cancelled", "cancelled"),
+            ("rejected", "rejected"),
+        ):
+            EXECUTOR_EVENTS.labels(executor=name, event=event).set(s.get(key, 0))
+        EXECUTOR_QUEUE_WAIT_MS.labels(executor=name, stat="avg").set(
+            s.get("queue_wait_avg_ms", 0.0)
+        )
+        EXECUTOR_QUEUE_WAIT_MS.labels(executor=name, stat="max").set(
+            s.get("queue_wait_max_ms", 0.0)
+        )
+
+    return stats
+
+
+def update_result_store_stats(stats: dict[str, Any] | None = None) -> dict[str, Any]:
+    """
+    Refresh result store gauges from ResultStore.stats().
+
+    Called by the /metrics endpoint right before rendering.
+
+    Args:
+        stats: Stats dict from ResultStore.stats() (default: global result store)
+
+    Returns:
+        The stats dict that was published
+
+    Example:
+        >>> update_result_store_stats()
+        {"results": 3, "spilled_results": 1, "memory_bytes": 52428800, ...}
+    """
+    if stats is None:
+        from cbb_data.utils.result_store import get_result_store
+
+        stats = get_result_store().stats()
+
+    for stat in (
+        "results",
+        "spilled_results",
+        "memory_bytes",
+        "disk_bytes",
+        "stored",
+        "pages",
+        "misses",
+        "spills",
+        "evictions",
+        "expirations",
+    ):
+        RESULT_STORE.labels(stat=stat).set(stats.get(stat, 0))
+
+    return stats
+
+
+def update_rate_limiter_stats(
+    stats: dict[str, dict[str, Any]] | None = None,
+) -> dict[str, dict[str, Any]]:
+    """
+    Refresh rate limiter gauges from SourceRateLimiter.stats().
+
+    Called by the /metrics endpoint right before rendering. The wait-time
+    histogram (cbb_rate_limit_wait_seconds) is collected on its own.
+
+    Args:
+        stats: Stats dict from SourceRateLimiter.stats() (default: global limiter)
+
+    Returns:
+        The stats dict that was published
+
+    Example:
+        >>> update_rate_limiter_stats()
+        {"espn": {"acquired": 240, "waited": 31, "rejected": 0, ...}}
+    """
+    if stats is None:
+        from cbb_data.utils.rate_limiter import get_source_limiter
+
+        stats = get_source_limiter().stats()
+
+    for source, s in stats.items():
+        for stat in ("acquired", "waited", "rejected", "wait_max_seconds"):
+            RATE_LIMITER.labels(source=source, stat=stat).set(s.get(stat, 0))
+
+    return stats
+
+
+def update_adaptive_concurrency_stats(
+    stats: dict[str, dict[str, Any]] | None = None,
+) -> dict[str, dict[str, Any]]:
+    """
+    Refresh adaptive concurrency gauges from concurrency_stats().
+
+    Called by the /metrics endpoint right before rendering.
+
+    Args:
+        stats: Stats dict from concurrency_stats() (default: all source controllers)
+
+    Returns:
+        The stats dict that was published
+
+    Example:
+        >>> update_adaptive_concurrency_stats()
+        {"euroleague": {"limit": 7, "in_flight": 5, "decreases": 1, ...}}
+    """
+    if stats is None:
+        from cbb_data.utils.adaptive_concurrency import concurrency_stats
+
+        stats = concurrency_stats()
+
+    for source, s in stats.items():
+        for stat in (
+            "limit",
+            "in_flight",
+            "latency_avg_ms",
+            "error_rate",
+            "successes",
+            "errors",
+            "congestion",
+            "increases",
+            "decreases",
+        ):
+            ADAPTIVE_CONCURRENCY.labels(source=source, stat=stat).set(s.get(stat, 0))
+
+    return stats
+
+
 def get_metrics_snapshot() -> dict:
     """
     Get a snapshot of current metrics for LLMs.
@@ -318,6 +666,12 @@ def get_metrics_snapshot() -> dict:
     # from REGISTRY. For now, return a placeholder.
     return {
         "metrics_enabled": True,
+        "memory_cache": update_memory_cache_stats(),
+        "upstream_http": update_upstream_http_stats(),
+        "executors": update_executor_stats(),
+        "result_store": update_result_store_stats(),
+        "rate_limiter": update_rate_limiter_stats(),
+        "adaptive_concurrency": update_adaptive_concurrency_stats(),
         "note": "Use GET /metrics endpoint for full Prometheus metrics",
     }
 
@@ -336,6 +690,18 @@ __all__ = [
     "REQUEST_DURATION",
     "ROWS_RETURNED",
     "DUCKDB_SIZE_MB",
+    "MEMORY_CACHE_ENTRIES",
+    "MEMORY_CACHE_BYTES",
+    "MEMORY_CACHE_EVENTS",
+    "UPSTREAM_REQUESTS",
+    "UPSTREAM_BYTES",
+    "UPSTREAM_LATENCY_MS",
+    "EXECUTOR_TASKS",
+    "EXECUTOR_EVENTS",
+    "EXECUTOR_QUEUE_WAIT_MS",
+    "RESULT_STORE",
+    "RATE_LIMITER",
+    "ADAPTIVE_CONCURRENCY",
     "REQUEST_TOTAL",
     "ERROR_TOTAL",
     # Tracking functions
@@ -346,6 +712,12 @@ __all__ = [
     "track_http_request",
     "track_error",
     "update_cache_size",
+    "update_memory_cache_stats",
+    "update_upstream_http_stats",
+    "update_executor_stats",
+    "update_result_store_stats",
+    "update_rate_limiter_stats",
+    "update_adaptive_concurrency_stats",
     "get_metrics_snapshot",
     # Prometheus exports (for /metrics endpoint)
     "generate_latest",
@@ -1,15 +1,54 @@
-"""Basketball data storage utilities."""
-
-from cbb_data.storage.cache_helper import fetch_multi_season_with_storage, fetch_with_storage
-from cbb_data.storage.duckdb_storage import DuckDBStorage, get_storage
-from cbb_data.storage.save_data import estimate_file_size, get_recommended_format, save_to_disk
-
-__all__ = [
-    "DuckDBStorage",
-    "get_storage",
-    "fetch_with_storage",
-    "fetch_multi_season_with_storage",
-    "save_to_disk",
-    "get_recommended_format",
-    "estimate_file_size",
-]
+"""Basketball data storage utilities.
+
+Submodules are imported on first access, so ``cbb_data.storage.freshness``
+can be used without loading DuckDB or the fetcher cache.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from cbb_data.storage.cache_helper import (
+        fetch_multi_season_with_storage,
+        fetch_with_storage,
+    )
+    from cbb_data.storage.duckdb_storage import DuckDBStorage, get_storage
+    from cbb_data.storage.freshness import (
+        FreshnessPolicy,
+        get_freshness_policy,
+        set_freshness_policy,
+    )
+    from cbb_data.storage.incremental import SyncResult, sync_season
+    from cbb_data.storage.save_data import (
+        estimate_file_size,
+        get_recommended_format,
+        save_to_disk,
+    )
+
+_EXPORTS = {
+    "DuckDBStorage": "duckdb_storage",
+    "get_storage": "duckdb_storage",
+    "fetch_with_storage": "cache_helper",
+    "fetch_multi_season_with_storage": "cache_helper",
+    "FreshnessPolicy": "freshness",
+    "get_freshness_policy": "freshness",
+    "set_freshness_policy": "freshness",
+    "sync_season": "incremental",
+    "SyncResult": "incremental",
+    "save_to_disk": "save_data",
+    "get_recommended_format": "save_data",
+    "estimate_file_size": "save_data",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import storage exports on first access (PEP 562)"""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    return getattr(module, name)
@@ -4,7 +4,7 @@ Smart cache-aware data fetching with DuckDB storage layer.
 This module provides intelligent data fetching that checks multiple cache layers
 before making API calls:
 1. Memory cache (fastest, TTL-based)
-2. DuckDB storage (fast, persistent)
+2. DuckDB storage (fast, persistent; stale tables refresh in the background)
 3. API fetch (slowest, rate-limited)
 
 Usage:
@@ -26,6 +26,7 @@ import pandas as pd
 
 from cbb_data.fetchers.base import Cache
 from cbb_data.storage.duckdb_storage import get_storage
+from cbb_data.storage.freshness import get_freshness_policy, refresh_in_background
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +49,10 @@ def fetch_with_storage(
     2. DuckDB storage (10-100ms) - Persistent, fast SQL queries
     3. API fetch (3-180s) - Slowest, rate-limited
 
+    Stale DuckDB tables (older than their FreshnessPolicy) are returned
+    immediately and refreshed in the background, unless the policy sets
+    serve_stale=False, in which case they are refetched synchronously.
+
     Args:
         dataset: Dataset name ('schedule', 'player_game', etc.)
         league: League code ('NCAA-MBB', 'EuroLeague')
@@ -92,16 +97,34 @@ def fetch_with_storage(
     if use_storage:
         storage = get_storage()
         if storage.has_data(dataset, league, season):
-            logger.info(f"✓ DuckDB storage HIT for {dataset}/{league}/{season}")
-            df = storage.load(dataset, league, season)
-
-            # Update memory cache for future requests
-            if cache and not df.empty:
-                cache.set(cache_key, df)
-                logger.debug("Updated memory cache with DuckDB data")
-
-            return df
-        logger.debug(f"DuckDB storage MISS for {dataset}/{league}/{season}")
+            policy = get_freshness_policy(dataset, league, season)
+            stale = policy.is_stale(storage.get_age_seconds(dataset, league, season))
+
+            if not stale or policy.serve_stale:
+                logger.info(f"✓ DuckDB storage HIT for {dataset}/{league}/{season}")
+                df = storage.load(dataset, league, season)
+
+                # Update memory cache for future requests
+                if cache and not df.empty:
+                    cache.set(df, cache_key)
+                    logger.debug("Updated memory cache with DuckDB data")
+
+                if stale:
+                    logger.info(
+                        f"Stale data for {dataset}/{league}/{season}, refreshing in background"
+                    )
+                    refresh_in_background(
+                        dataset,
+                        league,
+                        season,
+                        fetcher_func,
+                        on_success=(lambda fresh: cache.set(fresh, cache_key)) if cache else None,
+                    )
+
+                return df
+            logger.info(f"DuckDB storage STALE for {dataset}/{league}/{season}, refetching")
+        else:
+            logger.debug(f"DuckDB storage MISS for {dataset}/{league}/{season}")
 
     # Layer 3: Fetch from API (slowest, 3-180 seconds)
     logger.info(f"Fetching from API for {dataset}/{league}/{season}")
@@ -152,7 +175,7 @@ def _fetch_and_cache(
 
     # Save to memory cache (TTL-based)
     if cache:
-        cache.set(cache_key, df)
+        cache.set(df, cache_key)
         logger.debug(f"✓ Saved to memory cache: {cache_key}")
 
     return df
@@ -1,5 +1,5 @@
 """
-DuckDB-based persistent storage layer for basketball data.
+DuckDB-based persistent storage for basketball data.
 
 Provides fast, SQL-queryable local storage with automatic table management.
 Uses DuckDB for optimal performance on analytical queries (30-600x faster than pandas).
@@ -7,9 +7,32 @@ Uses DuckDB for optimal performance on analytical queries (30-600x faster than p
 Features:
 - Persistent storage across sessions (survives memory cache TTL)
 - SQL-based filtering and aggregation
-- Automatic table naming: {dataset}_{league}_{season}
-- Multi-season queries with UNION ALL (fast merging)
+- One table per dataset, partitioned by hidden _league/_season columns
+- Cross-season and cross-league loads as a single scan
+- Zone-map friendly layout: each partition is written sorted by the common
+  filter keys (GAME_ID, TEAM_ID, PLAYER_ID, GAME_DATE)
+- Schema evolution when leagues/seasons bring new or differently typed columns
 - Parquet export with compression
+- Arrow-native reads/writes (load_arrow, stream_arrow, save_arrow) that skip pandas
+- Per-partition write timestamps for freshness checks (stale-while-revalidate)
+- Delta writes: save(mode="append" | "upsert") touches only the incoming rows,
+  upserts keyed by the dataset's DatasetRegistry keys
+- Per-game merges and ingest watermarks for incremental season syncs
+- Automatic migration of legacy {dataset}_{league}_{season} tables
+- Thread-safe: per-thread cursors for parallel reads, one queued writer thread
+- Read-only mode for API replicas (CBB_DUCKDB_READ_ONLY=1)
+
+Layout:
+    Every dataset lives in one table named after the dataset ("schedule",
+    "player_game", ...). Each row carries three hidden columns:
+    - _league, _season: partition keys
+    - _row: original row position, used to return rows in the order saved
+    The _cbb_table_meta table records, per (dataset, league, season), the
+    row count, write time and the column list/types of the saved DataFrame,
+    so loads return exactly the columns (and dtypes) that were saved.
+    The _cbb_sync_watermark table records, per partition, each ingested
+    GAME_ID with its date and whether the game was complete when ingested
+    (see storage/incremental.py).
 
 Usage:
     from cbb_data.storage.duckdb_storage import get_storage
@@ -19,10 +42,13 @@ Usage:
     # Save data
     storage.save(df, dataset='schedule', league='NCAA-MBB', season='2024')
 
+    # Add or update a few games without rewriting the season
+    storage.save(new_rows, dataset='player_game', league='NCAA-MBB', season='2024', mode='upsert')
+
     # Load data
     df = storage.load(dataset='schedule', league='NCAA-MBB', season='2024')
 
-    # Load multiple seasons (fast SQL UNION ALL)
+    # Load multiple seasons (single scan)
     df = storage.load_multi_season(
         dataset='schedule',
         league='NCAA-MBB',
@@ -30,17 +56,94 @@ Usage:
     )
 """
 
+import json
 import logging
+import os
+import queue
+import re
+import threading
+import uuid
+from collections.abc import Callable
+from concurrent.futures import Future
+from datetime import UTC, datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import duckdb
 import pandas as pd
+import pyarrow as pa
 
 logger = logging.getLogger(__name__)
 
 # Global storage instance (singleton pattern)
 _storage_instance: Optional["DuckDBStorage"] = None
+_storage_lock = threading.Lock()
+
+# Internal table recording when each dataset/league/season was last written
+META_TABLE = "_cbb_table_meta"
+
+# Internal table recording which games of each partition were ingested (incremental sync)
+WATERMARK_TABLE = "_cbb_sync_watermark"
+
+# Hidden partition/ordering columns added to every dataset table
+PARTITION_COLUMNS = ("_league", "_season", "_row")
+
+# Filter keys used to cluster rows inside a partition (zone-map pruning)
+CLUSTER_KEYS = ("GAME_ID", "TEAM_ID", "PLAYER_ID", "GAME_DATE")
+
+# Datasets recognised when migrating legacy {dataset}_{league}_{season} tables
+KNOWN_DATASETS = (
+    "prospect_player_season",
+    "player_team_season",
+    "player_season",
+    "team_season",
+    "player_game",
+    "team_game",
+    "schedule",
+    "shots",
+    "pbp",
+)
+
+# save() modes: whole-partition replace, plain append, key-matched upsert
+SAVE_MODES = ("replace", "append", "upsert")
+
+# Sentinel for "record the current time" in _record_write
+_NOW = object()
+
+_INTEGER_TYPES = {"TINYINT", "SMALLINT", "INTEGER", "BIGINT", "HUGEINT"}
+_UNSIGNED_TYPES = {"UTINYINT", "USMALLINT", "UINTEGER", "UBIGINT"}
+_FLOAT_TYPES = {"FLOAT", "DOUBLE"}
+
+
+def _quote(identifier: str) -> str:
+    """Quote a SQL identifier"""
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _fetch_arrow_table(result: duckdb.DuckDBPyConnection) -> pa.Table:
+    """Fetch a query result as an Arrow table (across DuckDB versions)"""
+    to_table = getattr(result, "to_arrow_table", None) or result.fetch_arrow_table
+    table: pa.Table = to_table()
+    return table
+
+
+def _fetch_arrow_reader(result: duckdb.DuckDBPyConnection, batch_size: int) -> pa.RecordBatchReader:
+    """Fetch a query result as an Arrow RecordBatchReader (across DuckDB versions)"""
+    to_reader = getattr(result, "to_arrow_reader", None) or result.fetch_record_batch
+    reader: pa.RecordBatchReader = to_reader(batch_size)
+    return reader
+
+
+def _widen_type(current: str, incoming: str) -> str:
+    """Smallest common type for two DuckDB column types"""
+    if current == incoming:
+        return current
+    numeric = _INTEGER_TYPES | _UNSIGNED_TYPES
+    if current in numeric and incoming in numeric:
+        return "BIGINT"
+    if current in numeric | _FLOAT_TYPES and incoming in numeric | _FLOAT_TYPES:
+        return "DOUBLE"
+    return "VARCHAR"
 
 
 class DuckDBStorage:
@@ -48,67 +151,773 @@ class DuckDBStorage:
     DuckDB-based persistent storage for basketball data.
 
     Provides fast SQL-queryable storage with automatic table management.
+
+    Thread safety:
+        A DuckDB connection must not be shared between threads, so every
+        thread gets its own cursor (conn.cursor()) on the shared database.
+        Reads run in parallel on those cursors. All writes (save, metadata,
+        migration) go through a queue drained by one writer thread, so
+        concurrent saves never interleave or block readers.
+
+    Read-only mode:
+        With read_only=True (or CBB_DUCKDB_READ_ONLY=1) the database is opened
+        read-only, e.g. for API replicas serving a file written elsewhere.
+        save() becomes a no-op; the file must already exist.
     """
 
-    def __init__(self, db_path: str = "data/basketball.duckdb"):
+    def __init__(
+        self,
+        db_path: str = "data/basketball.duckdb",
+        auto_migrate: bool = True,
+        read_only: bool | None = None,
+    ):
         """
         Initialize DuckDB storage.
 
         Args:
             db_path: Path to DuckDB database file (created if doesn't exist)
+            auto_migrate: Move legacy per-season tables into the consolidated
+                layout on startup (default: True)
+            read_only: Open the database read-only (default: CBB_DUCKDB_READ_ONLY
+                env var, then False)
         """
+        if read_only is None:
+            read_only = os.getenv("CBB_DUCKDB_READ_ONLY", "").lower() in ("1", "true", "yes")
+
         self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.read_only = read_only
+        if not read_only:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Initialize connection (file-based for persistence)
-        self.conn = duckdb.connect(str(self.db_path))
+        # Root connection (file-based for persistence); threads use cursors of it
+        self.conn = duckdb.connect(str(self.db_path), read_only=read_only)
+        self._cursors: dict[threading.Thread, duckdb.DuckDBPyConnection] = {}
+        self._cursors_lock = threading.Lock()
 
-        logger.info(f"DuckDB storage initialized at {self.db_path}")
+        self._write_queue: queue.Queue[tuple[Callable[[], Any], Future] | None] = queue.Queue()
+        self._writer: threading.Thread | None = None
 
-    def _get_table_name(self, dataset: str, league: str, season: str) -> str:
+        if not read_only:
+            self._writer = threading.Thread(
+                target=self._write_loop, name="cbb-duckdb-writer", daemon=True
+            )
+            self._writer.start()
+            self._submit_write(self._ensure_meta_table).result()
+
+            if auto_migrate:
+                self._submit_write(self.migrate_legacy_tables).result()
+
+        mode = "read-only" if read_only else "read-write"
+        logger.info(f"DuckDB storage initialized at {self.db_path} ({mode})")
+
+    # ------------------------------------------------------------------
+    # Connection pool
+    # ------------------------------------------------------------------
+
+    @property
+    def _con(self) -> duckdb.DuckDBPyConnection:
+        """Cursor owned by the calling thread (created on first use)."""
+        thread = threading.current_thread()
+        cursor = self._cursors.get(thread)
+        if cursor is None:
+            with self._cursors_lock:
+                # Drop cursors of threads that have exited (executor churn)
+                for dead in [t for t in self._cursors if not t.is_alive()]:
+                    self._cursors.pop(dead).close()
+                cursor = self.conn.cursor()
+                self._cursors[thread] = cursor
+        return cursor
+
+    def _write_loop(self) -> None:
+        """Writer thread: run queued writes one at a time."""
+        while True:
+            item = self._write_queue.get()
+            if item is None:
+                break
+            fn, future = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn())
+            except BaseException as e:
+                future.set_exception(e)
+
+    def _submit_write(self, fn: Callable[[], Any]) -> Future:
+        """Queue a write for the writer thread (runs inline if already on it)."""
+        future: Future = Future()
+        if threading.current_thread() is self._writer:
+            try:
+                future.set_result(fn())
+            except BaseException as e:
+                future.set_exception(e)
+            return future
+        if self._writer is None or not self._writer.is_alive():
+            raise RuntimeError("DuckDB storage is read-only or closed")
+        self._write_queue.put((fn, future))
+        return future
+
+    def pending_writes(self) -> int:
+        """Number of writes waiting in the writer queue."""
+        return self._write_queue.qsize()
+
+    # ------------------------------------------------------------------
+    # Metadata
+    # ------------------------------------------------------------------
+
+    def _ensure_meta_table(self) -> None:
+        """Create the partition metadata table if missing."""
+        self._con.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {META_TABLE} (
+                dataset VARCHAR,
+                league VARCHAR,
+                season VARCHAR,
+                row_count BIGINT,
+                updated_at TIMESTAMP,
+                PRIMARY KEY (dataset, league, season)
+            )
+            """
+        )
+        # Column list/types per partition (added with the consolidated layout)
+        self._con.execute(f"ALTER TABLE {META_TABLE} ADD COLUMN IF NOT EXISTS columns VARCHAR")
+        self._con.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {WATERMARK_TABLE} (
+                dataset VARCHAR,
+                league VARCHAR,
+                season VARCHAR,
+                game_id VARCHAR,
+                game_date TIMESTAMP,
+                completed BOOLEAN,
+                ingested_at TIMESTAMP,
+                PRIMARY KEY (dataset, league, season, game_id)
+            )
+            """
+        )
+
+    def _record_write(
+        self,
+        dataset: str,
+        league: str,
+        season: str,
+        row_count: int,
+        columns: list[tuple[str, str]],
+        updated_at: datetime | None | object = _NOW,
+    ) -> None:
+        """Record a partition write (UTC timestamp + saved column schema).
+
+        updated_at defaults to now; None records an unknown write time.
         """
-        Generate standardized table name.
+        if updated_at is _NOW:
+            updated_at = datetime.now(UTC).replace(tzinfo=None)
+        self._con.execute(
+            f"INSERT OR REPLACE INTO {META_TABLE} "
+            "(dataset, league, season, row_count, updated_at, columns) VALUES (?, ?, ?, ?, ?, ?)",
+            [dataset, league, season, row_count, updated_at, json.dumps(columns)],
+        )
+
+    def _partition_columns(
+        self, dataset: str, league: str, seasons: list[str]
+    ) -> tuple[list[str], list[tuple[str, str]]]:
+        """
+        Get stored seasons and their combined column schema.
 
-        Format: {dataset}_{league}_{season}
-        Example: schedule_NCAA_MBB_2024
+        Returns:
+            (available seasons, [(column, type), ...]) where columns keep the
+            order they were saved in. A column whose type differs between
+            seasons is reported with type "" (use the table type).
         """
+        placeholders = ", ".join("?" for _ in seasons)
+        rows = self._con.execute(
+            f"SELECT season, columns FROM {META_TABLE} "
+            f"WHERE dataset = ? AND league = ? AND season IN ({placeholders})",
+            [dataset, league, *seasons],
+        ).fetchall()
+
+        stored = dict(rows)
+        available = [season for season in seasons if season in stored]
+        merged: dict[str, str] = {}
+        for columns_json in (stored[season] for season in available):
+            for name, col_type in json.loads(columns_json or "[]"):
+                if name not in merged:
+                    merged[name] = col_type
+                elif merged[name] != col_type:
+                    merged[name] = ""
+        return available, list(merged.items())
+
+    # ------------------------------------------------------------------
+    # Table helpers
+    # ------------------------------------------------------------------
+
+    def _get_table_name(self, dataset: str) -> str:
+        """
+        Physical table holding every league/season of a dataset.
+
+        Example: schedule, player_game
+        """
+        return re.sub(r"[^0-9A-Za-z_]", "_", dataset)
+
+    def _legacy_table_name(self, dataset: str, league: str, season: str) -> str:
+        """Table name used before the consolidated layout: {dataset}_{league}_{season}"""
         # Sanitize league name (replace hyphens with underscores)
         league_clean = league.replace("-", "_")
         return f"{dataset}_{league_clean}_{season}"
 
-    def save(self, df: pd.DataFrame, dataset: str, league: str, season: str) -> None:
+    def _table_exists(self, table_name: str) -> bool:
+        result = self._con.execute(
+            "SELECT COUNT(*) FROM information_schema.tables "
+            "WHERE table_schema = 'main' AND table_name = ?",
+            [table_name],
+        ).fetchone()
+        return bool(result and result[0] > 0)
+
+    def _table_columns(self, table_name: str) -> dict[str, str]:
+        rows = self._con.execute(f"DESCRIBE {_quote(table_name)}").fetchall()
+        return {row[0]: row[1] for row in rows}
+
+    def _evolve_schema(self, table_name: str, incoming: list[tuple[str, str]]) -> None:
+        """Add new columns and widen conflicting column types in place."""
+        existing = self._table_columns(table_name)
+        for name, col_type in incoming:
+            if name not in existing:
+                self._con.execute(
+                    f"ALTER TABLE {_quote(table_name)} ADD COLUMN {_quote(name)} {col_type}"
+                )
+                logger.debug(f"Added column {name} ({col_type}) to {table_name}")
+            else:
+                widened = _widen_type(existing[name], col_type)
+                if widened != existing[name]:
+                    self._con.execute(
+                        f"ALTER TABLE {_quote(table_name)} ALTER {_quote(name)} TYPE {widened}"
+                    )
+                    logger.info(
+                        f"Widened {table_name}.{name} from {existing[name]} to {widened} "
+                        f"(incoming {col_type})"
+                    )
+
+    def _select_list(self, table_name: str, columns: list[tuple[str, str]]) -> str:
+        """SELECT list restoring each saved column's type where the table widened it."""
+        table_types = self._table_columns(table_name)
+        parts = []
+        for name, col_type in columns:
+            if name not in table_types:
+                continue
+            if col_type and table_types[name] != col_type:
+                parts.append(f"TRY_CAST({_quote(name)} AS {col_type}) AS {_quote(name)}")
+            else:
+                parts.append(_quote(name))
+        return ", ".join(parts) if parts else "*"
+
+    def _write_partition(
+        self, relation_name: str, dataset: str, league: str, season: str
+    ) -> tuple[int, list[tuple[str, str]]]:
         """
-        Save DataFrame to DuckDB table.
+        Replace one league/season partition with the rows of a registered relation.
 
-        Creates or replaces table with standardized naming.
+        Caller is responsible for the surrounding transaction.
+
+        Returns:
+            (row count, saved column schema)
+        """
+        table_name = self._get_table_name(dataset)
+        incoming = [
+            (row[0], row[1])
+            for row in self._con.execute(f"DESCRIBE SELECT * FROM {relation_name}").fetchall()
+            if row[0] not in PARTITION_COLUMNS
+        ]
+
+        if not self._table_exists(table_name):
+            self._con.execute(
+                f"CREATE TABLE {_quote(table_name)} (_league VARCHAR, _season VARCHAR, _row BIGINT"
+                + "".join(f", {_quote(name)} {col_type}" for name, col_type in incoming)
+                + ")"
+            )
+        else:
+            self._evolve_schema(table_name, incoming)
+
+        # Cluster rows by the common filter keys so zone maps can skip row groups
+        upper = {name.upper(): name for name, _ in incoming}
+        cluster = [_quote(upper[key]) for key in CLUSTER_KEYS if key in upper]
+        order_by = f" ORDER BY {', '.join(cluster)}, _row" if cluster else " ORDER BY _row"
+
+        self._con.execute(
+            f"DELETE FROM {_quote(table_name)} WHERE _league = ? AND _season = ?",
+            [league, season],
+        )
+        self._con.execute(
+            f"INSERT INTO {_quote(table_name)} BY NAME "
+            f"SELECT * FROM (SELECT ?::VARCHAR AS _league, ?::VARCHAR AS _season, "
+            f"(row_number() OVER () - 1)::BIGINT AS _row, * FROM {relation_name}){order_by}",
+            [league, season],
+        )
+        result = self._con.execute(
+            f"SELECT COUNT(*) FROM {_quote(table_name)} WHERE _league = ? AND _season = ?",
+            [league, season],
+        ).fetchone()
+        return (int(result[0]) if result else 0), incoming
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def save(
+        self,
+        df: pd.DataFrame,
+        dataset: str,
+        league: str,
+        season: str,
+        wait: bool = True,
+        mode: str = "replace",
+        keys: list[str] | None = None,
+    ) -> None:
+        """
+        Save DataFrame into the league/season partition of a dataset table.
+
+        Modes:
+            replace: Replace every row previously saved for the partition
+            append: Add the rows after the stored ones
+            upsert: Replace stored rows whose key columns match an incoming
+                row, then append the incoming rows. Keys default to the
+                dataset's DatasetRegistry keys (e.g., PLAYER_ID + GAME_ID).
+
+        append/upsert only touch the incoming rows (and the matching stored
+        rows), so adding one game costs one game, not a season rewrite. Into
+        an empty partition every mode is a plain replace.
+
+        New columns are added to the dataset table; conflicting column types
+        are widened (the saved type is restored on load).
+
+        Writes are queued for the single writer thread. No-op in read-only mode.
 
         Args:
             df: DataFrame to save
             dataset: Dataset name ('schedule', 'player_game', etc.)
             league: League code ('NCAA-MBB', 'EuroLeague')
             season: Season string ('2024', '2023', etc.)
+            wait: Block until the write is committed (default: True). With
+                wait=False failures are only logged.
+            mode: 'replace' (default), 'append' or 'upsert'
+            keys: Key columns for upsert (default: registry keys of the dataset)
+
+        Raises:
+            ValueError: Unknown mode, or upsert keys unknown/missing from df
 
         Example:
             >>> storage.save(df, 'schedule', 'NCAA-MBB', '2024')
-            # Creates table: schedule_NCAA_MBB_2024
+            # Writes partition NCAA-MBB/2024 of table: schedule
+            >>> storage.save(new_games_df, 'player_game', 'NCAA-MBB', '2024', mode='upsert')
         """
         if df.empty:
             logger.warning(f"Empty DataFrame - skipping save for {dataset}/{league}/{season}")
             return
 
-        table_name = self._get_table_name(dataset, league, season)
+        if self.read_only:
+            logger.debug(f"Read-only storage - skipping save for {dataset}/{league}/{season}")
+            return
 
-        try:
-            # Create or replace table from DataFrame
-            self.conn.execute(f"CREATE OR REPLACE TABLE {table_name} AS SELECT * FROM df")
+        merge_keys = self._merge_keys(dataset, mode, keys, list(df.columns))
+        future = self._submit_write(
+            lambda: self._save_partition(df, dataset, league, season, merge_keys)
+        )
+        if wait:
+            future.result()
+
+    def save_arrow(
+        self,
+        data: pa.Table | pa.RecordBatchReader,
+        dataset: str,
+        league: str,
+        season: str,
+        wait: bool = True,
+        mode: str = "replace",
+        keys: list[str] | None = None,
+    ) -> None:
+        """
+        Save Arrow data into the league/season partition of a dataset table.
+
+        Same semantics as save(), but DuckDB scans the Arrow buffers directly
+        (no pandas conversion). A RecordBatchReader is consumed batch by batch,
+        so the full dataset never has to be materialized in Python.
 
-            row_count = len(df)
-            logger.debug(f"Saved {row_count:,} rows to table: {table_name}")
+        Args:
+            data: Arrow table or record batch stream
+            dataset: Dataset name
+            league: League code
+            season: Season string
+            wait: Block until the write is committed (default: True)
+            mode: 'replace' (default), 'append' or 'upsert'
+            keys: Key columns for upsert (default: registry keys of the dataset)
+
+        Example:
+            >>> storage.save_arrow(pbp_table, 'pbp', 'NCAA-MBB', '2025')
+        """
+        if isinstance(data, pa.Table) and data.num_rows == 0:
+            logger.warning(f"Empty Arrow table - skipping save for {dataset}/{league}/{season}")
+            return
+
+        if self.read_only:
+            logger.debug(f"Read-only storage - skipping save for {dataset}/{league}/{season}")
+            return
+
+        merge_keys = self._merge_keys(dataset, mode, keys, list(data.schema.names))
+        if merge_keys and isinstance(data, pa.RecordBatchReader):
+            # Upserts scan the incoming rows twice (match + insert); a stream reads once
+            data = data.read_all()
+        future = self._submit_write(
+            lambda: self._save_partition(data, dataset, league, season, merge_keys)
+        )
+        if wait:
+            future.result()
+
+    def _merge_keys(
+        self, dataset: str, mode: str, keys: list[str] | None, columns: list[str]
+    ) -> list[str] | None:
+        """
+        Resolve the rows a save replaces: None = whole partition, [] = none (append).
+
+        Raises:
+            ValueError: Unknown mode, or upsert keys unknown/missing from the data
+        """
+        if mode not in SAVE_MODES:
+            raise ValueError(f"Unknown save mode '{mode}' (expected one of {SAVE_MODES})")
+        if mode == "replace":
+            return None
+        if mode == "append":
+            return []
+
+        if not keys:
+            from cbb_data.catalog.registry import DatasetRegistry
+
+            if dataset not in DatasetRegistry.list_ids():
+                # The catalog registers itself when the dataset API is imported,
+                # which callers of storage alone (ingest scripts) may never do
+                import cbb_data.api.datasets  # noqa: F401
+            try:
+                keys = list(DatasetRegistry.get(dataset)["keys"])
+            except KeyError:
+                raise ValueError(
+                    f"No keys registered for dataset '{dataset}' - pass keys= for upsert"
+                ) from None
+        missing = [k for k in keys if k not in columns]
+        if missing:
+            raise ValueError(f"Upsert keys {missing} not in {dataset} columns")
+        return keys
+
+    def _save_partition(
+        self,
+        data: Any,
+        dataset: str,
+        league: str,
+        season: str,
+        merge_keys: list[str] | None = None,
+    ) -> None:
+        """Write one partition from a DataFrame or Arrow object (runs on the writer thread)."""
+        table_name = self._get_table_name(dataset)
+        relation_name = f"_cbb_incoming_{uuid.uuid4().hex}"
+        self._con.register(relation_name, data)
+
+        try:
+            self._con.execute("BEGIN TRANSACTION")
+            available, saved = (
+                self._partition_columns(dataset, league, [season])
+                if merge_keys is not None
+                else ([], [])
+            )
+            if available and merge_keys is not None:
+                row_count, columns = self._merge_rows(
+                    relation_name, table_name, league, season, saved, merge_keys
+                )
+            else:
+                row_count, columns = self._write_partition(relation_name, dataset, league, season)
+            if row_count == 0:
+                # Streams can turn out empty; keep whatever was stored before
+                self._con.execute("ROLLBACK")
+                logger.warning(f"No rows to save for {dataset}/{league}/{season}")
+                return
+            self._record_write(dataset, league, season, row_count, columns)
+            self._con.execute("COMMIT")
+            logger.debug(f"Saved {row_count:,} rows to {table_name} [{league}/{season}]")
 
         except Exception as e:
+            self._con.execute("ROLLBACK")
             logger.error(f"Failed to save to DuckDB: {e}")
             raise
 
+        finally:
+            self._con.unregister(relation_name)
+
+    def merge_games(
+        self,
+        df: pd.DataFrame,
+        dataset: str,
+        league: str,
+        season: str,
+        watermark: pd.DataFrame | None = None,
+        key: str = "GAME_ID",
+        replace: bool = False,
+        wait: bool = True,
+    ) -> None:
+        """
+        Merge rows of some games into a league/season partition.
+
+        Rows already stored for the incoming games (matched on ``key``) are
+        deleted and the incoming rows appended (an upsert keyed by game, so a
+        refetched game replaces all of its stored rows), so the write touches
+        only the games in df instead of rewriting the season. Schema evolution works as
+        in save(). The first merge into an empty partition is a plain save.
+
+        The optional watermark (columns GAME_ID, GAME_DATE, COMPLETED) is
+        upserted into the sync watermark in the same transaction, so stored
+        rows and watermark never disagree.
+
+        Args:
+            df: Rows for the games being merged (must contain ``key``)
+            dataset: Dataset name
+            league: League code
+            season: Season string
+            watermark: Ingested games to record (see get_watermark)
+            key: Game identifier column (default: GAME_ID)
+            replace: Replace the whole partition and its watermark instead
+            wait: Block until the write is committed (default: True)
+
+        Example:
+            >>> storage.merge_games(new_box_scores, 'player_game', 'LKL', '2024-25', watermark=wm)
+        """
+        if self.read_only:
+            logger.debug(f"Read-only storage - skipping merge for {dataset}/{league}/{season}")
+            return
+        if df.empty and watermark is None:
+            return
+        if not df.empty and key not in df.columns:
+            raise ValueError(f"merge_games requires a {key} column")
+
+        future = self._submit_write(
+            lambda: self._merge_partition(df, dataset, league, season, watermark, key, replace)
+        )
+        if wait:
+            future.result()
+
+    def _merge_partition(
+        self,
+        df: pd.DataFrame,
+        dataset: str,
+        league: str,
+        season: str,
+        watermark: pd.DataFrame | None,
+        key: str,
+        replace: bool,
+    ) -> None:
+        """Merge games into one partition (runs on the writer thread)."""
+        table_name = self._get_table_name(dataset)
+        relation_name = f"_cbb_incoming_{uuid.uuid4().hex}"
+        watermark_name = f"_cbb_watermark_{uuid.uuid4().hex}"
+        self._con.register(relation_name, df)
+        if watermark is not None:
+            self._con.register(watermark_name, watermark)
+
+        try:
+            self._con.execute("BEGIN TRANSACTION")
+            if not df.empty:
+                available, saved = self._partition_columns(dataset, league, [season])
+                if replace or not available:
+                    row_count, columns = self._write_partition(
+                        relation_name, dataset, league, season
+                    )
+                else:
+                    row_count, columns = self._merge_rows(
+                        relation_name, table_name, league, season, saved, [key]
+                    )
+                self._record_write(dataset, league, season, row_count, columns)
+
+            if replace:
+                self._con.execute(
+                    f"DELETE FROM {WATERMARK_TABLE} WHERE dataset = ? AND league = ? AND season = ?",
+                    [dataset, league, season],
+                )
+            if watermark is not None and not watermark.empty:
+                self._con.execute(
+                    f"INSERT OR REPLACE INTO {WATERMARK_TABLE} "
+                    "(dataset, league, season, game_id, game_date, completed, ingested_at) "
+                    "SELECT ?, ?, ?, CAST(GAME_ID AS VARCHAR), TRY_CAST(GAME_DATE AS TIMESTAMP), "
+                    f"COALESCE(TRY_CAST(COMPLETED AS BOOLEAN), false), ? FROM {watermark_name}",
+                    [dataset, league, season, datetime.now(UTC).replace(tzinfo=None)],
+                )
+            self._con.execute("COMMIT")
+            logger.debug(f"Merged {len(df):,} rows into {table_name} [{league}/{season}]")
+
+        except Exception as e:
+            self._con.execute("ROLLBACK")
+            logger.error(f"Failed to merge into DuckDB: {e}")
+            raise
+
+        finally:
+            self._con.unregister(relation_name)
+            if watermark is not None:
+                self._con.unregister(watermark_name)
+
+    def _merge_rows(
+        self,
+        relation_name: str,
+        table_name: str,
+        league: str,
+        season: str,
+        saved: list[tuple[str, str]],
+        keys: list[str],
+    ) -> tuple[int, list[tuple[str, str]]]:
+        """
+        Delete stored rows matching the incoming keys and append the incoming rows.
+
+        Keys are compared as text (NULL matches NULL), so a key column whose
+        type was widened still matches. No keys means a plain append. Caller
+        is responsible for the surrounding transaction.
+
+        Returns:
+            (partition row count, saved column schema after the merge)
+        """
+        incoming = [
+            (row[0], row[1])
+            for row in self._con.execute(f"DESCRIBE SELECT * FROM {relation_name}").fetchall()
+            if row[0] not in PARTITION_COLUMNS
+        ]
+        self._evolve_schema(table_name, incoming)
+
+        partition = "_league = ? AND _season = ?"
+        if keys:
+            match = " AND ".join(
+                f"CAST(t.{_quote(k)} AS VARCHAR) IS NOT DISTINCT FROM CAST(i.{_quote(k)} AS VARCHAR)"
+                for k in keys
+            )
+            self._con.execute(
+                f"DELETE FROM {_quote(table_name)} AS t WHERE t._league = ? AND t._season = ? "
+                f"AND EXISTS (SELECT 1 FROM {relation_name} AS i WHERE {match})",
+                [league, season],
+            )
+        result = self._con.execute(
+            f"SELECT COALESCE(MAX(_row) + 1, 0) FROM {_quote(table_name)} WHERE {partition}",
+            [league, season],
+        ).fetchone()
+        start = int(result[0]) if result else 0
+
+        upper = {name.upper(): name for name, _ in incoming}
+        cluster = [_quote(upper[k]) for k in CLUSTER_KEYS if k in upper]
+        order_by = f" ORDER BY {', '.join(cluster)}, _row" if cluster else " ORDER BY _row"
+        self._con.execute(
+            f"INSERT INTO {_quote(table_name)} BY NAME "
+            f"SELECT * FROM (SELECT ?::VARCHAR AS _league, ?::VARCHAR AS _season, "
+            f"(? + row_number() OVER () - 1)::BIGINT AS _row, * FROM {relation_name}){order_by}",
+            [league, season, start],
+        )
+        result = self._con.execute(
+            f"SELECT COUNT(*) FROM {_quote(table_name)} WHERE {partition}", [league, season]
+        ).fetchone()
+
+        # Saved schema: stored columns first (widened where the rows disagree), then new ones
+        columns = dict(saved)
+        for name, col_type in incoming:
+            columns[name] = _widen_type(columns[name], col_type) if columns.get(name) else col_type
+        return (int(result[0]) if result else 0), list(columns.items())
+
+    def get_watermark(self, dataset: str, league: str, season: str) -> pd.DataFrame:
+        """
+        Get the games recorded as ingested for a partition.
+
+        Args:
+            dataset: Dataset name
+            league: League code
+            season: Season string
+
+        Returns:
+            DataFrame with GAME_ID, GAME_DATE, COMPLETED (complete when
+            ingested) and INGESTED_AT; empty if nothing was synced
+        """
+        try:
+            return self._con.execute(
+                "SELECT game_id AS GAME_ID, game_date AS GAME_DATE, completed AS COMPLETED, "
+                f"ingested_at AS INGESTED_AT FROM {WATERMARK_TABLE} "
+                "WHERE dataset = ? AND league = ? AND season = ? ORDER BY game_date, game_id",
+                [dataset, league, season],
+            ).df()
+        except Exception as e:
+            logger.debug(f"Error reading sync watermark: {e}")
+            return pd.DataFrame(columns=["GAME_ID", "GAME_DATE", "COMPLETED", "INGESTED_AT"])
+
+    def _query_partitions(
+        self,
+        dataset: str,
+        league: str,
+        seasons: list[str],
+        filter_sql: str | None = None,
+        limit: int | None = None,
+        columns: list[str] | None = None,
+    ) -> str | None:
+        """Build the SELECT for the given seasons (None if nothing is stored).
+
+        The partition scan restores saved column types in an inner SELECT, so
+        filter_sql sees the same column types the saved DataFrame had. DuckDB
+        pushes the outer predicates into the scan for columns that needed no
+        cast, which lets zone maps skip row groups.
+        """
+        available, saved_columns = self._partition_columns(dataset, league, seasons)
+        if not available:
+            return None
+
+        table_name = self._get_table_name(dataset)
+        season_list = ", ".join("'" + s.replace("'", "''") + "'" for s in available)
+        league_lit = "'" + league.replace("'", "''") + "'"
+
+        scan = (
+            f"SELECT {self._select_list(table_name, saved_columns)}, _season, _row "
+            f"FROM {_quote(table_name)} "
+            f"WHERE _league = {league_lit} AND _season IN ({season_list})"
+        )
+
+        projection = "* EXCLUDE (_season, _row)"
+        if columns:
+            saved_names = {name for name, _ in saved_columns}
+            selected = [c for c in columns if c in saved_names]
+            if selected:
+                projection = ", ".join(_quote(c) for c in selected)
+
+        query = f"SELECT {projection} FROM ({scan}) AS partition_rows"
+        if filter_sql:
+            query += f" WHERE ({filter_sql})"
+
+        # Return rows in saved order (seasons in the order requested)
+        if len(available) > 1:
+            query += f" ORDER BY list_position([{season_list}], _season), _row"
+        else:
+            query += " ORDER BY _row"
+
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+        return query
+
+    def get_schema(self, dataset: str, league: str, seasons: list[str]) -> dict[str, str]:
+        """
+        Get the saved column types for stored seasons of a dataset.
+
+        Args:
+            dataset: Dataset name
+            league: League code
+            seasons: Season strings
+
+        Returns:
+            Dict of column name -> DuckDB type, in saved column order (empty if
+            nothing is stored). Columns whose type differs between seasons
+            report the table's (widened) type.
+        """
+        try:
+            available, saved_columns = self._partition_columns(dataset, league, list(seasons))
+            if not available:
+                return {}
+            table_types = self._table_columns(self._get_table_name(dataset))
+        except Exception as e:
+            logger.debug(f"Error reading stored schema: {e}")
+            return {}
+        return {
+            name: col_type or table_types.get(name, "VARCHAR") for name, col_type in saved_columns
+        }
+
     def load(
         self,
         dataset: str,
@@ -116,16 +925,21 @@ class DuckDBStorage:
         season: str,
         filter_sql: str | None = None,
         limit: int | None = None,
+        columns: list[str] | None = None,
+        params: list[Any] | None = None,
     ) -> pd.DataFrame:
         """
-        Load data from DuckDB table.
+        Load one league/season partition of a dataset.
 
         Args:
             dataset: Dataset name
             league: League code
             season: Season string
-            filter_sql: Optional SQL WHERE clause (e.g., "TEAM_NAME = 'Duke'")
+            filter_sql: Optional SQL WHERE clause (e.g., "TEAM_NAME = 'Duke'"),
+                may contain ? placeholders bound from params
             limit: Optional row limit
+            columns: Optional columns to return (unknown names are ignored)
+            params: Values for ? placeholders in filter_sql
 
         Returns:
             pd.DataFrame: Loaded data
@@ -133,26 +947,20 @@ class DuckDBStorage:
         Example:
             >>> df = storage.load('schedule', 'NCAA-MBB', '2024', limit=100)
             >>> df = storage.load('schedule', 'NCAA-MBB', '2024', filter_sql="HOME_TEAM = 'Duke'")
+            >>> df = storage.load(
+            ...     'player_game', 'NCAA-MBB', '2024',
+            ...     filter_sql='"PLAYER_ID" IN (?, ?)', params=[101, 102],
+            ...     columns=['PLAYER_NAME', 'PTS'],
+            ... )
         """
-        table_name = self._get_table_name(dataset, league, season)
-
-        # Check if table exists
-        if not self.has_data(dataset, league, season):
-            logger.warning(f"Table not found: {table_name}")
-            return pd.DataFrame()
-
-        # Build query
-        query = f"SELECT * FROM {table_name}"
-
-        if filter_sql:
-            query += f" WHERE {filter_sql}"
-
-        if limit:
-            query += f" LIMIT {limit}"
-
         try:
-            df = self.conn.execute(query).df()
-            logger.debug(f"Loaded {len(df):,} rows from {table_name}")
+            query = self._query_partitions(dataset, league, [season], filter_sql, limit, columns)
+            if query is None:
+                logger.warning(f"No stored data for {dataset}/{league}/{season}")
+                return pd.DataFrame()
+
+            df = self._con.execute(query, params or []).df()
+            logger.debug(f"Loaded {len(df):,} rows from {dataset} [{league}/{season}]")
             return df
 
         except Exception as e:
@@ -166,21 +974,23 @@ class DuckDBStorage:
         seasons: list[str],
         filter_sql: str | None = None,
         limit: int | None = None,
+        columns: list[str] | None = None,
+        params: list[Any] | None = None,
     ) -> pd.DataFrame:
         """
-        Load data from multiple seasons using SQL UNION ALL.
-
-        This is 30-600x faster than pandas concat for large datasets.
+        Load data from multiple seasons with a single scan of the dataset table.
 
         Args:
             dataset: Dataset name
             league: League code
             seasons: List of season strings
-            filter_sql: Optional SQL WHERE clause applied to each table
+            filter_sql: Optional SQL WHERE clause (? placeholders bound from params)
             limit: Optional row limit for final result
+            columns: Optional columns to return (unknown names are ignored)
+            params: Values for ? placeholders in filter_sql
 
         Returns:
-            pd.DataFrame: Combined data from all seasons
+            pd.DataFrame: Combined data from all seasons (in the order requested)
 
         Example:
             >>> df = storage.load_multi_season(
@@ -193,40 +1003,105 @@ class DuckDBStorage:
         if not seasons:
             return pd.DataFrame()
 
-        # Get table names for existing seasons
-        available_tables = []
-        for season in seasons:
-            if self.has_data(dataset, league, season):
-                table_name = self._get_table_name(dataset, league, season)
-                available_tables.append(table_name)
+        try:
+            query = self._query_partitions(
+                dataset, league, list(seasons), filter_sql, limit, columns
+            )
+            if query is None:
+                logger.warning(f"No tables found for {dataset}/{league} in seasons: {seasons}")
+                return pd.DataFrame()
 
-        if not available_tables:
-            logger.warning(f"No tables found for {dataset}/{league} in seasons: {seasons}")
+            df = self._con.execute(query, params or []).df()
+            logger.info(f"Loaded {len(df):,} rows for {len(seasons)} seasons in a single scan")
+            return df
+
+        except Exception as e:
+            logger.error(f"Failed to load multi-season from DuckDB: {e}")
             return pd.DataFrame()
 
-        # Build UNION ALL query
-        queries = []
-        for table_name in available_tables:
-            query = f"SELECT * FROM {table_name}"
-            if filter_sql:
-                query += f" WHERE {filter_sql}"
-            queries.append(f"({query})")
+    def load_arrow(
+        self,
+        dataset: str,
+        league: str,
+        seasons: str | list[str],
+        filter_sql: str | None = None,
+        limit: int | None = None,
+        columns: list[str] | None = None,
+        params: list[Any] | None = None,
+    ) -> pa.Table:
+        """
+        Load one or more seasons as an Arrow table (no pandas conversion).
+
+        Arguments match load()/load_multi_season(); seasons may be a single
+        season string or a list.
+
+        Returns:
+            pa.Table: Loaded data (empty table if nothing is stored)
+
+        Example:
+            >>> table = storage.load_arrow('pbp', 'NCAA-MBB', ['2025', '2024'])
+            >>> pl_df = polars.from_arrow(table)
+        """
+        season_list = [seasons] if isinstance(seasons, str) else list(seasons)
+        query = self._query_partitions(dataset, league, season_list, filter_sql, limit, columns)
+        if query is None:
+            logger.warning(f"No stored data for {dataset}/{league}/{season_list}")
+            return pa.table({})
+
+        table = _fetch_arrow_table(self._con.execute(query, params or []))
+        logger.debug(f"Loaded {table.num_rows:,} rows (Arrow) from {dataset} [{league}]")
+        return table
+
+    def stream_arrow(
+        self,
+        dataset: str,
+        league: str,
+        seasons: str | list[str],
+        filter_sql: str | None = None,
+        limit: int | None = None,
+        columns: list[str] | None = None,
+        params: list[Any] | None = None,
+        batch_size: int = 100_000,
+    ) -> pa.RecordBatchReader:
+        """
+        Stream one or more seasons as Arrow record batches.
+
+        The query runs on its own cursor, so the reader stays valid while the
+        calling thread issues other queries; the cursor is closed once the
+        stream is exhausted. Peak memory is one batch instead of the full result.
 
-        union_query = " UNION ALL ".join(queries)
+        Args:
+            batch_size: Rows per record batch
+            (other arguments as in load_arrow)
 
-        if limit:
-            union_query = f"SELECT * FROM ({union_query}) LIMIT {limit}"
+        Returns:
+            pa.RecordBatchReader over the result (empty if nothing is stored)
 
+        Example:
+            >>> for batch in storage.stream_arrow('shots', 'NCAA-MBB', '2025'):
+            ...     process(batch)
+        """
+        season_list = [seasons] if isinstance(seasons, str) else list(seasons)
+        query = self._query_partitions(dataset, league, season_list, filter_sql, limit, columns)
+        if query is None:
+            logger.warning(f"No stored data for {dataset}/{league}/{season_list}")
+            return pa.RecordBatchReader.from_batches(pa.schema([]), [])
+
+        with self._cursors_lock:
+            cursor = self.conn.cursor()
         try:
-            df = self.conn.execute(union_query).df()
-            logger.info(
-                f"Loaded {len(df):,} rows from {len(available_tables)} seasons using SQL UNION ALL"
-            )
-            return df
+            source = _fetch_arrow_reader(cursor.execute(query, params or []), batch_size)
+        except Exception:
+            cursor.close()
+            raise
 
-        except Exception as e:
-            logger.error(f"Failed to load multi-season from DuckDB: {e}")
-            return pd.DataFrame()
+        def batches() -> Any:
+            try:
+                yield from source
+            finally:
+                cursor.close()
+
+        return pa.RecordBatchReader.from_batches(source.schema, batches())
 
     def has_data(self, dataset: str, league: str, season: str) -> bool:
         """
@@ -238,31 +1113,92 @@ class DuckDBStorage:
             season: Season string
 
         Returns:
-            bool: True if table exists, False otherwise
+            bool: True if the partition has been saved, False otherwise
+        """
+        return bool(self.available_seasons(dataset, league, [season]))
+
+    def available_seasons(self, dataset: str, league: str, seasons: list[str]) -> list[str]:
         """
-        table_name = self._get_table_name(dataset, league, season)
+        Get which of the given seasons are stored (single metadata lookup).
+
+        Args:
+            dataset: Dataset name
+            league: League code
+            seasons: Season strings to check
+
+        Returns:
+            Stored seasons, in the order given
+        """
+        if not seasons:
+            return []
+        try:
+            available, _ = self._partition_columns(dataset, league, list(seasons))
+            return available
+        except Exception as e:
+            logger.debug(f"Error checking stored partitions: {e}")
+            return []
+
+    def get_last_updated(self, dataset: str, league: str, season: str) -> datetime | None:
+        """
+        Get when data for dataset/league/season was last written.
+
+        Args:
+            dataset: Dataset name
+            league: League code
+            season: Season string
 
+        Returns:
+            datetime (naive UTC) of the last save, or None if unknown (never
+            saved, or saved before write timestamps were recorded)
+        """
         try:
-            # Query to check if table exists
-            result = self.conn.execute(
-                f"SELECT COUNT(*) FROM information_schema.tables WHERE table_name = '{table_name}'"
+            result = self._con.execute(
+                f"SELECT updated_at FROM {META_TABLE} WHERE dataset = ? AND league = ? AND season = ?",
+                [dataset, league, season],
             ).fetchone()
+        except Exception as e:
+            logger.debug(f"Error reading table metadata: {e}")
+            return None
 
-            if result is None:
-                return False
+        if result is None:
+            return None
+        updated_at: datetime | None = result[0]
+        return updated_at
 
-            exists: bool = bool(result[0] > 0)
-            return exists
+    def get_row_count(self, dataset: str, league: str, season: str) -> int | None:
+        """
+        Get the number of rows saved for dataset/league/season (metadata only).
 
+        Returns:
+            Row count of the last save, or None if the partition is not stored
+        """
+        try:
+            result = self._con.execute(
+                f"SELECT row_count FROM {META_TABLE} WHERE dataset = ? AND league = ? AND season = ?",
+                [dataset, league, season],
+            ).fetchone()
         except Exception as e:
-            logger.debug(f"Error checking table existence: {e}")
-            return False
+            logger.debug(f"Error reading table metadata: {e}")
+            return None
+        return None if result is None or result[0] is None else int(result[0])
+
+    def get_age_seconds(self, dataset: str, league: str, season: str) -> float | None:
+        """
+        Get seconds since data for dataset/league/season was last written.
+
+        Returns:
+            Age in seconds, or None if the write time is unknown
+        """
+        updated_at = self.get_last_updated(dataset, league, season)
+        if updated_at is None:
+            return None
+        return (datetime.now(UTC).replace(tzinfo=None) - updated_at).total_seconds()
 
     def export_to_parquet(
         self, dataset: str, league: str, season: str, output_path: str, compression: str = "zstd"
     ) -> None:
         """
-        Export DuckDB table to Parquet file.
+        Export one league/season partition to a Parquet file.
 
         Args:
             dataset: Dataset name
@@ -277,10 +1213,9 @@ class DuckDBStorage:
             ...     'output/schedule_2024.parquet'
             ... )
         """
-        table_name = self._get_table_name(dataset, league, season)
-
-        if not self.has_data(dataset, league, season):
-            logger.error(f"Table not found: {table_name}")
+        query = self._query_partitions(dataset, league, [season])
+        if query is None:
+            logger.error(f"No stored data for {dataset}/{league}/{season}")
             return
 
         output_file = Path(output_path)
@@ -288,11 +1223,16 @@ class DuckDBStorage:
 
         try:
             # DuckDB can export directly to Parquet (very fast)
-            query = f"COPY {table_name} TO '{output_file}' (FORMAT PARQUET, COMPRESSION {compression.upper()})"
-            self.conn.execute(query)
+            path_lit = str(output_file).replace("'", "''")
+            self._con.execute(
+                f"COPY ({query}) TO '{path_lit}' (FORMAT PARQUET, COMPRESSION {compression.upper()})"
+            )
 
             file_size_mb = output_file.stat().st_size / (1024 * 1024)
-            logger.info(f"Exported {table_name} to {output_file.name} ({file_size_mb:.2f} MB)")
+            logger.info(
+                f"Exported {dataset} [{league}/{season}] to {output_file.name} "
+                f"({file_size_mb:.2f} MB)"
+            )
 
         except Exception as e:
             logger.error(f"Failed to export to Parquet: {e}")
@@ -300,36 +1240,147 @@ class DuckDBStorage:
 
     def list_tables(self) -> list[str]:
         """
-        List all tables in the database.
+        List all dataset tables in the database.
 
         Returns:
-            List[str]: Table names
+            List[str]: Table names (one per dataset)
         """
         try:
-            result = self.conn.execute(
+            result = self._con.execute(
                 "SELECT table_name FROM information_schema.tables WHERE table_schema = 'main'"
             ).fetchall()
 
-            tables = [row[0] for row in result]
+            tables = [row[0] for row in result if row[0] not in (META_TABLE, WATERMARK_TABLE)]
             return tables
 
         except Exception as e:
             logger.error(f"Failed to list tables: {e}")
             return []
 
+    def list_partitions(self, dataset: str | None = None) -> list[tuple[str, str, str]]:
+        """
+        List stored (dataset, league, season) partitions.
+
+        Args:
+            dataset: Optional dataset to restrict to
+
+        Returns:
+            List of (dataset, league, season) tuples
+        """
+        query = f"SELECT dataset, league, season FROM {META_TABLE}"
+        params: list[Any] = []
+        if dataset:
+            query += " WHERE dataset = ?"
+            params.append(dataset)
+        rows = self._con.execute(query + " ORDER BY 1, 2, 3", params).fetchall()
+        return [(row[0], row[1], row[2]) for row in rows]
+
+    # ------------------------------------------------------------------
+    # Migration
+    # ------------------------------------------------------------------
+
+    def _parse_legacy_table(
+        self, table_name: str, known_leagues: dict[str, str]
+    ) -> tuple[str, str, str] | None:
+        """Split a legacy {dataset}_{league}_{season} name (None if not legacy)."""
+        for dataset in KNOWN_DATASETS:
+            prefix = dataset + "_"
+            if not table_name.startswith(prefix):
+                continue
+            rest = table_name[len(prefix) :]
+            if "_" not in rest:
+                return None
+            league_clean, season = rest.rsplit("_", 1)
+            league = known_leagues.get(league_clean, league_clean)
+            return dataset, league, season
+        return None
+
+    def migrate_legacy_tables(self) -> int:
+        """
+        Move legacy {dataset}_{league}_{season} tables into the dataset tables.
+
+        Legacy tables are detected by name, copied into their dataset table as
+        a partition (keeping any recorded write time) and dropped. Safe to run
+        repeatedly; a no-op once everything is migrated.
+
+        Returns:
+            Number of tables migrated
+        """
+        if self.read_only:
+            return 0
+        if threading.current_thread() is not self._writer:
+            result: int = self._submit_write(self.migrate_legacy_tables).result()
+            return result
+
+        tables = set(self.list_tables()) - {self._get_table_name(d) for d in KNOWN_DATASETS}
+        if not tables:
+            return 0
+
+        # Map sanitized league names back to league codes
+        from cbb_data.catalog.levels import LEAGUE_LEVELS
+
+        known_leagues = {league.replace("-", "_"): league for league in LEAGUE_LEVELS}
+        recorded = {
+            self._legacy_table_name(d, lg, s): (d, lg, s, ts)
+            for d, lg, s, ts in self._con.execute(
+                f"SELECT dataset, league, season, updated_at FROM {META_TABLE}"
+            ).fetchall()
+        }
+
+        migrated = 0
+        for table_name in sorted(tables):
+            if table_name in recorded:
+                dataset, league, season, updated_at = recorded[table_name]
+            else:
+                parsed = self._parse_legacy_table(table_name, known_leagues)
+                if parsed is None:
+                    continue
+                dataset, league, season = parsed
+                updated_at = None
+
+            try:
+                self._con.execute("BEGIN TRANSACTION")
+                row_count, columns = self._write_partition(
+                    _quote(table_name), dataset, league, season
+                )
+                self._record_write(dataset, league, season, row_count, columns, updated_at)
+                self._con.execute(f"DROP TABLE {_quote(table_name)}")
+                self._con.execute("COMMIT")
+                migrated += 1
+                logger.info(f"Migrated legacy table {table_name} -> {dataset} [{league}/{season}]")
+            except Exception as e:
+                self._con.execute("ROLLBACK")
+                logger.warning(f"Failed to migrate legacy table {table_name}: {e}")
+
+        return migrated
+
     def close(self) -> None:
-        """Close DuckDB connection."""
+        """Stop the writer (after queued writes finish) and close all connections."""
+        if self._writer is not None and self._writer.is_alive():
+            self._write_queue.put(None)
+            self._writer.join()
+
+        with self._cursors_lock:
+            for cursor in self._cursors.values():
+                cursor.close()
+            self._cursors.clear()
+
         if hasattr(self, "conn"):
             self.conn.close()
             logger.debug("DuckDB connection closed")
 
 
-def get_storage(db_path: str = "data/basketball.duckdb") -> DuckDBStorage:
+def get_storage(
+    db_path: str = "data/basketball.duckdb", read_only: bool | None = None
+) -> DuckDBStorage:
     """
     Get or create global DuckDB storage instance (singleton pattern).
 
+    Thread-safe; the instance hands each thread its own cursor.
+
     Args:
         db_path: Path to DuckDB database file
+        read_only: Open read-only (default: CBB_DUCKDB_READ_ONLY env var)
 
     Returns:
         DuckDBStorage: Global storage instance
@@ -341,6 +1392,8 @@ def get_storage(db_path: str = "data/basketball.duckdb") -> DuckDBStorage:
     global _storage_instance
 
     if _storage_instance is None:
-        _storage_instance = DuckDBStorage(db_path)
+        with _storage_lock:
+            if _storage_instance is None:
+                _storage_instance = DuckDBStorage(db_path, read_only=read_only)
 
     return _storage_instance
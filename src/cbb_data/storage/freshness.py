@@ -0,0 +1,235 @@
+"""
+Freshness policies and stale-while-revalidate refreshes for DuckDB storage.
+
+DuckDB tables used to be served forever once written. Each save now records
+when the table was written (see DuckDBStorage.get_last_updated), and a
+FreshnessPolicy decides how old a table may get before it is refreshed.
+
+Stale tables are served immediately while a background thread refetches and
+overwrites them, so in-season schedules and box scores stay current without
+users ever waiting on a cold upstream refresh.
+
+Policy resolution (first match wins):
+1. (dataset, league) override registered via set_freshness_policy()
+2. (dataset, None) override
+3. Completed seasons -> never stale
+4. DEFAULT_MAX_AGE_SECONDS by dataset (in-season defaults)
+
+Usage:
+    from cbb_data.storage.freshness import set_freshness_policy
+
+    # Refresh EuroLeague schedules every 30 minutes during the season
+    set_freshness_policy("schedule", league="EuroLeague", max_age_seconds=1800)
+
+    # Block instead of serving stale data for NCAA player_game
+    set_freshness_policy("player_game", league="NCAA-MBB", max_age_seconds=3600, serve_stale=False)
+"""
+
+import logging
+import re
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class FreshnessPolicy:
+    """How long a stored table stays fresh
+
+    Attributes:
+        max_age_seconds: Age after which the table is stale (None = never stale)
+        serve_stale: If True, return stale data immediately and refresh in the
+            background. If False, refresh synchronously before returning.
+    """
+
+    max_age_seconds: float | None
+    serve_stale: bool = True
+
+    def is_stale(self, age_seconds: float | None) -> bool:
+        """Check whether a table of the given age is stale (unknown age = stale)"""
+        if self.max_age_seconds is None:
+            return False
+        if age_seconds is None:
+            return True
+        return age_seconds > self.max_age_seconds
+
+
+# In-season defaults per dataset (seconds). Game-level data changes as games
+# finish; season aggregates change at the same cadence as box scores.
+DEFAULT_MAX_AGE_SECONDS: dict[str, float] = {
+    "schedule": 60 * 60,  # 1 hour (scores, status, new fixtures)
+    "player_game": 6 * 60 * 60,
+    "team_game": 6 * 60 * 60,
+    "pbp": 12 * 60 * 60,
+    "shots": 12 * 60 * 60,
+    "player_season": 6 * 60 * 60,
+    "team_season": 6 * 60 * 60,
+    "player_team_season": 6 * 60 * 60,
+}
+
+# Fallback for datasets without a default
+FALLBACK_MAX_AGE_SECONDS = 24 * 60 * 60
+
+NEVER_STALE = FreshnessPolicy(max_age_seconds=None)
+
+_policies: dict[tuple[str, str | None], FreshnessPolicy] = {}
+_policies_lock = threading.Lock()
+
+
+def set_freshness_policy(
+    dataset: str,
+    league: str | None = None,
+    max_age_seconds: float | None = None,
+    serve_stale: bool = True,
+) -> None:
+    """Register a freshness policy override
+
+    Args:
+        dataset: Dataset name ('schedule', 'player_game', etc.)
+        league: League code, or None to apply to every league
+        max_age_seconds: Age after which data is stale (None = never stale)
+        serve_stale: Serve stale data while refreshing in the background
+    """
+    with _policies_lock:
+        _policies[(dataset, league)] = FreshnessPolicy(max_age_seconds, serve_stale)
+
+
+def clear_freshness_policies() -> None:
+    """Remove all registered overrides"""
+    with _policies_lock:
+        _policies.clear()
+
+
+def is_season_completed(season: str, today: date | None = None) -> bool:
+    """Best-effort check whether a season is over
+
+    Season strings differ by league ("2024", "2024-25", "E2024", "U2024"), and a
+    single year may name either the starting or the ending year. To stay safe
+    the latest plausible year is used: "2024-25" ends in 2025 and "2024" is
+    assumed to run into 2025. A season counts as completed once that year is over.
+
+    Args:
+        season: Season string
+        today: Override for the current date (testing)
+
+    Returns:
+        True if the season has certainly finished
+    """
+    today = today or date.today()
+    match = re.search(r"(\d{4})(?:\s*-\s*(\d{2,4}))?", str(season))
+    if not match:
+        return False
+
+    start_year = int(match.group(1))
+    if match.group(2):
+        end = match.group(2)
+        end_year = int(end) if len(end) == 4 else (start_year // 100) * 100 + int(end)
+        if end_year < start_year:
+            end_year += 100
+    else:
+        end_year = start_year + 1
+
+    return today.year > end_year
+
+
+def get_freshness_policy(dataset: str, league: str, season: str) -> FreshnessPolicy:
+    """Resolve the freshness policy for a stored table
+
+    Args:
+        dataset: Dataset name
+        league: League code
+        season: Season string
+
+    Returns:
+        FreshnessPolicy for the table
+    """
+    with _policies_lock:
+        policy = _policies.get((dataset, league)) or _policies.get((dataset, None))
+    if policy is not None:
+        return policy
+
+    if is_season_completed(season):
+        return NEVER_STALE
+
+    return FreshnessPolicy(DEFAULT_MAX_AGE_SECONDS.get(dataset, FALLBACK_MAX_AGE_SECONDS))
+
+
+# ==============================================================================
+# Background Refresh
+# ==============================================================================
+
+_refresh_executor: ThreadPoolExecutor | None = None
+_refresh_in_progress: dict[tuple[str, str, str], Future] = {}
+_refresh_lock = threading.Lock()
+
+
+def _get_refresh_executor() -> ThreadPoolExecutor:
+    """Get the shared background refresh pool (created on first use)"""
+    global _refresh_executor
+    if _refresh_executor is None:
+        _refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cbb-refresh")
+    return _refresh_executor
+
+
+def refresh_in_background(
+    dataset: str,
+    league: str,
+    season: str,
+    fetcher_func: Callable[[], pd.DataFrame],
+    on_success: Callable[[pd.DataFrame], None] | None = None,
+) -> Future | None:
+    """Refetch a stale table in the background and overwrite it in storage
+
+    At most one refresh per (dataset, league, season) runs at a time; extra
+    requests while a refresh is running are ignored.
+
+    Args:
+        dataset: Dataset name
+        league: League code
+        season: Season string
+        fetcher_func: Function that fetches fresh data from the API
+        on_success: Optional callback with the fresh DataFrame (e.g., update memory cache)
+
+    Returns:
+        Future for the scheduled refresh, or None if one is already running
+    """
+    key = (dataset, league, season)
+
+    with _refresh_lock:
+        if key in _refresh_in_progress:
+            logger.debug(f"Refresh already running for {dataset}/{league}/{season}")
+            return None
+
+        def run() -> None:
+            from cbb_data.storage.duckdb_storage import get_storage
+
+            try:
+                logger.info(f"Background refresh started for {dataset}/{league}/{season}")
+                df = fetcher_func()
+                if df is None or df.empty:
+                    logger.warning(
+                        f"Background refresh returned no data for {dataset}/{league}/{season}; "
+                        "keeping stored table"
+                    )
+                    return
+                get_storage().save(df, dataset, league, season)
+                if on_success is not None:
+                    on_success(df)
+                logger.info(
+                    f"Background refresh saved {len(df):,} rows for {dataset}/{league}/{season}"
+                )
+            except Exception as e:
+                logger.warning(f"Background refresh failed for {dataset}/{league}/{season}: {e}")
+            finally:
+                with _refresh_lock:
+                    _refresh_in_progress.pop(key, None)
+
+        future = _get_refresh_executor().submit(run)
+        _refresh_in_progress[key] = future
+        return future
@@ -0,0 +1,297 @@
+"""
+Watermark-based incremental season syncs for DuckDB storage.
+
+fetch_with_duckdb_cache refreshes a season by refetching and replacing all of
+it. sync_season instead keeps a watermark per (dataset, league, season): the
+GAME_IDs already ingested, their dates and whether each game was complete when
+it was ingested. A sync reads the schedule, fetches only games that are new or
+have completed since the last sync, and merges them into the stored partition
+(DuckDBStorage.merge_games). A nightly in-season refresh costs O(new games)
+instead of O(season).
+
+How a sync decides what to fetch:
+- schedule: rows of games not yet ingested, plus games that were not complete
+  when last ingested (scores/status may have changed)
+- game-level datasets (player_game, team_game, pbp, shots): completed games
+  that were never ingested or were ingested before they completed
+- A completed game the fetcher returns no rows for is left out of the
+  watermark and retried on the next sync (sources often lag the final buzzer)
+
+The schedule callable receives a ``since`` date derived from the watermark
+(latest ingested date, or the earliest still-incomplete game, minus
+SYNC_LOOKBACK_DAYS) so date-ranged sources can skip finished days. Callables
+that always return the full schedule may ignore it; the game-ID diff keeps the
+result correct either way.
+
+Configuration (environment):
+- CBB_SYNC_LOOKBACK_DAYS: Days re-read before the watermark date (default 3),
+  covering postponed games and late schedule corrections
+
+Usage:
+    import pandas as pd
+
+    from cbb_data.fetchers.fiba_html_common import (
+        load_fiba_game_index,
+        scrape_fiba_box_score,
+        scrape_fiba_games,
+    )
+    from cbb_data.storage.incremental import sync_season
+
+    def box_scores(game_ids):
+        games = scrape_fiba_games(
+            scrape_fiba_box_score, "LKL", game_ids, league="LKL", season="2024-25"
+        )
+        return pd.concat([df.assign(GAME_ID=gid) for gid, df in games], ignore_index=True)
+
+    result = sync_season(
+        "player_game",
+        "LKL",
+        "2024-25",
+        schedule_fn=lambda since: load_fiba_game_index("LKL", "2024-25"),
+        fetch_games_fn=box_scores,
+    )
+    print(result.games_fetched, "games fetched,", result.rows_written, "rows written")
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    from cbb_data.storage.duckdb_storage import DuckDBStorage
+
+logger = logging.getLogger(__name__)
+
+SYNC_LOOKBACK_DAYS = int(os.getenv("CBB_SYNC_LOOKBACK_DAYS", "3"))
+
+# Schedule columns checked (in order) for a game status
+STATUS_COLUMNS = ("STATUS", "GAME_STATUS", "STATUS_TYPE", "GAME_STATE")
+
+# Status values meaning the game is over ("Final", "Final/OT", "STATUS_FINAL", "Completed",
+# "Played", ...); a bare "played" only counts as the whole status
+_COMPLETED_STATUS = r"(?:^|[^a-z])(?:final|complete|completed|closed|finished|ended)|^played$"
+
+# Negated forms that override a completed term ("Not played", "To be played", "Not finished")
+_PENDING_STATUS = r"(?:^|[^a-z])(?:not|to be|yet to)(?:[^a-z]|$)"
+
+
+@dataclass
+class SyncResult:
+    """Outcome of one sync_season call
+
+    Attributes:
+        new_games: Games ingested for the first time
+        updated_games: Previously ingested games fetched again (now complete)
+        pending_games: Completed games the fetcher returned no rows for
+        rows_written: Rows merged into storage
+        since: Schedule start date passed to schedule_fn (None = full schedule)
+        full: True if the partition and its watermark were replaced
+    """
+
+    dataset: str
+    league: str
+    season: str
+    new_games: list[str] = field(default_factory=list)
+    updated_games: list[str] = field(default_factory=list)
+    pending_games: list[str] = field(default_factory=list)
+    rows_written: int = 0
+    since: date | None = None
+    full: bool = False
+
+    @property
+    def games_fetched(self) -> int:
+        """Number of games merged by this sync"""
+        return len(self.new_games) + len(self.updated_games)
+
+
+def completed_games(schedule: pd.DataFrame, today: date | None = None) -> pd.Series:
+    """Flag which schedule rows are finished games
+
+    A game's status column wins when present; otherwise both scores being
+    recorded counts as complete; otherwise a GAME_DATE before today does.
+
+    Args:
+        schedule: Schedule DataFrame
+        today: Override for the current date (testing)
+
+    Returns:
+        Boolean Series aligned with schedule
+    """
+    today = today or date.today()
+    done = pd.Series(False, index=schedule.index)
+
+    if "GAME_DATE" in schedule.columns:
+        game_date = pd.to_datetime(schedule["GAME_DATE"], errors="coerce").dt.date
+        done = game_date.lt(today).fillna(False).astype(bool)
+
+    if {"HOME_SCORE", "AWAY_SCORE"} <= set(schedule.columns):
+        home = pd.to_numeric(schedule["HOME_SCORE"], errors="coerce")
+        away = pd.to_numeric(schedule["AWAY_SCORE"], errors="coerce")
+        scored = home.notna() & away.notna()
+        done = done.where(~scored, (home + away).gt(0))
+
+    status_col = next((c for c in STATUS_COLUMNS if c in schedule.columns), None)
+    if status_col is not None:
+        status = schedule[status_col]
+        known = status.notna() & status.astype(str).str.strip().ne("")
+        text = status.astype(str).str.strip().str.lower()
+        finished = text.str.contains(_COMPLETED_STATUS, regex=True) & ~text.str.contains(
+            _PENDING_STATUS, regex=True
+        )
+        done = done.where(~known, finished)
+
+    return done.astype(bool)
+
+
+def sync_since(watermark: pd.DataFrame, lookback_days: int | None = None) -> date | None:
+    """Date from which the schedule has to be re-read
+
+    Args:
+        watermark: DuckDBStorage.get_watermark() result
+        lookback_days: Days to re-read before the watermark (default: SYNC_LOOKBACK_DAYS)
+
+    Returns:
+        Earliest incomplete ingested game date, else the latest ingested game
+        date, minus the lookback; None when nothing dated was ingested
+    """
+    if watermark.empty:
+        return None
+    dates = pd.to_datetime(watermark["GAME_DATE"], errors="coerce")
+    incomplete = dates[~watermark["COMPLETED"].astype(bool)].dropna()
+    anchor = incomplete.min() if not incomplete.empty else dates.max()
+    if pd.isna(anchor):
+        return None
+    lookback = SYNC_LOOKBACK_DAYS if lookback_days is None else lookback_days
+    anchor_date: date = pd.Timestamp(anchor).date()
+    return anchor_date - timedelta(days=lookback)
+
+
+def sync_season(
+    dataset: str,
+    league: str,
+    season: str,
+    schedule_fn: Callable[[date | None], pd.DataFrame],
+    fetch_games_fn: Callable[[list[str]], pd.DataFrame] | None = None,
+    storage: DuckDBStorage | None = None,
+    full: bool = False,
+    today: date | None = None,
+) -> SyncResult:
+    """Bring a stored season up to date, fetching only new or newly completed games
+
+    Args:
+        dataset: Dataset name ('schedule', 'player_game', ...)
+        league: League code
+        season: Season string
+        schedule_fn: Returns the season schedule (GAME_ID, GAME_DATE and a
+            status or score columns); receives the ``since`` date (None =
+            whole season)
+        fetch_games_fn: Returns rows (with GAME_ID) for a list of game IDs.
+            Required for every dataset except 'schedule', whose rows come from
+            the schedule itself
+        storage: Storage to sync into (default: get_storage())
+        full: Ignore the watermark, refetch every game and replace the partition
+        today: Override for the current date (testing)
+
+    Returns:
+        SyncResult describing what was fetched and written
+
+    Raises:
+        ValueError: If fetch_games_fn is missing for a game-level dataset
+    """
+    if dataset != "schedule" and fetch_games_fn is None:
+        raise ValueError(f"sync_season needs fetch_games_fn for dataset '{dataset}'")
+
+    if storage is None:
+        from cbb_data.storage.duckdb_storage import get_storage
+
+        storage = get_storage()
+
+    watermark = (
+        pd.DataFrame(columns=["GAME_ID", "GAME_DATE", "COMPLETED"])
+        if full
+        else storage.get_watermark(dataset, league, season)
+    )
+    since = None if full else sync_since(watermark)
+    result = SyncResult(dataset, league, season, since=since, full=full)
+
+    schedule = schedule_fn(since)
+    if schedule is None or schedule.empty or "GAME_ID" not in schedule.columns:
+        logger.info(f"No schedule for {league} {season} - nothing to sync")
+        return result
+
+    schedule = schedule.copy()
+    schedule["GAME_ID"] = schedule["GAME_ID"].astype(str)
+    schedule = schedule.drop_duplicates(subset=["GAME_ID"], keep="last")
+    done = completed_games(schedule, today)
+
+    ingested = dict(
+        zip(
+            watermark["GAME_ID"].astype(str),
+            watermark["COMPLETED"].astype(bool),
+            strict=True,
+        )
+    )
+    is_new = ~schedule["GAME_ID"].isin(ingested.keys())
+    was_incomplete = schedule["GAME_ID"].map(lambda gid: ingested.get(gid) is False)
+
+    if dataset == "schedule":
+        wanted = is_new | was_incomplete
+    else:
+        wanted = done & (is_new | was_incomplete)
+
+    todo = schedule[wanted]
+    if todo.empty:
+        logger.info(f"{dataset}/{league}/{season} is up to date ({len(ingested)} games ingested)")
+        return result
+
+    game_ids = todo["GAME_ID"].tolist()
+    logger.info(
+        f"Syncing {len(game_ids)} games of {dataset}/{league}/{season} "
+        f"({int(is_new[wanted].sum())} new, {int(was_incomplete[wanted].sum())} updated)"
+    )
+
+    if fetch_games_fn is None:
+        data = todo.reset_index(drop=True)
+    else:
+        data = fetch_games_fn(game_ids)
+        if data is None:
+            data = pd.DataFrame()
+
+    fetched = set(data["GAME_ID"].astype(str)) if "GAME_ID" in data.columns else set()
+    if fetch_games_fn is None:
+        ingested_rows = todo
+    else:
+        ingested_rows = todo[todo["GAME_ID"].isin(fetched)]
+        result.pending_games = [gid for gid in game_ids if gid not in fetched]
+
+    new_watermark = pd.DataFrame(
+        {
+            "GAME_ID": ingested_rows["GAME_ID"].to_numpy(),
+            "GAME_DATE": (
+                pd.to_datetime(ingested_rows["GAME_DATE"], errors="coerce").to_numpy()
+                if "GAME_DATE" in ingested_rows.columns
+                else pd.NaT
+            ),
+            "COMPLETED": done[ingested_rows.index].to_numpy(),
+        }
+    )
+
+    if not data.empty:
+        storage.merge_games(data, dataset, league, season, watermark=new_watermark, replace=full)
+    result.rows_written = len(data)
+    result.new_games = [gid for gid in ingested_rows["GAME_ID"] if gid not in ingested]
+    result.updated_games = [gid for gid in ingested_rows["GAME_ID"] if gid in ingested]
+
+    if result.pending_games:
+        logger.info(
+            f"{len(result.pending_games)} completed games returned no rows; "
+            "they will be retried on the next sync"
+        )
+    return result
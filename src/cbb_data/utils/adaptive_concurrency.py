@@ -0,0 +1,283 @@
+"""Adaptive (AIMD) concurrency limits for upstream fetch pools
+
+Fetch loops used fixed worker counts (5 threads for EuroLeague box scores,
+4 for full seasons, one game at a time with a 1s pause for LNB). A fixed
+count leaves throughput unused while a source is healthy and keeps piling
+up timeouts when it slows down.
+
+An AdaptiveConcurrency controller holds one source's limit and adjusts it
+like TCP congestion control (additive increase, multiplicative decrease):
+
+Key Features:
+- Additive increase: +1 slot per ``limit`` successful calls, as long as the
+  latency average stays within ``latency_tolerance`` x the best latency seen
+  and the recent error rate is at most ``max_error_rate`` (calls faster than
+  ``latency_floor`` are cache hits and do not move the latency reference)
+- Multiplicative decrease: the limit is multiplied by ``decrease`` on 429,
+  5xx, timeouts and connection errors. Only calls that started after the last
+  cut can cut again, so one burst of failures counts once
+- Other errors (404, parse errors) only count towards the error rate
+- Per-source state shared by every fetch loop of the process (get_concurrency)
+- Counters published as Prometheus gauges by servers/metrics.py
+
+Thread pools are sized to ``max_limit``; each upstream call runs inside
+``slot()``, which blocks while ``limit`` calls are already in flight.
+
+Configuration (environment):
+- CBB_ADAPTIVE_CONCURRENCY: "false" pins every source at its initial limit
+  (default "true")
+- CBB_ADAPTIVE_MAX_CONCURRENCY: Default upper bound per source (default 16)
+
+Usage:
+    from cbb_data.utils.adaptive_concurrency import get_concurrency
+
+    concurrency = get_concurrency("euroleague", initial_limit=5)
+    with ThreadPoolExecutor(max_workers=concurrency.max_limit) as executor:
+        ...
+        # inside each task
+        with concurrency.slot():
+            box = fetch_euroleague_box_score(season, game_code)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+ADAPTIVE_ENABLED = os.getenv("CBB_ADAPTIVE_CONCURRENCY", "true").lower() == "true"
+ADAPTIVE_MAX_CONCURRENCY = int(os.getenv("CBB_ADAPTIVE_MAX_CONCURRENCY", "16"))
+
+# HTTP statuses that mean "back off"
+CONGESTION_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def classify_exception(exc: BaseException) -> str:
+    """Classify a failed upstream call
+
+    Args:
+        exc: Exception raised by the call
+
+    Returns:
+        "congestion" for 429/5xx, timeouts and connection errors (back off),
+        "error" for anything else
+    """
+    if isinstance(exc, TimeoutError | ConnectionError):
+        return "congestion"
+    name = type(exc).__name__
+    if "Timeout" in name or name == "ConnectionError":
+        return "congestion"  # requests/httpx timeout and connection classes
+    if getattr(exc, "kind", None) == "rate_limited":
+        return "congestion"  # DataUnavailableError(kind="rate_limited")
+
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    if isinstance(status, int) and status in CONGESTION_STATUSES:
+        return "congestion"
+    return "error"
+
+
+class AdaptiveConcurrency:
+    """AIMD concurrency limit for one upstream source
+
+    Thread-safe.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int | None = None,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        latency_tolerance: float = 2.0,
+        latency_floor: float = 0.05,
+        max_error_rate: float = 0.2,
+        window: int = 20,
+        adaptive: bool | None = None,
+    ):
+        """Initialize controller
+
+        Args:
+            source: Source name (for logs and metrics)
+            initial_limit: Starting concurrency
+            min_limit: Lowest limit after cuts
+            max_limit: Highest limit (default: CBB_ADAPTIVE_MAX_CONCURRENCY env var,
+                then 16; never below initial_limit)
+            increase: Slots added per ``limit`` healthy successes
+            decrease: Factor applied to the limit on congestion
+            latency_tolerance: Latency average allowed relative to the best seen
+                before increases pause
+            latency_floor: Calls faster than this (seconds) are cache hits and
+                leave the latency statistics alone
+            max_error_rate: Recent error rate above which increases pause
+            window: Recent calls used for the error rate
+            adaptive: False pins the limit at initial_limit (default:
+                CBB_ADAPTIVE_CONCURRENCY env var)
+        """
+        self.source = source
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(initial_limit, max_limit or ADAPTIVE_MAX_CONCURRENCY)
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.latency_floor = latency_floor
+        self.max_error_rate = max_error_rate
+        self.adaptive = ADAPTIVE_ENABLED if adaptive is None else adaptive
+
+        self._limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self._in_flight = 0
+        self._cond = threading.Condition()
+        self._outcomes: deque[bool] = deque(maxlen=window)  # True = failed
+        self._latency_avg: float | None = None
+        self._latency_best: float | None = None
+        self._last_cut = 0.0
+        self._counts = dict.fromkeys(
+            ("successes", "errors", "congestion", "increases", "decreases"), 0
+        )
+
+    @property
+    def limit(self) -> int:
+        """Current number of calls allowed in flight"""
+        return int(self._limit)
+
+    @contextlib.contextmanager
+    def slot(self) -> Iterator[None]:
+        """Run one upstream call inside the limit
+
+        Blocks while ``limit`` calls are in flight. The call's latency and
+        outcome (exceptions are classified, then re-raised) adjust the limit.
+        """
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+        start = time.monotonic()
+        try:
+            yield
+        except BaseException as e:
+            outcome = classify_exception(e) if isinstance(e, Exception) else None
+            self._release(start, outcome)
+            raise
+        self._release(start, "success")
+
+    def _release(self, start: float, outcome: str | None) -> None:
+        """Free a slot and apply the call's outcome"""
+        latency = time.monotonic() - start
+        with self._cond:
+            self._in_flight -= 1
+            if outcome == "success":
+                self._on_success(latency)
+            elif outcome is not None:
+                self._on_failure(start, outcome)
+            self._cond.notify_all()
+
+    def _on_success(self, latency: float) -> None:
+        self._counts["successes"] += 1
+        self._outcomes.append(False)
+        if latency >= self.latency_floor:
+            if self._latency_best is None or latency < self._latency_best:
+                self._latency_best = latency
+            else:
+                # Let the reference follow a source that got slower for good
+                self._latency_best += (latency - self._latency_best) * 0.01
+            self._latency_avg = (
+                latency if self._latency_avg is None else 0.7 * self._latency_avg + 0.3 * latency
+            )
+
+        if not self.adaptive or self._limit >= self.max_limit:
+            return
+        if (
+            self._latency_avg is not None
+            and self._latency_best is not None
+            and self._latency_avg > self.latency_tolerance * self._latency_best
+        ):
+            return  # queueing upstream: hold
+        if sum(self._outcomes) > self.max_error_rate * len(self._outcomes):
+            return
+        before = int(self._limit)
+        self._limit = min(float(self.max_limit), self._limit + self.increase / self._limit)
+        if int(self._limit) > before:
+            self._counts["increases"] += 1
+            logger.debug(f"Concurrency for {self.source} raised to {int(self._limit)}")
+
+    def _on_failure(self, start: float, outcome: str) -> None:
+        self._outcomes.append(True)
+        if outcome != "congestion":
+            self._counts["errors"] += 1
+            return
+
+        self._counts["congestion"] += 1
+        if not self.adaptive or start < self._last_cut:
+            return  # started before the last cut: already accounted for
+        before = int(self._limit)
+        self._limit = max(float(self.min_limit), self._limit * self.decrease)
+        self._last_cut = time.monotonic()
+        if int(self._limit) < before:
+            self._counts["decreases"] += 1
+            logger.info(
+                f"Concurrency for {self.source} cut to {int(self._limit)} (upstream congestion)"
+            )
+
+    def stats(self) -> dict[str, Any]:
+        """Get controller state and counters
+
+        Returns:
+            Dict with limit, in_flight, min_limit, max_limit, latency_avg_ms,
+            latency_best_ms, error_rate and the successes, errors, congestion,
+            increases and decreases counters
+        """
+        with self._cond:
+            outcomes = list(self._outcomes)
+            return {
+                "limit": int(self._limit),
+                "in_flight": self._in_flight,
+                "min_limit": self.min_limit,
+                "max_limit": self.max_limit,
+                "latency_avg_ms": round((self._latency_avg or 0.0) * 1000, 2),
+                "latency_best_ms": round((self._latency_best or 0.0) * 1000, 2),
+                "error_rate": round(sum(outcomes) / len(outcomes), 3) if outcomes else 0.0,
+                **self._counts,
+            }
+
+
+# Per-source controllers shared by every fetch loop of the process
+_controllers: dict[str, AdaptiveConcurrency] = {}
+_controllers_lock = threading.Lock()
+
+
+def get_concurrency(source: str, initial_limit: int = 4, **kwargs: Any) -> AdaptiveConcurrency:
+    """Get or create a source's controller (settings apply on first creation)
+
+    Args:
+        source: Source name (e.g. "euroleague", "lnb")
+        initial_limit: Starting concurrency
+        **kwargs: Other AdaptiveConcurrency settings
+
+    Returns:
+        The shared AdaptiveConcurrency for ``source``
+    """
+    controller = _controllers.get(source)
+    if controller is None:
+        with _controllers_lock:
+            controller = _controllers.get(source)
+            if controller is None:
+                controller = AdaptiveConcurrency(source, initial_limit, **kwargs)
+                _controllers[source] = controller
+    return controller
+
+
+def concurrency_stats() -> dict[str, dict[str, Any]]:
+    """Get state of every source controller ({source: AdaptiveConcurrency.stats()})"""
+    with _controllers_lock:
+        controllers = list(_controllers.values())
+    return {controller.source: controller.stats() for controller in controllers}
@@ -0,0 +1,324 @@
+"""Bounded executors for blocking work called from async servers
+
+The REST and MCP servers are asyncio applications, but dataset fetches
+(get_dataset, scrapers, DuckDB scans) are blocking. Running them directly in
+an ``async def`` handler freezes the event loop, so one slow scrape stalls
+every other request on the worker, health checks included.
+
+A BoundedExecutor runs that work on a dedicated thread pool and awaits it:
+
+Key Features:
+- Fixed worker count per executor (separate pools keep cheap work from
+  queueing behind slow scrapes)
+- Bounded queue: submissions beyond workers + max_queue are rejected with
+  ExecutorBusyError instead of piling up (servers answer 503)
+- Per-call timeouts; a timed-out or cancelled call that has not started is
+  dropped from the queue; one that is already running is abandoned like in
+  ``run_with_deadlines``
+- Counters for queue depth, running tasks, timeouts, rejections and queue
+  wait, published as Prometheus gauges by servers/metrics.py
+
+Synchronous fan-outs (prospect leagues, MCP batches) use ``run_with_deadlines``
+instead: a throwaway pool where each task gets its own deadline.
+
+Usage:
+    from cbb_data.utils.executor import get_executor
+
+    executor = get_executor("rest", max_workers=8, max_queue=64)
+    df = await executor.run(get_dataset, "schedule", filters, timeout=120)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import threading
+import time
+from collections.abc import Callable, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ExecutorBusyError(RuntimeError):
+    """Raised when an executor's queue is full"""
+
+
+class BoundedExecutor:
+    """Thread pool with a bounded queue, timeouts and counters
+
+    Thread-safe; ``run`` may be awaited from any event loop.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: int = 8,
+        max_queue: int = 64,
+        default_timeout: float | None = None,
+    ):
+        """Initialize executor
+
+        Args:
+            name: Executor name (thread names and metric labels)
+            max_workers: Worker threads
+            max_queue: Calls allowed to wait for a worker (0 = unbounded)
+            default_timeout: Seconds allowed per call when run() gets none
+                (None = no timeout)
+        """
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max_queue
+        self.default_timeout = default_timeout
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix=f"cbb-{name}"
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._counts = dict.fromkeys(
+            ("submitted", "completed", "failed", "timeouts", "cancelled", "rejected"), 0
+        )
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._started = 0
+
+    async def run(
+        self, fn: Callable[..., T], *args: Any, timeout: float | None = None, **kwargs: Any
+    ) -> T:
+        """Run a blocking call on the pool and await its result
+
+        Args:
+            fn: Blocking function
+            *args: Positional arguments for fn
+            timeout: Seconds to wait for the result, queue time included
+                (default: default_timeout)
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            fn's return value
+
+        Raises:
+            ExecutorBusyError: If the queue is full
+            TimeoutError: If the call did not finish in time
+            Exception: Whatever fn raised
+        """
+        with self._lock:
+            if self.max_queue and self._queued >= self.max_queue:
+                self._counts["rejected"] += 1
+                raise ExecutorBusyError(
+                    f"{self.name} executor busy ({self._running} running, {self._queued} queued)"
+                )
+            self._queued += 1
+            self._counts["submitted"] += 1
+
+        submitted = time.perf_counter()
+        call = functools.partial(fn, *args, **kwargs)
+        future = self._pool.submit(self._tracked, call, submitted)
+        future.add_done_callback(self._on_done)
+
+        timeout = self.default_timeout if timeout is None else timeout
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except TimeoutError:
+            future.cancel()
+            with self._lock:
+                self._counts["timeouts"] += 1
+            logger.warning(f"{self.name} executor: call timed out after {timeout}s")
+            raise
+        except asyncio.CancelledError:
+            # Client went away; drop the call if it has not started yet
+            future.cancel()
+            raise
+
+    def _tracked(self, call: Callable[[], T], submitted: float) -> T:
+        """Run a call on a worker thread, moving it from queued to running"""
+        waited = time.perf_counter() - submitted
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+            self._started += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+        try:
+            return call()
+        finally:
+            with self._lock:
+                self._running -= 1
+
+    def _on_done(self, future: Any) -> None:
+        with self._lock:
+            if future.cancelled():
+                # Cancelled before a worker picked it up
+                self._queued -= 1
+                self._counts["cancelled"] += 1
+            elif future.exception() is not None:
+                self._counts["failed"] += 1
+            else:
+                self._counts["completed"] += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Get executor counters
+
+        Returns:
+            Dict with max_workers, running, queued, submitted, completed,
+            failed, timeouts, cancelled, rejected, queue_wait_avg_ms and
+            queue_wait_max_ms
+        """
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "running": self._running,
+                "queued": self._queued,
+                **self._counts,
+                "queue_wait_avg_ms": 1000 * self._wait_total / self._started
+                if self._started
+                else 0.0,
+                "queue_wait_max_ms": 1000 * self._wait_max,
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop accepting work and drop queued calls"""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+
+# Named executors shared by the servers
+_executors: dict[str, BoundedExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def get_executor(
+    name: str,
+    max_workers: int = 8,
+    max_queue: int = 64,
+    default_timeout: float | None = None,
+) -> BoundedExecutor:
+    """Get or create a named executor (settings apply on first creation)
+
+    Args:
+        name: Executor name
+        max_workers: Worker threads
+        max_queue: Calls allowed to wait for a worker (0 = unbounded)
+        default_timeout: Seconds allowed per call (None = no timeout)
+
+    Returns:
+        The shared BoundedExecutor for ``name``
+    """
+    executor = _executors.get(name)
+    if executor is None:
+        with _executors_lock:
+            executor = _executors.get(name)
+            if executor is None:
+                executor = BoundedExecutor(name, max_workers, max_queue, default_timeout)
+                _executors[name] = executor
+    return executor
+
+
+def executor_stats() -> dict[str, dict[str, Any]]:
+    """Get counters of every named executor ({name: BoundedExecutor.stats()})"""
+    with _executors_lock:
+        executors = list(_executors.values())
+    return {executor.name: executor.stats() for executor in executors}
+
+
+@dataclass
+class TaskOutcome:
+    """Outcome of one task run by run_with_deadlines
+
+    Attributes:
+        value: Task result (None on error or timeout)
+        error: Exception the task raised, or TimeoutError if it ran out of time
+        duration: Seconds from the task's start to its end (the timeout if it timed out)
+        timed_out: Whether the task missed its deadline
+    """
+
+    value: Any = None
+    error: BaseException | None = None
+    duration: float = 0.0
+    timed_out: bool = False
+
+
+def run_with_deadlines(
+    tasks: Mapping[str, Callable[[], Any]],
+    timeout: float,
+    max_workers: int,
+    thread_name_prefix: str = "cbb-deadline",
+) -> dict[str, TaskOutcome]:
+    """Run tasks on a thread pool, each with its own deadline
+
+    A task's timeout starts when a worker picks it up, so tasks waiting for a
+    free worker are not charged for the wait. Threads cannot be interrupted: a
+    task still running at its deadline is reported as timed out and its result
+    dropped, but it finishes in the background, so what it fetched still lands
+    in the fetch caches for the next request. The pool is shut down without
+    waiting for such tasks.
+
+    Args:
+        tasks: {key: zero-argument callable}
+        timeout: Seconds allowed per task
+        max_workers: Concurrent tasks (capped at the number of tasks)
+        thread_name_prefix: Worker thread name prefix
+
+    Returns:
+        {key: TaskOutcome} for every task
+    """
+    outcomes: dict[str, TaskOutcome] = {}
+    if not tasks:
+        return outcomes
+
+    started: dict[str, float] = {}
+    finished: dict[str, float] = {}
+    lock = threading.Lock()
+
+    def run(key: str, fn: Callable[[], Any]) -> Any:
+        with lock:
+            started[key] = time.monotonic()
+        try:
+            return fn()
+        finally:
+            with lock:
+                finished[key] = time.monotonic()
+
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(tasks))), thread_name_prefix=thread_name_prefix
+    )
+    try:
+        futures: dict[Future, str] = {
+            executor.submit(run, key, fn): key for key, fn in tasks.items()
+        }
+        pending = set(futures)
+        while pending:
+            now = time.monotonic()
+            with lock:
+                deadlines = {
+                    f: started[futures[f]] + timeout for f in pending if futures[f] in started
+                }
+
+            for future in [f for f, deadline in deadlines.items() if deadline <= now]:
+                if not future.done():
+                    pending.discard(future)
+                    error = TimeoutError(f"Timed out after {timeout:.0f}s")
+                    outcomes[futures[future]] = TaskOutcome(
+                        error=error, duration=timeout, timed_out=True
+                    )
+
+            wait_for = min(deadlines.values(), default=now + timeout) - now
+            done, pending = wait(pending, timeout=max(wait_for, 0.01), return_when=FIRST_COMPLETED)
+            for future in done:
+                key = futures[future]
+                with lock:
+                    duration = finished[key] - started[key]
+                try:
+                    outcomes[key] = TaskOutcome(value=future.result(), duration=duration)
+                except Exception as e:
+                    outcomes[key] = TaskOutcome(error=e, duration=duration)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return outcomes
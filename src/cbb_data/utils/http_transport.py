@@ -0,0 +1,441 @@
+"""Shared HTTP transport for all fetchers
+
+One pooled ``requests.Session`` is shared by every fetcher, so repeated
+requests to a host reuse keep-alive connections instead of paying a new
+TCP/TLS handshake each time.
+
+Key Features:
+- Per-host connection pools (urllib3 keeps one pool per host)
+- Compressed transfers: gzip/deflate always, brotli when the ``brotli``
+  package is installed (requests advertises whatever urllib3 can decode)
+- Conditional requests: responses carrying an ETag or Last-Modified header
+  are stored on disk; the next GET for the same URL sends If-None-Match /
+  If-Modified-Since and a 304 is answered from the stored body
+- Parsed-result reuse: ``fetch_parsed`` keeps the parsed object of each URL,
+  so an unchanged (304) page is neither downloaded nor parsed again
+- Per-source counters: requests, errors, 304s, bytes on the wire, bytes saved
+  and latency, published as Prometheus gauges by servers/metrics.py
+
+Configuration (environment):
+- CBB_HTTP_POOL_MAXSIZE: Connections kept per host (default 16)
+- CBB_HTTP_CONDITIONAL: "false" disables the ETag/Last-Modified store
+- CBB_HTTP_CACHE_DIR: Store directory (default data/.cache/http)
+
+Rate limiting stays with the callers (``rate_limiter.acquire(source)``); the
+transport only moves bytes.
+
+Usage:
+    from cbb_data.utils.http_transport import http_get
+
+    response = http_get(url, source="wnba", headers=WNBA_HEADERS, params=params, timeout=30)
+    response.raise_for_status()
+    data = response.json()
+    response.not_modified  # True when the body came from the store after a 304
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import Any, TypeVar
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+HTTP_POOL_MAXSIZE = int(os.getenv("CBB_HTTP_POOL_MAXSIZE", "16"))
+HTTP_CONDITIONAL = os.getenv("CBB_HTTP_CONDITIONAL", "true").lower() == "true"
+HTTP_CACHE_DIR = Path(os.getenv("CBB_HTTP_CACHE_DIR", "data/.cache/http"))
+
+# Bodies larger than this are not stored for conditional requests
+MAX_STORED_BODY_BYTES = 32 * 1024 * 1024
+
+# Response headers kept with a stored body (the body is stored decoded, so
+# Content-Encoding/Content-Length are dropped)
+_STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Cache-Control", "Date")
+
+
+class ValidatorStore:
+    """On-disk store of response bodies and their validators (ETag/Last-Modified)
+
+    Each entry is two files named by a hash of the request: ``<key>.json``
+    (URL, validators, headers, encoding) and ``<key>.body``. Writes go through a
+    temporary file and a rename, so concurrent readers never see partial
+    entries.
+    """
+
+    def __init__(self, directory: str | Path | None = None):
+        self.directory = Path(directory) if directory is not None else HTTP_CACHE_DIR
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        return self.directory / f"{key}.json", self.directory / f"{key}.body"
+
+    def get(self, key: str) -> tuple[dict[str, Any], bytes] | None:
+        """Load a stored entry (None if missing or unreadable)"""
+        meta_path, body_path = self._paths(key)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            return meta, body_path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"HTTP store read failed for {key}: {e}")
+            return None
+
+    def put(self, key: str, meta: dict[str, Any], body: bytes | None = None) -> None:
+        """Store an entry (body=None only refreshes the metadata)"""
+        meta_path, body_path = self._paths(key)
+        suffix = f".{threading.get_ident()}.tmp"
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            if body is not None:
+                tmp = body_path.with_suffix(suffix)
+                tmp.write_bytes(body)
+                tmp.replace(body_path)
+            tmp = meta_path.with_suffix(suffix)
+            tmp.write_text(json.dumps(meta), encoding="utf-8")
+            tmp.replace(meta_path)
+        except Exception as e:
+            logger.warning(f"HTTP store write failed for {meta.get('url')}: {e}")
+
+    def clear(self) -> None:
+        """Remove every stored entry"""
+        if not self.directory.exists():
+            return
+        for path in self.directory.iterdir():
+            if path.suffix in (".json", ".body", ".tmp"):
+                path.unlink(missing_ok=True)
+
+
+class HttpTransport:
+    """Pooled, conditional HTTP client shared by all fetchers
+
+    Thread-safe: the session's connection pools and the counters may be used
+    from fetcher worker pools.
+    """
+
+    def __init__(
+        self,
+        pool_maxsize: int | None = None,
+        conditional: bool | None = None,
+        store: ValidatorStore | None = None,
+        max_parsed_entries: int = 256,
+    ):
+        """Initialize transport
+
+        Args:
+            pool_maxsize: Connections kept per host (default: CBB_HTTP_POOL_MAXSIZE)
+            conditional: Use the ETag/Last-Modified store (default: CBB_HTTP_CONDITIONAL)
+            store: Validator store (default: ValidatorStore(HTTP_CACHE_DIR))
+            max_parsed_entries: Parsed results kept by fetch_parsed()
+        """
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=pool_maxsize or HTTP_POOL_MAXSIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self.conditional = HTTP_CONDITIONAL if conditional is None else conditional
+        self.store = store or ValidatorStore()
+
+        self._parsed: OrderedDict[str, tuple[str, Any]] = OrderedDict()
+        self._max_parsed = max_parsed_entries
+        self._stats: dict[str, dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        source: str = "http",
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: float | None = 30,
+        conditional: bool | None = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Send a request through the pooled session
+
+        GET requests are conditional when the store holds validators for the
+        same URL and headers. A 304 is returned as the stored 200 response with
+        ``response.not_modified = True``.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            source: Counter label (use the rate limiter source name)
+            params: Query parameters
+            headers: Request headers
+            timeout: Timeout in seconds
+            conditional: Override the transport's conditional setting
+            **kwargs: Passed to requests (json=, data=, ...)
+
+        Returns:
+            requests.Response (with a ``not_modified`` attribute)
+
+        Raises:
+            requests.RequestException: On connection errors and timeouts
+        """
+        method = method.upper()
+        use_store = (self.conditional if conditional is None else conditional) and method == "GET"
+
+        key = None
+        stored = None
+        send_headers = dict(headers or {})
+        if use_store:
+            full_url = requests.Request("GET", url, params=params).prepare().url or url
+            key = _request_key(full_url, headers)
+            stored = self.store.get(key)
+            if stored is not None:
+                meta = stored[0]
+                if meta.get("etag"):
+                    send_headers["If-None-Match"] = meta["etag"]
+                if meta.get("last_modified"):
+                    send_headers["If-Modified-Since"] = meta["last_modified"]
+
+        start = time.perf_counter()
+        try:
+            response = self.session.request(
+                method, url, params=params, headers=send_headers, timeout=timeout, **kwargs
+            )
+        except Exception:
+            self._record(source, time.perf_counter() - start, error=True)
+            raise
+        elapsed = time.perf_counter() - start
+        wire_bytes = _wire_bytes(response)
+
+        if response.status_code == 304 and stored is not None and key is not None:
+            meta, body = stored
+            self._refresh_validators(key, meta, response)
+            self._record(source, elapsed, wire_bytes=wire_bytes, saved_bytes=len(body))
+            return _stored_response(meta, body, response)
+
+        response.not_modified = False  # type: ignore[attr-defined]
+        self._record(source, elapsed, wire_bytes=wire_bytes, error=response.status_code >= 400)
+        if key is not None and response.status_code == 200:
+            self._store_response(key, response)
+        return response
+
+    def get(self, url: str, *, source: str = "http", **kwargs: Any) -> requests.Response:
+        """GET through the pooled session (see request())"""
+        return self.request("GET", url, source=source, **kwargs)
+
+    def fetch_parsed(
+        self,
+        url: str,
+        parse: Callable[[requests.Response], T],
+        *,
+        source: str = "http",
+        clone: Callable[[T], T] | None = None,
+        **kwargs: Any,
+    ) -> T:
+        """GET a URL and parse it, reusing the last parsed result on a 304
+
+        Args:
+            url: Request URL
+            parse: Parser for a successful response (raise_for_status is
+                called before parsing)
+            source: Counter label
+            clone: Copy function applied to results handed out from the memo
+                (e.g., ``lambda df: df.copy()``), so callers can't mutate it
+            **kwargs: Passed to get()
+
+        Returns:
+            Parsed result
+        """
+        response = self.get(url, source=source, **kwargs)
+        response.raise_for_status()
+        validator = response.headers.get("ETag") or response.headers.get("Last-Modified")
+        memo_key = _request_key(response.url, kwargs.get("headers"))
+
+        if response.not_modified and validator:  # type: ignore[attr-defined]
+            with self._lock:
+                entry = self._parsed.get(memo_key)
+                if entry is not None and entry[0] == validator:
+                    self._parsed.move_to_end(memo_key)
+                    return clone(entry[1]) if clone else entry[1]
+
+        result = parse(response)
+        if validator:
+            with self._lock:
+                self._parsed[memo_key] = (validator, result)
+                self._parsed.move_to_end(memo_key)
+                while len(self._parsed) > self._max_parsed:
+                    self._parsed.popitem(last=False)
+            return clone(result) if clone else result
+        return result
+
+    # ------------------------------------------------------------------
+    # Store helpers
+    # ------------------------------------------------------------------
+
+    def _store_response(self, key: str, response: requests.Response) -> None:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not (etag or last_modified) or len(response.content) > MAX_STORED_BODY_BYTES:
+            return
+        meta = {
+            "url": response.url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "encoding": response.encoding,
+            "headers": {h: response.headers[h] for h in _STORED_HEADERS if h in response.headers},
+            "stored_at": time.time(),
+        }
+        self.store.put(key, meta, response.content)
+
+    def _refresh_validators(
+        self, key: str, meta: dict[str, Any], response: requests.Response
+    ) -> None:
+        """Apply validators sent with a 304 (servers may rotate them)"""
+        changed = False
+        for field, header in (("etag", "ETag"), ("last_modified", "Last-Modified")):
+            value = response.headers.get(header)
+            if value and value != meta.get(field):
+                meta[field] = value
+                meta["headers"][header] = value
+                changed = True
+        if changed:
+            self.store.put(key, meta)
+
+    # ------------------------------------------------------------------
+    # Counters
+    # ------------------------------------------------------------------
+
+    def _record(
+        self,
+        source: str,
+        elapsed: float,
+        wire_bytes: int = 0,
+        saved_bytes: int = 0,
+        error: bool = False,
+    ) -> None:
+        with self._lock:
+            s = self._stats.get(source)
+            if s is None:
+                s = self._stats[source] = dict.fromkeys(
+                    (
+                        "requests",
+                        "errors",
+                        "not_modified",
+                        "bytes",
+                        "bytes_saved",
+                        "latency_total",
+                        "latency_max",
+                    ),
+                    0,
+                )
+            s["requests"] += 1
+            s["errors"] += int(error)
+            s["not_modified"] += int(saved_bytes > 0)
+            s["bytes"] += wire_bytes
+            s["bytes_saved"] += saved_bytes
+            s["latency_total"] += elapsed
+            s["latency_max"] = max(s["latency_max"], elapsed)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Get per-source request counters
+
+        Returns:
+            {source: {"requests", "errors", "not_modified", "bytes", "bytes_saved",
+            "latency_avg_ms", "latency_max_ms"}}
+        """
+        with self._lock:
+            return {
+                source: {
+                    "requests": int(s["requests"]),
+                    "errors": int(s["errors"]),
+                    "not_modified": int(s["not_modified"]),
+                    "bytes": int(s["bytes"]),
+                    "bytes_saved": int(s["bytes_saved"]),
+                    "latency_avg_ms": 1000 * s["latency_total"] / s["requests"],
+                    "latency_max_ms": 1000 * s["latency_max"],
+                }
+                for source, s in self._stats.items()
+            }
+
+    def reset_stats(self) -> None:
+        """Zero all counters"""
+        with self._lock:
+            self._stats.clear()
+
+    def close(self) -> None:
+        """Close pooled connections"""
+        self.session.close()
+
+
+def _request_key(url: str, headers: Mapping[str, str] | None) -> str:
+    """Hash of the full URL and request headers (responses may vary by header)"""
+    parts = [url, *(f"{k.lower()}={v}" for k, v in sorted((headers or {}).items()))]
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()[:32]
+
+
+def _wire_bytes(response: requests.Response) -> int:
+    """Bytes received on the wire (compressed size when the body was encoded)"""
+    content_length = len(response.content)
+    try:
+        read = int(response.raw.tell())
+    except Exception:
+        return content_length
+    return read if read > 0 else content_length
+
+
+def _stored_response(
+    meta: dict[str, Any], body: bytes, not_modified: requests.Response
+) -> requests.Response:
+    """Build a 200 response from a stored entry after a 304"""
+    response = requests.Response()
+    response.status_code = 200
+    response.reason = "OK"
+    response._content = body
+    response.headers = CaseInsensitiveDict(meta.get("headers", {}))
+    response.encoding = meta.get("encoding")
+    response.url = not_modified.url
+    response.request = not_modified.request
+    response.elapsed = not_modified.elapsed
+    response.not_modified = True  # type: ignore[attr-defined]
+    return response
+
+
+# Global transport instance
+_transport: HttpTransport | None = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> HttpTransport:
+    """Get the global HTTP transport shared by all fetchers"""
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = HttpTransport()
+    return _transport
+
+
+def http_get(url: str, *, source: str = "http", **kwargs: Any) -> requests.Response:
+    """GET through the global transport (convenience function)
+
+    Args:
+        url: Request URL
+        source: Counter label (use the rate limiter source name)
+        **kwargs: params=, headers=, timeout=, conditional=, ...
+
+    Returns:
+        requests.Response (with a ``not_modified`` attribute)
+    """
+    return get_transport().get(url, source=source, **kwargs)
@@ -0,0 +1,111 @@
+"""Lazy imports for fetcher modules
+
+Importing every fetcher up front pulls in each league's dependencies
+(sportsdataverse, euroleague-api, cbbpy, BeautifulSoup, rpy2 probes, ...),
+even when a caller only needs one league. These helpers defer the import of a
+module until it is actually used.
+
+- LazyModule: module stand-in; the first attribute access imports the module
+- LazyFetcher: callable reference to ``module.attr``; the first call imports it
+- lazy_refs(): namespace whose attributes are LazyFetchers (for registries
+  such as LeagueSourceConfig, where functions are stored but rarely called)
+
+Example:
+    gleague = LazyModule("cbb_data.fetchers.gleague")
+    df = gleague.fetch_gleague_schedule(season="2024-25")  # imports here
+
+    lkl = lazy_refs("cbb_data.fetchers.lkl")
+    fetch = lkl.fetch_schedule  # nothing imported yet
+    df = fetch(season="2024")  # imports here
+"""
+
+from __future__ import annotations
+
+import importlib
+import threading
+from types import ModuleType
+from typing import Any
+
+_import_lock = threading.RLock()
+
+
+def _import(module_name: str) -> ModuleType:
+    """Import a module (serialized so concurrent first uses don't race)"""
+    with _import_lock:
+        return importlib.import_module(module_name)
+
+
+class LazyModule:
+    """Module stand-in that imports the real module on first attribute access"""
+
+    __slots__ = ("_module_name", "_module")
+
+    def __init__(self, module_name: str):
+        self._module_name = module_name
+        self._module: ModuleType | None = None
+
+    def _load(self) -> ModuleType:
+        if self._module is None:
+            self._module = _import(self._module_name)
+        return self._module
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._load(), name)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<LazyModule {self._module_name} ({state})>"
+
+
+class LazyFetcher:
+    """Callable reference to ``module.attr`` that imports the module on first call"""
+
+    __slots__ = ("module_name", "attr_name", "_target")
+
+    def __init__(self, module_name: str, attr_name: str):
+        self.module_name = module_name
+        self.attr_name = attr_name
+        self._target: Any = None
+
+    def resolve(self) -> Any:
+        """Import the module and return the referenced attribute"""
+        if self._target is None:
+            self._target = getattr(_import(self.module_name), self.attr_name)
+        return self._target
+
+    @property
+    def loaded(self) -> bool:
+        """True once the module has been imported"""
+        return self._target is not None
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"<LazyFetcher {self.module_name}.{self.attr_name}>"
+
+
+class _LazyRefs:
+    """Namespace returning a LazyFetcher for every attribute"""
+
+    __slots__ = ("_module_name",)
+
+    def __init__(self, module_name: str):
+        self._module_name = module_name
+
+    def __getattr__(self, name: str) -> LazyFetcher:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return LazyFetcher(self._module_name, name)
+
+
+def lazy_refs(module_name: str) -> Any:
+    """Namespace of lazy references to a module's functions
+
+    Args:
+        module_name: Fully qualified module name
+
+    Returns:
+        Object whose attributes are LazyFetcher references (nothing is imported)
+    """
+    return _LazyRefs(module_name)
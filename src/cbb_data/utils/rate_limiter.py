@@ -5,12 +5,59 @@ This module provides rate limiting for API calls to respect source limits:
 - ESPN: burst allowed, respect 429 responses
 - EuroLeague: documented limits TBD
 - NCAA API: unknown, conservative defaults
+
+Limits only hold if every caller draws from the same bucket. With several
+uvicorn workers plus ingestion scripts, per-process buckets multiply the
+effective rate, so SourceRateLimiter can keep its buckets in a shared backend.
+
+Key Features:
+- Token buckets with reservations: a caller takes a token even when the bucket
+  is empty (tokens go negative) and sleeps exactly until its token is due, so
+  waiting costs one wakeup and callers are served in arrival order
+- Backends (CBB_RATE_LIMIT_BACKEND env var):
+  - "memory" (default): per-process buckets
+  - "file": buckets shared by the processes of one host, stored in small files
+    under an advisory file lock
+  - "redis": buckets shared across hosts, refilled and reserved atomically by
+    a Lua script against the Redis clock (falls back to a local bucket while
+    Redis is unreachable)
+- ``acquire_async``: waits with asyncio.sleep instead of blocking the loop
+- Per-source wait-time histograms, exported by servers/metrics.py as
+  cbb_rate_limit_wait_seconds
+
+Configuration (environment):
+- CBB_RATE_LIMIT_BACKEND: "memory", "file" or "redis" (default "memory")
+- CBB_RATE_LIMIT_DIR: Bucket files of the "file" backend (default "data/locks")
+- REDIS_HOST / REDIS_PORT / REDIS_DB: Redis server of the "redis" backend
+
+Usage:
+    from cbb_data.utils.rate_limiter import get_source_limiter
+
+    limiter = get_source_limiter()
+    limiter.acquire("espn")               # blocks until a token is due
+    await limiter.acquire_async("espn")   # same, without blocking the loop
 """
 
 from __future__ import annotations
 
+import asyncio
+import bisect
+import logging
+import os
+import struct
 import threading
 import time
+from pathlib import Path
+from typing import Any
+
+from .single_flight import connect_redis, file_lock
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_BACKENDS = ("memory", "file", "redis")
+
+# Upper bounds (seconds) of the wait-time histogram buckets
+WAIT_BUCKETS = (0.0, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
 
 
 class RateLimiter:
@@ -21,7 +68,8 @@ class RateLimiter:
     - Each request consumes one token
     - If no tokens available, caller must wait
 
-    This is thread-safe and can be shared across multiple fetchers.
+    This is thread-safe and can be shared across multiple fetchers. Subclasses
+    keep the bucket somewhere else by overriding ``_reserve`` and ``reset``.
 
     Example:
         # Allow 1 request per second
@@ -32,6 +80,9 @@ class RateLimiter:
             response = requests.get(url)
     """
 
+    # True when _reserve does I/O (shared buckets)
+    _shared = False
+
     def __init__(
         self,
         calls_per_second: float = 1.0,
@@ -44,14 +95,20 @@ class RateLimiter:
             burst_size: Maximum burst capacity (default: calls_per_second * 2)
         """
         self.rate = calls_per_second
-        self.burst_size = burst_size or int(calls_per_second * 2)
+        self.burst_size = burst_size or max(1, int(calls_per_second * 2))
         self.tokens = float(self.burst_size)
-        self.last_refill = time.time()
+        self.last_refill = time.monotonic()
         self.lock = threading.Lock()
 
+        # Wait-time histogram (per bucket of WAIT_BUCKETS, last slot = above the top bound)
+        self._wait_counts = [0] * (len(WAIT_BUCKETS) + 1)
+        self._wait_sum = 0.0
+        self._wait_max = 0.0
+        self._rejected = 0
+
     def _refill(self) -> None:
         """Refill tokens based on elapsed time"""
-        now = time.time()
+        now = time.monotonic()
         elapsed = now - self.last_refill
 
         # Add tokens based on elapsed time
@@ -59,6 +116,24 @@ class RateLimiter:
         self.tokens = min(self.burst_size, self.tokens + tokens_to_add)
         self.last_refill = now
 
+    def _reserve(self, max_wait: float | None) -> float | None:
+        """Take a token, possibly one that is not due yet
+
+        Args:
+            max_wait: Longest acceptable wait (None = any)
+
+        Returns:
+            Seconds until the reserved token is due (0.0 = available now), or
+            None if the wait would exceed max_wait (nothing is reserved)
+        """
+        with self.lock:
+            self._refill()
+            wait = 0.0 if self.tokens >= 1.0 else (1.0 - self.tokens) / self.rate
+            if max_wait is not None and wait > max_wait:
+                return None
+            self.tokens -= 1.0
+            return wait
+
     def acquire(self, block: bool = True, timeout: float | None = None) -> bool:
         """Acquire a token (may block if rate limit exceeded)
 
@@ -67,38 +142,212 @@ class RateLimiter:
             timeout: Maximum wait time in seconds (None = wait forever)
 
         Returns:
-            True if token acquired, False if timeout/non-blocking failure
+            True if token acquired, False if timeout/non-blocking failure.
+            A wait longer than timeout fails right away instead of sleeping first.
+        """
+        wait = self._reserve(0.0 if not block else timeout)
+        if wait is None:
+            self._record(None)
+            return False
+        if wait > 0:
+            # Sleep until our token is due; no polling
+            time.sleep(wait)
+        self._record(wait)
+        return True
+
+    async def acquire_async(self, block: bool = True, timeout: float | None = None) -> bool:
+        """Acquire a token without blocking the event loop
+
+        Same semantics as ``acquire``; the wait is an ``asyncio.sleep``.
+        Shared buckets reserve on a worker thread (file lock / Redis round
+        trip). Cancelling the wait does not return the reserved token.
         """
-        start_time = time.time()
+        max_wait = 0.0 if not block else timeout
+        if self._shared:
+            wait = await asyncio.to_thread(self._reserve, max_wait)
+        else:
+            wait = self._reserve(max_wait)
+        if wait is None:
+            self._record(None)
+            return False
+        if wait > 0:
+            await asyncio.sleep(wait)
+        self._record(wait)
+        return True
 
-        while True:
-            with self.lock:
-                self._refill()
+    def reset(self) -> None:
+        """Reset the rate limiter (refill all tokens)"""
+        with self.lock:
+            self.tokens = float(self.burst_size)
+            self.last_refill = time.monotonic()
 
-                if self.tokens >= 1.0:
-                    # Token available; consume it
-                    self.tokens -= 1.0
-                    return True
+    def _record(self, wait: float | None) -> None:
+        """Count an acquire outcome in the wait-time histogram"""
+        with self.lock:
+            if wait is None:
+                self._rejected += 1
+                return
+            self._wait_counts[bisect.bisect_left(WAIT_BUCKETS, wait)] += 1
+            self._wait_sum += wait
+            self._wait_max = max(self._wait_max, wait)
 
-            # No token available
-            if not block:
-                return False
+    def stats(self) -> dict[str, Any]:
+        """Get acquire counters and the wait-time histogram
 
-            # Check timeout
-            if timeout is not None:
-                elapsed = time.time() - start_time
-                if elapsed >= timeout:
-                    return False
+        Returns:
+            Dict with rate, burst_size, acquired, waited (acquires that slept),
+            rejected, wait_sum_seconds, wait_max_seconds and wait_buckets
+            (cumulative counts keyed by upper bound, "+Inf" last)
+        """
+        with self.lock:
+            counts = list(self._wait_counts)
+            buckets: dict[str, int] = {}
+            total = 0
+            for bound, count in zip(WAIT_BUCKETS, counts, strict=False):
+                total += count
+                buckets[str(bound)] = total
+            total += counts[-1]
+            buckets["+Inf"] = total
+            return {
+                "rate": self.rate,
+                "burst_size": self.burst_size,
+                "acquired": total,
+                "waited": total - counts[0],
+                "rejected": self._rejected,
+                "wait_sum_seconds": round(self._wait_sum, 6),
+                "wait_max_seconds": round(self._wait_max, 6),
+                "wait_buckets": buckets,
+            }
+
+
+# Bucket file layout: tokens, last refill (wall clock, shared by processes)
+_BUCKET_STATE = struct.Struct(">dd")
+
+
+class FileRateLimiter(RateLimiter):
+    """Token bucket shared by the processes of one host
+
+    The bucket lives in a small file; every reservation refills and takes a
+    token under an exclusive advisory lock on that file.
+    """
 
-            # Wait before retrying (but not too long)
-            wait_time = min(1.0 / self.rate, 0.1)
-            time.sleep(wait_time)
+    _shared = True
+
+    def __init__(
+        self,
+        path: str | Path,
+        calls_per_second: float = 1.0,
+        burst_size: int | None = None,
+    ):
+        """Initialize file-backed rate limiter
+
+        Args:
+            path: Bucket file (created on first use)
+            calls_per_second: Maximum sustained rate (default 1.0)
+            burst_size: Maximum burst capacity (default: calls_per_second * 2)
+        """
+        super().__init__(calls_per_second, burst_size)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def _reserve(self, max_wait: float | None) -> float | None:
+        with self.lock, file_lock(self.path.with_suffix(".lock")):
+            now = time.time()
+            try:
+                tokens, last = _BUCKET_STATE.unpack(self.path.read_bytes())
+            except (OSError, struct.error):
+                tokens, last = float(self.burst_size), now
+            tokens = min(self.burst_size, tokens + max(0.0, now - last) * self.rate)
+            wait = 0.0 if tokens >= 1.0 else (1.0 - tokens) / self.rate
+            if max_wait is not None and wait > max_wait:
+                self.path.write_bytes(_BUCKET_STATE.pack(tokens, now))
+                return None
+            self.path.write_bytes(_BUCKET_STATE.pack(tokens - 1.0, now))
+            return wait
 
     def reset(self) -> None:
-        """Reset the rate limiter (refill all tokens)"""
-        with self.lock:
-            self.tokens = float(self.burst_size)
-            self.last_refill = time.time()
+        with self.lock, file_lock(self.path.with_suffix(".lock")):
+            self.path.write_bytes(_BUCKET_STATE.pack(float(self.burst_size), time.time()))
+
+
+# Refill + reserve in one atomic step on the Redis clock.
+# KEYS[1] = bucket hash; ARGV = rate, burst, max_wait (-1 = any)
+# Returns the wait as a string (Lua numbers are truncated to integers in replies), or "-1"
+_RESERVE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local max_wait = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if tokens < 1 then wait = (1 - tokens) / rate end
+if max_wait >= 0 and wait > max_wait then
+    redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+    return '-1'
+end
+tokens = tokens - 1
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil((burst - tokens) / rate) + 60)
+return tostring(wait)
+"""
+
+
+class RedisRateLimiter(RateLimiter):
+    """Token bucket shared across hosts through Redis
+
+    While Redis is unreachable, reservations fall back to this instance's
+    local bucket (same rate) rather than failing fetches.
+    """
+
+    _shared = True
+
+    def __init__(
+        self,
+        client: Any,
+        key: str,
+        calls_per_second: float = 1.0,
+        burst_size: int | None = None,
+    ):
+        """Initialize Redis-backed rate limiter
+
+        Args:
+            client: redis.Redis client
+            key: Bucket key (e.g. "cbb:rate_limit:espn")
+            calls_per_second: Maximum sustained rate (default 1.0)
+            burst_size: Maximum burst capacity (default: calls_per_second * 2)
+        """
+        super().__init__(calls_per_second, burst_size)
+        self.client = client
+        self.key = key
+        self._script = client.register_script(_RESERVE_SCRIPT)
+        self._degraded = False
+
+    def _reserve(self, max_wait: float | None) -> float | None:
+        try:
+            reply = self._script(
+                keys=[self.key],
+                args=[self.rate, self.burst_size, -1 if max_wait is None else max_wait],
+            )
+        except Exception as e:
+            if not self._degraded:
+                logger.warning(f"Redis rate limiter unavailable ({e}); using local bucket")
+                self._degraded = True
+            return super()._reserve(max_wait)
+
+        self._degraded = False
+        wait = float(reply.decode() if isinstance(reply, bytes) else reply)
+        return None if wait < 0 else wait
+
+    def reset(self) -> None:
+        super().reset()
+        try:
+            self.client.delete(self.key)
+        except Exception as e:
+            logger.debug(f"Could not reset Redis bucket {self.key}: {e}")
 
 
 class SourceRateLimiter:
@@ -107,6 +356,9 @@ class SourceRateLimiter:
     Manages separate rate limiters for each data source.
     This allows us to respect different rate limits per source.
 
+    With the "file" or "redis" backend, all processes using the same backend
+    draw from one bucket per source.
+
     Example:
         limiter = SourceRateLimiter()
 
@@ -127,15 +379,66 @@ class SourceRateLimiter:
         "ncaa": 2.0,  # NCAA: unknown, be conservative
         "nbl": 2.0,  # NBL: unknown
         "fiba": 1.0,  # FIBA: unknown, be conservative
+        "fiba_livestats": 3.0,  # LiveStats HTML (LKL/BCL/BAL/ABA/NZ-NBL): shared host
     }
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        backend: str | None = None,
+        bucket_dir: str | Path | None = None,
+        redis_client: Any | None = None,
+    ) -> None:
+        """Initialize per-source limiters
+
+        Args:
+            backend: "memory", "file" or "redis" (default: CBB_RATE_LIMIT_BACKEND
+                env var, then "memory")
+            bucket_dir: Bucket files of the "file" backend (default:
+                CBB_RATE_LIMIT_DIR env var, then "data/locks")
+            redis_client: Client for the "redis" backend (default: built from
+                REDIS_* env vars; falls back to "memory" if unreachable)
+        """
+        backend = (backend or os.getenv("CBB_RATE_LIMIT_BACKEND") or "memory").lower()
+        if backend not in RATE_LIMIT_BACKENDS:
+            raise ValueError(
+                f"Unknown rate limit backend '{backend}'. Use one of {RATE_LIMIT_BACKENDS}"
+            )
+        self.backend = backend
+        self.bucket_dir = Path(bucket_dir or os.getenv("CBB_RATE_LIMIT_DIR") or "data/locks")
+        self._redis = redis_client
+        # Redis is contacted on first use, not when the module is imported
+        self._connected = backend != "redis" or redis_client is not None
+
+        # Limiters are built on first acquire from these (calls_per_second, burst_size)
+        self._limits: dict[str, tuple[float, int | None]] = {
+            source: (rate, None) for source, rate in self.DEFAULT_LIMITS.items()
+        }
         self._limiters: dict[str, RateLimiter] = {}
         self._lock = threading.Lock()
 
-        # Initialize default limiters
-        for source, rate in self.DEFAULT_LIMITS.items():
-            self._limiters[source] = RateLimiter(calls_per_second=rate)
+    def _connect(self) -> None:
+        """Connect the redis backend (caller holds self._lock)"""
+        if self._connected:
+            return
+        self._connected = True
+        self._redis = connect_redis()
+        if self._redis is None:
+            logger.warning("Redis unavailable for rate limiting; using per-process buckets")
+            self.backend = "memory"
+
+    def _make_limiter(
+        self, source: str, calls_per_second: float, burst_size: int | None = None
+    ) -> RateLimiter:
+        """Build a limiter for a source on the configured backend"""
+        if self.backend == "file":
+            return FileRateLimiter(
+                self.bucket_dir / f"rate_{source}.bucket", calls_per_second, burst_size
+            )
+        if self.backend == "redis":
+            return RedisRateLimiter(
+                self._redis, f"cbb:rate_limit:{source}", calls_per_second, burst_size
+            )
+        return RateLimiter(calls_per_second=calls_per_second, burst_size=burst_size)
 
     def set_limit(
         self, source: str, calls_per_second: float, burst_size: int | None = None
@@ -148,10 +451,19 @@ class SourceRateLimiter:
             burst_size: Optional burst capacity
         """
         with self._lock:
-            self._limiters[source] = RateLimiter(
-                calls_per_second=calls_per_second,
-                burst_size=burst_size,
-            )
+            self._limits[source] = (calls_per_second, burst_size)
+            self._limiters.pop(source, None)
+
+    def _get(self, source: str) -> RateLimiter:
+        # Get or create limiter for this source
+        with self._lock:
+            if source not in self._limiters:
+                self._connect()
+                # Unknown source; use conservative default (1 req/sec)
+                calls_per_second, burst_size = self._limits.get(source, (1.0, None))
+                self._limiters[source] = self._make_limiter(source, calls_per_second, burst_size)
+
+            return self._limiters[source]
 
     def acquire(self, source: str, block: bool = True, timeout: float | None = None) -> bool:
         """Acquire a token for a source
@@ -164,15 +476,22 @@ class SourceRateLimiter:
         Returns:
             True if token acquired, False otherwise
         """
-        # Get or create limiter for this source
-        with self._lock:
-            if source not in self._limiters:
-                # Unknown source; use conservative default (1 req/sec)
-                self._limiters[source] = RateLimiter(calls_per_second=1.0)
+        return self._get(source).acquire(block=block, timeout=timeout)
 
-            limiter = self._limiters[source]
+    async def acquire_async(
+        self, source: str, block: bool = True, timeout: float | None = None
+    ) -> bool:
+        """Acquire a token for a source without blocking the event loop
 
-        return limiter.acquire(block=block, timeout=timeout)
+        Args:
+            source: Source identifier
+            block: Whether to wait if rate exceeded
+            timeout: Maximum wait time
+
+        Returns:
+            True if token acquired, False otherwise
+        """
+        return await self._get(source).acquire_async(block=block, timeout=timeout)
 
     def reset(self, source: str | None = None) -> None:
         """Reset rate limiter(s)
@@ -181,12 +500,20 @@ class SourceRateLimiter:
             source: Specific source to reset, or None for all sources
         """
         with self._lock:
-            if source:
-                if source in self._limiters:
-                    self._limiters[source].reset()
-            else:
-                for limiter in self._limiters.values():
-                    limiter.reset()
+            sources = [source] if source else list(self._limits.keys() | self._limiters.keys())
+        for name in sources:
+            self._get(name).reset()
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Get per-source acquire counters and wait-time histograms
+
+        Returns:
+            {source: RateLimiter.stats()} for sources that have been used
+        """
+        with self._lock:
+            limiters = dict(self._limiters)
+        stats = {source: limiter.stats() for source, limiter in limiters.items()}
+        return {source: s for source, s in stats.items() if s["acquired"] or s["rejected"]}
 
 
 # Global source rate limiter instance
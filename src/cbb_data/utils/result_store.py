@@ -0,0 +1,378 @@
+"""Server-side result sets for cursor pagination
+
+Paging through a large query by re-running it with a growing offset costs a
+full fetch (and often a full scrape) per page. A ResultStore keeps the first
+call's result instead: ``paginate`` stores the frame as an Arrow table and
+returns the first page plus an opaque cursor; ``page`` reads later pages from
+the stored table by slicing it, so each page costs O(page size) no matter how
+large the result is.
+
+Key Features:
+- Results are held as Arrow tables; slicing is zero-copy
+- Sliding TTL: every page read extends the result's lifetime
+- Memory budget: least recently used results spill to Arrow IPC files
+  (memory-mapped on read, still O(page)); spilled results beyond the disk
+  budget are dropped
+- Unknown, expired or evicted cursors raise ResultExpiredError (REST answers
+  410, MCP wrappers re-run the query)
+
+Cursors are process-local: behind several workers, requests for the next page
+must reach the worker that issued the cursor (or get a 410 and re-query).
+
+Configuration (environment):
+- CBB_RESULT_TTL_SECONDS: Seconds a result lives after its last read (default 600)
+- CBB_RESULT_MAX_MB: In-memory budget before spilling (default 256)
+- CBB_RESULT_SPILL_MB: Disk budget for spilled results (default 2048, 0 = never spill)
+- CBB_RESULT_SPILL_DIR: Spill directory (default: <tmp>/cbb_results)
+
+Usage:
+    from cbb_data.utils.result_store import get_result_store
+
+    store = get_result_store()
+    page = store.paginate(df, page_size=500)      # first 500 rows
+    while page.next_cursor:
+        page = store.page(page.next_cursor)       # next 500 rows, no refetch
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import secrets
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+
+class ResultExpiredError(LookupError):
+    """Raised when a cursor is malformed or its result is gone"""
+
+
+@dataclass
+class Page:
+    """One page of a stored result
+
+    Attributes:
+        frame: Rows of this page
+        offset: Position of the first row in the full result
+        total_rows: Rows in the full result
+        next_cursor: Cursor for the following page (None on the last page)
+        meta: Metadata stored with the result (e.g. df.attrs of the source frame)
+    """
+
+    frame: pd.DataFrame
+    offset: int
+    total_rows: int
+    next_cursor: str | None = None
+    meta: dict[str, Any] = field(default_factory=dict)
+
+
+class _Result:
+    """A stored result: an Arrow table in memory, or an IPC file on disk"""
+
+    __slots__ = ("table", "path", "nbytes", "rows", "page_size", "meta", "expires")
+
+    def __init__(self, table: pa.Table, page_size: int, meta: dict[str, Any], expires: float):
+        self.table: pa.Table | None = table
+        self.path: Path | None = None
+        self.nbytes = table.nbytes
+        self.rows = table.num_rows
+        self.page_size = page_size
+        self.meta = meta
+        self.expires = expires
+
+
+def make_cursor(result_id: str, offset: int) -> str:
+    """Build the cursor of a result position"""
+    return f"{result_id}.{offset}"
+
+
+def parse_cursor(cursor: str) -> tuple[str, int]:
+    """Split a cursor into (result_id, offset)
+
+    Raises:
+        ResultExpiredError: If the cursor is malformed
+    """
+    result_id, _, offset = str(cursor).rpartition(".")
+    if not result_id or not offset.isdigit():
+        raise ResultExpiredError(f"Invalid cursor: {cursor!r}")
+    return result_id, int(offset)
+
+
+class ResultStore:
+    """In-memory store of paginated results with TTL, LRU spilling and eviction
+
+    Thread-safe.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float | None = None,
+        max_bytes: int | None = None,
+        spill_bytes: int | None = None,
+        spill_dir: str | Path | None = None,
+    ):
+        """Initialize store
+
+        Args:
+            ttl_seconds: Seconds a result lives after its last read
+                (default: CBB_RESULT_TTL_SECONDS env var, then 600)
+            max_bytes: In-memory budget (default: CBB_RESULT_MAX_MB env var, then 256 MB)
+            spill_bytes: Disk budget for spilled results, 0 disables spilling
+                (default: CBB_RESULT_SPILL_MB env var, then 2048 MB)
+            spill_dir: Spill directory (default: CBB_RESULT_SPILL_DIR env var,
+                then <tmp>/cbb_results)
+        """
+        if ttl_seconds is None:
+            ttl_seconds = float(os.getenv("CBB_RESULT_TTL_SECONDS", "600"))
+        if max_bytes is None:
+            max_bytes = int(float(os.getenv("CBB_RESULT_MAX_MB", "256")) * 1024 * 1024)
+        if spill_bytes is None:
+            spill_bytes = int(float(os.getenv("CBB_RESULT_SPILL_MB", "2048")) * 1024 * 1024)
+        if spill_dir is None:
+            spill_dir = os.getenv("CBB_RESULT_SPILL_DIR") or (
+                Path(tempfile.gettempdir()) / "cbb_results"
+            )
+        self.ttl = ttl_seconds
+        self.max_bytes = max_bytes
+        self.spill_bytes = spill_bytes
+        self.spill_dir = Path(spill_dir)
+
+        # Least recently used first
+        self._results: OrderedDict[str, _Result] = OrderedDict()
+        self._lock = threading.Lock()
+        self._mem_bytes = 0
+        self._disk_bytes = 0
+        self._counts = dict.fromkeys(
+            ("stored", "pages", "misses", "spills", "evictions", "expirations"), 0
+        )
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def paginate(
+        self, df: pd.DataFrame, page_size: int, meta: dict[str, Any] | None = None
+    ) -> Page:
+        """Return the first page of a result, storing the rest for later pages
+
+        Results that fit in one page are not stored.
+
+        Args:
+            df: Full result
+            page_size: Rows per page
+            meta: Metadata returned with every page (default: df.attrs)
+
+        Returns:
+            First page; next_cursor is set when more rows remain
+        """
+        page_size = max(1, int(page_size))
+        meta = dict(df.attrs) if meta is None else meta
+        if len(df) <= page_size:
+            return Page(df, 0, len(df), None, meta)
+
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Mixed-type object columns (scraped data): store them as strings,
+            # and serve the first page from the same converted frame
+            objects = df.select_dtypes(include="object").columns
+            df = df.astype(dict.fromkeys(objects, str))
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        result_id = secrets.token_urlsafe(12)
+        result = _Result(table, page_size, meta, time.monotonic() + self.ttl)
+        with self._lock:
+            self._sweep()
+            self._results[result_id] = result
+            self._mem_bytes += result.nbytes
+            self._counts["stored"] += 1
+            self._enforce_budgets()
+
+        logger.debug(f"Stored result {result_id}: {result.rows} rows, {result.nbytes} bytes")
+        return Page(
+            df.iloc[:page_size].reset_index(drop=True),
+            0,
+            len(df),
+            make_cursor(result_id, page_size),
+            meta,
+        )
+
+    def page(self, cursor: str, page_size: int | None = None) -> Page:
+        """Read the page a cursor points to
+
+        Args:
+            cursor: next_cursor of a previous page
+            page_size: Rows to return (default: the page size the result was stored with)
+
+        Returns:
+            The page; reading it extends the result's TTL
+
+        Raises:
+            ResultExpiredError: If the cursor is malformed, unknown or expired
+        """
+        result_id, offset = parse_cursor(cursor)
+        with self._lock:
+            result = self._results.get(result_id)
+            if result is not None and result.expires <= time.monotonic():
+                self._drop(result_id)
+                self._counts["expirations"] += 1
+                result = None
+            if result is None:
+                self._counts["misses"] += 1
+                raise ResultExpiredError(f"Result for cursor {cursor!r} expired or unknown")
+            result.expires = time.monotonic() + self.ttl
+            self._results.move_to_end(result_id)
+            self._counts["pages"] += 1
+            table, path = result.table, result.path
+
+        size = max(1, int(page_size or result.page_size))
+        if table is None:
+            # Spilled: memory-map the IPC file; slicing reads only the page
+            try:
+                with pa.memory_map(str(path)) as source:
+                    table = pa.ipc.open_file(source).read_all()
+                    frame = table.slice(offset, size).to_pandas()
+            except OSError as e:
+                raise ResultExpiredError(f"Result for cursor {cursor!r} is gone: {e}") from e
+        else:
+            frame = table.slice(offset, size).to_pandas()
+
+        end = offset + len(frame)
+        next_cursor = make_cursor(result_id, end) if end < result.rows else None
+        return Page(frame, offset, result.rows, next_cursor, result.meta)
+
+    def delete(self, cursor_or_id: str) -> bool:
+        """Drop a stored result (e.g. when a client is done paging)
+
+        Returns:
+            True if a result was removed
+        """
+        result_id = cursor_or_id.rpartition(".")[0] or cursor_or_id
+        with self._lock:
+            return self._drop(result_id)
+
+    def clear(self) -> None:
+        """Drop every stored result"""
+        with self._lock:
+            for result_id in list(self._results):
+                self._drop(result_id)
+
+    def stats(self) -> dict[str, Any]:
+        """Get store counters
+
+        Returns:
+            Dict with results, memory_results, spilled_results, memory_bytes,
+            disk_bytes, max_bytes, spill_bytes, ttl_seconds and the stored,
+            pages, misses, spills, evictions and expirations counters
+        """
+        with self._lock:
+            spilled = sum(1 for r in self._results.values() if r.table is None)
+            return {
+                "results": len(self._results),
+                "memory_results": len(self._results) - spilled,
+                "spilled_results": spilled,
+                "memory_bytes": self._mem_bytes,
+                "disk_bytes": self._disk_bytes,
+                "max_bytes": self.max_bytes,
+                "spill_bytes": self.spill_bytes,
+                "ttl_seconds": self.ttl,
+                **self._counts,
+            }
+
+    # ------------------------------------------------------------------
+    # Internals (caller holds the lock)
+    # ------------------------------------------------------------------
+
+    def _drop(self, result_id: str) -> bool:
+        result = self._results.pop(result_id, None)
+        if result is None:
+            return False
+        if result.table is not None:
+            self._mem_bytes -= result.nbytes
+        if result.path is not None:
+            self._disk_bytes -= result.nbytes
+            result.path.unlink(missing_ok=True)
+        return True
+
+    def _sweep(self) -> None:
+        """Drop expired results"""
+        now = time.monotonic()
+        for result_id in [rid for rid, r in self._results.items() if r.expires <= now]:
+            self._drop(result_id)
+            self._counts["expirations"] += 1
+
+    def _enforce_budgets(self) -> None:
+        """Spill least recently used results over the memory budget; drop over the disk budget"""
+        for result_id, result in list(self._results.items()):
+            if not self.max_bytes or self._mem_bytes <= self.max_bytes:
+                break
+            if result.table is None:
+                continue
+            if self.spill_bytes and result.nbytes <= self.spill_bytes and self._spill(result_id):
+                continue
+            self._drop(result_id)
+            self._counts["evictions"] += 1
+
+        for result_id, result in list(self._results.items()):
+            if self._disk_bytes <= self.spill_bytes:
+                break
+            if result.path is not None:
+                self._drop(result_id)
+                self._counts["evictions"] += 1
+
+    def _spill(self, result_id: str) -> bool:
+        """Move a result's table to an Arrow IPC file"""
+        result = self._results[result_id]
+        table = result.table
+        if table is None:
+            return False
+        path = self.spill_dir / f"{result_id}.arrow"
+        try:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+            with (
+                pa.OSFile(str(path), "wb") as sink,
+                pa.ipc.new_file(sink, table.schema) as writer,
+            ):
+                writer.write_table(table)
+        except OSError as e:
+            logger.warning(f"Could not spill result {result_id}: {e}")
+            path.unlink(missing_ok=True)
+            return False
+
+        result.table = None
+        result.path = path
+        self._mem_bytes -= result.nbytes
+        self._disk_bytes += result.nbytes
+        self._counts["spills"] += 1
+        logger.debug(f"Spilled result {result_id} ({result.nbytes} bytes) to {path}")
+        return True
+
+
+# Process-wide store shared by the REST and MCP servers
+_result_store: ResultStore | None = None
+_result_store_lock = threading.Lock()
+
+
+def get_result_store() -> ResultStore:
+    """Get the global result store (created on first use)"""
+    global _result_store
+    if _result_store is None:
+        with _result_store_lock:
+            if _result_store is None:
+                _result_store = ResultStore()
+    return _result_store
+
+
+def set_result_store(store: ResultStore) -> None:
+    """Set a custom result store"""
+    global _result_store
+    _result_store = store
@@ -0,0 +1,316 @@
+"""Single-flight request coalescing
+
+When several callers ask for the same expensive result at the same time, only
+the first one (the "leader") does the work; the rest wait for its result.
+This removes redundant upstream scrapes under bursty REST/MCP load and keeps
+rate-limiter contention down.
+
+Modes (CBB_SINGLE_FLIGHT env var):
+- "thread" (default): coalesce threads within one process
+- "file": additionally serialize identical work across processes with a
+  per-key file lock (workers on the same host)
+- "redis": additionally serialize across hosts with a Redis lock
+- "off": disable coalescing entirely
+
+Cross-process modes cannot hand a Python object to another worker. Instead the
+leader of each process takes the shared lock; if it had to wait for another
+worker to release it, it re-checks the cache via the ``recheck`` callback before
+doing the work, so the second worker finds the first worker's result in
+Redis/DuckDB instead of scraping again. A leader that got the lock straight
+away does the work without rechecking.
+
+Example:
+    flight = get_single_flight()
+
+    df = flight.do(
+        key="player_season|NCAA-MBB|2025",
+        fn=lambda: expensive_fetch(),
+        clone=lambda df: df.copy(),
+    )
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import os
+import sys
+import threading
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+SINGLE_FLIGHT_MODES = ("off", "thread", "file", "redis")
+
+
+class _Call:
+    """An in-flight call shared by a leader and its followers"""
+
+    __slots__ = ("done", "result", "error", "owner", "followers")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.owner = threading.get_ident()
+        self.followers = 0
+
+
+class SingleFlight:
+    """Deduplicate concurrent calls that share a key
+
+    Thread-safe. Re-entrant calls for a key the current thread is already
+    leading run directly instead of deadlocking.
+    """
+
+    def __init__(
+        self,
+        mode: str | None = None,
+        lock_dir: str | Path | None = None,
+        lock_timeout: float = 600.0,
+        redis_client: Any | None = None,
+    ):
+        """Initialize single-flight group
+
+        Args:
+            mode: "off", "thread", "file" or "redis" (default: CBB_SINGLE_FLIGHT env var,
+                then "thread")
+            lock_dir: Directory for file locks (default: CBB_SINGLE_FLIGHT_LOCK_DIR env
+                var, then "data/locks")
+            lock_timeout: Seconds before a cross-process lock is considered abandoned
+                (Redis lock expiry; also the max wait for the lock)
+            redis_client: Redis client for "redis" mode (default: built from REDIS_* env vars)
+        """
+        mode = (mode or os.getenv("CBB_SINGLE_FLIGHT") or "thread").lower()
+        if mode not in SINGLE_FLIGHT_MODES:
+            raise ValueError(
+                f"Unknown single-flight mode '{mode}'. Use one of {SINGLE_FLIGHT_MODES}"
+            )
+
+        self.mode = mode
+        self.lock_timeout = lock_timeout
+        self.lock_dir = Path(lock_dir or os.getenv("CBB_SINGLE_FLIGHT_LOCK_DIR") or "data/locks")
+        self._redis = redis_client
+        self._calls: dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        self._leaders = 0
+        self._coalesced = 0
+
+        if mode == "file":
+            self.lock_dir.mkdir(parents=True, exist_ok=True)
+        elif mode == "redis" and self._redis is None:
+            self._redis = connect_redis()
+            if self._redis is None:
+                logger.warning("Redis unavailable for single-flight; using thread mode")
+                self.mode = "thread"
+
+    def do(
+        self,
+        key: str,
+        fn: Callable[[], T],
+        recheck: Callable[[], T | None] | None = None,
+        clone: Callable[[T], T] | None = None,
+    ) -> T:
+        """Run fn once per key across concurrent callers
+
+        Args:
+            key: Identity of the work (e.g., compiled request or cache key)
+            fn: Function doing the work
+            recheck: Optional cache lookup run by the leader when it had to wait
+                for the cross-process lock; a non-None result skips fn
+            clone: Optional copier applied to the result handed to followers, so
+                callers that mutate their result (DataFrames) don't interfere
+
+        Returns:
+            Result of fn (or recheck), shared with all concurrent callers
+
+        Raises:
+            Whatever fn raised; followers re-raise the leader's exception
+        """
+        if self.mode == "off":
+            return fn()
+
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                self._leaders += 1
+                role = "leader"
+            elif call.owner == threading.get_ident():
+                role = "reentrant"
+            else:
+                call.followers += 1
+                self._coalesced += 1
+                role = "follower"
+
+        if role == "reentrant":
+            return fn()
+
+        if role == "follower":
+            logger.debug(f"Single-flight: waiting on in-flight call {key[:60]}")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            result: T = call.result
+            return clone(result) if clone is not None else result
+
+        try:
+            with self._shared_lock(key) as waited:
+                value = None
+                if recheck is not None and waited:
+                    # Another worker held the lock and may have published its result
+                    value = recheck()
+                if value is None:
+                    value = fn()
+            with self._lock:
+                self._calls.pop(key, None)
+                if call.followers:
+                    # Snapshot before the leader's caller can mutate its copy
+                    call.result = clone(value) if clone is not None else value
+            return value
+        except BaseException as e:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.error = e
+            raise
+        finally:
+            call.done.set()
+
+    @contextlib.contextmanager
+    def _shared_lock(self, key: str) -> Iterator[bool]:
+        """Cross-process lock for key (no-op in thread mode)
+
+        Yields:
+            True if another worker held the lock and this one had to wait
+        """
+        if self.mode == "thread":
+            yield False
+            return
+
+        digest = hashlib.sha256(key.encode()).hexdigest()[:32]
+
+        if self.mode == "redis":
+            assert self._redis is not None  # __init__ falls back to thread mode without one
+            lock = self._redis.lock(
+                f"cbb:single_flight:{digest}",
+                timeout=self.lock_timeout,
+                blocking_timeout=self.lock_timeout,
+            )
+            acquired = lock.acquire(blocking=False)
+            waited = not acquired
+            if waited:
+                acquired = lock.acquire()
+            try:
+                yield waited
+            finally:
+                if acquired:
+                    with contextlib.suppress(Exception):
+                        lock.release()
+            return
+
+        with file_lock(self.lock_dir / f"{digest}.lock") as waited:
+            yield waited
+
+    def in_flight(self) -> int:
+        """Number of keys currently being computed"""
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> dict[str, Any]:
+        """Get coalescing statistics"""
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "in_flight": len(self._calls),
+                "leaders": self._leaders,
+                "coalesced": self._coalesced,
+            }
+
+
+@contextlib.contextmanager
+def file_lock(path: Path) -> Iterator[bool]:
+    """Exclusive advisory lock on a file (blocks until acquired)
+
+    Yields:
+        True if another holder had the lock and the caller had to wait
+    """
+    with open(path, "a+b") as handle:
+        if sys.platform == "win32":
+            import msvcrt
+
+            handle.seek(0)
+            try:
+                msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+                waited = False
+            except OSError:
+                waited = True
+                # LK_LOCK retries for ~10s before raising; loop until acquired
+                while True:
+                    try:
+                        msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        continue
+            try:
+                yield waited
+            finally:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            try:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                waited = False
+            except BlockingIOError:
+                waited = True
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield waited
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def connect_redis() -> Any | None:
+    """Build a Redis client from REDIS_* env vars (None if unavailable)"""
+    try:
+        import redis
+
+        client = redis.Redis(
+            host=os.getenv("REDIS_HOST", "localhost"),
+            port=int(os.getenv("REDIS_PORT", "6379")),
+            db=int(os.getenv("REDIS_DB", "0")),
+            socket_connect_timeout=2,
+        )
+        client.ping()
+        return client
+    except Exception as e:
+        logger.debug(f"Redis connection failed: {e}")
+        return None
+
+
+# Global single-flight group (can be reconfigured)
+_single_flight: SingleFlight | None = None
+_single_flight_lock = threading.Lock()
+
+
+def get_single_flight() -> SingleFlight:
+    """Get the global single-flight group (created on first use)"""
+    global _single_flight
+    if _single_flight is None:
+        with _single_flight_lock:
+            if _single_flight is None:
+                _single_flight = SingleFlight()
+    return _single_flight
+
+
+def set_single_flight(flight: SingleFlight) -> None:
+    """Set a custom single-flight group"""
+    global _single_flight
+    _single_flight = flight
@@ -0,0 +1,181 @@
+"""
+Tests for adaptive upstream concurrency (utils/adaptive_concurrency.py).
+
+Tests:
+    - Healthy calls raise the limit additively up to max_limit
+    - 429/5xx/timeouts halve the limit once per burst; other errors do not cut
+    - Failure classification (status codes, timeouts, rate_limited errors)
+    - slot() never lets more than ``limit`` calls run at once
+    - fetch_euroleague_full_season runs its calls under the "euroleague" limit
+    - LNB bulk ingestion sees 429s from the real fetchers and lowers the "lnb" limit
+"""
+
+import contextlib
+import sys
+import threading
+import time
+
+import pandas as pd
+import requests
+
+from cbb_data.fetchers import euroleague
+from cbb_data.fetchers.base import DataUnavailableError
+from cbb_data.utils import adaptive_concurrency as ac
+from cbb_data.utils.adaptive_concurrency import AdaptiveConcurrency, classify_exception
+
+
+class _HTTPError(Exception):
+    def __init__(self, status_code: int):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class ReadTimeout(Exception):  # named like requests/httpx timeouts
+    pass
+
+
+def _call(controller: AdaptiveConcurrency, exc: Exception | None = None) -> None:
+    with contextlib.suppress(Exception), controller.slot():
+        if exc is not None:
+            raise exc
+
+
+def test_additive_increase_up_to_max() -> None:
+    """About ``limit`` healthy calls add one slot; the limit stops at max_limit"""
+    controller = AdaptiveConcurrency("test", initial_limit=2, max_limit=6, adaptive=True)
+    for _ in range(5):
+        _call(controller)
+    assert controller.limit == 3
+
+    for _ in range(100):
+        _call(controller)
+    stats = controller.stats()
+    assert stats["limit"] == 6 and stats["increases"] == 4
+    assert stats["successes"] == 105 and stats["in_flight"] == 0
+
+
+def test_multiplicative_decrease_once_per_burst() -> None:
+    """Calls in flight when the limit was cut do not cut it again"""
+    controller = AdaptiveConcurrency("test", initial_limit=8, adaptive=True)
+
+    # Three calls in flight fail together with 429
+    slots = [controller.slot() for _ in range(3)]
+    for slot in slots:
+        slot.__enter__()
+    for slot in slots:
+        error = _HTTPError(429)
+        assert not slot.__exit__(type(error), error, None)  # re-raised, not swallowed
+    assert controller.limit == 4 and controller.stats()["decreases"] == 1
+
+    # A call started after the cut cuts again; never below min_limit
+    for _ in range(4):
+        _call(controller, TimeoutError())
+    stats = controller.stats()
+    assert stats["limit"] == 1 and stats["decreases"] == 3 and stats["congestion"] == 7
+
+    # Plain errors count towards the error rate and pause increases, no cut
+    controller = AdaptiveConcurrency("test", initial_limit=4, window=10, adaptive=True)
+    for _ in range(5):
+        _call(controller, ValueError("bad payload"))
+    for _ in range(5):
+        _call(controller)
+    stats = controller.stats()
+    assert stats["limit"] == 4 and stats["errors"] == 5 and stats["error_rate"] == 0.5
+
+    pinned = AdaptiveConcurrency("test", initial_limit=4, adaptive=False)
+    _call(pinned, _HTTPError(503))
+    assert pinned.limit == 4
+
+
+def test_classify_exception() -> None:
+    class _Response:
+        status_code = 502
+
+    wrapped = Exception("bad gateway")
+    wrapped.response = _Response()  # type: ignore[attr-defined]
+
+    assert classify_exception(_HTTPError(429)) == "congestion"
+    assert classify_exception(wrapped) == "congestion"
+    assert classify_exception(ReadTimeout()) == "congestion"
+    assert classify_exception(ConnectionResetError()) == "congestion"
+    assert classify_exception(DataUnavailableError("rate_limited", "slow down")) == "congestion"
+    assert classify_exception(_HTTPError(404)) == "error"
+    assert classify_exception(KeyError("GAME_ID")) == "error"
+
+
+def test_slot_caps_in_flight() -> None:
+    """Eight threads share a limit of 2"""
+    controller = AdaptiveConcurrency("test", initial_limit=2, adaptive=False)
+    peak = 0
+    lock = threading.Lock()
+
+    def work() -> None:
+        nonlocal peak
+        with controller.slot():
+            with lock:
+                peak = max(peak, controller.stats()["in_flight"])
+            time.sleep(0.02)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert peak == 2 and controller.stats()["successes"] == 8
+
+
+def test_full_season_uses_source_limit(monkeypatch) -> None:
+    """Box/PBP/shot calls go through the shared controller; failures are isolated"""
+    monkeypatch.setattr(ac, "_controllers", {})
+    schedule = pd.DataFrame({"GAME_CODE": list(range(1, 7))})
+    monkeypatch.setattr(euroleague, "fetch_euroleague_games", lambda season, phase: schedule)
+
+    def box(season: str, game_code: int) -> pd.DataFrame:
+        if game_code == 3:
+            raise _HTTPError(503)
+        return pd.DataFrame({"GAME_CODE": [game_code]})
+
+    monkeypatch.setattr(euroleague, "fetch_euroleague_box_score", box)
+    monkeypatch.setattr(
+        euroleague,
+        "fetch_euroleague_play_by_play",
+        lambda season, game_code: pd.DataFrame({"GAME_CODE": [game_code]}),
+    )
+
+    result = euroleague.fetch_euroleague_full_season("E2024", max_workers=3, skip_shots=True)
+    assert sorted(result["box_scores"]["GAME_CODE"]) == [1, 2, 4, 5, 6]
+    assert len(result["play_by_play"]) == 5 and result["shots"].empty
+
+    stats = ac.concurrency_stats()["euroleague"]
+    assert stats["successes"] == 10 and stats["congestion"] == 1
+    assert stats["max_limit"] >= 3 and stats["in_flight"] == 0
+
+
+def test_lnb_ingest_backs_off_on_fetcher_429s(monkeypatch) -> None:
+    """429s inside fetch_lnb_play_by_play/game_shots reach the controller instead of an empty frame"""
+    from tools.lnb import bulk_ingest_pbp_shots as bulk
+
+    # The tool imports the package as src.cbb_data, so patch those module objects
+    lnb = sys.modules[bulk.fetch_lnb_play_by_play.__module__]
+    bulk_ac = sys.modules[bulk.get_concurrency.__module__]
+
+    def throttled(url: str, **kwargs) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 429
+        response.url = url
+        return response
+
+    monkeypatch.setattr(lnb, "http_get", throttled)
+    monkeypatch.setattr(lnb.rate_limiter, "acquire", lambda source, **kwargs: True)
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)  # retry_on_error backoff
+    monkeypatch.setattr(bulk, "log_error", lambda *args: None)
+    controller = bulk_ac.AdaptiveConcurrency("lnb", initial_limit=4, adaptive=True)
+    monkeypatch.setitem(bulk_ac._controllers, "lnb", controller)
+
+    assert bulk.ingest_pbp_for_game("g1", "2024-2025", "Betclic ELITE") is False
+    assert bulk.ingest_shots_for_game("g1", "2024-2025", "Betclic ELITE") is False
+
+    stats = controller.stats()
+    assert stats["congestion"] == 2 and stats["successes"] == 0
+    assert stats["limit"] < 4 and stats["in_flight"] == 0
@@ -0,0 +1,109 @@
+"""
+Tests for the Cache codec layer (fetchers/base.py).
+
+Tests:
+    - Arrow IPC round-trip preserves dtypes (datetimes, categoricals, nullable ints)
+    - Parquet and legacy JSON codecs
+    - Plain dict values still go through JSON
+    - Fallback to JSON for frames Arrow cannot encode
+    - @cached_dataframe returns cached frames without re-calling the function
+"""
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+
+def _typed_frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "PLAYER_ID": pd.array([1, None, 3], dtype="Int64"),
+            "GAME_DATE": pd.to_datetime(["2024-11-04", "2024-11-08", None]),
+            "PLAY_TYPE": pd.Categorical(["JumpShot", "Rebound", "JumpShot"]),
+            "PTS": [2.0, 0.0, 3.0],
+            "PLAYER_NAME": ["A", "B", None],
+        }
+    )
+
+
+def test_arrow_codec_preserves_dtypes() -> None:
+    """Arrow IPC round-trip should be lossless, including pandas extension dtypes"""
+    from cbb_data.fetchers.base import Cache
+
+    cache = Cache(ttl_seconds=60, redis_enabled=False, codec="arrow")
+    df = _typed_frame()
+    cache.set(df, "arrow", 1)
+
+    result = cache.get("arrow", 1)
+    pd.testing.assert_frame_equal(result, df)
+    assert cache.stats()["codec"] == "arrow"
+
+    print("[PASS] Arrow codec preserves dtypes")
+
+
+@pytest.mark.parametrize("codec", ["parquet", "json"])
+def test_other_frame_codecs_round_trip(codec: str) -> None:
+    """Parquet and JSON codecs return the same values"""
+    from cbb_data.fetchers.base import Cache
+
+    cache = Cache(ttl_seconds=60, redis_enabled=False, codec=codec)
+    df = pd.DataFrame({"GAME_ID": ["1", "2"], "PTS": [10, 12]})
+    cache.set(df, "frame")
+
+    result = cache.get("frame")
+    assert result["PTS"].tolist() == [10, 12]
+    assert result.columns.tolist() == ["GAME_ID", "PTS"]
+
+    print(f"[PASS] {codec} codec round-trip")
+
+
+def test_dict_values_use_json() -> None:
+    """Non-DataFrame values are stored as JSON"""
+    from cbb_data.fetchers.base import Cache
+
+    cache = Cache(ttl_seconds=60, redis_enabled=False)
+    cache.set({"rows": 3, "leagues": ["NCAA-MBB"]}, "meta")
+
+    assert cache.get("meta") == {"rows": 3, "leagues": ["NCAA-MBB"]}
+    assert cache._mem[cache._key("meta")][1][:1] == b"J"
+
+    print("[PASS] Dict values use JSON codec")
+
+
+def test_unencodable_frame_falls_back_to_json() -> None:
+    """Mixed-object columns Arrow rejects are cached via the JSON codec"""
+    from cbb_data.fetchers.base import Cache
+
+    cache = Cache(ttl_seconds=60, redis_enabled=False, codec="arrow")
+    df = pd.DataFrame({"RAW": [1, "a", {"nested": True}]})
+    cache.set(df, "mixed")
+
+    assert cache._mem[cache._key("mixed")][1][:1] == b"S"
+    assert len(cache.get("mixed")) == 3
+
+    print("[PASS] Unencodable frame falls back to JSON")
+
+
+def test_cached_dataframe_hits_cache() -> None:
+    """Decorated function runs once per kwargs and returns typed frames on hits"""
+    from cbb_data.fetchers.base import Cache, cached_dataframe, get_cache, set_cache
+
+    original = get_cache()
+    set_cache(Cache(ttl_seconds=60, redis_enabled=False))
+    calls = []
+
+    @cached_dataframe
+    def fetch(season: str) -> pd.DataFrame:
+        calls.append(season)
+        return _typed_frame()
+
+    try:
+        first = fetch(season="2024")
+        second = fetch(season="2024")
+        pd.testing.assert_frame_equal(first, second)
+        assert calls == ["2024"]
+    finally:
+        set_cache(original)
+
+    print("[PASS] cached_dataframe hits cache")
@@ -0,0 +1,81 @@
+"""
+Tests for DuckDBStorage thread safety.
+
+Tests:
+    - Each thread reads through its own cursor
+    - Concurrent saves are serialized by the writer queue without losing data
+    - Read-only mode serves reads and skips writes
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("duckdb")
+
+
+@pytest.fixture
+def storage(tmp_path):
+    from cbb_data.storage.duckdb_storage import DuckDBStorage
+
+    instance = DuckDBStorage(str(tmp_path / "test.duckdb"))
+    yield instance
+    instance.close()
+
+
+def test_threads_get_their_own_cursor(storage) -> None:
+    """Cursors are per thread and reused within a thread"""
+    cursors = {}
+
+    def grab(name: str) -> None:
+        cursors[name] = (storage._con, storage._con)
+
+    threads = [threading.Thread(target=grab, args=(str(i),)) for i in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert all(first is second for first, second in cursors.values())
+    assert len({id(first) for first, _ in cursors.values()}) == 3
+
+
+def test_concurrent_saves_and_reads(storage) -> None:
+    """Parallel writers and readers never see partial or lost partitions"""
+    seasons = [str(2000 + i) for i in range(12)]
+
+    def write(season: str) -> None:
+        df = pd.DataFrame({"GAME_ID": [f"{season}-{n}" for n in range(50)], "PTS": range(50)})
+        storage.save(df, "schedule", "NCAA-MBB", season)
+
+    def read(season: str) -> int:
+        return len(storage.load("schedule", "NCAA-MBB", season))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(write, seasons))
+        counts = list(pool.map(read, seasons))
+
+    assert counts == [50] * len(seasons)
+    assert storage.pending_writes() == 0
+    assert len(storage.load_multi_season("schedule", "NCAA-MBB", seasons)) == 50 * len(seasons)
+
+
+def test_read_only_mode(tmp_path) -> None:
+    """Read-only storage reads existing data and ignores saves"""
+    from cbb_data.storage.duckdb_storage import DuckDBStorage
+
+    db_path = str(tmp_path / "replica.duckdb")
+    writer = DuckDBStorage(db_path)
+    writer.save(pd.DataFrame({"GAME_ID": ["g1"]}), "schedule", "EuroLeague", "2024")
+    writer.close()
+
+    replica = DuckDBStorage(db_path, read_only=True)
+    try:
+        assert replica.has_data("schedule", "EuroLeague", "2024")
+        replica.save(pd.DataFrame({"GAME_ID": ["g2"]}), "schedule", "EuroLeague", "2025")
+        assert not replica.has_data("schedule", "EuroLeague", "2025")
+        assert replica.load("schedule", "EuroLeague", "2024")["GAME_ID"].tolist() == ["g1"]
+    finally:
+        replica.close()
@@ -0,0 +1,235 @@
+"""
+Tests for the consolidated (one table per dataset) DuckDB layout.
+
+Tests:
+    - Partitions share one table and round-trip with original row order/dtypes
+    - Re-saving a partition replaces only that partition
+    - Schema evolution: new columns and widened types across seasons
+    - load_multi_season runs as one query with filters and limits
+    - Legacy {dataset}_{league}_{season} tables are migrated on startup
+    - Arrow-native save/load/stream paths
+    - append/upsert save modes (registry keys, schema evolution, Arrow streams)
+    - upsert resolves catalog keys without the dataset API being imported
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import duckdb
+import pandas as pd
+import pytest
+
+pytest.importorskip("duckdb")
+
+
+@pytest.fixture
+def storage(tmp_path):
+    from cbb_data.storage.duckdb_storage import DuckDBStorage
+
+    instance = DuckDBStorage(str(tmp_path / "test.duckdb"))
+    yield instance
+    instance.close()
+
+
+def test_partitions_share_one_table(storage) -> None:
+    """Leagues/seasons are partitions of a single dataset table"""
+    df = pd.DataFrame({"GAME_ID": ["3", "1", "2"], "PTS": [70, 81, 65]})
+    storage.save(df, "schedule", "NCAA-MBB", "2024")
+    storage.save(df.head(1), "schedule", "NCAA-WBB", "2024")
+    storage.save(df.head(2), "schedule", "NCAA-MBB", "2023")
+
+    assert storage.list_tables() == ["schedule"]
+    assert storage.has_data("schedule", "NCAA-MBB", "2023")
+    assert not storage.has_data("schedule", "NCAA-MBB", "2022")
+
+    loaded = storage.load("schedule", "NCAA-MBB", "2024")
+    pd.testing.assert_frame_equal(loaded, df)
+
+    # Re-saving one partition leaves the others alone
+    storage.save(df.tail(1), "schedule", "NCAA-MBB", "2024")
+    assert len(storage.load("schedule", "NCAA-MBB", "2024")) == 1
+    assert len(storage.load("schedule", "NCAA-WBB", "2024")) == 1
+    assert len(storage.load("schedule", "NCAA-MBB", "2023")) == 2
+
+
+def test_schema_evolution_across_seasons(storage) -> None:
+    """New columns are added and conflicting types widened; loads keep saved dtypes"""
+    old = pd.DataFrame({"GAME_ID": [1, 2], "PTS": [10, 20]})
+    new = pd.DataFrame({"GAME_ID": ["A-1"], "PTS": [12.5], "AST": [3]})
+    storage.save(old, "player_game", "EuroLeague", "2023")
+    storage.save(new, "player_game", "EuroLeague", "2024")
+
+    pd.testing.assert_frame_equal(storage.load("player_game", "EuroLeague", "2023"), old)
+    pd.testing.assert_frame_equal(storage.load("player_game", "EuroLeague", "2024"), new)
+
+    combined = storage.load_multi_season("player_game", "EuroLeague", ["2024", "2023"])
+    assert list(combined.columns) == ["GAME_ID", "PTS", "AST"]
+    assert len(combined) == 3
+    assert combined["GAME_ID"].iloc[0] == "A-1"
+
+
+def test_load_multi_season_filter_and_limit(storage) -> None:
+    """Filters and limits apply across the combined seasons"""
+    for season in ["2022", "2023", "2024"]:
+        storage.save(
+            pd.DataFrame({"TEAM": ["Duke", "UNC"], "SEASON": [season, season]}),
+            "team_game",
+            "NCAA-MBB",
+            season,
+        )
+
+    df = storage.load_multi_season(
+        "team_game", "NCAA-MBB", ["2024", "2023", "2021"], filter_sql="TEAM = 'Duke'"
+    )
+    assert df["SEASON"].tolist() == ["2024", "2023"]
+
+    limited = storage.load_multi_season("team_game", "NCAA-MBB", ["2022", "2023"], limit=3)
+    assert len(limited) == 3
+    assert storage.available_seasons("team_game", "NCAA-MBB", ["2021", "2022"]) == ["2022"]
+
+
+def test_legacy_tables_are_migrated(tmp_path) -> None:
+    """Old per-season tables move into the dataset table on startup"""
+    from cbb_data.storage.duckdb_storage import DuckDBStorage
+
+    db_path = str(tmp_path / "legacy.duckdb")
+    conn = duckdb.connect(db_path)
+    conn.execute("CREATE TABLE schedule_NCAA_MBB_2024 AS SELECT 'g1' AS GAME_ID, 80 AS PTS")
+    conn.execute("CREATE TABLE player_game_EuroLeague_E2024 AS SELECT 7 AS PLAYER_ID")
+    conn.close()
+
+    storage = DuckDBStorage(db_path)
+    try:
+        assert sorted(storage.list_tables()) == ["player_game", "schedule"]
+        df = storage.load("schedule", "NCAA-MBB", "2024")
+        assert df.to_dict("records") == [{"GAME_ID": "g1", "PTS": 80}]
+        assert storage.has_data("player_game", "EuroLeague", "E2024")
+        # Migrated data has no known write time, so it is refreshed on next use
+        assert storage.get_age_seconds("schedule", "NCAA-MBB", "2024") is None
+    finally:
+        storage.close()
+
+
+def test_arrow_round_trip_and_stream(storage) -> None:
+    """Arrow tables and batch streams save/load without pandas"""
+    import pyarrow as pa
+
+    table = pa.table({"GAME_ID": ["g1", "g2", "g3"], "PTS": [70, 81, 65]})
+    storage.save_arrow(table, "pbp", "NCAA-MBB", "2025")
+    reader = pa.RecordBatchReader.from_batches(table.schema, table.to_batches(max_chunksize=1))
+    storage.save_arrow(reader, "pbp", "NCAA-MBB", "2024")
+
+    loaded = storage.load_arrow("pbp", "NCAA-MBB", "2025")
+    assert loaded.equals(table)
+    both = storage.load_arrow("pbp", "NCAA-MBB", ["2025", "2024"], columns=["PTS"], limit=4)
+    assert both.column_names == ["PTS"]
+    assert both["PTS"].to_pylist() == [70, 81, 65, 70]
+
+    stream = storage.stream_arrow("pbp", "NCAA-MBB", ["2024", "2025"], batch_size=2)
+    sizes = [batch.num_rows for batch in stream]
+    assert sum(sizes) == 6 and max(sizes) <= 2
+
+    # Stream and pandas reads interleave on the same thread
+    stream = storage.stream_arrow("pbp", "NCAA-MBB", "2025", batch_size=1)
+    first = stream.read_next_batch()
+    assert len(storage.load("pbp", "NCAA-MBB", "2024")) == 3
+    assert first.num_rows == 1 and stream.read_all().num_rows == 2
+
+    assert storage.load_arrow("pbp", "NCAA-MBB", "1999").num_rows == 0
+
+
+def test_append_and_upsert_modes(storage) -> None:
+    """append adds rows; upsert replaces rows with matching keys and appends the rest"""
+    base = pd.DataFrame(
+        {"GAME_ID": ["1", "1", "2"], "PLAYER_ID": ["a", "b", "a"], "PTS": [10, 12, 8]}
+    )
+    storage.save(base, "player_game", "NCAA-MBB", "2024")
+
+    storage.save(
+        pd.DataFrame({"GAME_ID": ["3"], "PLAYER_ID": ["a"], "PTS": [5]}),
+        "player_game",
+        "NCAA-MBB",
+        "2024",
+        mode="append",
+    )
+    assert storage.load("player_game", "NCAA-MBB", "2024")["GAME_ID"].tolist() == [
+        "1",
+        "1",
+        "2",
+        "3",
+    ]
+
+    # Corrected stat for (1, b) plus a new player column; other rows untouched
+    update = pd.DataFrame(
+        {"GAME_ID": ["1", "4"], "PLAYER_ID": ["b", "c"], "PTS": [14, 3], "AST": [2, 1]}
+    )
+    storage.save(
+        update, "player_game", "NCAA-MBB", "2024", mode="upsert", keys=["GAME_ID", "PLAYER_ID"]
+    )
+    loaded = storage.load("player_game", "NCAA-MBB", "2024")
+    assert list(zip(loaded["GAME_ID"], loaded["PLAYER_ID"], loaded["PTS"], strict=True)) == [
+        ("1", "a", 10),
+        ("2", "a", 8),
+        ("3", "a", 5),
+        ("1", "b", 14),
+        ("4", "c", 3),
+    ]
+    assert loaded["AST"].isna().sum() == 3
+    assert storage.list_partitions("player_game") == [("player_game", "NCAA-MBB", "2024")]
+
+
+def test_upsert_uses_registry_keys(storage) -> None:
+    """Without keys= upsert uses the dataset's DatasetRegistry keys"""
+    import pyarrow as pa
+
+    from cbb_data.catalog.registry import DatasetRegistry
+
+    DatasetRegistry.register(
+        "test_upsert_ds", keys=["TEAM_ID", "GAME_ID"], filters=[], fetch=lambda c: pd.DataFrame()
+    )
+    try:
+        first = pd.DataFrame({"TEAM_ID": [1, 2], "GAME_ID": [7, 7], "PTS": [80, 75]})
+        storage.save(first, "test_upsert_ds", "NBL", "2024")
+        table = pa.table({"TEAM_ID": [2, 3], "GAME_ID": [7, 8], "PTS": [77.5, 90.0]})
+        reader = pa.RecordBatchReader.from_batches(table.schema, table.to_batches(max_chunksize=1))
+        storage.save_arrow(reader, "test_upsert_ds", "NBL", "2024", mode="upsert")
+
+        loaded = storage.load("test_upsert_ds", "NBL", "2024")
+        assert loaded["TEAM_ID"].tolist() == [1, 2, 3]
+        assert loaded["PTS"].tolist() == [80.0, 77.5, 90.0]
+    finally:
+        DatasetRegistry._items.pop("test_upsert_ds", None)
+
+    with pytest.raises(ValueError, match="No keys registered"):
+        storage.save(first, "unregistered_ds", "NBL", "2024", mode="upsert")
+    with pytest.raises(ValueError, match="not in"):
+        storage.save(first, "unregistered_ds", "NBL", "2024", mode="upsert", keys=["PLAYER_ID"])
+    with pytest.raises(ValueError, match="Unknown save mode"):
+        storage.save(first, "unregistered_ds", "NBL", "2024", mode="merge")
+
+
+def test_upsert_resolves_keys_in_fresh_interpreter(tmp_path) -> None:
+    """Storage loads the catalog itself when nothing imported cbb_data.api.datasets"""
+    script = f"""
+import sys
+import pandas as pd
+from cbb_data.storage.duckdb_storage import DuckDBStorage
+
+assert "cbb_data.api.datasets" not in sys.modules
+storage = DuckDBStorage({str(tmp_path / "fresh.duckdb")!r})
+storage.save(pd.DataFrame({{"GAME_ID": ["1", "2"], "PTS": [70, 80]}}), "schedule", "NBL", "2024")
+storage.save(pd.DataFrame({{"GAME_ID": ["2", "3"], "PTS": [85, 90]}}), "schedule", "NBL", "2024",
+             mode="upsert")
+print(storage.load("schedule", "NBL", "2024").sort_values("GAME_ID")["PTS"].tolist())
+storage.close()
+"""
+    src = Path(__file__).resolve().parent.parent / "src"
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        env={"PYTHONPATH": str(src), "PATH": ""},
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == "[70, 85, 90]"
@@ -0,0 +1,115 @@
+"""
+Tests for concurrent ESPN date-range scoreboard fetching.
+
+Tests:
+    - Days are fetched concurrently and returned in date order
+    - Finished days are cached per day; only recent days are refetched
+    - fetch_schedule_range output matches the serial day-by-day result
+    - A failing day raises like the serial loop did
+"""
+
+import threading
+import time
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+
+from cbb_data.fetchers import espn_common, espn_mbb
+
+
+@pytest.fixture(autouse=True)
+def fresh_day_cache():
+    espn_common.clear_day_cache()
+    yield
+    espn_common.clear_day_cache()
+
+
+class FakeScoreboard:
+    """Scoreboard stub: one final game per day, scheduled games from `live_from` on"""
+
+    def __init__(self, live_from: date | None = None, delay: float = 0.0):
+        self.live_from = live_from
+        self.delay = delay
+        self.calls: list[str] = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, date: str, season: int | None = None, groups: str = "50") -> pd.DataFrame:
+        with self._lock:
+            self.calls.append(date)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+
+        day = pd.Timestamp(date).date()
+        if day.day % 5 == 0:
+            return pd.DataFrame()
+        live = self.live_from is not None and day >= self.live_from
+        return pd.DataFrame(
+            {
+                "GAME_ID": [f"g{date}", "shared"],
+                "GAME_DATE": [pd.Timestamp(day)] * 2,
+                "STATUS": ["Scheduled" if live else "Final", "Final/OT"],
+            }
+        )
+
+
+def test_days_fetched_concurrently_in_order() -> None:
+    """Workers overlap requests; frames come back in date order"""
+    fake = FakeScoreboard(delay=0.02)
+    start, end = date(2024, 11, 1), date(2024, 11, 20)
+
+    frames = espn_common.fetch_scoreboard_days(fake, "test", start, end, max_workers=4)
+
+    assert fake.max_active > 1
+    assert len(fake.calls) == 20
+    days = [frame["GAME_DATE"].iloc[0].date() for frame in frames]
+    assert days == sorted(days) and len(days) == 16  # days divisible by 5 are empty
+
+
+def test_finished_days_are_not_refetched() -> None:
+    """A refresh only requests days that were not yet final"""
+    today = date.today()
+    start = today - timedelta(days=10)
+    fake = FakeScoreboard(live_from=today - timedelta(days=3))
+
+    espn_common.fetch_scoreboard_days(fake, "test", start, today)
+    first = len(fake.calls)
+    fake.calls.clear()
+    espn_common.fetch_scoreboard_days(fake, "test", start, today)
+
+    refetched = sorted(pd.Timestamp(d).date() for d in fake.calls)
+    assert first == 11
+    # Recent days (and days with unfinished games) are refetched; older final days are not
+    assert refetched[0] == today - timedelta(days=3)
+    assert len(refetched) == 4
+
+
+def test_schedule_range_matches_serial(monkeypatch) -> None:
+    """fetch_schedule_range returns exactly what the old serial loop produced"""
+    fake = FakeScoreboard()
+    monkeypatch.setattr(espn_mbb, "fetch_espn_scoreboard", fake)
+    start, end = date(2024, 11, 1), date(2024, 12, 15)
+
+    result = espn_mbb.fetch_schedule_range(start, end, season=2025)
+
+    serial = [fake(date=(start + timedelta(n)).strftime("%Y%m%d")) for n in range(45)]
+    expected = pd.concat([f for f in serial if not f.empty], ignore_index=True)
+    expected = expected.drop_duplicates(subset=["GAME_ID"])
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_failing_day_raises() -> None:
+    """Errors propagate instead of silently dropping days"""
+
+    def fetch(date: str, season: int | None = None, groups: str = "50") -> pd.DataFrame:
+        if date.endswith("07"):
+            raise ConnectionError("boom")
+        return pd.DataFrame()
+
+    with pytest.raises(ConnectionError):
+        espn_common.fetch_scoreboard_days(fetch, "test", date(2024, 11, 1), date(2024, 11, 9))
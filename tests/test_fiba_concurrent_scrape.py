@@ -0,0 +1,115 @@
+"""
+Tests for concurrent FIBA LiveStats season scraping (fiba_html_common).
+
+Tests:
+    - Games are scraped concurrently and returned in schedule order
+    - Failed and empty games are skipped
+    - Requests respect the per-host in-flight limit
+    - Scrapes are served from the per-game parquet cache
+"""
+
+import threading
+import time
+
+import pandas as pd
+
+from cbb_data.fetchers import fiba_html_common as fiba
+
+
+class FakeScraper:
+    """Per-game scraper stub that tracks concurrent calls"""
+
+    def __init__(self, delay: float = 0.02):
+        self.delay = delay
+        self.calls: list[str] = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, league_code: str, game_id: str, **kwargs) -> pd.DataFrame:
+        with self._lock:
+            self.calls.append(game_id)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+
+        if game_id.endswith("3"):
+            raise ConnectionError("boom")
+        if game_id.endswith("5"):
+            return pd.DataFrame()
+        return pd.DataFrame({"GAME_ID": [game_id], "SEASON": [kwargs.get("season")]})
+
+
+def test_scrape_games_concurrent_and_ordered() -> None:
+    scraper = FakeScraper()
+    game_ids = [1000 + n for n in range(20)]
+
+    games = fiba.scrape_fiba_games(scraper, "LKL", game_ids, max_workers=4, season="2023-24")
+
+    assert scraper.max_active > 1
+    assert sorted(scraper.calls) == [str(g) for g in game_ids]
+    assert [game_id for game_id, _ in games] == [g for g in game_ids if str(g)[-1] not in "35"]
+    assert all(df["SEASON"].iloc[0] == "2023-24" for _, df in games)
+
+
+def test_scrape_games_single_worker_and_empty() -> None:
+    scraper = FakeScraper(delay=0)
+    assert fiba.scrape_fiba_games(scraper, "LKL", []) == []
+
+    games = fiba.scrape_fiba_games(scraper, "LKL", ["11", "13"], max_workers=1)
+    assert [game_id for game_id, _ in games] == ["11"]
+    assert scraper.max_active == 1
+
+
+def test_per_host_limit(monkeypatch) -> None:
+    """No more than FIBA_MAX_CONNECTIONS_PER_HOST requests are in flight per host"""
+    active: dict[str, int] = {}
+    peak: dict[str, int] = {}
+    lock = threading.Lock()
+
+    class FakeTransport:
+        def get(self, url: str, source: str, timeout: float):
+            host = url.split("/")[2]
+            with lock:
+                active[host] = active.get(host, 0) + 1
+                peak[host] = max(peak.get(host, 0), active[host])
+            time.sleep(0.02)
+            with lock:
+                active[host] -= 1
+            return url
+
+    monkeypatch.setattr(fiba, "FIBA_MAX_CONNECTIONS_PER_HOST", 2)
+    monkeypatch.setattr(fiba, "_host_slots", {})
+    monkeypatch.setattr(fiba, "get_transport", FakeTransport)
+    monkeypatch.setattr(fiba.rate_limiter, "acquire", lambda source: True)
+
+    urls = [f"https://host{n % 2}.example/{n}" for n in range(16)]
+    threads = [threading.Thread(target=fiba._http_get, args=(url, 1)) for url in urls]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert peak == {"host0.example": 2, "host1.example": 2}
+
+
+def test_cached_scrapes_skip_network(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(fiba, "CACHE_DIR", tmp_path)
+    scraper = FakeScraper(delay=0)
+    cached = fiba.with_cache(lambda league_code, game_id, **kwargs: f"{league_code}_{game_id}_t")(
+        scraper
+    )
+
+    first = fiba.scrape_fiba_games(cached, "BCL", ["1", "2", "4"], max_workers=3)
+    second = fiba.scrape_fiba_games(cached, "BCL", ["1", "2", "4"], max_workers=3)
+
+    assert len(scraper.calls) == 3
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "BCL_1_t.parquet",
+        "BCL_2_t.parquet",
+        "BCL_4_t.parquet",
+    ]
+    for (_, a), (_, b) in zip(first, second, strict=True):
+        pd.testing.assert_frame_equal(a, b)
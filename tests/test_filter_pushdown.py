@@ -0,0 +1,187 @@
+"""
+Tests for post_mask -> DuckDB filter pushdown.
+
+Tests:
+    - compile_sql_filter + storage.load match apply_post_mask row-for-row
+    - Filters that can't be expressed exactly are left as residual
+    - fetch_with_duckdb_cache pushes filters, projection and limit on cache hits
+    - get_dataset(as_format="arrow"/"parquet") reads stored partitions without pandas
+    - Schedules read to derive other datasets ignore the request's columns/limit
+"""
+
+import os
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from cbb_data.filters.compiler import apply_post_mask, compile_sql_filter
+from cbb_data.filters.spec import DateSpan
+
+pytest.importorskip("duckdb")
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    from cbb_data.storage import duckdb_storage
+
+    instance = duckdb_storage.DuckDBStorage(str(tmp_path / "test.duckdb"))
+    monkeypatch.setattr(duckdb_storage, "_storage_instance", instance)
+    yield instance
+    instance.close()
+
+
+@pytest.fixture
+def player_games() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "GAME_ID": ["g1", "g1", "g2", "g2", "g3", "g3"],
+            "GAME_DATE": pd.to_datetime(
+                ["2024-11-04", "2024-11-04", "2024-11-08", "2024-11-08", "2024-12-01", None]
+            ),
+            "PLAYER_ID": [1, 2, 1, 3, 2, 3],
+            "PLAYER_NAME": ["Cooper Flagg", "Kon Knueppel", "Cooper Flagg", "RJ Davis", None, "x"],
+            "TEAM_NAME": ["Duke", "Duke", "Duke", "UNC", "Duke", "UNC"],
+            "MIN": [32.0, 18.5, 35.0, 9.0, None, 40.0],
+            "PERIOD": [1, 2, 3, 4, 1, 2],
+            "HOME_AWAY": ["Home", "Away", "Home", "Home", "Away", "Away"],
+            "VENUE": ["Cameron Indoor", "Dean Dome", None, "Dean Dome", "Cameron Indoor", "x"],
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "post_mask",
+    [
+        {"PLAYER_ID": [1, 3]},
+        {"GAME_ID": ["g2", "g3"], "HOME_AWAY": "Home"},
+        {"DATE_RANGE": DateSpan(start=date(2024, 11, 5), end=date(2024, 12, 31))},
+        {"MIN_MINUTES": 18.5, "QUARTER": [1, 2]},
+        {"PLAYER_NAME": ["flagg", "davis"], "VENUE": "dome"},
+        {"TEAM_NAME": ["duke"], "ONLY_COMPLETE": True},
+        {"PLAYER_ID": None, "TEAM_NAME": None, "MIN_MINUTES": None},
+    ],
+)
+def test_pushdown_matches_post_mask(storage, player_games, post_mask) -> None:
+    """Rows read with the compiled predicate equal apply_post_mask on the full table"""
+    storage.save(player_games, "player_game", "NCAA-MBB", "2025")
+    schema = storage.get_schema("player_game", "NCAA-MBB", ["2025"])
+
+    pushdown = compile_sql_filter(post_mask, schema)
+    assert pushdown.exact
+
+    pushed = storage.load(
+        "player_game", "NCAA-MBB", "2025", filter_sql=pushdown.where, params=pushdown.params
+    )
+    expected = apply_post_mask(storage.load("player_game", "NCAA-MBB", "2025"), post_mask)
+    pd.testing.assert_frame_equal(pushed, expected.reset_index(drop=True))
+
+
+def test_inexact_filters_are_residual() -> None:
+    """Type mismatches, string dates and regex names stay in pandas"""
+    schema = {"GAME_ID": "BIGINT", "GAME_DATE": "VARCHAR", "PLAYER_NAME": "VARCHAR"}
+    pushdown = compile_sql_filter(
+        {
+            "GAME_ID": ["401"],
+            "DATE_RANGE": DateSpan(start=date(2024, 11, 1)),
+            "PLAYER_NAME": ["O'Neal.*"],
+            "TEAM_ID": [5],  # column not stored -> skipped, like apply_post_mask
+        },
+        schema,
+    )
+    assert pushdown.where is None
+    assert pushdown.residual == ["GAME_ID", "DATE_RANGE", "PLAYER_NAME"]
+    assert not pushdown.exact
+
+
+def test_fetch_with_duckdb_cache_pushdown(storage, player_games) -> None:
+    """Cache hits read only matching rows and requested columns"""
+    from cbb_data.api.datasets import fetch_with_duckdb_cache
+    from cbb_data.storage.freshness import clear_freshness_policies, set_freshness_policy
+
+    set_freshness_policy("player_game", max_age_seconds=None)
+    try:
+        storage.save(player_games, "player_game", "NCAA-MBB", "2025")
+
+        def fail() -> pd.DataFrame:
+            raise AssertionError("cache hit expected")
+
+        df = fetch_with_duckdb_cache(
+            "player_game",
+            "NCAA-MBB",
+            "2025",
+            fetcher_func=fail,
+            post_mask={"TEAM_NAME": ["Duke"], "MIN_MINUTES": 10},
+            columns=["PLAYER_NAME", "MIN"],
+            limit=1,
+        )
+        assert df.to_dict("records") == [{"PLAYER_NAME": "Cooper Flagg", "MIN": 32.0}]
+
+        # No matches is a valid (empty) cache hit, not a refetch
+        empty = fetch_with_duckdb_cache(
+            "player_game", "NCAA-MBB", "2025", fetcher_func=fail, post_mask={"PLAYER_ID": [99]}
+        )
+        assert empty.empty
+    finally:
+        clear_freshness_policies()
+
+
+def test_get_dataset_arrow_reads_storage_directly(storage, monkeypatch) -> None:
+    """Stored partitions come back as Arrow straight from DuckDB, filters pushed down"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    from cbb_data.api.datasets import get_dataset
+    from cbb_data.storage.freshness import clear_freshness_policies, set_freshness_policy
+
+    schedule = pd.DataFrame(
+        {"GAME_CODE": [1, 2, 3], "HOME_TEAM": ["Real Madrid", "Olympiacos", "Monaco"]}
+    )
+    set_freshness_policy("schedule", max_age_seconds=None)
+    try:
+        storage.save(schedule, "schedule", "EuroLeague", "2024")
+
+        def no_pandas(*args, **kwargs) -> pd.DataFrame:
+            raise AssertionError("pandas load used")
+
+        monkeypatch.setattr(storage, "load", no_pandas)
+        filters = {"league": "EuroLeague", "season": "2024"}
+        table = get_dataset("schedule", filters, columns=["HOME_TEAM"], limit=2, as_format="arrow")
+        parquet = get_dataset("schedule", filters, as_format="parquet")
+    finally:
+        clear_freshness_policies()
+
+    assert isinstance(table, pa.Table)
+    assert table.to_pydict() == {"HOME_TEAM": ["Real Madrid", "Olympiacos"]}
+    assert parquet["rows"] == 3
+    assert pq.read_table(parquet["path"]).column("GAME_CODE").to_pylist() == [1, 2, 3]
+    os.remove(parquet["path"])
+
+
+def test_derived_schedule_ignores_output_pushdown(storage, monkeypatch) -> None:
+    """player_season reads every stored game, not the request's limit/columns"""
+    from cbb_data.api import datasets
+    from cbb_data.storage.freshness import clear_freshness_policies, set_freshness_policy
+
+    schedule = pd.DataFrame({"GAME_CODE": [1, 2, 3], "HOME_TEAM": ["A", "B", "C"]})
+    seen: list[list[str]] = []
+
+    def player_game(compiled: dict) -> pd.DataFrame:
+        seen.append(compiled["post_mask"]["GAME_CODE"])
+        return pd.DataFrame()
+
+    monkeypatch.setattr(datasets, "get_league_source_config", lambda league: None)
+    monkeypatch.setattr(datasets, "_fetch_player_game", player_game)
+    set_freshness_policy("schedule", max_age_seconds=None)
+    try:
+        storage.save(schedule, "schedule", "EuroLeague", "2024")
+        compiled = {
+            "params": {"Season": "E2024"},
+            "post_mask": {},
+            "meta": {"league": "EuroLeague", "limit": 1, "columns": ["PTS"], "arrow": True},
+        }
+        datasets._fetch_player_season(compiled)
+    finally:
+        clear_freshness_policies()
+
+    assert seen == [["1", "2", "3"]]
@@ -0,0 +1,149 @@
+"""
+Tests for the shared HTTP transport (utils/http_transport.py).
+
+Tests:
+    - Unchanged pages come back as 304 and are served from the validator store
+    - Last-Modified validators and changed pages
+    - fetch_parsed reuses the parsed result on 304
+    - Sequential requests reuse one keep-alive connection
+    - Per-source counters (requests, errors, 304s, bytes)
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from cbb_data.utils.http_transport import HttpTransport, ValidatorStore
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802
+        server = self.server
+        server.requests.append((self.path, dict(self.headers), self.client_address[1]))
+        if self.path.startswith("/missing"):
+            return self._send(404, b"nope", {})
+
+        body = server.pages.get(self.path, b"")
+        version = server.versions.get(self.path, "v1")
+        if self.path.startswith("/modified"):
+            validator = {"Last-Modified": f"Wed, 01 Jan 2025 00:00:0{version[-1]} GMT"}
+            matched = self.headers.get("If-Modified-Since") == validator["Last-Modified"]
+        else:
+            validator = {"ETag": f'"{version}"'}
+            matched = self.headers.get("If-None-Match") == validator["ETag"]
+
+        if matched:
+            return self._send(304, b"", validator)
+        return self._send(200, body, {"Content-Type": "text/html; charset=utf-8", **validator})
+
+    def _send(self, status: int, body: bytes, headers: dict) -> None:
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.requests = []
+    httpd.pages = {"/page": "<p>résumé</p>".encode(), "/modified": b"last-modified body"}
+    httpd.versions = {}
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def transport(tmp_path):
+    t = HttpTransport(conditional=True, store=ValidatorStore(tmp_path))
+    yield t
+    t.close()
+
+
+def _url(server, path: str) -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+def test_etag_not_modified(server, transport) -> None:
+    first = transport.get(_url(server, "/page"), source="test")
+    second = transport.get(_url(server, "/page"), source="test")
+
+    assert first.status_code == second.status_code == 200
+    assert not first.not_modified and second.not_modified
+    assert second.text == first.text == "<p>résumé</p>"
+    assert server.requests[1][1].get("If-None-Match") == '"v1"'
+
+    stats = transport.stats()["test"]
+    assert stats["requests"] == 2 and stats["not_modified"] == 1
+    assert stats["bytes_saved"] == len(first.content)
+
+
+def test_changed_page_and_last_modified(server, transport) -> None:
+    url = _url(server, "/modified")
+    transport.get(url)
+    assert transport.get(url).not_modified
+    assert server.requests[1][1].get("If-Modified-Since") == "Wed, 01 Jan 2025 00:00:01 GMT"
+
+    server.versions["/modified"] = "v2"
+    server.pages["/modified"] = b"new body"
+    changed = transport.get(url)
+    assert not changed.not_modified and changed.content == b"new body"
+    assert transport.get(url).content == b"new body"
+
+
+def test_fetch_parsed_skips_reparse(server, transport) -> None:
+    calls = []
+
+    def parse(response: requests.Response) -> list:
+        calls.append(response.not_modified)
+        return [response.text]
+
+    url = _url(server, "/page")
+    first = transport.fetch_parsed(url, parse, clone=list)
+    first.append("mutated")
+    second = transport.fetch_parsed(url, parse, clone=list)
+
+    assert calls == [False]
+    assert second == ["<p>résumé</p>"]
+
+    server.versions["/page"] = "v2"
+    transport.fetch_parsed(url, parse)
+    assert calls == [False, False]
+
+
+def test_keep_alive_and_unconditional(server, transport) -> None:
+    for _ in range(3):
+        transport.get(_url(server, "/page"), conditional=False)
+
+    assert len({port for _, _, port in server.requests}) == 1
+    assert all("If-None-Match" not in headers for _, headers, _ in server.requests)
+    assert "gzip" in server.requests[0][1].get("Accept-Encoding", "")
+
+
+def test_error_counters(server, transport) -> None:
+    response = transport.get(_url(server, "/missing"), source="bad")
+    assert response.status_code == 404
+    with pytest.raises(requests.HTTPError):
+        response.raise_for_status()
+
+    with pytest.raises(requests.ConnectionError):
+        transport.get("http://127.0.0.1:9/", source="bad", timeout=1)
+
+    stats = transport.stats()["bad"]
+    assert stats["requests"] == 2 and stats["errors"] == 2
+    assert list(transport.store.directory.iterdir()) == []
+
+    transport.reset_stats()
+    assert transport.stats() == {}
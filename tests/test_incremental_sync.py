@@ -0,0 +1,191 @@
+"""
+Tests for watermark-based incremental season syncs (storage/incremental.py).
+
+Tests:
+    - First sync ingests completed games; the next one fetches only new games
+    - Games completed since the last sync are refetched and merged in place
+    - Games the fetcher returns nothing for stay pending and are retried
+    - Schedule syncs re-read incomplete games; since date comes from the watermark
+    - merge_games evolves the schema and keeps other partitions intact
+"""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("duckdb")
+
+from cbb_data.storage.incremental import completed_games, sync_season  # noqa: E402
+
+TODAY = date(2025, 1, 20)
+
+
+@pytest.fixture
+def storage(tmp_path):
+    from cbb_data.storage.duckdb_storage import DuckDBStorage
+
+    instance = DuckDBStorage(str(tmp_path / "test.duckdb"))
+    yield instance
+    instance.close()
+
+
+def _schedule(games: list[tuple[str, str, int | None]]) -> pd.DataFrame:
+    """(GAME_ID, GAME_DATE, total score or None if unplayed)"""
+    return pd.DataFrame(
+        {
+            "GAME_ID": [g for g, _, _ in games],
+            "GAME_DATE": pd.to_datetime([d for _, d, _ in games]),
+            "HOME_SCORE": [None if s is None else s // 2 for _, _, s in games],
+            "AWAY_SCORE": [None if s is None else s - s // 2 for _, _, s in games],
+        }
+    )
+
+
+class FakeBoxScores:
+    """Two player rows per game; records which games were requested"""
+
+    def __init__(self, missing: set[str] | None = None):
+        self.missing = missing or set()
+        self.calls: list[list[str]] = []
+
+    def __call__(self, game_ids: list[str]) -> pd.DataFrame:
+        self.calls.append(list(game_ids))
+        rows = [
+            {"GAME_ID": gid, "PLAYER_ID": f"p{n}", "PTS": 10 + n}
+            for gid in game_ids
+            if gid not in self.missing
+            for n in range(2)
+        ]
+        return pd.DataFrame(rows)
+
+
+def test_second_sync_fetches_only_new_games(storage) -> None:
+    """The watermark limits the second sync to games added since the first"""
+    schedule = _schedule(
+        [("1", "2025-01-10", 150), ("2", "2025-01-12", 160), ("3", "2025-01-25", None)]
+    )
+    fetch = FakeBoxScores()
+
+    first = sync_season(
+        "player_game", "LKL", "2024-25", lambda since: schedule, fetch, storage, today=TODAY
+    )
+    assert first.new_games == ["1", "2"] and first.rows_written == 4 and first.since is None
+    assert fetch.calls == [["1", "2"]]
+
+    schedule = pd.concat([schedule, _schedule([("4", "2025-01-14", 140)])], ignore_index=True)
+    second = sync_season(
+        "player_game", "LKL", "2024-25", lambda since: schedule, fetch, storage, today=TODAY
+    )
+    assert fetch.calls[-1] == ["4"]
+    assert second.new_games == ["4"] and second.updated_games == []
+    assert second.since == date(2025, 1, 9)  # latest ingested date minus 3 lookback days
+
+    stored = storage.load("player_game", "LKL", "2024-25")
+    assert sorted(stored["GAME_ID"].unique()) == ["1", "2", "4"]
+    assert len(stored) == 6
+
+    third = sync_season(
+        "player_game", "LKL", "2024-25", lambda since: schedule, fetch, storage, today=TODAY
+    )
+    assert third.games_fetched == 0 and len(fetch.calls) == 2
+
+
+def test_pending_games_are_retried(storage) -> None:
+    """A completed game without data stays out of the watermark until it has rows"""
+    schedule = _schedule([("1", "2025-01-10", 150), ("2", "2025-01-12", 160)])
+    fetch = FakeBoxScores(missing={"2"})
+
+    result = sync_season(
+        "player_game", "LKL", "2024-25", lambda since: schedule, fetch, storage, today=TODAY
+    )
+    assert result.new_games == ["1"] and result.pending_games == ["2"]
+    assert storage.get_watermark("player_game", "LKL", "2024-25")["GAME_ID"].tolist() == ["1"]
+
+    fetch.missing.clear()
+    retry = sync_season(
+        "player_game", "LKL", "2024-25", lambda since: schedule, fetch, storage, today=TODAY
+    )
+    assert fetch.calls[-1] == ["2"] and retry.new_games == ["2"]
+    assert len(storage.load("player_game", "LKL", "2024-25")) == 4
+
+
+def test_schedule_sync_updates_incomplete_games(storage) -> None:
+    """Schedule rows of unfinished games are re-read and replaced once final"""
+    before = pd.DataFrame(
+        {
+            "GAME_ID": ["1", "2"],
+            "GAME_DATE": pd.to_datetime(["2025-01-10", "2025-01-21"]),
+            "STATUS": ["Final", "Scheduled"],
+        }
+    )
+    seen_since = []
+
+    def schedule_fn(since):
+        seen_since.append(since)
+        return current
+
+    current = before
+    sync_season("schedule", "ESPN", "2025", schedule_fn, storage=storage, today=TODAY)
+    watermark = storage.get_watermark("schedule", "ESPN", "2025")
+    assert watermark["COMPLETED"].tolist() == [True, False]
+
+    current = before.assign(STATUS=["Final", "Final/OT"])
+    result = sync_season("schedule", "ESPN", "2025", schedule_fn, storage=storage, today=TODAY)
+    assert result.updated_games == ["2"] and result.new_games == []
+    assert seen_since == [None, date(2025, 1, 18)]  # earliest incomplete game minus lookback
+
+    stored = storage.load("schedule", "ESPN", "2025").sort_values("GAME_ID")
+    assert stored["STATUS"].tolist() == ["Final", "Final/OT"]
+
+
+def test_full_sync_replaces_partition(storage) -> None:
+    """full=True ignores the watermark and rewrites the partition"""
+    schedule = _schedule([("1", "2025-01-10", 150)])
+    fetch = FakeBoxScores()
+    sync_season("player_game", "LKL", "2024-25", lambda s: schedule, fetch, storage, today=TODAY)
+    storage.save(pd.DataFrame({"GAME_ID": ["x"], "PTS": [1]}), "player_game", "LKL", "2024-25")
+
+    result = sync_season(
+        "player_game", "LKL", "2024-25", lambda s: schedule, fetch, storage, full=True, today=TODAY
+    )
+    assert result.full and fetch.calls[-1] == ["1"]
+    assert storage.load("player_game", "LKL", "2024-25")["GAME_ID"].tolist() == ["1", "1"]
+
+
+def test_merge_games_evolves_schema(storage) -> None:
+    """Merged games may add columns and widen types; other partitions are untouched"""
+    storage.save(pd.DataFrame({"GAME_ID": [1, 2], "PTS": [10, 20]}), "team_game", "NBL", "2024")
+    storage.save(pd.DataFrame({"GAME_ID": [9], "PTS": [5]}), "team_game", "NBL", "2023")
+
+    storage.merge_games(
+        pd.DataFrame({"GAME_ID": [2, 3], "PTS": [21.5, 30.0], "AST": [4, 5]}),
+        "team_game",
+        "NBL",
+        "2024",
+    )
+    merged = storage.load("team_game", "NBL", "2024")
+    assert merged["GAME_ID"].tolist() == [1, 2, 3]
+    assert merged["PTS"].tolist() == [10.0, 21.5, 30.0]
+    assert merged["AST"].isna().tolist() == [True, False, False]
+    assert storage.load("team_game", "NBL", "2023")["PTS"].tolist() == [5]
+
+
+def test_completed_games_sources() -> None:
+    """Status beats scores, scores beat dates"""
+    schedule = pd.DataFrame(
+        {
+            "GAME_DATE": ["2025-01-01", "2025-01-01", "2025-02-01", "2025-01-01"],
+            "HOME_SCORE": [80, None, None, 0],
+            "AWAY_SCORE": [70, None, None, 0],
+            "STATUS": [None, "", "STATUS_FINAL", "Postponed"],
+        }
+    )
+    assert completed_games(schedule, TODAY).tolist() == [True, True, True, False]
+
+
+def test_completed_games_ignores_negated_statuses() -> None:
+    """Negated statuses like "Not played" are pending; a bare "Played" is done"""
+    statuses = ["Not played", "To be played", "Not finished", "Played", "Final", "Incomplete"]
+    schedule = pd.DataFrame({"STATUS": statuses})
+    assert completed_games(schedule, TODAY).tolist() == [False, False, False, True, True, False]
@@ -0,0 +1,74 @@
+"""
+Tests for lazy fetcher imports.
+
+Tests:
+    - import cbb_data / get_dataset load no fetcher modules or their dependencies
+    - LeagueSourceConfig holds lazy references that import on first call
+    - fetchers package exposes submodules on attribute access
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+
+def _loaded_modules(code: str) -> list[str]:
+    """Run code in a fresh interpreter and return the cbb_data/third-party modules loaded"""
+    script = f"{code}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))\n"
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={"PYTHONPATH": str(SRC), "PATH": ""},
+    )
+    modules: list[str] = json.loads(result.stdout.strip().splitlines()[-1])
+    return modules
+
+
+def test_import_cbb_data_is_lazy() -> None:
+    """Importing the package loads neither the dataset API nor any fetcher"""
+    modules = _loaded_modules("import cbb_data")
+    assert "cbb_data.api.datasets" not in modules
+    assert "pandas" not in modules
+
+
+def test_get_dataset_does_not_import_fetchers() -> None:
+    """Building the dataset API and league registry imports no fetcher module"""
+    modules = _loaded_modules(
+        "from cbb_data import get_dataset\n"
+        "from cbb_data.catalog.sources import get_league_source_config\n"
+        "cfg = get_league_source_config('LKL')\n"
+        "assert cfg is not None and cfg.fetch_schedule is not None"
+    )
+    fetcher_modules = [m for m in modules if m.startswith("cbb_data.fetchers.")]
+    assert fetcher_modules == []
+    for heavy in ("bs4", "euroleague_api", "sportsdataverse", "cbbpy", "rpy2", "redis"):
+        assert heavy not in modules
+
+
+def test_lazy_fetcher_resolves_on_call() -> None:
+    """LazyFetcher imports its module on first use"""
+    from cbb_data.utils.lazy_import import LazyFetcher, LazyModule
+
+    ref = LazyFetcher("json", "dumps")
+    assert not ref.loaded
+    assert ref({"a": 1}) == '{"a": 1}'
+    assert ref.loaded
+
+    module = LazyModule("json")
+    assert module.loads("[1]") == [1]
+
+
+def test_fetchers_package_attribute_access() -> None:
+    """fetchers.<name> imports the submodule; unknown names raise AttributeError"""
+    from cbb_data import fetchers
+
+    assert fetchers.DataUnavailableError.__name__ == "DataUnavailableError"
+    with pytest.raises(AttributeError):
+        fetchers.not_a_fetcher  # noqa: B018
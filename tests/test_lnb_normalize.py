@@ -0,0 +1,196 @@
+"""
+Tests for the season-level LNB normalized table builder (lnb/normalize.py).
+
+Tests:
+    - Player stats from PBP events and shots, column order and first-appearance order
+    - Team totals with opponent points and result
+    - Shot zones, distances and clock parsing
+    - Partitions whose GAME_ID doesn't match the file name are dropped
+    - transform_season writes one file per table, removes per-game files and skips
+      seasons whose raw data hasn't changed
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+from cbb_data.lnb.normalize import (
+    PLAYER_GAME_COLUMNS,
+    SHOT_EVENT_COLUMNS,
+    build_player_game,
+    build_shot_events,
+    build_team_game,
+    parse_clock_seconds,
+    read_season_partitions,
+    transform_season,
+)
+
+SEASON = "2024-2025"
+G1 = "11111111-aaaa-0000-0000-000000000001"
+G2 = "22222222-bbbb-0000-0000-000000000002"
+
+
+def _pbp(game_id: str) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "GAME_ID": game_id,
+            "PLAYER_ID": ["p1", "p2", "p1", "p3", "p3", "p2", None],
+            "PLAYER_NAME": ["One", "Two", "One", "Three", "Three", "Two", None],
+            "TEAM_ID": ["A", "A", "A", "B", "B", "A", None],
+            "EVENT_TYPE": [
+                "assist",
+                "rebound",
+                "freeThrow",
+                "freeThrow",
+                "steal",
+                "foul",
+                "jumpBall",
+            ],
+            "SUCCESS": [None, None, True, False, None, None, None],
+        }
+    )
+
+
+def _shots(game_id: str) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "GAME_ID": game_id,
+            "EVENT_ID": [1, 2, 3, 4],
+            "PLAYER_ID": ["p2", "p3", "p4", "p2"],
+            "PLAYER_NAME": ["Two", "Three", "Four", "Two"],
+            "TEAM_ID": ["A", "B", "B", "A"],
+            "PERIOD_ID": [1, 1, 2, 4],
+            "CLOCK": ["PT9M59.5S", "PT45S", "PT1M", None],
+            "SHOT_TYPE": ["3pt", "2pt", "2pt", "3pt"],
+            "SHOT_SUBTYPE": ["jumpshot", "layup", "jumpshot", "jumpshot"],
+            "SUCCESS": [True, True, False, True],
+            "X_COORD": [20.0, 5.0, 30.0, None],
+            "Y_COORD": [10.0, 50.0, 50.0, None],
+        }
+    )
+
+
+def _write_raw(raw_dir, kind: str, df: pd.DataFrame, file_game_id: str) -> None:
+    season_dir = raw_dir / kind / f"season={SEASON}"
+    season_dir.mkdir(parents=True, exist_ok=True)
+    df.to_parquet(season_dir / f"game_id={file_game_id}.parquet", index=False)
+
+
+def test_player_game_stats() -> None:
+    """Counting stats come from PBP, field goals from shots; FT counted for every player"""
+    df = build_player_game(_pbp(G1), _shots(G1), SEASON, {G1: "LNB_ELITE2"})
+
+    assert list(df.columns) == PLAYER_GAME_COLUMNS
+    assert df["PLAYER_ID"].tolist() == ["p1", "p2", "p3", "p4"]
+    stats = df.set_index("PLAYER_ID")
+    assert stats.loc["p1", ["AST", "FTM", "FTA", "PTS", "FT_PCT"]].tolist() == [1, 1, 1, 1, 1.0]
+    assert stats.loc["p2", ["FG3M", "FG3A", "FGA", "PTS", "REB", "PF"]].tolist() == [
+        2,
+        2,
+        2,
+        6,
+        1,
+        1,
+    ]
+    assert stats.loc["p3", ["FTA", "FTM", "FG2M", "STL", "PTS"]].tolist() == [1, 0, 1, 1, 2]
+    assert stats.loc["p4", ["FGA", "FGM", "FG_PCT", "TEAM_ID"]].tolist() == [1, 0, 0.0, "B"]
+    assert set(df["LEAGUE"]) == {"LNB_ELITE2"} and set(df["SEASON"]) == {SEASON}
+    assert df[["MIN", "PLUS_MINUS"]].isna().all().all()
+
+
+def test_games_without_shots_are_skipped() -> None:
+    pbp = pd.concat([_pbp(G1), _pbp(G2)], ignore_index=True)
+    df = build_player_game(pbp, _shots(G2), SEASON)
+    assert set(df["GAME_ID"]) == {G2}
+    assert set(df["LEAGUE"]) == {"LNB_PROA"}
+
+
+def test_team_game_opponents() -> None:
+    """Each team row carries the other team's points and the result"""
+    player_game = build_player_game(
+        pd.concat([_pbp(G1), _pbp(G2)], ignore_index=True),
+        pd.concat([_shots(G1), _shots(G2)], ignore_index=True),
+        SEASON,
+    )
+    team = build_team_game(player_game)
+
+    assert team[["GAME_ID", "TEAM_ID"]].values.tolist() == [
+        [G1, "A"],
+        [G1, "B"],
+        [G2, "A"],
+        [G2, "B"],
+    ]
+    assert team["PTS"].tolist() == [7, 2, 7, 2]
+    assert team["OPP_ID"].tolist() == ["B", "A", "B", "A"]
+    assert team["OPP_PTS"].tolist() == [2, 7, 2, 7]
+    assert team["WIN"].tolist() == [1, 0, 1, 0]
+
+
+def test_shot_events() -> None:
+    df = build_shot_events(_shots(G1), SEASON)
+
+    assert list(df.columns) == SHOT_EVENT_COLUMNS
+    assert df["SHOT_ZONE"].tolist() == [
+        "Three-Point (Corner)",
+        "Paint",
+        "Mid-Range",
+        "Unknown",
+    ]
+    assert df["SHOT_DISTANCE"].iloc[1] == pytest.approx(0.8)
+    assert df["SHOT_DISTANCE"].isna().tolist() == [False, False, False, True]
+    assert df["POINTS"].tolist() == [3, 2, 0, 3]
+    assert df["CLOCK_SECONDS"].tolist() == [599.5, 45.0, 60.0, 0.0]
+
+
+def test_parse_clock_seconds_invalid() -> None:
+    clock = pd.Series(["PT10M", "garbage", None, "PT0.3S"])
+    assert parse_clock_seconds(clock).tolist() == [600.0, 0.0, 0.0, 0.3]
+
+
+def test_read_partitions_drops_mismatched_files(tmp_path) -> None:
+    """A file holding another game's rows is skipped instead of duplicating that game"""
+    _write_raw(tmp_path, "pbp", _pbp(G1), G1)
+    _write_raw(tmp_path, "pbp", _pbp(G1), G2)  # corrupted partition
+    pbp_g2 = _pbp(G2).assign(SUCCESS=None)  # all-null column in one file
+    _write_raw(tmp_path, "pbp", pbp_g2, "33333333-cccc-0000-0000-000000000003")
+
+    df = read_season_partitions("pbp", SEASON, tmp_path)
+    assert df["GAME_ID"].unique().tolist() == [G1]
+    assert len(df) == 7
+    assert read_season_partitions("pbp", "1999-2000", tmp_path).empty
+
+
+def test_transform_season_writes_and_skips(tmp_path) -> None:
+    raw_dir, out_dir = tmp_path / "raw", tmp_path / "normalized"
+    for game_id in (G1, G2):
+        _write_raw(raw_dir, "pbp", _pbp(game_id), game_id)
+        _write_raw(raw_dir, "shots", _shots(game_id), game_id)
+
+    stale = out_dir / "player_game" / f"season={SEASON}" / f"game_id={G1}.parquet"
+    stale.parent.mkdir(parents=True)
+    _pbp(G1).to_parquet(stale)
+
+    kwargs = {"raw_dir": raw_dir, "out_dir": out_dir, "historical_dir": tmp_path / "none"}
+    stats = transform_season(SEASON, **kwargs)
+    assert stats == {
+        "season": SEASON,
+        "skipped": False,
+        "games": 2,
+        "player_game": 8,
+        "team_game": 4,
+        "shot_events": 8,
+    }
+    assert not stale.exists()
+    for table in ("player_game", "team_game", "shot_events"):
+        files = list((out_dir / table / f"season={SEASON}").glob("*.parquet"))
+        assert [f.name for f in files] == ["data.parquet"]
+
+    assert transform_season(SEASON, **kwargs)["skipped"]
+
+    # New raw data triggers a rebuild; force always rebuilds
+    newer = raw_dir / "shots" / f"season={SEASON}" / f"game_id={G2}.parquet"
+    future = newer.stat().st_mtime + 10
+    os.utime(newer, (future, future))
+    assert not transform_season(SEASON, **kwargs)["skipped"]
+    assert not transform_season(SEASON, force=True, **kwargs)["skipped"]
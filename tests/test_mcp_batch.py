@@ -0,0 +1,129 @@
+"""
+Tests for parallel batch execution (servers/mcp_batch.py).
+
+Tests:
+    - Requests run concurrently up to max_concurrent; results keep request order
+    - Identical sub-requests run once; invalid ones fail without running anything
+    - A hanging request times out without holding up the others
+    - Tools backed by the same cached fetch share one upstream call
+"""
+
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from cbb_data.fetchers.base import Cache, cached_dataframe, get_cache, set_cache
+from cbb_data.servers import mcp_batch
+from cbb_data.servers.mcp_batch import batch_query, batch_query_safe
+
+
+class SlowTool:
+    """Echo tool that sleeps and tracks concurrency"""
+
+    def __init__(self, delay: float = 0.2):
+        self.delay = delay
+        self.calls: list[dict] = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, **kwargs) -> dict:
+        with self._lock:
+            self.calls.append(kwargs)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(kwargs.get("delay", self.delay))
+            return {"echo": kwargs.get("n")}
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+@pytest.fixture
+def slow(monkeypatch) -> SlowTool:
+    tool = SlowTool()
+    monkeypatch.setitem(mcp_batch.TOOL_DISPATCH, "slow", tool)
+    return tool
+
+
+def test_parallel_and_ordered(slow) -> None:
+    """Five 0.2s calls take about one call's time with max_concurrent=5"""
+    requests = [{"tool": "slow", "args": {"n": n, "delay": 0.2 - n * 0.03}} for n in range(5)]
+
+    summary = batch_query_safe(requests, max_concurrent=5)
+    assert [r["result"]["echo"] for r in summary["results"]] == [0, 1, 2, 3, 4]
+    assert slow.max_active == 5
+    assert summary["summary"]["wall_duration_ms"] < 400 < summary["summary"]["total_duration_ms"]
+
+    slow.max_active = 0
+    batch_query(requests, max_concurrent=2)
+    assert slow.max_active == 2
+
+
+def test_duplicates_run_once(slow) -> None:
+    """Identical requests share a result; bad requests fail alone"""
+    results = batch_query(
+        [
+            {"tool": "slow", "args": {"n": 1, "delay": 0}},
+            {"tool": "missing", "args": {}},
+            {"tool": "slow", "args": {"delay": 0, "n": 1}},
+            {"tool": "slow"},
+        ]
+    )
+    assert len(slow.calls) == 1
+    assert results[0]["ok"] and results[2]["result"] == results[0]["result"]
+    assert results[2]["deduplicated"] and "deduplicated" not in results[0]
+    assert results[1]["error_type"] == "KeyError" and results[1]["tool"] == "missing"
+    assert "missing 'args'" in results[3]["error"]
+
+
+def test_timeout_does_not_block_batch(slow) -> None:
+    """A hanging request is reported as timed out; the rest succeed"""
+    start = time.perf_counter()
+    results = batch_query(
+        [
+            {"tool": "slow", "args": {"n": 0, "delay": 2.0}},
+            {"tool": "slow", "args": {"n": 1, "delay": 0.05}},
+        ],
+        timeout=0.3,
+    )
+    assert time.perf_counter() - start < 1.0
+    assert results[0]["error_type"] == "TimeoutError" and not results[0]["ok"]
+    assert results[1]["ok"] and results[1]["result"] == {"echo": 1}
+
+
+def test_tools_share_underlying_fetch(monkeypatch) -> None:
+    """Two tools reading the same cached dataset trigger one upstream fetch"""
+    previous = get_cache()
+    set_cache(Cache(ttl_seconds=60, redis_enabled=False, sweep_interval_seconds=0))
+    upstream: list[str] = []
+
+    @cached_dataframe
+    def fetch_season_games(league: str, season: str) -> pd.DataFrame:
+        upstream.append(league)
+        time.sleep(0.2)
+        return pd.DataFrame({"GAME_ID": ["1", "2"], "TEAM": ["A", "B"]})
+
+    monkeypatch.setitem(
+        mcp_batch.TOOL_DISPATCH,
+        "schedule_like",
+        lambda **kw: {"games": len(fetch_season_games(**kw))},
+    )
+    monkeypatch.setitem(
+        mcp_batch.TOOL_DISPATCH,
+        "team_game_like",
+        lambda **kw: {"teams": fetch_season_games(**kw)["TEAM"].nunique()},
+    )
+    try:
+        args = {"league": "LKL", "season": "2024-25"}
+        results = batch_query(
+            [{"tool": "schedule_like", "args": args}, {"tool": "team_game_like", "args": args}]
+        )
+    finally:
+        set_cache(previous)
+
+    assert [r["result"] for r in results] == [{"games": 2}, {"teams": 2}]
+    assert upstream == ["LKL"]
@@ -0,0 +1,123 @@
+"""
+Tests for off-loop MCP tool execution (BasketballDataMCPServer.execute_tool).
+
+Tests:
+    - Slow tools run concurrently without blocking the event loop
+    - Per-tool max_concurrency limits one tool without delaying others
+    - Timeouts and handler errors come back as error payloads
+    - Cancelling a call that waits for a slot means it never runs
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from cbb_data.servers.mcp_server import BasketballDataMCPServer
+
+
+def _slow_tool(delay: float = 0.3, value: str = "ok") -> dict:
+    time.sleep(delay)
+    return {"success": True, "data": value}
+
+
+@pytest.fixture
+def server():
+    instance = BasketballDataMCPServer("test")
+    instance.tools_registry = {
+        "slow": {"name": "slow", "handler": _slow_tool},
+        "single": {"name": "single", "handler": _slow_tool, "max_concurrency": 1},
+        "quick": {"name": "quick", "handler": _slow_tool, "timeout": 0.1},
+        "broken": {"name": "broken", "handler": lambda: 1 / 0},
+    }
+    return instance
+
+
+def test_slow_tools_run_concurrently_off_loop(server) -> None:
+    """Three 0.3s calls finish together while the loop keeps ticking"""
+
+    async def scenario() -> tuple[list[str], float, int]:
+        ticks = 0
+
+        async def heartbeat() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.02)
+                ticks += 1
+
+        beat = asyncio.create_task(heartbeat())
+        start = time.perf_counter()
+        results = await asyncio.gather(*(server.execute_tool("slow", {}) for _ in range(3)))
+        elapsed = time.perf_counter() - start
+        beat.cancel()
+        return results, elapsed, ticks
+
+    results, elapsed, ticks = asyncio.run(scenario())
+    assert [json.loads(r)["data"] for r in results] == ["ok"] * 3
+    assert elapsed < 0.6
+    assert ticks >= 5
+
+
+def test_per_tool_limit_does_not_delay_other_tools(server) -> None:
+    """max_concurrency=1 serializes one tool; another tool runs alongside"""
+
+    async def scenario() -> dict[str, float]:
+        start = time.perf_counter()
+        done: dict[str, float] = {}
+
+        async def call(key: str, name: str) -> None:
+            await server.execute_tool(name, {"delay": 0.2})
+            done[key] = time.perf_counter() - start
+
+        await asyncio.gather(
+            call("single-1", "single"), call("single-2", "single"), call("slow", "slow")
+        )
+        return done
+
+    done = asyncio.run(scenario())
+    assert done["slow"] < 0.35
+    assert max(done["single-1"], done["single-2"]) >= 0.4
+
+
+def test_timeouts_and_errors_are_payloads(server) -> None:
+    """Timeouts, handler exceptions and unknown tools return success=False"""
+
+    async def scenario() -> list[dict]:
+        texts = [
+            await server.execute_tool("quick", {"delay": 0.5}),
+            await server.execute_tool("broken", {}),
+            await server.execute_tool("missing", {}),
+        ]
+        return [json.loads(text) for text in texts]
+
+    timed_out, broken, missing = asyncio.run(scenario())
+    assert timed_out["error_type"] == "TimeoutError" and not timed_out["success"]
+    assert broken["error_type"] == "ZeroDivisionError"
+    assert missing == {"success": False, "error": "Tool 'missing' not found"}
+
+
+def test_cancelled_waiting_call_never_runs(server) -> None:
+    """A call cancelled while waiting for its tool slot is dropped"""
+    ran: list[str] = []
+
+    def record(value: str) -> dict:
+        ran.append(value)
+        time.sleep(0.2)
+        return {"success": True}
+
+    server.tools_registry["single"]["handler"] = record
+
+    async def scenario() -> None:
+        first = asyncio.create_task(server.execute_tool("single", {"value": "first"}))
+        second = asyncio.create_task(server.execute_tool("single", {"value": "second"}))
+        await asyncio.sleep(0.05)
+        second.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await second
+        await first
+        # The slot is free again after the cancellation
+        await server.execute_tool("single", {"value": "third"})
+
+    asyncio.run(scenario())
+    assert ran == ["first", "third"]
@@ -0,0 +1,127 @@
+"""
+Tests for the bounded in-memory Cache tier (fetchers/base.py).
+
+Tests:
+    - LRU eviction by entry count
+    - Eviction by payload bytes
+    - Expired entry sweeping (manual + background thread)
+    - Hit/miss/eviction counters in Cache.stats()
+    - Memory cache gauges published for /metrics
+"""
+
+import time
+
+import pandas as pd
+
+
+def _frame(rows: int = 100) -> pd.DataFrame:
+    return pd.DataFrame({"PTS": range(rows)})
+
+
+def test_lru_eviction_by_entries() -> None:
+    """Least recently used entry is evicted once max_entries is exceeded"""
+    from cbb_data.fetchers.base import Cache
+
+    cache = Cache(redis_enabled=False, max_entries=2, sweep_interval_seconds=0)
+    cache.set(_frame(), "a")
+    cache.set(_frame(), "b")
+    assert cache.get("a") is not None  # "a" becomes most recently used
+    cache.set(_frame(), "c")
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.stats()["evictions"] == 1
+
+    print("[PASS] LRU eviction by entry count")
+
+
+def test_eviction_by_bytes() -> None:
+    """Memory tier stays under max_bytes and skips single oversized entries"""
+    from cbb_data.fetchers.base import Cache
+
+    probe = Cache(redis_enabled=False, sweep_interval_seconds=0)
+    probe.set(_frame(), "probe")
+    entry_bytes = probe.stats()["memory_bytes"]
+
+    cache = Cache(
+        redis_enabled=False, max_bytes=entry_bytes * 2, max_entries=0, sweep_interval_seconds=0
+    )
+    for i in range(5):
+        cache.set(_frame(), "k", i)
+
+    stats = cache.stats()
+    assert stats["memory_entries"] == 2
+    assert stats["memory_bytes"] <= entry_bytes * 2
+    assert stats["evictions"] == 3
+
+    cache.set(_frame(10_000), "huge")
+    assert cache.get("huge") is None
+
+    print("[PASS] Eviction by bytes")
+
+
+def test_sweep_removes_expired_entries() -> None:
+    """sweep() purges expired keys that are never read again"""
+    from cbb_data.fetchers.base import Cache
+
+    cache = Cache(ttl_seconds=0, redis_enabled=False, sweep_interval_seconds=0)
+    cache.set({"x": 1}, "old")
+    time.sleep(0.01)
+
+    assert cache.sweep() == 1
+    stats = cache.stats()
+    assert stats["memory_entries"] == 0
+    assert stats["memory_bytes"] == 0
+    assert stats["expirations"] == 1
+
+    print("[PASS] Sweep removes expired entries")
+
+
+def test_background_sweeper() -> None:
+    """Background thread purges expired entries without any reads"""
+    from cbb_data.fetchers.base import Cache
+
+    cache = Cache(ttl_seconds=0, redis_enabled=False, sweep_interval_seconds=0.05)
+    try:
+        cache.set({"x": 1}, "old")
+        deadline = time.time() + 2
+        while cache.stats()["memory_entries"] and time.time() < deadline:
+            time.sleep(0.05)
+        assert cache.stats()["memory_entries"] == 0
+    finally:
+        cache.close()
+
+    print("[PASS] Background sweeper")
+
+
+def test_stats_counters() -> None:
+    """Hits and misses are counted for every lookup"""
+    from cbb_data.fetchers.base import Cache
+
+    cache = Cache(redis_enabled=False, sweep_interval_seconds=0)
+    cache.set({"x": 1}, "key")
+    cache.get("key")
+    cache.get("key")
+    cache.get("missing")
+
+    stats = cache.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert abs(stats["hit_rate"] - 2 / 3) < 1e-9
+
+    print("[PASS] Stats counters")
+
+
+def test_memory_cache_metrics() -> None:
+    """update_memory_cache_stats publishes gauges without error"""
+    from cbb_data.fetchers.base import Cache
+    from cbb_data.servers.metrics import update_memory_cache_stats
+
+    cache = Cache(redis_enabled=False, sweep_interval_seconds=0)
+    cache.set({"x": 1}, "key")
+
+    stats = update_memory_cache_stats(cache.stats())
+    assert stats["memory_entries"] == 1
+
+    print("[PASS] Memory cache metrics")
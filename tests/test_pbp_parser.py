@@ -0,0 +1,180 @@
+"""
+Tests for the vectorized PBP-to-box-score parser (parsers/pbp_parser.py).
+
+Tests:
+    - Stats per play type, assists and first-appearance player order
+    - Team events, missing text/score and turnover variants
+    - Batch parsing equals per-game parsing
+    - parse_games_to_box_scores matches parse_game_to_box_score per game
+"""
+
+import numpy as np
+import pandas as pd
+
+from cbb_data.parsers.pbp_parser import (
+    BOX_SCORE_COLUMNS,
+    parse_game_to_box_score,
+    parse_games_to_box_scores,
+    parse_pbp_to_player_stats,
+    parse_pbp_to_player_stats_batch,
+)
+
+MAPPING = {
+    "1": {"name": "Cooper Flagg", "team_name": "Duke", "jersey": "2"},
+    "2": {"name": "Kon Knueppel", "team_name": "Duke", "jersey": "7"},
+    "3": {"name": "RJ Davis", "team_name": "UNC", "jersey": "4"},
+}
+
+
+def _plays(rows: list[tuple]) -> pd.DataFrame:
+    return pd.DataFrame(rows, columns=["PLAY_TYPE", "PARTICIPANTS", "SCORE_VALUE", "TEXT"])
+
+
+def _boxscore_raw(mapping: dict) -> dict:
+    teams: dict[str, list] = {}
+    for pid, info in mapping.items():
+        teams.setdefault(info["team_name"], []).append(
+            {"athlete": {"id": pid, "displayName": info["name"], "jersey": info["jersey"]}}
+        )
+    return {
+        "players": [
+            {"team": {"id": name, "displayName": name}, "statistics": [{"athletes": athletes}]}
+            for name, athletes in teams.items()
+        ]
+    }
+
+
+def test_stats_and_player_order() -> None:
+    """Each play type updates the right columns; assisters appear after shooters"""
+    plays = _plays(
+        [
+            ("Substitution", ["3"], 0, "RJ Davis enters"),
+            ("JumpShot", ["1", "2"], 3, "Cooper Flagg made Three Point Jumper."),
+            ("LayUpShot", ["1"], 2, "Cooper Flagg missed Layup."),
+            ("Defensive Rebound", ["3"], 0, ""),
+            ("DunkShot", ["3", "4"], 2, "RJ Davis makes Dunk."),
+            ("MadeFreeThrow", ["1"], 1, ""),
+            ("MissedFreeThrow", ["1"], 0, ""),
+            ("Lost Ball Turnover", ["2"], 0, ""),
+            ("Bad Pass\nTurnover", ["2"], 0, ""),
+            ("Steal", ["3"], 0, ""),
+            ("Block Shot", ["2"], 0, ""),
+            ("PersonalFoul", ["1"], 0, ""),
+            ("Offensive Rebound", ["1"], 0, ""),
+            ("OfficialTVTimeOut", [], 0, ""),
+            ("Dead Ball Rebound", None, 0, ""),
+        ]
+    )
+    df = parse_pbp_to_player_stats(plays, MAPPING)
+
+    assert df["PLAYER_ID"].tolist() == ["3", "1", "2", "4"]
+    stats = df.set_index("PLAYER_ID")
+    shooting = ["PTS", "FGM", "FGA", "FG3M", "FG3A", "FG2A", "FTM", "FTA"]
+    assert stats.loc["1", shooting].tolist() == [4, 1, 2, 1, 1, 1, 1, 2]
+    assert stats.loc["1", ["OREB", "PF", "FG_PCT"]].tolist() == [1, 1, 0.5]
+    assert stats.loc["2", ["AST", "TOV", "BLK", "PTS"]].tolist() == [1, 2, 1, 0]
+    assert stats.loc["3", ["PTS", "FG2M", "DREB", "REB", "STL"]].tolist() == [2, 1, 1, 1, 1]
+    assert stats.loc["4", ["AST", "PLAYER_NAME", "TEAM"]].tolist() == [1, "Unknown", "Unknown"]
+    assert list(df.columns[:17]) == [
+        "PLAYER_ID",
+        "PTS",
+        "FGM",
+        "FGA",
+        "FG2M",
+        "FG2A",
+        "FG3M",
+        "FG3A",
+        "FTM",
+        "FTA",
+        "OREB",
+        "DREB",
+        "AST",
+        "STL",
+        "TOV",
+        "BLK",
+        "PF",
+    ]
+    assert list(df.columns[17:]) == ["PLAYER_NAME", "TEAM", "REB", "FG_PCT"]
+    assert df["PTS"].dtype == np.int64
+
+
+def test_missing_text_and_columns() -> None:
+    """Shots without a description count as misses; missing columns use defaults"""
+    plays = _plays([("JumpShot", ["1"], 2, None), ("JumpShot", ["1"], 2, np.nan)])
+    df = parse_pbp_to_player_stats(plays, MAPPING)
+    assert df[["FGA", "FG2A", "FGM", "PTS"]].iloc[0].tolist() == [2, 2, 0, 0]
+
+    no_text = pd.DataFrame({"PLAY_TYPE": ["Steal"], "PARTICIPANTS": [np.array(["2"])]})
+    assert parse_pbp_to_player_stats(no_text, MAPPING)["STL"].tolist() == [1]
+
+    assert parse_pbp_to_player_stats(_plays([("Timeout", [], 0, "")]), MAPPING).empty
+    assert parse_pbp_to_player_stats(pd.DataFrame(), MAPPING).empty
+
+
+def _season(n_games: int) -> tuple[pd.DataFrame, dict]:
+    rng = np.random.default_rng(7)
+    types = ["JumpShot", "LayUpShot", "MadeFreeThrow", "Defensive Rebound", "Steal", "Timeout"]
+    frames = []
+    for g in range(n_games):
+        n = 60
+        kinds = rng.choice(types, size=n)
+        made = rng.random(n) < 0.5
+        frames.append(
+            pd.DataFrame(
+                {
+                    "GAME_ID": f"g{g}",
+                    "PLAY_TYPE": kinds,
+                    "PARTICIPANTS": [
+                        [] if k == "Timeout" else [str(a), str(b)][: 1 + (m and a % 2)]
+                        for k, a, b, m in zip(
+                            kinds, rng.integers(1, 4, n), rng.integers(1, 4, n), made, strict=True
+                        )
+                    ],
+                    "SCORE_VALUE": np.where(made, 2, 0),
+                    "TEXT": np.where(made, "made shot", "missed shot"),
+                }
+            )
+        )
+    return pd.concat(frames, ignore_index=True), {f"g{g}": MAPPING for g in range(n_games)}
+
+
+def test_batch_matches_per_game() -> None:
+    """One batch call equals parse_pbp_to_player_stats run game by game"""
+    plays, mappings = _season(12)
+    batch = parse_pbp_to_player_stats_batch(plays, mappings)
+
+    per_game = pd.concat(
+        [
+            parse_pbp_to_player_stats(game_plays, mappings[game_id]).assign(GAME_ID=game_id)
+            for game_id, game_plays in plays.groupby("GAME_ID", sort=False)
+        ],
+        ignore_index=True,
+    )
+    per_game = per_game[["GAME_ID"] + [c for c in per_game.columns if c != "GAME_ID"]]
+    pd.testing.assert_frame_equal(batch, per_game)
+
+
+def test_games_to_box_scores_matches_single_game() -> None:
+    """Season batch output equals per-game parse_game_to_box_score output"""
+    plays, _ = _season(4)
+    games = {
+        game_id: {
+            "plays": game_plays.reset_index(drop=True),
+            "boxscore_raw": _boxscore_raw(MAPPING),
+        }
+        for game_id, game_plays in plays.groupby("GAME_ID", sort=False)
+    }
+    games["empty"] = {"plays": pd.DataFrame(), "boxscore_raw": {}}
+
+    batch = parse_games_to_box_scores(games, season=2025, league="NCAA-WBB")
+    expected = pd.concat(
+        [
+            parse_game_to_box_score(game, game_id, season=2025, league="NCAA-WBB")
+            for game_id, game in games.items()
+            if game_id != "empty"
+        ],
+        ignore_index=True,
+    )
+    assert list(batch.columns) == BOX_SCORE_COLUMNS
+    pd.testing.assert_frame_equal(batch, expected)
+    assert set(batch["Dorsal"]) <= {"2", "7", "4"}
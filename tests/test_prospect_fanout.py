@@ -0,0 +1,132 @@
+"""
+Tests for the concurrent prospect_player_season league fan-out.
+
+Tests:
+    - Leagues are fetched concurrently and concatenated in league order
+    - Failed and timed-out leagues are reported in df.attrs["leagues"]
+    - Complete results are served from one merged cache entry; partial ones are not cached
+"""
+
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from cbb_data.api import datasets
+from cbb_data.fetchers.base import Cache, get_cache, set_cache
+
+LEAGUES = ["NCAA-MBB", "NCAA-WBB", "NJCAA", "OTE", "G-League", "NBL"]
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    previous = get_cache()
+    set_cache(Cache(ttl_seconds=60, redis_enabled=False, sweep_interval_seconds=0))
+    yield
+    set_cache(previous)
+
+
+class FakeLeagues:
+    """player_season stub: one row per league after `delay` seconds"""
+
+    def __init__(self, delay: float = 0.0, fail: str | None = None, hang: str | None = None):
+        self.delay = delay
+        self.fail = fail
+        self.hang = hang
+        self.calls: list[str] = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, compiled: dict) -> pd.DataFrame:
+        league = compiled["meta"]["league"]
+        with self._lock:
+            self.calls.append(league)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(2.0 if league == self.hang else self.delay)
+            if league == self.fail:
+                raise ConnectionError("upstream down")
+            if league == "NBL":
+                return pd.DataFrame()
+            return pd.DataFrame({"PLAYER_NAME": [f"{league} star"], "PTS": [20.0]})
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    def install(**kwargs) -> FakeLeagues:
+        stub = FakeLeagues(**kwargs)
+        monkeypatch.setattr(datasets, "_fetch_player_season", stub)
+        monkeypatch.setattr(
+            datasets,
+            "get_leagues_by_level",
+            lambda level: LEAGUES[:3] if level == "college" else LEAGUES[3:],
+        )
+        return stub
+
+    return install
+
+
+def _compiled(force: bool = False) -> dict:
+    params = {"Season": "2024", "PerMode": "PerGame"}
+    if force:
+        params["ForceRefresh"] = True
+    return {"params": params, "post_mask": {}, "meta": {}}
+
+
+def test_leagues_fetched_concurrently_in_order(fake) -> None:
+    """Latency tracks the slowest league, not the sum; rows keep league order"""
+    stub = fake(delay=0.2)
+
+    start = time.perf_counter()
+    df = datasets._fetch_prospect_player_season(_compiled())
+    elapsed = time.perf_counter() - start
+
+    assert stub.max_active > 1
+    assert elapsed < 0.2 * len(LEAGUES) / 2
+    assert df["LEAGUE"].tolist() == LEAGUES[:5]
+    assert df.attrs["leagues"] == {
+        "successful": LEAGUES[:5],
+        "empty": ["NBL"],
+        "failed": {},
+        "timed_out": [],
+    }
+
+
+def test_failures_and_timeouts_are_reported(fake, monkeypatch) -> None:
+    """A failing league and a hanging league don't block or sink the others"""
+    monkeypatch.setattr(datasets, "PROSPECT_LEAGUE_TIMEOUT", 0.3)
+    stub = fake(fail="NJCAA", hang="OTE")
+
+    start = time.perf_counter()
+    df = datasets._fetch_prospect_player_season(_compiled())
+    assert time.perf_counter() - start < 1.5
+
+    report = df.attrs["leagues"]
+    assert report["failed"] == {"NJCAA": "upstream down"}
+    assert report["timed_out"] == ["OTE"]
+    assert df["LEAGUE"].tolist() == ["NCAA-MBB", "NCAA-WBB", "G-League"]
+
+    # Partial results are not cached: the next call fans out again
+    calls = len(stub.calls)
+    datasets._fetch_prospect_player_season(_compiled())
+    assert len(stub.calls) == calls + len(LEAGUES)
+
+
+def test_complete_result_uses_merged_cache(fake) -> None:
+    """A complete fan-out is cached as one entry; ForceRefresh bypasses it"""
+    stub = fake()
+    first = datasets._fetch_prospect_player_season(_compiled())
+
+    again = datasets._fetch_prospect_player_season(_compiled())
+    assert len(stub.calls) == len(LEAGUES)
+    pd.testing.assert_frame_equal(again, first)
+    assert again.attrs["leagues"] == first.attrs["leagues"]
+
+    datasets._fetch_prospect_player_season(_compiled(force=True))
+    assert len(stub.calls) == 2 * len(LEAGUES)
@@ -0,0 +1,126 @@
+"""
+Tests for source rate limiting (utils/rate_limiter.py).
+
+Tests:
+    - Waiting acquires sleep once, exactly until their token is due
+    - Non-blocking and timed-out acquires fail without reserving a token
+    - acquire_async waits on the event loop without blocking it
+    - The file backend shares one bucket between processes
+    - Per-source stats carry a cumulative wait-time histogram
+    - The redis backend connects on first acquire, not at construction
+"""
+
+import asyncio
+import multiprocessing
+import time
+
+import pytest
+
+from cbb_data.utils import rate_limiter as rl
+from cbb_data.utils.rate_limiter import FileRateLimiter, RateLimiter, SourceRateLimiter
+
+
+def test_waits_sleep_once_until_token_is_due(monkeypatch) -> None:
+    """Each empty-bucket acquire sleeps one precise interval, no polling"""
+    sleeps: list[float] = []
+    monkeypatch.setattr(rl.time, "sleep", sleeps.append)
+
+    limiter = RateLimiter(calls_per_second=20.0, burst_size=1)
+    for _ in range(4):
+        assert limiter.acquire()
+
+    # First token from the burst; the next three are reserved 1/20s apart
+    assert len(sleeps) == 3
+    assert sleeps == pytest.approx([0.05, 0.10, 0.15], abs=0.01)
+
+
+def test_nonblocking_and_timeout_do_not_reserve() -> None:
+    """A refused acquire leaves the bucket as it was"""
+    limiter = RateLimiter(calls_per_second=2.0, burst_size=1)
+    assert limiter.acquire(block=False)
+    assert not limiter.acquire(block=False)
+
+    start = time.perf_counter()
+    assert not limiter.acquire(timeout=0.1)  # next token is ~0.5s away
+    assert time.perf_counter() - start < 0.05
+    assert limiter.tokens > -0.5  # nothing was reserved
+
+    stats = limiter.stats()
+    assert stats["acquired"] == 1 and stats["rejected"] == 2
+
+
+def test_acquire_async_keeps_loop_free() -> None:
+    """Concurrent async acquires are paced while other tasks keep running"""
+    limiter = RateLimiter(calls_per_second=50.0, burst_size=1)
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    async def scenario() -> float:
+        task = asyncio.create_task(ticker())
+        start = time.perf_counter()
+        results = await asyncio.gather(*(limiter.acquire_async() for _ in range(6)))
+        elapsed = time.perf_counter() - start
+        task.cancel()
+        assert all(results)
+        return elapsed
+
+    elapsed = asyncio.run(scenario())
+    assert 0.09 <= elapsed < 0.3  # five reserved tokens at 50/s
+    assert ticks >= 10
+
+
+def _take_tokens(path: str, count: int) -> None:
+    limiter = FileRateLimiter(path, calls_per_second=20.0, burst_size=1)
+    for _ in range(count):
+        limiter.acquire()
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="needs fork start method"
+)
+def test_file_backend_shared_across_processes(tmp_path) -> None:
+    """Two processes drawing 6 tokens each are paced as one 20/s bucket"""
+    path = str(tmp_path / "rate_test.bucket")
+    FileRateLimiter(path, calls_per_second=20.0, burst_size=1).reset()
+
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=_take_tokens, args=(path, 6)) for _ in range(2)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=10)
+    elapsed = time.perf_counter() - start
+
+    assert all(worker.exitcode == 0 for worker in workers)
+    assert elapsed >= 0.5  # 11 tokens past the burst at 20/s (per-process buckets: ~0.25s)
+
+
+def test_source_stats_histogram(tmp_path, monkeypatch) -> None:
+    """Per-source stats report cumulative wait buckets; unused sources are omitted"""
+    limiter = SourceRateLimiter(backend="file", bucket_dir=tmp_path)
+    limiter.set_limit("test_source", calls_per_second=100.0, burst_size=2)
+    for _ in range(4):
+        limiter.acquire("test_source")
+
+    stats = limiter.stats()
+    assert list(stats) == ["test_source"]
+    source = stats["test_source"]
+    assert source["acquired"] == 4 and source["waited"] == 2
+    assert source["wait_buckets"]["0.0"] == 2 and source["wait_buckets"]["+Inf"] == 4
+    assert 0.01 <= source["wait_sum_seconds"] < 0.05
+
+    # Redis requested but unreachable: connects on first acquire, then per-process buckets
+    attempts: list[int] = []
+    monkeypatch.setattr(rl, "connect_redis", lambda: attempts.append(1))
+    redis_limiter = SourceRateLimiter(backend="redis")
+    assert attempts == [] and redis_limiter.backend == "redis"
+    assert redis_limiter.acquire("espn")
+    assert attempts == [1] and redis_limiter.backend == "memory"
+    with pytest.raises(ValueError):
+        SourceRateLimiter(backend="carrier-pigeon")
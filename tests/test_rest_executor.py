@@ -0,0 +1,160 @@
+"""
+Tests for off-loop dataset execution in the REST API (utils/executor.py).
+
+Tests:
+    - BoundedExecutor runs calls off the loop, bounds its queue and times out
+    - Cancelled queued calls never start; counters track every outcome
+    - A slow dataset query does not block /health on the same event loop
+    - Busy and timed-out queries answer 503 / 504
+    - The storage lookup that picks the pool runs off the event loop
+    - run_with_deadlines times each task from its start and captures errors
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+import pandas as pd
+import pytest
+from fastapi import HTTPException
+
+from cbb_data.api.rest_api import routes
+from cbb_data.api.rest_api.models import DatasetRequest
+from cbb_data.utils.executor import BoundedExecutor, ExecutorBusyError
+
+
+def test_executor_bounds_queue_and_times_out() -> None:
+    """Calls beyond workers + queue are rejected; slow calls time out"""
+    executor = BoundedExecutor("test", max_workers=1, max_queue=1)
+    release = threading.Event()
+
+    async def scenario() -> None:
+        first = asyncio.create_task(executor.run(release.wait, 5))
+        await asyncio.sleep(0.05)
+        second = asyncio.create_task(executor.run(lambda: "queued"))
+        await asyncio.sleep(0.05)
+        assert executor.stats()["running"] == 1 and executor.stats()["queued"] == 1
+
+        with pytest.raises(ExecutorBusyError):
+            await executor.run(lambda: "rejected")
+
+        release.set()
+        assert await first is True
+        assert await second == "queued"
+
+        with pytest.raises(TimeoutError):
+            await executor.run(time.sleep, 0.5, timeout=0.05)
+
+    asyncio.run(scenario())
+    stats = executor.stats()
+    assert stats["rejected"] == 1 and stats["timeouts"] == 1
+    assert stats["completed"] >= 2 and stats["queued"] == 0
+    executor.shutdown(wait=True)
+
+
+def test_cancelled_queued_call_never_runs() -> None:
+    """Timing out while still queued drops the call"""
+    executor = BoundedExecutor("test-cancel", max_workers=1, max_queue=4)
+    ran: list[str] = []
+
+    async def scenario() -> None:
+        blocker = asyncio.create_task(executor.run(time.sleep, 0.3))
+        await asyncio.sleep(0.05)
+        with pytest.raises(TimeoutError):
+            await executor.run(ran.append, "late", timeout=0.05)
+        await blocker
+
+    asyncio.run(scenario())
+    time.sleep(0.05)
+    assert ran == []
+    assert executor.stats()["cancelled"] == 1 and executor.stats()["queued"] == 0
+    executor.shutdown(wait=True)
+
+
+def test_slow_query_does_not_block_health(monkeypatch) -> None:
+    """/health answers while a dataset query is still running"""
+
+    def slow_get_dataset(**kwargs) -> pd.DataFrame:
+        time.sleep(0.5)
+        return pd.DataFrame({"GAME_ID": ["1"]})
+
+    monkeypatch.setattr(routes, "get_dataset", slow_get_dataset)
+    request = DatasetRequest(filters={"league": "EuroLeague", "season": "2024"})
+
+    async def scenario() -> tuple[float, float]:
+        start = time.perf_counter()
+        query = asyncio.create_task(routes.query_dataset("schedule", request))
+        await asyncio.sleep(0.01)
+        await routes.health_check()
+        health_done = time.perf_counter() - start
+        response = await query
+        assert json.loads(response.body)["data"] == [["1"]]
+        return health_done, time.perf_counter() - start
+
+    health_done, query_done = asyncio.run(scenario())
+    assert health_done < 0.2 < query_done
+
+
+def test_busy_and_timeout_status_codes(monkeypatch) -> None:
+    """Full queue -> 503 with Retry-After; timeout -> 504"""
+    request = DatasetRequest(filters={"league": "EuroLeague", "season": "2024"})
+    monkeypatch.setattr(routes, "get_dataset", lambda **kwargs: time.sleep(0.3))
+
+    busy = BoundedExecutor("test-busy", max_workers=1, max_queue=1)
+    busy._queued = 1  # simulate a full queue
+    monkeypatch.setattr(routes, "_dataset_executor", lambda fast: busy)
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(routes.query_dataset("schedule", request))
+    assert exc.value.status_code == 503 and exc.value.headers == {"Retry-After": "5"}
+
+    slow = BoundedExecutor("test-slow", max_workers=1, max_queue=1, default_timeout=0.05)
+    monkeypatch.setattr(routes, "_dataset_executor", lambda fast: slow)
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(routes.query_dataset("schedule", request))
+    assert exc.value.status_code == 504
+    slow.shutdown(wait=True)
+
+
+def test_storage_lookup_runs_off_the_loop(monkeypatch) -> None:
+    """The DuckDB has_data check that picks the pool never runs on the event loop thread"""
+    threads: list[int] = []
+
+    def is_stored(dataset_id: str, filters: dict) -> bool:
+        threads.append(threading.get_ident())
+        return True
+
+    monkeypatch.setattr(routes, "_is_stored", is_stored)
+    monkeypatch.setattr(routes, "get_dataset", lambda **kwargs: pd.DataFrame({"GAME_ID": ["1"]}))
+    request = DatasetRequest(filters={"league": "EuroLeague", "season": "2024"})
+
+    async def scenario() -> int:
+        await routes.query_dataset("schedule", request)
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(scenario())
+    assert len(threads) == 1 and threads[0] != loop_thread
+
+
+def test_run_with_deadlines_times_tasks_from_their_start() -> None:
+    """Queued tasks are not charged for the wait; stragglers time out; errors are captured"""
+    from cbb_data.utils.executor import run_with_deadlines
+
+    def fail() -> None:
+        raise ValueError("bad league")
+
+    tasks = {
+        "a": lambda: time.sleep(0.15) or "a",
+        "slow": lambda: time.sleep(1.0),
+        "b": lambda: time.sleep(0.15) or "b",  # waits for "a", ends past 0.25s overall
+        "bad": fail,
+    }
+    start = time.perf_counter()
+    outcomes = run_with_deadlines(tasks, timeout=0.25, max_workers=2)
+    elapsed = time.perf_counter() - start
+
+    assert outcomes["a"].value == "a" and outcomes["b"].value == "b"
+    assert outcomes["slow"].timed_out and isinstance(outcomes["slow"].error, TimeoutError)
+    assert isinstance(outcomes["bad"].error, ValueError) and not outcomes["bad"].timed_out
+    assert 0.1 <= outcomes["a"].duration < 0.25
+    assert elapsed < 0.8  # returned without waiting for "slow" to finish
@@ -0,0 +1,90 @@
+"""
+Tests for pre-serialized JSON responses (api/rest_api/fast_json.py).
+
+Tests:
+    - json/records rows match what the DatasetResponse model path produces
+    - NaN/NaT/pd.NA become null; timestamps are ISO 8601 like Timestamp.isoformat()
+    - The pandas writer fallback (no orjson) keeps the same shape
+    - query_dataset answers with the DatasetResponse wire schema
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.testclient import TestClient
+
+from cbb_data.api.rest_api import app, fast_json, routes
+from cbb_data.api.rest_api.fast_json import DatasetJSONResponse, encode_rows
+from cbb_data.api.rest_api.models import DatasetMetadata, DatasetResponse
+
+
+def _games() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "GAME_ID": ["g1", "g2", "g3"],
+            "PTS": np.array([81, 77, 90], dtype="int64"),
+            "PLUS_MINUS": [4.5, np.nan, -0.1],
+            "TEAM_ID": pd.array([12, None, 7], dtype="Int64"),
+            "GAME_DATE": pd.to_datetime(
+                ["2025-01-10", None, "2025-01-12 19:30:00.25"], format="ISO8601"
+            ),
+            "VENUE": pd.Categorical(["A", "B", "A"]),
+            "NOTE": ["x", None, "z"],
+        }
+    )
+
+
+def _model_json(df: pd.DataFrame, output_format: str) -> dict:
+    """What the DatasetResponse path puts on the wire"""
+    data, columns = routes._dataframe_to_response_data(df, output_format)
+    return json.loads(json.dumps(jsonable_encoder(DatasetResponse(data=data, columns=columns))))
+
+
+@pytest.mark.parametrize("output_format", ["json", "records"])
+def test_rows_match_model_path(output_format) -> None:
+    """Values, nulls and ISO timestamps equal the model-encoded payload"""
+    df = _games().dropna()  # the model path cannot serialize NaN, NaT or pd.NA
+    rows, columns = encode_rows(df, output_format)
+    expected = _model_json(df, output_format)
+    assert json.loads(rows) == expected["data"] and columns == expected["columns"]
+
+    # Missing values of every kind become null
+    data = json.loads(encode_rows(_games(), output_format)[0])
+    missing = data[1] if output_format == "json" else list(data[1].values())
+    assert missing == ["g2", 77, None, None, None, "B", None]
+    assert missing[4] is None and "2025-01-12T19:30:00.250000" in json.dumps(data[2])
+
+
+def test_pandas_writer_fallback(monkeypatch) -> None:
+    """Without orjson the pandas writer produces the same shape"""
+    monkeypatch.setattr(fast_json, "ORJSON_AVAILABLE", False)
+    rows, columns = encode_rows(_games(), "json")
+    data = json.loads(rows)
+    assert columns == list(_games().columns) and len(data) == 3
+    assert data[1][:4] == ["g2", 77, None, None] and data[0][4].startswith("2025-01-10T00:00:00")
+    assert encode_rows(pd.DataFrame(), "records") == (b"[]", [])
+    with pytest.raises(ValueError):
+        encode_rows(_games(), "csv")
+
+
+def test_query_dataset_wire_schema(monkeypatch) -> None:
+    """The endpoint answers with data/columns/metadata, NaN included"""
+    monkeypatch.setattr(routes, "get_dataset", lambda **kwargs: _games())
+    client = TestClient(app)
+    response = client.post(
+        "/datasets/schedule", json={"filters": {"league": "LKL", "season": "2024-25"}}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+
+    body = response.json()
+    assert set(body) == {"data", "columns", "metadata"}
+    assert body["columns"][0] == "GAME_ID" and body["data"][1][2] is None
+    metadata = DatasetMetadata.model_validate(body["metadata"])
+    assert metadata.row_count == 3 and metadata.total_rows == 3
+
+    response = DatasetJSONResponse(b"[]", None)
+    assert json.loads(response.body) == {"data": [], "columns": None, "metadata": None}
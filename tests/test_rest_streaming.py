@@ -0,0 +1,157 @@
+"""
+Tests for streamed REST output formats (api/rest_api/streaming.py).
+
+Tests:
+    - arrow streams record batches of one schema, zstd-compressed on request
+    - ndjson is encoded in chunks (NaN -> null, ISO timestamps) and gzip-negotiated
+    - parquet_raw is a binary parquet file with one row group per chunk
+    - stored partitions stream from DuckDB record batches without get_dataset
+    - Accept-Encoding negotiation honours q-values
+"""
+
+import gzip
+import json
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from fastapi.testclient import TestClient
+
+from cbb_data.api.rest_api import app, routes
+from cbb_data.api.rest_api.streaming import negotiate_encoding, stream_dataframe
+
+ROWS = 25_000
+
+
+def _pbp() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "GAME_ID": np.repeat(["g1", "g2"], ROWS // 2 + 1)[:ROWS],
+            "EVENT_NUM": np.arange(ROWS),
+            "SCORE_DIFF": np.where(np.arange(ROWS) % 10 == 0, np.nan, 1.0),
+            "GAME_DATE": pd.Timestamp("2025-01-10"),
+        }
+    )
+
+
+@pytest.fixture
+def client(monkeypatch) -> TestClient:
+    monkeypatch.setattr(routes, "get_dataset", lambda **kwargs: _pbp())
+    return TestClient(app)
+
+
+def _query(client: TestClient, output_format: str, encoding: str = "identity"):
+    return client.post(
+        "/datasets/pbp",
+        json={"filters": {"league": "LKL", "season": "2024-25"}, "output_format": output_format},
+        headers={"Accept-Encoding": encoding},
+    )
+
+
+def test_arrow_stream_batches_and_zstd() -> None:
+    """Record batches arrive one chunk at a time and decode as one stream"""
+    body, media_type, encoding = stream_dataframe(_pbp(), "arrow", "zstd", chunk_rows=10_000)
+    chunks = list(body)
+    assert media_type == "application/vnd.apache.arrow.stream" and encoding == "zstd"
+    assert len(chunks) >= 4  # schema, three batches, end of stream
+
+    raw = pa.CompressedInputStream(pa.BufferReader(b"".join(chunks)), "zstd").read()
+    reader = pa.ipc.open_stream(raw)
+    batches = list(reader)
+    assert [b.num_rows for b in batches] == [10_000, 10_000, 5_000]
+    table = pa.Table.from_batches(batches)
+    assert table.column("EVENT_NUM").to_pylist()[-1] == ROWS - 1
+
+
+def test_arrow_over_http(client) -> None:
+    """The endpoint answers with an uncompressed Arrow stream by default"""
+    response = _query(client, "arrow")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.apache.arrow.stream"
+    assert "content-encoding" not in response.headers
+    assert pa.ipc.open_stream(response.content).read_all().num_rows == ROWS
+
+
+def test_ndjson_chunks_and_gzip(client) -> None:
+    """NDJSON rows are valid JSON lines; gzip is applied when accepted"""
+    response = _query(client, "ndjson", "gzip")
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["x-row-count"] == str(ROWS)
+
+    lines = response.text.splitlines()  # httpx decodes gzip
+    assert len(lines) == ROWS
+    first = json.loads(lines[0])
+    assert first["SCORE_DIFF"] is None and first["GAME_DATE"].startswith("2025-01-10T")
+
+    body, _, _ = stream_dataframe(_pbp(), "ndjson", "gzip")
+    assert gzip.decompress(b"".join(body)).count(b"\n") == ROWS
+
+
+def test_parquet_raw_row_groups(client) -> None:
+    """parquet_raw is a plain parquet file and is never content-encoded"""
+    response = _query(client, "parquet_raw", "gzip, zstd")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.apache.parquet"
+    assert "content-encoding" not in response.headers
+
+    parquet = pq.ParquetFile(pa.BufferReader(response.content))
+    assert parquet.metadata.num_rows == ROWS
+    assert parquet.metadata.num_row_groups == 3
+
+
+def test_stored_partition_streams_from_storage(tmp_path, monkeypatch) -> None:
+    """A stored league + season partition is read in batches, never through get_dataset"""
+    pytest.importorskip("duckdb")
+    from cbb_data.storage import duckdb_storage
+    from cbb_data.storage.freshness import clear_freshness_policies, set_freshness_policy
+
+    storage = duckdb_storage.DuckDBStorage(str(tmp_path / "test.duckdb"))
+    monkeypatch.setattr(duckdb_storage, "_storage_instance", storage)
+
+    def no_dataframe(**kwargs) -> pd.DataFrame:
+        raise AssertionError("get_dataset used")
+
+    monkeypatch.setattr(routes, "get_dataset", no_dataframe)
+    set_freshness_policy("pbp", max_age_seconds=None)
+    try:
+        storage.save(_pbp(), "pbp", "LKL", "2024-25")
+        client = TestClient(app)
+        arrow = _query(client, "arrow")
+        ndjson = _query(client, "ndjson", "gzip")
+        limited = client.post(
+            "/datasets/pbp",
+            json={
+                "filters": {"league": "LKL", "season": "2024-25"},
+                "output_format": "ndjson",
+                "limit": 3,
+            },
+        )
+    finally:
+        clear_freshness_policies()
+        storage.close()
+
+    assert arrow.status_code == 200 and arrow.headers["x-row-count"] == str(ROWS)
+    table = pa.ipc.open_stream(arrow.content).read_all()
+    assert table.num_rows == ROWS
+    assert table.column("EVENT_NUM").to_pylist()[:3] == [0, 1, 2]
+
+    assert ndjson.headers["content-encoding"] == "gzip"
+    lines = ndjson.text.splitlines()  # httpx decodes gzip
+    assert len(lines) == ROWS
+    assert json.loads(lines[0])["SCORE_DIFF"] is None
+
+    assert limited.headers["x-row-count"] == "3"
+    assert len(limited.content.splitlines()) == 3
+
+
+def test_negotiate_encoding() -> None:
+    """Highest q-value wins; zstd is preferred on ties; q=0 refuses"""
+    assert negotiate_encoding("gzip, zstd") == "zstd"
+    assert negotiate_encoding("gzip;q=1.0, zstd;q=0.5") == "gzip"
+    assert negotiate_encoding("zstd;q=0, gzip") == "gzip"
+    assert negotiate_encoding("br, identity") is None
+    assert negotiate_encoding("*") == "zstd"
+    assert negotiate_encoding(None) is None
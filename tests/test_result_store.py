@@ -0,0 +1,159 @@
+"""
+Tests for server-side result cursors (utils/result_store.py).
+
+Tests:
+    - paginate/page walk a stored result in order without refetching
+    - Results expire after their TTL; unknown cursors raise ResultExpiredError
+    - Over the memory budget results spill to disk (and stay readable) or are evicted
+    - REST query_dataset pages via page_size/cursor and answers 410 for expired cursors
+    - mcp_autopaginate serves later pages of offset-less getters from the store
+    - Mixed-type object columns have the same type on every page
+"""
+
+import asyncio
+import json
+import time
+
+import pandas as pd
+import pytest
+from fastapi import HTTPException
+
+from cbb_data.api.rest_api import routes
+from cbb_data.api.rest_api.models import DatasetRequest
+from cbb_data.servers.mcp_wrappers import mcp_autopaginate
+from cbb_data.utils import result_store
+from cbb_data.utils.result_store import ResultExpiredError, ResultStore
+
+
+def _frame(rows: int = 10) -> pd.DataFrame:
+    return pd.DataFrame({"GAME_ID": [f"g{i}" for i in range(rows)], "PTS": range(rows)})
+
+
+@pytest.fixture
+def store(monkeypatch, tmp_path) -> ResultStore:
+    instance = ResultStore(ttl_seconds=60, spill_dir=tmp_path)
+    monkeypatch.setattr(result_store, "_result_store", instance)
+    return instance
+
+
+def test_pages_walk_stored_result(store) -> None:
+    """Pages come back in order; the last page has no cursor"""
+    df = _frame(10)
+    df.attrs["leagues"] = {"successful": ["LKL"]}
+
+    page = store.paginate(df, 4)
+    seen = [page.frame]
+    while page.next_cursor:
+        page = store.page(page.next_cursor)
+        seen.append(page.frame)
+        assert page.total_rows == 10 and page.meta == {"leagues": {"successful": ["LKL"]}}
+
+    assert [len(p) for p in seen] == [4, 4, 2]
+    pd.testing.assert_frame_equal(pd.concat(seen, ignore_index=True), df)
+    assert store.paginate(_frame(3), 4).next_cursor is None  # single page: nothing stored
+    assert store.stats()["results"] == 1 and store.stats()["pages"] == 2
+
+
+def test_expired_and_unknown_cursors(store) -> None:
+    """TTL expiry and bad cursors raise ResultExpiredError"""
+    store.ttl = 0.05
+    cursor = store.paginate(_frame(10), 4).next_cursor
+    time.sleep(0.1)
+    with pytest.raises(ResultExpiredError):
+        store.page(cursor)
+    with pytest.raises(ResultExpiredError):
+        store.page("not-a-cursor")
+    assert store.stats()["expirations"] == 1 and store.stats()["results"] == 0
+
+
+def test_memory_budget_spills_then_evicts(store) -> None:
+    """Least recently used results spill to disk; without spilling they are evicted"""
+    big = _frame(5000)
+    first = store.paginate(big, 100).next_cursor
+    store.max_bytes = int(store.stats()["memory_bytes"] * 1.5)
+    second = store.paginate(big, 100).next_cursor
+
+    stats = store.stats()
+    assert stats["spilled_results"] == 1 and stats["memory_results"] == 1
+    page = store.page(first)
+    assert page.frame["GAME_ID"].tolist()[:2] == ["g100", "g101"]
+
+    store.spill_bytes = 0
+    store.paginate(big, 100)
+    with pytest.raises(ResultExpiredError):
+        store.page(second)
+    assert store.stats()["evictions"] >= 1
+
+
+def test_rest_cursor_pages_without_refetch(store, monkeypatch) -> None:
+    """page_size returns a cursor; cursor requests don't call get_dataset"""
+    calls = []
+
+    def fake_get_dataset(**kwargs) -> pd.DataFrame:
+        calls.append(kwargs)
+        return _frame(10)
+
+    monkeypatch.setattr(routes, "get_dataset", fake_get_dataset)
+    filters = {"league": "LKL", "season": "2024-25"}
+
+    first = json.loads(
+        asyncio.run(
+            routes.query_dataset("schedule", DatasetRequest(filters=filters, page_size=6))
+        ).body
+    )
+    assert first["data"][0] == ["g0", 0] and len(first["data"]) == 6
+    cursor = first["metadata"]["next_cursor"]
+    assert first["metadata"]["total_rows"] == 10 and cursor
+
+    second = json.loads(
+        asyncio.run(
+            routes.query_dataset("schedule", DatasetRequest(filters=filters, cursor=cursor))
+        ).body
+    )
+    assert [row[0] for row in second["data"]] == ["g6", "g7", "g8", "g9"]
+    assert second["metadata"]["next_cursor"] is None and len(calls) == 1
+
+    store.clear()
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(
+            routes.query_dataset("schedule", DatasetRequest(filters=filters, cursor=cursor))
+        )
+    assert exc.value.status_code == 410
+
+
+def test_autopaginate_uses_store_for_offsetless_getter(store) -> None:
+    """A getter without offset support is called once across pages"""
+    calls = []
+
+    @mcp_autopaginate
+    def fetch(league: str, limit: int | None = None) -> pd.DataFrame:
+        calls.append(limit)
+        return _frame(10)
+
+    first = fetch("LKL", limit=4)
+    assert first["data"][0] == ["g0", 0] and first["truncated"]
+    second = fetch("LKL", limit=4, cursor=first["next_cursor"])
+    assert [row[0] for row in second["data"]] == ["g4", "g5", "g6", "g7"]
+    assert calls == [None]
+
+    # Expired cursor: re-run the query and resume at the same row
+    store.clear()
+    resumed = fetch("LKL", limit=4, cursor=second["next_cursor"])
+    assert [row[0] for row in resumed["data"]] == ["g8", "g9"]
+    assert not resumed["truncated"] and calls == [None, None]
+
+    # Malformed cursor: a clean validation error, no refetch
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        fetch("LKL", limit=4, cursor="not-a-cursor")
+    assert calls == [None, None]
+
+
+def test_mixed_object_columns_page_consistently(store) -> None:
+    """Stringified mixed-type columns come back as strings on every page"""
+    df = pd.DataFrame({"JERSEY": [1, "4", 7, "10", 12, "00"]})
+    page = store.paginate(df, 2)
+    values = list(page.frame["JERSEY"])
+    while page.next_cursor:
+        page = store.page(page.next_cursor)
+        values += list(page.frame["JERSEY"])
+    assert values == ["1", "4", "7", "10", "12", "00"]
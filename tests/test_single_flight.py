@@ -0,0 +1,229 @@
+"""
+Tests for single-flight request coalescing (utils/single_flight.py).
+
+Tests:
+    - Concurrent identical calls run the work once
+    - Followers receive clones, not the leader's object
+    - Leader exceptions propagate to followers
+    - Re-entrant calls on the same key don't deadlock
+    - File-lock mode rechecks the cache only after waiting on another worker
+    - @cached_dataframe coalesces concurrent misses
+    - get_dataset workers that waited read the leader's result in file mode
+    - Sequential get_dataset calls in file mode each fetch (no result caching)
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+
+def _run_concurrently(fn, n: int = 8) -> list:
+    barrier = threading.Barrier(n)
+
+    def call():
+        barrier.wait()
+        return fn()
+
+    with ThreadPoolExecutor(max_workers=n) as pool:
+        futures = [pool.submit(call) for _ in range(n)]
+        return [f.result() for f in futures]
+
+
+def test_concurrent_calls_coalesce() -> None:
+    """Only one of N concurrent callers executes the work"""
+    from cbb_data.utils.single_flight import SingleFlight
+
+    flight = SingleFlight(mode="thread")
+    calls = []
+
+    def work() -> pd.DataFrame:
+        calls.append(1)
+        time.sleep(0.2)
+        return pd.DataFrame({"PTS": [10, 20]})
+
+    results = _run_concurrently(
+        lambda: flight.do("player_season|2025", work, clone=lambda df: df.copy())
+    )
+
+    assert len(calls) == 1
+    assert all(r["PTS"].tolist() == [10, 20] for r in results)
+    # Every caller gets its own object
+    assert len({id(r) for r in results}) == len(results)
+    assert flight.stats()["coalesced"] == len(results) - 1
+    assert flight.in_flight() == 0
+
+    print("[PASS] Concurrent calls coalesce")
+
+
+def test_leader_exception_propagates() -> None:
+    """Followers see the leader's exception instead of retrying"""
+    from cbb_data.utils.single_flight import SingleFlight
+
+    flight = SingleFlight(mode="thread")
+    calls = []
+
+    def work() -> None:
+        calls.append(1)
+        time.sleep(0.2)
+        raise RuntimeError("upstream 503")
+
+    def call() -> str:
+        try:
+            flight.do("failing", work)
+        except RuntimeError as e:
+            return str(e)
+        return "no error"
+
+    results = _run_concurrently(call, n=4)
+    assert results == ["upstream 503"] * 4
+    assert len(calls) == 1
+
+    print("[PASS] Leader exception propagates")
+
+
+def test_reentrant_call_does_not_deadlock() -> None:
+    """A leader calling do() again with its own key runs the inner work directly"""
+    from cbb_data.utils.single_flight import SingleFlight
+
+    flight = SingleFlight(mode="thread")
+    result = flight.do("outer", lambda: flight.do("outer", lambda: 42) + 1)
+    assert result == 43
+
+    print("[PASS] Re-entrant call does not deadlock")
+
+
+def test_file_mode_rechecks_cache(tmp_path) -> None:
+    """In file-lock mode the leader uses recheck() only if it waited for the lock"""
+    import hashlib
+
+    from cbb_data.utils.single_flight import SingleFlight, file_lock
+
+    flight = SingleFlight(mode="file", lock_dir=tmp_path)
+    rechecks = []
+
+    def recheck() -> str:
+        rechecks.append(1)
+        return "from cache"
+
+    # Uncontended: the work runs and the cache is not consulted
+    assert flight.do("key", lambda: "fetched", recheck=recheck) == "fetched"
+    assert rechecks == []
+
+    # Another worker holds the lock: after waiting, the leader rechecks
+    path = tmp_path / f"{hashlib.sha256(b'key').hexdigest()[:32]}.lock"
+    held = threading.Event()
+
+    def other_worker() -> None:
+        with file_lock(path):
+            held.set()
+            time.sleep(0.2)
+
+    worker = threading.Thread(target=other_worker)
+    worker.start()
+    held.wait(5)
+    assert flight.do("key", lambda: "fetched", recheck=recheck) == "from cache"
+    worker.join()
+    assert rechecks == [1]
+
+    print("[PASS] File mode rechecks cache after waiting")
+
+
+def test_invalid_mode() -> None:
+    """Unknown modes are rejected"""
+    from cbb_data.utils.single_flight import SingleFlight
+
+    with pytest.raises(ValueError):
+        SingleFlight(mode="zookeeper")
+
+
+def test_cached_dataframe_coalesces_misses() -> None:
+    """Concurrent cache misses on one key trigger a single fetch"""
+    from cbb_data.fetchers.base import Cache, cached_dataframe, get_cache, set_cache
+
+    original = get_cache()
+    set_cache(Cache(redis_enabled=False, sweep_interval_seconds=0))
+    calls = []
+
+    @cached_dataframe
+    def fetch(season: str) -> pd.DataFrame:
+        calls.append(season)
+        time.sleep(0.2)
+        return pd.DataFrame({"GAME_ID": ["1", "2"]})
+
+    try:
+        results = _run_concurrently(lambda: fetch(season="2025"), n=6)
+    finally:
+        set_cache(original)
+
+    assert calls == ["2025"]
+    assert all(len(r) == 2 for r in results)
+
+    print("[PASS] cached_dataframe coalesces misses")
+
+
+def _file_mode_get_dataset(tmp_path, monkeypatch, fetch_seconds: float = 0.0):
+    """Patch get_dataset to run in file mode with a counting schedule fetcher
+
+    Each thread gets its own SingleFlight, standing in for a separate worker process.
+    """
+    from cbb_data.api import datasets
+    from cbb_data.catalog.registry import DatasetRegistry
+    from cbb_data.fetchers.base import Cache, set_cache
+    from cbb_data.utils.single_flight import SingleFlight
+
+    calls = []
+
+    def fetch(compiled: dict) -> pd.DataFrame:
+        calls.append(1)
+        time.sleep(fetch_seconds)
+        return pd.DataFrame({"GAME_ID": ["1", "2"], "ROUND": [len(calls)] * 2})
+
+    workers = threading.local()
+
+    def worker_flight() -> SingleFlight:
+        if not hasattr(workers, "flight"):
+            workers.flight = SingleFlight(mode="file", lock_dir=tmp_path)
+        return workers.flight
+
+    monkeypatch.setitem(DatasetRegistry.get("schedule"), "fetch", fetch)
+    monkeypatch.setattr(datasets, "get_single_flight", worker_flight)
+    set_cache(Cache(redis_enabled=False, sweep_interval_seconds=0))
+    return datasets.get_dataset, calls
+
+
+def test_get_dataset_file_mode_hands_off_result(tmp_path, monkeypatch) -> None:
+    """A worker that waited on the file lock reads the leader's result instead of refetching"""
+    from cbb_data.fetchers.base import get_cache, set_cache
+
+    original_cache = get_cache()
+    filters = {"league": "NCAA-MBB", "season": "2025"}
+    try:
+        get_dataset, calls = _file_mode_get_dataset(tmp_path, monkeypatch, fetch_seconds=0.3)
+        results = _run_concurrently(lambda: get_dataset("schedule", filters), n=2)
+    finally:
+        set_cache(original_cache)
+
+    assert len(calls) == 1
+    assert [r["ROUND"].tolist() for r in results] == [[1, 1], [1, 1]]
+
+    print("[PASS] get_dataset hands off results in file mode")
+
+
+def test_get_dataset_file_mode_sequential_calls_refetch(tmp_path, monkeypatch) -> None:
+    """The handoff is not a result cache: back-to-back calls each fetch"""
+    from cbb_data.fetchers.base import get_cache, set_cache
+
+    original_cache = get_cache()
+    filters = {"league": "NCAA-MBB", "season": "2025"}
+    try:
+        get_dataset, calls = _file_mode_get_dataset(tmp_path, monkeypatch)
+        rounds = [get_dataset("schedule", filters)["ROUND"].iloc[0] for _ in range(3)]
+    finally:
+        set_cache(original_cache)
+
+    assert len(calls) == 3 and rounds == [1, 2, 3]
+
+    print("[PASS] get_dataset refetches sequential calls in file mode")
@@ -0,0 +1,124 @@
+"""
+Tests for DuckDB freshness metadata and stale-while-revalidate refreshes.
+
+Tests:
+    - save() records write time, get_age_seconds() reports it
+    - Freshness policy resolution (overrides, completed seasons, defaults)
+    - fetch_with_storage serves stale data and refreshes in the background
+    - serve_stale=False refetches synchronously
+"""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("duckdb")
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    """Isolated DuckDBStorage installed as the global singleton"""
+    from cbb_data.storage import duckdb_storage
+    from cbb_data.storage.freshness import clear_freshness_policies
+
+    instance = duckdb_storage.DuckDBStorage(str(tmp_path / "test.duckdb"))
+    monkeypatch.setattr(duckdb_storage, "_storage_instance", instance)
+    yield instance
+    clear_freshness_policies()
+    instance.close()
+
+
+def test_save_records_write_time(storage) -> None:
+    """Saving a table records its write time; unknown tables have no age"""
+    assert storage.get_age_seconds("schedule", "NCAA-MBB", "2025") is None
+
+    storage.save(pd.DataFrame({"GAME_ID": ["1"]}), "schedule", "NCAA-MBB", "2025")
+
+    age = storage.get_age_seconds("schedule", "NCAA-MBB", "2025")
+    assert age is not None and 0 <= age < 60
+    assert "_cbb_table_meta" not in storage.list_tables()
+
+    print("[PASS] Save records write time")
+
+
+def test_policy_resolution() -> None:
+    """Overrides beat defaults; completed seasons never go stale"""
+    from cbb_data.storage.freshness import (
+        DEFAULT_MAX_AGE_SECONDS,
+        clear_freshness_policies,
+        get_freshness_policy,
+        is_season_completed,
+        set_freshness_policy,
+    )
+
+    today = date(2026, 10, 16)
+    assert is_season_completed("2022-23", today)
+    assert is_season_completed("E2024", today)
+    assert not is_season_completed("2025-26", today)
+    assert not is_season_completed("2026", today)
+    assert not is_season_completed("current", today)
+
+    try:
+        assert get_freshness_policy("schedule", "NCAA-MBB", "2019").max_age_seconds is None
+
+        set_freshness_policy("schedule", max_age_seconds=60)
+        set_freshness_policy("schedule", league="EuroLeague", max_age_seconds=5, serve_stale=False)
+
+        assert get_freshness_policy("schedule", "NCAA-MBB", "2019").max_age_seconds == 60
+        euro = get_freshness_policy("schedule", "EuroLeague", "2019")
+        assert euro.max_age_seconds == 5 and not euro.serve_stale
+    finally:
+        clear_freshness_policies()
+
+    default = get_freshness_policy("player_game", "NCAA-MBB", "2099")
+    assert default.max_age_seconds == DEFAULT_MAX_AGE_SECONDS["player_game"]
+    assert default.is_stale(None)
+    assert not default.is_stale(1)
+
+    print("[PASS] Policy resolution")
+
+
+def test_stale_data_served_while_refreshing(storage) -> None:
+    """Stale table is returned immediately and replaced in the background"""
+    from cbb_data.storage.cache_helper import fetch_with_storage
+    from cbb_data.storage.freshness import set_freshness_policy
+
+    storage.save(pd.DataFrame({"GAME_ID": ["old"]}), "schedule", "NCAA-MBB", "2099")
+    set_freshness_policy("schedule", max_age_seconds=0)
+
+    fresh = pd.DataFrame({"GAME_ID": ["new"]})
+    df = fetch_with_storage(
+        "schedule", "NCAA-MBB", "2099", fetcher_func=lambda: fresh, cache_key="sched"
+    )
+    assert df["GAME_ID"].tolist() == ["old"]
+
+    from cbb_data.storage import freshness
+
+    for future in list(freshness._refresh_in_progress.values()):
+        future.result(timeout=10)
+
+    reloaded = storage.load("schedule", "NCAA-MBB", "2099")
+    assert reloaded["GAME_ID"].tolist() == ["new"]
+
+    print("[PASS] Stale data served while refreshing")
+
+
+def test_blocking_refresh_when_serve_stale_disabled(storage) -> None:
+    """serve_stale=False refetches before returning"""
+    from cbb_data.storage.cache_helper import fetch_with_storage
+    from cbb_data.storage.freshness import set_freshness_policy
+
+    storage.save(pd.DataFrame({"GAME_ID": ["old"]}), "schedule", "NCAA-MBB", "2099")
+    set_freshness_policy("schedule", max_age_seconds=0, serve_stale=False)
+
+    df = fetch_with_storage(
+        "schedule",
+        "NCAA-MBB",
+        "2099",
+        fetcher_func=lambda: pd.DataFrame({"GAME_ID": ["new"]}),
+        cache_key="sched",
+    )
+    assert df["GAME_ID"].tolist() == ["new"]
+
+    print("[PASS] Blocking refresh when serve_stale disabled")
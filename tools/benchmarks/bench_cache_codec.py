@@ -0,0 +1,100 @@
+"""Benchmark Cache Codecs
+
+Compares encode/decode time and payload size of the Cache DataFrame codecs
+(legacy JSON orient="split" vs Arrow IPC vs Parquet) on a synthetic
+play-by-play sized table.
+
+Usage:
+    # Default: 200k rows
+    python tools/benchmarks/bench_cache_codec.py
+
+    # Custom size / repetitions
+    python tools/benchmarks/bench_cache_codec.py --rows 1000000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from cbb_data.fetchers.base import CacheCodec, JSONFrameCodec, make_frame_codec
+
+
+def make_pbp_frame(rows: int, seed: int = 42) -> pd.DataFrame:
+    """Build a synthetic PBP-like DataFrame with mixed dtypes"""
+    rng = np.random.default_rng(seed)
+    play_types = ["JumpShot", "LayUpShot", "DunkShot", "Rebound", "Foul", "Turnover", "FreeThrow"]
+    return pd.DataFrame(
+        {
+            "GAME_ID": rng.integers(400_000_000, 400_010_000, rows).astype(str),
+            "PLAY_ID": np.arange(rows),
+            "PERIOD": rng.integers(1, 5, rows),
+            "CLOCK": rng.uniform(0, 600, rows).round(1),
+            "PLAY_TYPE": pd.Categorical(rng.choice(play_types, rows)),
+            "TEAM_ID": pd.array(rng.integers(1, 400, rows), dtype="Int64"),
+            "PLAYER_ID": pd.array(rng.integers(1, 5000, rows), dtype="Int64"),
+            "SCORE_HOME": rng.integers(0, 120, rows),
+            "SCORE_AWAY": rng.integers(0, 120, rows),
+            "GAME_DATE": pd.Timestamp("2024-11-04")
+            + pd.to_timedelta(rng.integers(0, 150, rows), unit="D"),
+            "TEXT": rng.choice(["Made jumper", "Missed layup", "Defensive rebound"], rows),
+        }
+    )
+
+
+def bench_codec(codec: CacheCodec, df: pd.DataFrame, repeat: int) -> dict[str, float]:
+    """Time encode/decode for one codec (best of `repeat`)"""
+    encode_times = []
+    decode_times = []
+    payload = b""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        payload = codec.encode(df)
+        encode_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        codec.decode(payload)
+        decode_times.append(time.perf_counter() - start)
+
+    return {
+        "encode_ms": min(encode_times) * 1000,
+        "decode_ms": min(decode_times) * 1000,
+        "size_mb": len(payload) / (1024 * 1024),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark Cache DataFrame codecs")
+    parser.add_argument("--rows", type=int, default=200_000, help="Rows in synthetic frame")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions per codec")
+    args = parser.parse_args()
+
+    df = make_pbp_frame(args.rows)
+    codecs: dict[str, CacheCodec] = {
+        "json (split)": JSONFrameCodec(),
+        "arrow": make_frame_codec("arrow", compression="none"),
+        "arrow+zstd": make_frame_codec("arrow", compression="zstd"),
+        "parquet+zstd": make_frame_codec("parquet", compression="zstd"),
+    }
+
+    print(f"Synthetic PBP frame: {len(df):,} rows x {len(df.columns)} columns\n")
+    print(f"{'codec':<14} {'encode ms':>10} {'decode ms':>10} {'size MB':>9}")
+    print("-" * 46)
+    for label, codec in codecs.items():
+        result = bench_codec(codec, df, args.repeat)
+        print(
+            f"{label:<14} {result['encode_ms']:>10.1f} {result['decode_ms']:>10.1f} "
+            f"{result['size_mb']:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Benchmark Package Import Time
+
+Measures cold-start cost with ``python -X importtime`` in fresh interpreters
+and lists the slowest imported modules, so regressions (an eager fetcher or
+heavy optional dependency creeping back into the import path) are easy to spot.
+
+Target: ``import cbb_data`` under 300 ms. The dataset API itself
+(``from cbb_data import get_dataset``) is reported too; it is dominated by
+pandas and must not import any fetcher module.
+
+Usage:
+    # Default: 5 runs per statement, top 15 modules
+    python tools/benchmarks/bench_import_time.py
+
+    # More runs, custom target; exits 1 if the target is missed
+    python tools/benchmarks/bench_import_time.py --runs 10 --target-ms 300
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).parent.parent.parent / "src"
+
+STATEMENTS = {
+    "import cbb_data": "import cbb_data",
+    "from cbb_data import get_dataset": "from cbb_data import get_dataset",
+}
+
+# "import time: self [us] | cumulative | imported package"
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def run_importtime(statement: str) -> list[tuple[str, int, int]]:
+    """Run a statement under -X importtime in a fresh interpreter
+
+    Returns:
+        List of (module, cumulative_us, depth) in import order
+    """
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            depth = (len(match.group(3)) - 1) // 2
+            rows.append((match.group(4), int(match.group(2)), depth))
+    return rows
+
+
+def total_ms(rows: list[tuple[str, int, int]]) -> float:
+    """Total import time: sum of top-level (depth 0) cumulative times"""
+    return sum(cumulative for _, cumulative, depth in rows if depth == 0) / 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark cbb_data import time")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per statement")
+    parser.add_argument("--top", type=int, default=15, help="Slowest modules to list")
+    parser.add_argument(
+        "--target-ms", type=float, default=300.0, help="Target for 'import cbb_data' (ms)"
+    )
+    args = parser.parse_args()
+
+    # Python's own startup modules (site, encodings) are excluded by importtime
+    # only partially; measure an empty run to subtract the baseline.
+    baseline = statistics.median(total_ms(run_importtime("pass")) for _ in range(args.runs))
+
+    results: dict[str, float] = {}
+    for label, statement in STATEMENTS.items():
+        runs = [run_importtime(statement) for _ in range(args.runs)]
+        results[label] = statistics.median(total_ms(rows) for rows in runs) - baseline
+
+        print(f"\n{label}: {results[label]:.1f} ms (median of {args.runs}, startup excluded)")
+        slowest = sorted(runs[-1], key=lambda row: row[1], reverse=True)[: args.top]
+        print(f"  {'module':<50} {'cumulative ms':>14}")
+        for module, cumulative, _ in slowest:
+            print(f"  {module:<50} {cumulative / 1000:>14.1f}")
+
+        fetchers = sorted({m for m, _, _ in runs[-1] if m.startswith("cbb_data.fetchers.")})
+        if fetchers:
+            print(f"  WARNING: fetcher modules imported eagerly: {', '.join(fetchers)}")
+
+    cold = results["import cbb_data"]
+    status = "OK" if cold <= args.target_ms else "OVER TARGET"
+    print(f"\nimport cbb_data: {cold:.1f} ms / target {args.target_ms:.0f} ms -> {status}")
+    if cold > args.target_ms:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
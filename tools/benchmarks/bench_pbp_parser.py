@@ -0,0 +1,251 @@
+"""Benchmark PBP-to-Box-Score Parsing
+
+Rebuilds player box scores for a synthetic season of ESPN-style play-by-play
+and compares:
+- legacy: the previous row-by-row parser (plays.iterrows), one call per game
+- per-game: vectorized parse_pbp_to_player_stats, one call per game
+- batch: vectorized parse_pbp_to_player_stats_batch, one call for the season
+
+All three must produce identical box scores.
+
+Usage:
+    # Default: 5,000 games (~2.3M plays); legacy timed on a 200-game sample
+    python tools/benchmarks/bench_pbp_parser.py
+
+    # Smaller season, legacy on every game
+    python tools/benchmarks/bench_pbp_parser.py --games 500 --legacy-games 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from cbb_data.parsers.pbp_parser import (  # noqa: E402
+    parse_pbp_to_player_stats,
+    parse_pbp_to_player_stats_batch,
+)
+
+PLAYS_PER_GAME = 460
+PLAYERS_PER_TEAM = 13
+
+# (play type, weight)
+PLAY_MIX = [
+    ("JumpShot", 0.22),
+    ("LayUpShot", 0.09),
+    ("DunkShot", 0.02),
+    ("TipShot", 0.01),
+    ("MadeFreeThrow", 0.06),
+    ("MissedFreeThrow", 0.02),
+    ("Defensive Rebound", 0.13),
+    ("Offensive Rebound", 0.05),
+    ("Steal", 0.03),
+    ("Block Shot", 0.02),
+    ("Lost Ball Turnover", 0.04),
+    ("PersonalFoul", 0.08),
+    ("Substitution", 0.17),
+    ("OfficialTVTimeOut", 0.06),
+]
+
+
+def synthetic_season(n_games: int, seed: int = 0) -> tuple[pd.DataFrame, dict[str, dict]]:
+    """Generate ESPN-style plays and player mappings for n_games
+
+    Returns:
+        (plays with GAME_ID, {game_id: player mapping})
+    """
+    rng = np.random.default_rng(seed)
+    n = n_games * PLAYS_PER_GAME
+    types, weights = zip(*PLAY_MIX, strict=True)
+    play_type = rng.choice(
+        np.array(types, dtype=object), size=n, p=np.array(weights) / sum(weights)
+    )
+    game_idx = np.repeat(np.arange(n_games), PLAYS_PER_GAME)
+    roster = rng.integers(0, 2 * PLAYERS_PER_TEAM, size=(n, 2))
+    player_ids = (game_idx[:, None] * 100 + roster).astype(str)
+
+    is_shot = np.isin(play_type, ["JumpShot", "LayUpShot", "DunkShot", "TipShot"])
+    made = rng.random(n) < 0.45
+    three = (play_type == "JumpShot") & (rng.random(n) < 0.4)
+    score = np.where(is_shot & made, np.where(three, 3, 2), 0)
+    score = np.where(play_type == "MadeFreeThrow", 1, score)
+    text = np.where(is_shot, np.where(made, "Player made Jumper.", "Player missed Jumper."), "")
+
+    assisted = is_shot & made & (rng.random(n) < 0.55)
+    team_event = (play_type == "OfficialTVTimeOut") | (rng.random(n) < 0.03)
+    participants = [
+        [] if team else [a, b] if two else [a]
+        for a, b, two, team in zip(
+            player_ids[:, 0], player_ids[:, 1], assisted, team_event, strict=True
+        )
+    ]
+
+    game_ids = np.array([f"4017{i:05d}" for i in range(n_games)], dtype=object)
+    plays = pd.DataFrame(
+        {
+            "GAME_ID": game_ids[game_idx],
+            "PLAY_TYPE": play_type,
+            "TEXT": text,
+            "SCORE_VALUE": score,
+            "PARTICIPANTS": participants,
+        }
+    )
+    mappings = {
+        game_id: {
+            f"{i * 100 + p}": {"name": f"Player {p}", "team_name": f"Team {p // PLAYERS_PER_TEAM}"}
+            for p in range(2 * PLAYERS_PER_TEAM)
+        }
+        for i, game_id in enumerate(game_ids)
+    }
+    return plays, mappings
+
+
+# Stat columns of the legacy parser, in output order
+STATS = [
+    "PTS", "FGM", "FGA", "FG2M", "FG2A", "FG3M", "FG3A", "FTM", "FTA",
+    "OREB", "DREB", "AST", "STL", "TOV", "BLK", "PF",
+]  # fmt: skip
+
+
+def legacy_parse_pbp_to_player_stats(plays: pd.DataFrame, player_mapping: dict) -> pd.DataFrame:
+    """Previous row-by-row implementation (baseline)"""
+    stats: dict = {}
+
+    def init(pid):  # type: ignore[no-untyped-def]
+        stats[pid] = {"PLAYER_ID": pid, **dict.fromkeys(STATS, 0)}
+
+    for _, play in plays.iterrows():
+        try:
+            play_type = play.get("PLAY_TYPE")
+            participants = play.get("PARTICIPANTS", [])
+            score_value = play.get("SCORE_VALUE", 0)
+            text = play.get("TEXT", "")
+            if not participants or len(participants) == 0:
+                continue
+            pid = str(participants[0])
+            if pid not in stats:
+                init(pid)
+            s = stats[pid]
+            if play_type in ["JumpShot", "LayUpShot", "DunkShot", "TipShot"]:
+                s["FGA"] += 1
+                if score_value == 3:
+                    s["FG3A"] += 1
+                elif score_value == 2:
+                    s["FG2A"] += 1
+                text_lower = text.lower() if text else ""
+                if "made" in text_lower or "makes" in text_lower:
+                    s["FGM"] += 1
+                    if score_value == 3:
+                        s["FG3M"] += 1
+                    elif score_value == 2:
+                        s["FG2M"] += 1
+                    s["PTS"] += score_value
+                    if len(participants) > 1:
+                        if participants[1] not in stats:
+                            init(participants[1])
+                        stats[participants[1]]["AST"] += 1
+            elif play_type in ["MadeFreeThrow", "MissedFreeThrow"]:
+                s["FTA"] += 1
+                if play_type == "MadeFreeThrow":
+                    s["FTM"] += 1
+                    s["PTS"] += 1
+            elif play_type == "Defensive Rebound":
+                s["DREB"] += 1
+            elif play_type == "Offensive Rebound":
+                s["OREB"] += 1
+            elif play_type == "Steal":
+                s["STL"] += 1
+            elif play_type == "Block Shot":
+                s["BLK"] += 1
+            elif play_type and "Turnover" in play_type:
+                s["TOV"] += 1
+            elif play_type == "PersonalFoul":
+                s["PF"] += 1
+        except Exception:
+            continue
+
+    if not stats:
+        return pd.DataFrame()
+    df = pd.DataFrame.from_dict(stats, orient="index").reset_index(drop=True)
+    df["PLAYER_NAME"] = df["PLAYER_ID"].map(
+        lambda p: player_mapping.get(p, {}).get("name", "Unknown")
+    )
+    df["TEAM"] = df["PLAYER_ID"].map(
+        lambda p: player_mapping.get(p, {}).get("team_name", "Unknown")
+    )
+    df["REB"] = df["OREB"] + df["DREB"]
+    df["FG_PCT"] = (df["FGM"] / df["FGA"]).fillna(0.0)
+    return df
+
+
+def per_game(parse, plays: pd.DataFrame, mappings: dict[str, dict]) -> pd.DataFrame:  # type: ignore[no-untyped-def]
+    """Run a single-game parser over every game and stack the results"""
+    frames = [
+        parse(game_plays, mappings[game_id]).assign(GAME_ID=game_id)
+        for game_id, game_plays in plays.groupby("GAME_ID", sort=False)
+    ]
+    df = pd.concat(frames, ignore_index=True)
+    return df[["GAME_ID"] + [c for c in df.columns if c != "GAME_ID"]]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark PBP box score parsing")
+    parser.add_argument("--games", type=int, default=5000, help="Games in the synthetic season")
+    parser.add_argument(
+        "--legacy-games", type=int, default=200, help="Games to time the legacy parser on"
+    )
+    args = parser.parse_args()
+
+    import logging
+
+    logging.disable(logging.WARNING)
+
+    t0 = time.perf_counter()
+    plays, mappings = synthetic_season(args.games)
+    print(f"Synthetic season: {args.games:,} games, {len(plays):,} plays ")
+    print(f"  generated in {time.perf_counter() - t0:.1f}s\n")
+
+    t0 = time.perf_counter()
+    batch = parse_pbp_to_player_stats_batch(plays, mappings)
+    batch_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    vectorized = per_game(parse_pbp_to_player_stats, plays, mappings)
+    per_game_s = time.perf_counter() - t0
+
+    sample_ids = set(list(mappings)[: args.legacy_games])
+    sample = plays[plays["GAME_ID"].isin(sample_ids)]
+    t0 = time.perf_counter()
+    legacy = per_game(legacy_parse_pbp_to_player_stats, sample, mappings)
+    legacy_s = time.perf_counter() - t0
+    legacy_full_s = legacy_s * args.games / len(sample_ids)
+
+    pd.testing.assert_frame_equal(batch, vectorized)
+    pd.testing.assert_frame_equal(
+        batch[batch["GAME_ID"].isin(sample_ids)].reset_index(drop=True), legacy
+    )
+
+    print(f"{'method':<12} {'seconds':>10} {'games/s':>10} {'speedup':>9}")
+    for name, seconds in [
+        ("legacy", legacy_full_s),
+        ("per-game", per_game_s),
+        ("batch", batch_s),
+    ]:
+        print(
+            f"{name:<12} {seconds:>10.2f} {args.games / seconds:>10,.0f} "
+            f"{legacy_full_s / seconds:>8.1f}x"
+        )
+    if len(sample_ids) < args.games:
+        print(f"\nlegacy extrapolated from {len(sample_ids)} games ({legacy_s:.2f}s)")
+    print(f"Outputs identical: {len(batch):,} player box scores")
+
+
+if __name__ == "__main__":
+    main()
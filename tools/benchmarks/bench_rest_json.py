@@ -0,0 +1,101 @@
+"""Benchmark REST JSON Responses
+
+Compares the warm-cache response time of POST /datasets/{id} with
+output_format=json/records on the DatasetResponse model path (model
+validation + jsonable_encoder + json.dumps, what FastAPI did before) and the
+pre-serialized fast_json path. get_dataset is replaced by a function returning
+a prebuilt frame, so only serialization and request handling are measured.
+"handler ms" is the whole query_dataset call (dataset pool hop, metadata,
+encoding) on the fast path, without the HTTP middleware stack.
+
+Usage:
+    # Default: 10k, 50k and 200k rows
+    python tools/benchmarks/bench_rest_json.py
+
+    # Custom sizes / repetitions
+    python tools/benchmarks/bench_rest_json.py --rows 20000 100000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from bench_cache_codec import make_pbp_frame
+from fastapi.encoders import jsonable_encoder
+
+from cbb_data.api.rest_api import fast_json, routes
+from cbb_data.api.rest_api.models import DatasetRequest, DatasetResponse
+
+
+def model_encode(df: Any, output_format: str) -> bytes:
+    """Encode a response the way the DatasetResponse path does"""
+    data, columns = routes._dataframe_to_response_data(df, output_format)
+    payload = jsonable_encoder(DatasetResponse(data=data, columns=columns))
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def fast_encode(df: Any, output_format: str) -> bytes:
+    """Encode a response through fast_json"""
+    rows, columns = fast_json.encode_rows(df, output_format)
+    return fast_json.DatasetJSONResponse(rows, columns).body
+
+
+def handler_call(output_format: str) -> bytes:
+    """Run query_dataset end to end (get_dataset is patched to a warm frame)"""
+    request = DatasetRequest(
+        filters={"league": "LKL", "season": "2024-25"}, output_format=output_format
+    )
+    return asyncio.run(routes.query_dataset("pbp", request)).body
+
+
+def best_ms(fn: Any, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark REST JSON response encoding")
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=[10_000, 50_000, 200_000], help="Frame sizes"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions per case")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    print(f"orjson available: {fast_json.ORJSON_AVAILABLE}\n")
+    print(
+        f"{'rows':>8} {'format':<8} {'model ms':>9} {'fast ms':>9} {'handler ms':>11} {'speedup':>8}"
+    )
+    print("-" * 58)
+    for rows in args.rows:
+        # NaN-free frame: the model path rejects NaN floats
+        df = make_pbp_frame(rows)
+        routes.get_dataset = lambda df=df, **kwargs: df  # warm cache: no fetch
+        for output_format in ("json", "records"):
+            model = best_ms(partial(model_encode, df, output_format), args.repeat)
+            fast = best_ms(partial(fast_encode, df, output_format), args.repeat)
+            handler = best_ms(partial(handler_call, output_format), args.repeat)
+            print(
+                f"{rows:>8,} {output_format:<8} {model:>9.1f} {fast:>9.1f} {handler:>11.1f} "
+                f"{model / fast:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,9 @@ Purpose:
     - Track progress via game index flags (has_pbp, has_shots)
     - Log errors separately without failing the entire pipeline
     - Support resume (skip already-fetched games)
+    - Fetch several games at once under the adaptive "lnb" concurrency limit
+      (grows while the API is fast, halves on 429/5xx or timeouts); request
+      pacing comes from the shared source rate limiter
 
 Usage:
     # Ingest current season
@@ -25,6 +28,9 @@ Usage:
     # Limit games per season (for testing)
     uv run python tools/lnb/bulk_ingest_pbp_shots.py --max-games 10
 
+    # Start with 4 concurrent fetches (adapts from there)
+    uv run python tools/lnb/bulk_ingest_pbp_shots.py --concurrency 4
+
 Output:
     data/raw/lnb/pbp/season=YYYY-YYYY/game_id=<uuid>.parquet
     data/raw/lnb/shots/season=YYYY-YYYY/game_id=<uuid>.parquet
@@ -36,7 +42,8 @@ from __future__ import annotations
 import argparse
 import io
 import sys
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, datetime
 from pathlib import Path
 from typing import Any
@@ -57,6 +64,7 @@ from src.cbb_data.fetchers.lnb import (
     fetch_lnb_play_by_play,
     get_league_id_from_competition,
 )
+from src.cbb_data.utils.adaptive_concurrency import get_concurrency
 
 # ==============================================================================
 # CONFIG
@@ -71,8 +79,12 @@ ERROR_LOG_FILE = DATA_DIR / "ingestion_errors.csv"
 PBP_DIR = DATA_DIR / "pbp"
 SHOTS_DIR = DATA_DIR / "shots"
 
-# Rate limiting (respect API limits)
-SLEEP_BETWEEN_GAMES = 1.0  # seconds
+# Starting number of concurrent API calls (adapted at runtime; pacing comes
+# from the "lnb" source rate limiter)
+INITIAL_CONCURRENCY = 2
+
+# Serializes read-modify-write of the error log across worker threads
+_error_log_lock = threading.Lock()
 
 # ==============================================================================
 # UTILITY FUNCTIONS
@@ -342,11 +354,12 @@ def log_error(game_id: str, season: str, data_type: str, error: str) -> None:
     error_df = pd.DataFrame([error_data])
 
     # Append to error log
-    if ERROR_LOG_FILE.exists():
-        existing_errors = pd.read_csv(ERROR_LOG_FILE)
-        error_df = pd.concat([existing_errors, error_df], ignore_index=True)
+    with _error_log_lock:
+        if ERROR_LOG_FILE.exists():
+            existing_errors = pd.read_csv(ERROR_LOG_FILE)
+            error_df = pd.concat([existing_errors, error_df], ignore_index=True)
 
-    error_df.to_csv(ERROR_LOG_FILE, index=False)
+        error_df.to_csv(ERROR_LOG_FILE, index=False)
 
 
 # ==============================================================================
@@ -369,8 +382,10 @@ def ingest_pbp_for_game(game_id: str, season: str, competition: str) -> bool:
         # Convert competition to canonical league ID
         league_id = get_league_id_from_competition(competition)
 
-        # Fetch PBP with correct league ID
-        pbp_df = fetch_lnb_play_by_play(game_id, league_id=league_id)
+        # Fetch PBP with correct league ID; errors propagate so the "lnb" limit
+        # backs off on 429/5xx/timeouts instead of counting them as successes
+        with get_concurrency("lnb").slot():
+            pbp_df = fetch_lnb_play_by_play(game_id, league_id=league_id, raise_on_error=True)
 
         if pbp_df.empty:
             print(f"    [WARN] Empty PBP data for {game_id}")
@@ -404,7 +419,8 @@ def ingest_shots_for_game(game_id: str, season: str, competition: str) -> bool:
         league_id = get_league_id_from_competition(competition)
 
         # Fetch shots with correct league ID
-        shots_df = fetch_lnb_game_shots(game_id, league_id=league_id)
+        with get_concurrency("lnb").slot():
+            shots_df = fetch_lnb_game_shots(game_id, league_id=league_id, raise_on_error=True)
 
         if shots_df.empty:
             print(f"    [WARN] Empty shots data for {game_id}")
@@ -422,6 +438,35 @@ def ingest_shots_for_game(game_id: str, season: str, competition: str) -> bool:
         return False
 
 
+def ingest_game(row: Any, force_refetch: bool = False) -> tuple[bool | None, bool | None]:
+    """Fetch and save PBP and shots for one game (runs on a worker thread)
+
+    Args:
+        row: Game index row (itertuples record)
+        force_refetch: If True, re-fetch even if already fetched
+
+    Returns:
+        (pbp_success, shots_success); None where the dataset was already ingested
+    """
+    pbp_success = None
+    if (
+        force_refetch
+        or not row.has_pbp
+        or not has_parquet_for_game(PBP_DIR, row.season, row.game_id)
+    ):
+        pbp_success = ingest_pbp_for_game(row.game_id, row.season, row.competition)
+
+    shots_success = None
+    if (
+        force_refetch
+        or not row.has_shots
+        or not has_parquet_for_game(SHOTS_DIR, row.season, row.game_id)
+    ):
+        shots_success = ingest_shots_for_game(row.game_id, row.season, row.competition)
+
+    return pbp_success, shots_success
+
+
 # ==============================================================================
 # BULK INGESTION
 # ==============================================================================
@@ -432,6 +477,7 @@ def bulk_ingest(
     leagues: list[str] | None = None,
     max_games_per_season: int | None = None,
     force_refetch: bool = False,
+    concurrency: int = INITIAL_CONCURRENCY,
 ) -> dict[str, Any]:
     """Bulk ingest PBP and shots data for multiple seasons and leagues
 
@@ -445,6 +491,7 @@ def bulk_ingest(
                 If None, processes all leagues
         max_games_per_season: Limit games per season (for testing)
         force_refetch: If True, re-fetch even if already fetched
+        concurrency: Starting number of concurrent API calls (adapted at runtime)
 
     Returns:
         Dict with ingestion statistics
@@ -456,7 +503,8 @@ def bulk_ingest(
     print(f"Seasons: {seasons or 'All'}")
     print(f"Leagues: {leagues or 'All'}")
     print(f"Max games per season: {max_games_per_season or 'All'}")
-    print(f"Force re-fetch: {force_refetch}\n")
+    print(f"Force re-fetch: {force_refetch}")
+    print(f"Initial concurrency: {concurrency}\n")
 
     index_df = load_game_index()
 
@@ -529,50 +577,47 @@ def bulk_ingest(
 
     print(f"\n[INFO] Processing {len(to_fetch)} games...\n")
 
-    for idx, row in enumerate(to_fetch.itertuples(), 1):
-        print(f"[{idx}/{len(to_fetch)}] {row.season} - {row.game_id[:16]}...")
-        print(f"  Competition: {row.competition}")
-        print(f"  Home: {row.home_team_name}")
-        print(f"  Away: {row.away_team_name}")
-
-        pbp_success = False
-        if (
-            force_refetch
-            or not row.has_pbp
-            or not has_parquet_for_game(PBP_DIR, row.season, row.game_id)
-        ):
-            pbp_success = ingest_pbp_for_game(row.game_id, row.season, row.competition)
-            if pbp_success:
+    # Games run concurrently; index flags and stats are only touched here, on
+    # the main thread, as each game completes
+    concurrency_limit = get_concurrency("lnb", initial_limit=concurrency)
+    with ThreadPoolExecutor(max_workers=concurrency_limit.max_limit) as executor:
+        futures = {
+            executor.submit(ingest_game, row, force_refetch): row for row in to_fetch.itertuples()
+        }
+
+        for idx, future in enumerate(as_completed(futures), 1):
+            row = futures[future]
+            pbp_success, shots_success = future.result()
+
+            print(f"[{idx}/{len(to_fetch)}] {row.season} - {row.game_id[:16]}...")
+            print(f"  Competition: {row.competition}")
+            print(f"  Home: {row.home_team_name}")
+            print(f"  Away: {row.away_team_name}")
+
+            if pbp_success is None:
+                print("  [SKIP] PBP already ingested")
+            elif pbp_success:
                 stats["pbp_success"] += 1
                 index_df = update_index_flags(index_df, row.game_id, has_pbp=True)
             else:
                 stats["pbp_errors"] += 1
-        else:
-            print("  [SKIP] PBP already ingested")
-
-        shots_success = False
-        if (
-            force_refetch
-            or not row.has_shots
-            or not has_parquet_for_game(SHOTS_DIR, row.season, row.game_id)
-        ):
-            shots_success = ingest_shots_for_game(row.game_id, row.season, row.competition)
-            if shots_success:
+
+            if shots_success is None:
+                print("  [SKIP] Shots already ingested")
+            elif shots_success:
                 stats["shots_success"] += 1
                 index_df = update_index_flags(index_df, row.game_id, has_shots=True)
             else:
                 stats["shots_errors"] += 1
-        else:
-            print("  [SKIP] Shots already ingested")
 
-        if pbp_success and shots_success:
-            stats["both_success"] += 1
+            if pbp_success and shots_success:
+                stats["both_success"] += 1
 
-        if idx % 10 == 0:
-            save_game_index(index_df)
+            if idx % 10 == 0:
+                save_game_index(index_df)
 
-        time.sleep(SLEEP_BETWEEN_GAMES)
-        print()
+            print(f"  Concurrency: {concurrency_limit.limit}")
+            print()
 
     save_game_index(index_df)
     return stats
@@ -684,6 +729,13 @@ Available leagues:
         "--force-refetch", action="store_true", help="Re-fetch even if already fetched"
     )
 
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=INITIAL_CONCURRENCY,
+        help=f"Starting concurrent API calls, adapted at runtime (default: {INITIAL_CONCURRENCY})",
+    )
+
     args = parser.parse_args()
 
     # Run bulk ingestion
@@ -692,6 +744,7 @@ Available leagues:
         leagues=args.leagues,
         max_games_per_season=args.max_games,
         force_refetch=args.force_refetch,
+        concurrency=args.concurrency,
     )
 
     # Print summary